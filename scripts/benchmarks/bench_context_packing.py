@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Context Packing Benchmark
+
+Measures what token-budgeted packing saves over pasting the whole project
+context into every prompt. For each prompt the gathered context of --project
+(components, decisions, recent changes) is packed within each budget, and
+the benchmark reports tokens sent, tokens saved, how often the prompt's own
+keywords survive packing, and packing time. When tiktoken's encoding loads,
+the estimator's error against it is reported too.
+
+Uses recorded prompts (one per line, or JSONL with a "prompt" field) from
+--prompts, or a built-in set otherwise:
+    python scripts/benchmarks/bench_context_packing.py
+    python scripts/benchmarks/bench_context_packing.py --prompts prompts.jsonl
+    python scripts/benchmarks/bench_context_packing.py --budgets 500 1500 4000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.vibe.context_injector import ContextInjector, ProjectContext  # noqa: E402
+from src.vibe.context_packer import (  # noqa: E402
+    ContextPacker,
+    TokenEstimator,
+)
+
+PROMPTS = [
+    "Add OAuth login to the dashboard API",
+    "Fix the retry loop in the GitHub client when the rate limit resets",
+    "Write tests for the memory search index",
+    "Stream LLM responses to the TUI chat panel",
+    "Why does the Ollama client time out under load?",
+    "Refactor the dependency resolver to use uv lock files",
+    "Add a health check for LM Studio to the dashboard",
+    "Speed up HTML extraction in the web scraper",
+    "Document the workflow orchestrator agents",
+    "Cache prompt context between VIBE enhancer calls",
+]
+
+
+def load_prompts(path: Path | None) -> list[str]:
+    if path is None:
+        return PROMPTS
+    prompts = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            line = json.loads(line).get("prompt", "")
+        prompts.append(line)
+    return [p for p in prompts if p]
+
+
+def gather_context(project: Path) -> ProjectContext:
+    """Unpacked context for ``project``, as ContextInjector builds it."""
+    cwd = os.getcwd()
+    os.chdir(project)
+    try:
+        injector = ContextInjector()
+        return asyncio.run(injector._build_context("", None))
+    finally:
+        os.chdir(cwd)
+
+
+def keyword_matches(prompt: str, texts: list[str]) -> int:
+    """Snippets sharing a keyword with the prompt."""
+    words = {w.lower() for w in prompt.split() if len(w) > 3}
+    return sum(any(w in t.lower() for w in words) for t in texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Context packing benchmark")
+    parser.add_argument("--prompts", type=Path, default=None)
+    parser.add_argument(
+        "--project", type=Path, default=Path(__file__).parent.parent.parent
+    )
+    parser.add_argument("--budgets", type=int, nargs="+", default=[500, 1500, 4000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    prompts = load_prompts(args.prompts)
+    context = gather_context(args.project.resolve())
+    injector = ContextInjector.__new__(ContextInjector)
+    injector.packer = ContextPacker(TokenEstimator(use_tiktoken=False))
+    candidates = injector.context_snippets(context)
+    texts = [s.text for s in candidates]
+
+    exact = TokenEstimator()
+    estimator = injector.packer.estimator
+    if exact.exact:
+        samples = [(t, exact.count(t)) for t in texts + prompts]
+        estimator.calibrate(samples[: len(samples) // 2])
+        errors = [
+            abs(estimator.count(t) - n) / n for t, n in samples[len(samples) // 2 :]
+        ]
+        print(
+            f"estimator scale {estimator.scale:.2f}, "
+            f"mean error vs tiktoken {statistics.mean(errors):.1%}"
+        )
+    else:
+        print("tiktoken encoding unavailable; counting with the estimator")
+
+    full = sum(estimator.count(t) for t in texts)
+    print(
+        f"{len(prompts)} prompts, {len(candidates)} candidate snippets, "
+        f"{full} tokens unpacked\n"
+    )
+    print(
+        f"{'budget':>8} {'sent':>8} {'saved':>8} {'saved %':>8} "
+        f"{'matches kept':>13} {'pack ms':>8}"
+    )
+
+    for budget in args.budgets:
+        sent, kept, matched, times = [], 0, 0, []
+        for prompt in prompts:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                packed = injector.pack_context(context, prompt, budget)
+            times.append((time.perf_counter() - start) * 1000 / args.repeat)
+            sent.append(packed.packing["tokens_used"])
+
+            packed_texts = [s.text for s in injector.context_snippets(packed)]
+            matched += keyword_matches(prompt, texts)
+            kept += keyword_matches(prompt, packed_texts)
+
+        mean_sent = statistics.mean(sent)
+        recall = kept / matched if matched else 1.0
+        print(
+            f"{budget:>8} {mean_sent:>8.0f} {full - mean_sent:>8.0f} "
+            f"{1 - mean_sent / full if full else 0:>8.1%} {recall:>13.1%} "
+            f"{statistics.mean(times):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+"""
+Dashboard Search Benchmark
+
+Load-tests the dashboard /api/search endpoint against local stub platforms
+(no network). "per-request" rebuilds UnifiedSearch and its platform clients
+for every request, as the handler used to; "shared" uses the app-scoped
+service, whose cache and in-flight coalescing absorb repeated queries. The
+benchmark reports throughput, latency percentiles and platform calls made,
+then compares time to the first streamed platform result with time to the
+full ranked result:
+    python scripts/benchmarks/bench_dashboard_search.py
+    python scripts/benchmarks/bench_dashboard_search.py --requests 500 --concurrency 50
+    python scripts/benchmarks/bench_dashboard_search.py --init-ms 20 --distinct 5
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import httpx  # noqa: E402
+
+import src.dashboard.app as dashboard_app  # noqa: E402
+from src.discovery.base_client import (  # noqa: E402
+    PlatformClient,
+    RepositoryInfo,
+    SearchResult,
+)
+from src.discovery.unified_search import UnifiedSearch  # noqa: E402
+
+# Relative platform latencies; scaled by --latency-ms
+PLATFORMS = {"github": 1.0, "huggingface": 0.3, "kaggle": 0.6}
+
+
+class StubPlatform(PlatformClient):
+    """Local platform with a construction cost and a search latency."""
+
+    calls = 0
+
+    def __init__(self, name: str, latency: float, init_ms: float):
+        time.sleep(init_ms / 1000)  # Client construction is synchronous
+        self.name = name
+        self.latency = latency
+
+    @property
+    def platform_name(self) -> str:
+        return self.name
+
+    async def search(self, query, language=None, min_stars=0, max_results=20, **kw):
+        StubPlatform.calls += 1
+        await asyncio.sleep(self.latency)
+        repos = [
+            RepositoryInfo(
+                platform=self.name,
+                id=f"{query}-{i}",
+                url=f"https://{self.name}.example/{query}/{i}",
+                name=f"{query}-{i}",
+                full_name=f"{self.name}/{query}-{i}",
+                stars=i * 10,
+            )
+            for i in range(max_results)
+        ]
+        return SearchResult(query, self.name, len(repos), repos, 0)
+
+    async def get_repository(self, repo_id):
+        raise NotImplementedError
+
+    async def get_contents(self, repo_id, path=""):
+        raise NotImplementedError
+
+    async def get_file(self, repo_id, path):
+        raise NotImplementedError
+
+    async def clone(self, repo_id, destination, branch=None, depth=1):
+        raise NotImplementedError
+
+
+class StubSearch(UnifiedSearch):
+    """UnifiedSearch over the stub platforms instead of configured ones."""
+
+    def __init__(self, latency_ms: float, init_ms: float):
+        self._stub_args = (latency_ms, init_ms)
+        super().__init__()
+
+    def _init_clients(self, *args):
+        latency_ms, init_ms = self._stub_args
+        for name, weight in PLATFORMS.items():
+            latency = weight * latency_ms / 1000
+            self._clients[name] = StubPlatform(name, latency, init_ms)
+
+
+async def load_test(app, queries: list[str], concurrency: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+    async with client:
+
+        async def one(query: str):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/api/search",
+                    json={"query": query, "platforms": list(PLATFORMS)},
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(one(q) for q in queries))
+    return latencies
+
+
+def report(label: str, latencies: list[float], elapsed: float, calls: int):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95)]
+    print(
+        f"{label:>12} {len(latencies) / elapsed:>9.1f} "
+        f"{statistics.median(ordered) * 1000:>9.1f} {p95 * 1000:>9.1f} {calls:>8}"
+    )
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    vocabulary = [f"topic{i}" for i in range(args.distinct)]
+    queries = [rng.choice(vocabulary) for _ in range(args.requests)]
+
+    print(
+        f"{args.requests} requests, {args.distinct} distinct queries, "
+        f"concurrency {args.concurrency}\n"
+    )
+    print(f"{'mode':>12} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'calls':>8}")
+
+    original = dashboard_app.get_search_service
+    for mode in ("per-request", "shared"):
+        app = dashboard_app.create_app()
+        if mode == "per-request":
+            dashboard_app.get_search_service = lambda app: StubSearch(
+                args.latency_ms, args.init_ms
+            )
+        else:
+            dashboard_app.get_search_service = original
+            app.state.search = StubSearch(args.latency_ms, args.init_ms)
+
+        StubPlatform.calls = 0
+        start = time.perf_counter()
+        latencies = await load_test(app, queries, args.concurrency)
+        report(mode, latencies, time.perf_counter() - start, StubPlatform.calls)
+    dashboard_app.get_search_service = original
+
+    # Streaming: first platform result vs the full ranked result
+    search = StubSearch(args.latency_ms, 0)
+    first, full = [], []
+    for i in range(10):
+        start = time.perf_counter()
+        seen_first = None
+        async for _ in search.search_stream(f"stream{i}", list(PLATFORMS)):
+            if seen_first is None:
+                seen_first = time.perf_counter() - start
+        first.append(seen_first)
+        full.append(time.perf_counter() - start)
+    print(
+        f"\nstreaming: first platform after {statistics.mean(first) * 1000:.1f} ms, "
+        f"full result after {statistics.mean(full) * 1000:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard search benchmark")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--distinct", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--init-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=42)
+    logging.disable(logging.INFO)  # Per-request search and HTTP logs
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
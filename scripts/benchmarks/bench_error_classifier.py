@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Error Classifier Benchmark
+
+Compares the precompiled ErrorClassifier against the previous approach
+(rebuild the pattern table and re.search every uncompiled pattern over
+the whole output) on large synthetic npm/pip build logs:
+    python scripts/benchmarks/bench_error_classifier.py
+    python scripts/benchmarks/bench_error_classifier.py --sizes 1 10 50 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.cli_executor.error_classifier import (  # noqa: E402
+    DEFAULT_ERROR_TYPE_PATTERNS,
+    get_default_classifier,
+)
+from src.cli_executor.executor import ErrorType  # noqa: E402
+
+NOISE_LINES = [
+    "npm WARN deprecated inflight@1.0.6: This module is not supported",
+    "added 1342 packages, and audited 1343 packages in 41s",
+    "Collecting numpy>=1.26.0 (from -r requirements.txt (line 42))",
+    "  Downloading numpy-2.0.0-cp311-cp311-manylinux_2_17_x86_64.whl (19.3 MB)",
+    "Building wheel for tokenizers (pyproject.toml) ... -",
+    "  Compiling proc-macro2 v1.0.86",
+    "tests/unit/test_cache.py::TestMemoryCache::test_get PASSED       [ 12%]",
+]
+
+FAILURE_TAIL = "ModuleNotFoundError: No module named 'torchaudio'\n"
+
+
+def legacy_detect(stderr: str, stdout: str = "") -> ErrorType:
+    """The pre-classifier implementation, kept for comparison."""
+    combined = f"{stderr} {stdout}".lower()
+    patterns = {k: list(v) for k, v in DEFAULT_ERROR_TYPE_PATTERNS.items()}
+    for error_type, pattern_list in patterns.items():
+        for pattern in pattern_list:
+            if re.search(pattern, combined, re.IGNORECASE):
+                return error_type
+    return ErrorType.UNKNOWN
+
+
+def make_log(size_mb: float, seed: int = 0) -> str:
+    """Build a noisy log of roughly ``size_mb`` megabytes ending in an error."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    lines, size = [], 0
+    while size < target:
+        line = rng.choice(NOISE_LINES)
+        lines.append(line)
+        size += len(line) + 1
+    lines.append(FAILURE_TAIL)
+    return "\n".join(lines)
+
+
+def bench(func, text: str, repeat: int) -> tuple[float, ErrorType]:
+    """Best-of-``repeat`` wall time in milliseconds."""
+    best = float("inf")
+    result = ErrorType.UNKNOWN
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Error classifier benchmark")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    classifier = get_default_classifier()
+    print(f"{'log size':>10} {'legacy ms':>12} {'classifier ms':>14} {'speedup':>9}")
+    for size in args.sizes:
+        log = make_log(size)
+        legacy_ms, legacy_type = bench(legacy_detect, log, args.repeat)
+        new_ms, new_type = bench(classifier.classify_type, log, args.repeat)
+        assert legacy_type == new_type, (legacy_type, new_type)
+        print(
+            f"{size:>8.1f}MB {legacy_ms:>12.2f} {new_ms:>14.3f} "
+            f"{legacy_ms / max(new_ms, 1e-6):>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
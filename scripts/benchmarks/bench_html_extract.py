@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+HTML Extraction Benchmark
+
+Compares the previous scraping pipeline with the single-pass extractor.
+The old pipeline parsed each page with html.parser on the event loop, ran
+markdownify over the re-serialized tree, and re-parsed the page for tables
+and for code blocks. The new one is run inline and through the process
+pool. The benchmark reports throughput and the longest event-loop stall.
+
+Uses saved pages (*.html) from --corpus, or generated pages otherwise:
+    python scripts/benchmarks/bench_html_extract.py
+    python scripts/benchmarks/bench_html_extract.py --corpus ~/saved-pages
+    python scripts/benchmarks/bench_html_extract.py --pages 400 --size 80
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import markdownify  # noqa: E402
+from bs4 import BeautifulSoup, Comment  # noqa: E402
+
+from src.discovery.html_extract import (  # noqa: E402
+    PARSER,
+    extract_html,
+    extract_page,
+    get_extraction_executor,
+    shutdown_extraction_executor,
+)
+
+URL = "https://docs.example.com/guide/page.html"
+WORDS = (
+    "crawler parser markdown table code async pool process thread event loop "
+    "latency throughput benchmark document anchor image header footer install"
+).split()
+
+
+def make_page(size_kb: int, rng: random.Random) -> str:
+    """A documentation-style page of roughly ``size_kb`` kilobytes."""
+    parts = [
+        "<html lang='en'><head><title>Guide</title>",
+        "<meta name='description' content='Generated page'>",
+        "<style>body{margin:0}</style><script>var a = 1;</script></head><body>",
+        "<nav>" + "".join(f"<a href='/n{i}'>Nav {i}</a>" for i in range(30)) + "</nav>",
+    ]
+    while sum(map(len, parts)) < size_kb * 1024:
+        kind = rng.random()
+        if kind < 0.6:
+            text = " ".join(rng.choices(WORDS, k=60))
+            parts.append(f"<p>{text} <a href='/p{rng.randint(0, 999)}'>more</a></p>")
+        elif kind < 0.8:
+            rows = "".join(
+                f"<tr><td>{rng.choice(WORDS)}</td><td>{rng.randint(0, 99)}</td></tr>"
+                for _ in range(8)
+            )
+            parts.append(f"<table><tr><th>Name</th><th>Value</th></tr>{rows}</table>")
+        elif kind < 0.95:
+            code = "\n".join(f"x{i} = {i} * 2" for i in range(10))
+            parts.append(f"<pre><code class='language-python'>{code}</code></pre>")
+        else:
+            parts.append(f"<img src='/img/{rng.randint(0, 99)}.png'>")
+    parts.append("<footer>Footer</footer></body></html>")
+    return "".join(parts)
+
+
+def legacy_extract(url: str, html: str) -> tuple:
+    """The previous _fallback_scrape plus the two re-parsing extractors."""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.find("title")
+    title = title.get_text().strip() if title else ""
+    for script in soup(["script", "style", "nav", "footer"]):
+        script.decompose()
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    links = [a["href"] for a in soup.find_all("a", href=True)]
+    images = [img["src"] for img in soup.find_all("img", src=True)]
+    content = markdownify.markdownify(str(soup), heading_style="ATX")
+
+    tables = BeautifulSoup(html, "html.parser").find_all("table")
+    code = BeautifulSoup(html, "html.parser").find_all("pre")
+    return title, links, images, content, len(tables), len(code)
+
+
+async def run(mode: str, pages: list[str]) -> tuple[float, float]:
+    """Extract all pages; returns (seconds, longest loop stall in ms)."""
+    loop = asyncio.get_running_loop()
+    stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        while not done:
+            before = loop.time()
+            await asyncio.sleep(0.001)
+            stall = max(stall, (loop.time() - before - 0.001) * 1000)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+
+    if mode == "legacy":
+        for html in pages:
+            legacy_extract(URL, html)
+            await asyncio.sleep(0)
+    elif mode == "single-pass":
+        for html in pages:
+            extract_page(URL, html)
+            await asyncio.sleep(0)
+    else:
+        await asyncio.gather(*(extract_html(URL, html) for html in pages))
+
+    elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    return elapsed, stall
+
+
+async def main_async(pages: list[str]) -> None:
+    megabytes = sum(map(len, pages)) / 1e6
+    print(f"{len(pages)} pages, {megabytes:.1f} MB, parser={PARSER}")
+    print(f"{'mode':>14} {'pages/s':>9} {'MB/s':>7} {'max stall ms':>13}")
+
+    # Start the pool workers outside the timed run
+    get_extraction_executor()
+    await asyncio.gather(*(extract_html(URL, pages[0]) for _ in range(8)))
+
+    for mode in ("legacy", "single-pass", "process-pool"):
+        elapsed, stall = await run(mode, pages)
+        print(
+            f"{mode:>14} {len(pages) / elapsed:>9.1f} "
+            f"{megabytes / elapsed:>7.2f} {stall:>13.1f}"
+        )
+    shutdown_extraction_executor()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML extraction benchmark")
+    parser.add_argument("--corpus", type=Path, help="Directory of saved *.html pages")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--size", type=int, default=50, help="Generated page KB")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.corpus:
+        files = sorted([*args.corpus.glob("**/*.html"), *args.corpus.glob("**/*.htm")])
+        pages = [f.read_text(encoding="utf-8", errors="replace") for f in files]
+        if not pages:
+            parser.error(f"No .html files in {args.corpus}")
+    else:
+        rng = random.Random(args.seed)
+        pages = [make_page(args.size, rng) for _ in range(args.pages)]
+
+    asyncio.run(main_async(pages))
+
+
+if __name__ == "__main__":
+    main()
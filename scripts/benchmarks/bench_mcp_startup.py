@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+MCP Server Startup Benchmark
+
+Measures MCP server cold start in fresh interpreters: ``-X importtime``
+totals for ``src.mcp_server.server`` (lazy handlers) against the same
+import plus ``src.mcp_server.tools`` (what used to load eagerly), and the
+wall time until the first ``list_tools`` response:
+    python scripts/benchmarks/bench_mcp_startup.py
+    python scripts/benchmarks/bench_mcp_startup.py --repeat 5 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent
+
+LAZY_MODULES = ["src.mcp_server.server"]
+EAGER_MODULES = ["src.mcp_server.server", "src.mcp_server.tools"]
+
+FIRST_RESPONSE = """
+import asyncio, time
+start = time.perf_counter()
+from src.mcp_server.server import MCPServer, list_tools
+MCPServer()
+tools = asyncio.run(list_tools())
+print(f"{(time.perf_counter() - start) * 1000:.1f} {len(tools)}")
+"""
+
+
+def run_python(args: list[str]) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    # nosec B603 - runs this interpreter on fixed snippets
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_times(modules: list[str]) -> dict[str, int]:
+    """Cumulative import time in microseconds per module."""
+    proc = run_python(["-X", "importtime", "-c", f"import {', '.join(modules)}"])
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+def best_of(func, repeat: int):
+    results = [func() for _ in range(repeat)]
+    return min(results, key=lambda r: r[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP server startup benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    def measure(modules: list[str]):
+        times = import_times(modules)
+        return sum(times.get(name, 0) for name in modules) / 1000, times
+
+    lazy_ms, lazy_times = best_of(lambda: measure(LAZY_MODULES), args.repeat)
+    eager_ms, eager_times = best_of(lambda: measure(EAGER_MODULES), args.repeat)
+
+    print(f"{'import':<42} {'ms':>10}")
+    print(f"{'server (lazy handlers)':<42} {lazy_ms:>10.1f}")
+    print(f"{'server + tools (eager handlers)':<42} {eager_ms:>10.1f}")
+
+    deferred = sorted(
+        (
+            (cumulative, name)
+            for name, cumulative in eager_times.items()
+            if name.startswith("src.") and name not in lazy_times
+        ),
+        reverse=True,
+    )[: args.top]
+    print(f"\nSlowest deferred src modules (cumulative ms, top {args.top}):")
+    for cumulative, name in deferred:
+        print(f"  {name:<50} {cumulative / 1000:>8.1f}")
+
+    def first_response():
+        value, count = run_python(["-c", FIRST_RESPONSE]).stdout.split()[-2:]
+        return float(value), int(count)
+
+    first_ms, tool_count = best_of(first_response, args.repeat)
+    print(f"\nImport to first list_tools ({tool_count} tools): {first_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+Memory Search Benchmark
+
+Compares the BM25 inverted index used by LocalMemoryStore against the
+previous linear scan (lowercase and split every memory on every query) on
+synthetic memories, including category/agent filtered queries:
+    python scripts/benchmarks/bench_memory_search.py
+    python scripts/benchmarks/bench_memory_search.py --sizes 1000 10000 --queries 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.memory.mem0_integration import MemoryCategory, MemoryEntry  # noqa: E402
+from src.memory.search_index import BM25Index  # noqa: E402
+
+WORDS = [
+    "fastapi", "flask", "django", "pytest", "docker", "poetry", "uv", "tabs",
+    "spaces", "async", "sqlite", "postgres", "redis", "cache", "retry", "auth",
+    "jwt", "oauth", "react", "vue", "typescript", "lint", "ruff", "mypy",
+    "deploy", "kubernetes", "helm", "terraform", "logging", "metrics", "queue",
+    "worker", "celery", "pandas", "numpy", "torch", "cuda", "opencv", "error",
+    "timeout", "import", "module", "install", "prefers", "uses", "avoid",
+]  # fmt: skip
+AGENTS = ["coder", "reviewer", "ops", None]
+
+
+def make_entries(count: int, rng: random.Random) -> list[MemoryEntry]:
+    categories = list(MemoryCategory)
+    vocabulary = WORDS + [f"term{i}" for i in range(count // 10)]
+    return [
+        MemoryEntry(
+            id=f"m{i}",
+            content=" ".join(rng.choices(vocabulary, k=rng.randint(8, 30))),
+            category=rng.choice(categories),
+            agent_id=rng.choice(AGENTS),
+        )
+        for i in range(count)
+    ]
+
+
+def linear_search(entries, query, category=None, agent_id=None, limit=10):
+    """The previous LocalMemoryStore.search algorithm."""
+    query_lower = query.lower()
+    query_words = set(query_lower.split())
+    results = []
+    for entry in entries:
+        if category and entry.category != category:
+            continue
+        content_lower = entry.content.lower()
+        overlap = query_words & set(content_lower.split())
+        if overlap or query_lower in content_lower:
+            score = len(overlap) / len(query_words) if query_words else 0
+            if query_lower in content_lower:
+                score += 0.5
+            results.append((entry, score))
+    results.sort(key=lambda x: x[1], reverse=True)
+    results = [entry for entry, _ in results[:limit]]
+    # MemorySystem filtered by agent after the fact
+    return [e for e in results if not agent_id or e.agent_id == agent_id]
+
+
+def make_queries(count: int, rng: random.Random):
+    queries = []
+    for _ in range(count):
+        text = " ".join(rng.sample(WORDS, rng.randint(1, 4)))
+        category = rng.choice([None, rng.choice(list(MemoryCategory))])
+        agent_id = rng.choice([None, "coder"])
+        queries.append((text, category, agent_id))
+    return queries
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory search benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'memories':>10} {'build ms':>10} {'add us':>8} "
+        f"{'scan ms/q':>10} {'bm25 ms/q':>10} {'speedup':>8}"
+    )
+
+    for size in args.sizes:
+        entries = make_entries(size, rng)
+        queries = make_queries(args.queries, rng)
+        index = BM25Index()
+
+        def build(index=index, entries=entries):
+            for e in entries:
+                index.add(e.id, e.content, e.category.value, e.agent_id)
+
+        build_ms = timed(build)
+        extra = make_entries(100, rng)
+        add_ms = timed(
+            lambda index=index, extra=extra: [
+                index.add(f"x{e.id}", e.content, e.category.value) for e in extra
+            ]
+        )
+
+        def scan(entries=entries, queries=queries):
+            for text, category, agent_id in queries:
+                linear_search(entries, text, category, agent_id)
+
+        def ranked(index=index, queries=queries):
+            for text, category, agent_id in queries:
+                index.search(
+                    text, 10, category.value if category else None, agent_id
+                )
+
+        scan_ms = timed(scan) / len(queries)
+        bm25_ms = timed(ranked) / len(queries)
+        print(
+            f"{size:>10} {build_ms:>10.1f} {add_ms * 10:>8.1f} "
+            f"{scan_ms:>10.3f} {bm25_ms:>10.3f} {scan_ms / bm25_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Memory Store Write Benchmark
+
+Compares LocalMemoryStore's append-only log against the previous
+whole-file JSON rewrite for adding memories to stores of increasing size,
+plus the cost of reopening (lazy replay) and of a full compaction:
+    python scripts/benchmarks/bench_memory_store.py
+    python scripts/benchmarks/bench_memory_store.py --sizes 1000 10000 --adds 50
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.memory.mem0_integration import (  # noqa: E402
+    LocalMemoryStore,
+    MemoryCategory,
+    MemoryEntry,
+)
+
+
+def make_entry(i: int) -> MemoryEntry:
+    return MemoryEntry(
+        id=f"m{i:08d}",
+        content=f"Memory {i}: user prefers pytest fixtures over setup methods",
+        category=MemoryCategory.PREFERENCE,
+        tags=["preference", "testing"],
+    )
+
+
+def seed_store(path: Path, size: int) -> None:
+    """Write ``size`` memories in the legacy format and migrate them."""
+    data = {e.id: e.to_dict() for e in map(make_entry, range(size))}
+    (path / "memories.json").write_text(json.dumps(data), encoding="utf-8")
+    LocalMemoryStore(path).close()
+
+
+def json_rewrite_add_ms(size: int, adds: int) -> float:
+    """Per-add cost of the old approach: rewrite the whole file."""
+    memories = {e.id: e for e in map(make_entry, range(size))}
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_file = Path(tmp) / "memories.json"
+        start = time.perf_counter()
+        for i in range(adds):
+            entry = make_entry(size + i)
+            memories[entry.id] = entry
+            data = {k: v.to_dict() for k, v in memories.items()}
+            storage_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return (time.perf_counter() - start) * 1000 / adds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory store write benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--adds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'memories':>10} {'json add ms':>12} {'log add ms':>11} "
+        f"{'reopen ms':>10} {'compact ms':>11}"
+    )
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            seed_store(path, size)
+
+            start = time.perf_counter()
+            store = LocalMemoryStore(path)
+            reopen_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            for i in range(args.adds):
+                store.add(f"new memory {i}", MemoryCategory.CONTEXT)
+            log_ms = (time.perf_counter() - start) * 1000 / args.adds
+
+            start = time.perf_counter()
+            store.compact()
+            compact_ms = (time.perf_counter() - start) * 1000
+            store.close()
+
+        json_ms = json_rewrite_add_ms(size, args.adds)
+        print(
+            f"{size:>10} {json_ms:>12.2f} {log_ms:>11.3f} "
+            f"{reopen_ms:>10.1f} {compact_ms:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
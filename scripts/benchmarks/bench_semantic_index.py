@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Semantic Memory Index Benchmark
+
+Measures recall@k against exact search and per-query latency for the
+VectorIndex at several sizes, for exact brute force and IVF at a range of
+``nprobe`` values, plus batched embedding throughput and IVF training time:
+    python scripts/benchmarks/bench_semantic_index.py
+    python scripts/benchmarks/bench_semantic_index.py --sizes 10000 --nprobe 4 16 64
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.memory.semantic_index import HashingEmbedder, VectorIndex  # noqa: E402
+
+TOPICS = [
+    "deploy docker container kubernetes helm cluster",
+    "pytest fixture mock coverage assertion test",
+    "cache redis ttl eviction memoize invalidate",
+    "database sqlite postgres migration index query",
+    "async await event loop task queue worker",
+    "auth token oauth jwt session login",
+    "react vue component state props render",
+    "lint ruff mypy format style typing",
+    "error timeout retry backoff circuit breaker",
+    "build wheel package pip uv dependency",
+]
+
+
+def make_texts(count: int, rng: random.Random) -> list[str]:
+    """Memories drawn mostly from one topic, with some cross-topic noise."""
+    topics = [t.split() for t in TOPICS]
+    texts = []
+    for _ in range(count):
+        words = rng.choices(rng.choice(topics), k=rng.randint(4, 10))
+        words += rng.choices(rng.choice(topics), k=2)
+        texts.append(" ".join(words))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Semantic memory index benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    embedder = HashingEmbedder()
+
+    for size in args.sizes:
+        texts = make_texts(size, rng)
+        queries = make_texts(args.queries, rng)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index = VectorIndex(Path(tmp), embedder, ann_threshold=0, batch_size=256)
+
+            start = time.perf_counter()
+            index.add_many((f"m{i}", text) for i, text in enumerate(texts))
+            index.flush()
+            embed_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index.search(queries[0], args.k)  # trains the IVF lists
+            train_ms = (time.perf_counter() - start) * 1000
+            lists = index.get_stats()["ivf_lists"]
+
+            print(
+                f"\n{size} memories: embed {size / embed_s:,.0f} docs/s, "
+                f"IVF train {train_ms:.0f}ms ({lists} lists)"
+            )
+            print(f"{'mode':<14} {'recall@' + str(args.k):>10} {'ms/query':>10}")
+
+            start = time.perf_counter()
+            exact = [
+                {d for d, _ in index.search(q, args.k, exact=True)} for q in queries
+            ]
+            exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+            print(f"{'exact':<14} {1.0:>10.3f} {exact_ms:>10.3f}")
+
+            for nprobe in args.nprobe:
+                index.nprobe = nprobe
+                start = time.perf_counter()
+                approx = [{d for d, _ in index.search(q, args.k)} for q in queries]
+                ivf_ms = (time.perf_counter() - start) * 1000 / len(queries)
+                recall = sum(
+                    len(e & a) / max(1, len(e))
+                    for e, a in zip(exact, approx, strict=True)
+                ) / len(queries)
+                label = f"ivf nprobe={nprobe}"
+                print(f"{label:<14} {recall:>10.3f} {ivf_ms:>10.3f}")
+            index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -539,26 +539,15 @@ class DependencyAnalyzer:
                                 package_name=name,
                                 dep_a=dep_a,
                                 dep_b=dep_b,
-                                reason=f"Version specs may conflict: '{dep_a.version_spec}' vs '{dep_b.version_spec}'",
-                                resolvable=True,
+                                reason=f"Version specs conflict: '{dep_a.version_spec}' vs '{dep_b.version_spec}'",
+                                resolvable=False,
                             )
                         )
 
         return conflicts
 
     def _versions_compatible(self, spec_a: str, spec_b: str) -> bool:
-        """Check if two version specs are potentially compatible."""
-        # Simple heuristic - proper resolution needs a SAT solver
-        if not spec_a or not spec_b:
-            return True  # No constraint = compatible
+        """Check if some version satisfies both specs (exact PEP 440 intersection)."""
+        from src.resolution.specifiers import specifiers_compatible
 
-        # If specs are identical, they're compatible
-        if spec_a == spec_b:
-            return True
-
-        # Check for obvious conflicts (e.g., ==1.0 vs ==2.0)
-        if spec_a.startswith("==") and spec_b.startswith("=="):
-            return spec_a == spec_b
-
-        # Otherwise assume potentially compatible (needs real resolver)
-        return True
+        return specifiers_compatible(spec_a, spec_b)
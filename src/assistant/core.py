@@ -19,6 +19,7 @@ from typing import Any
 
 from src.core.config import get_settings
 from src.core.security import get_secure_logger
+from src.llm.scheduler import RequestLane, request_lane
 
 secure_logger = get_secure_logger(__name__)
 
@@ -292,7 +293,8 @@ When responding:
                 prompt += f"{msg['role'].upper()}: {msg['content']}\n"
             prompt += "ASSISTANT: "
 
-            result = await llm.complete(prompt)
+            with request_lane(RequestLane.INTERACTIVE):
+                result = await llm.complete(prompt)
             return result.content if hasattr(result, "content") else str(result)
 
         except Exception as e:
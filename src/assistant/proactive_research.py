@@ -25,6 +25,7 @@ from enum import Enum
 from typing import Any
 
 from src.core.security import get_secure_logger
+from src.utils.quota_broker import QuotaPriority, quota_priority
 
 secure_logger = get_secure_logger(__name__)
 
@@ -236,7 +237,9 @@ class ProactiveResearchEngine:
             # Only research if we haven't at this depth yet
             if self._current_depth != target_depth:
                 self._current_depth = target_depth
-                await self._do_research(target_depth)
+                # Idle-time research yields API quota to interactive searches
+                with quota_priority(QuotaPriority.BACKGROUND):
+                    await self._do_research(target_depth)
 
     async def _do_research(self, depth: ResearchDepth):
         """Perform research at specified depth."""
@@ -10,13 +10,21 @@ Central coordinator for seamless automation:
 """
 
 import asyncio
+import heapq
+import random
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from src.automation.metrics import ActionTimer, get_metrics_collector
+from src.automation.metrics import (
+    ActionTimer,
+    MetricsCollector,
+    TimingRecord,
+    get_metrics_collector,
+)
 from src.automation.testing import IntegrationTester, TestSuiteResult, get_default_tests
 from src.core.security import get_secure_logger
 
@@ -50,14 +58,27 @@ class SystemEvent:
 
 @dataclass
 class ScheduledTask:
-    """A scheduled task."""
+    """
+    A scheduled task.
+
+    max_instances caps concurrent runs; a due run that would exceed it is
+    skipped. With coalesce, runs missed while the loop was busy collapse
+    into a single run instead of firing back-to-back. jitter_seconds adds a
+    random delay to each run so tasks sharing an interval do not fire
+    together.
+    """
 
     name: str
     task_func: Callable[[], Awaitable[Any]]
-    interval_seconds: int
+    interval_seconds: float
     last_run: datetime | None = None
     enabled: bool = True
     run_immediately: bool = False
+    max_instances: int = 1
+    coalesce: bool = True
+    jitter_seconds: float = 0.0
+    run_count: int = 0
+    skipped_count: int = 0
 
 
 @dataclass
@@ -111,7 +132,18 @@ class AutomationCoordinator:
         self._events: list[SystemEvent] = []
         self._event_handlers: dict[EventType, list[Callable]] = {}
         self._scheduled_tasks: dict[str, ScheduledTask] = {}
+        # Timer heap of (fire time, sequence, task name, generation, due).
+        # The fire time is the jittered due time; the next run is scheduled
+        # from the un-jittered due time. Entries whose generation no longer
+        # matches are stale and dropped.
+        self._timer_heap: list[tuple[float, int, str, int, float]] = []
+        self._timer_seq = 0
+        self._task_generations: dict[str, int] = {}
+        self._task_instances: dict[str, set[asyncio.Task]] = {}
+        self._scheduler_wakeup = asyncio.Event()
         self._metrics = get_metrics_collector()
+        # Dispatch lateness per task, kept apart from the action history
+        self._lateness = MetricsCollector(max_samples=200)
         self._tester = IntegrationTester()
         self._n8n = None
         self._background_tasks: list[asyncio.Task] = []
@@ -198,12 +230,16 @@ class AutomationCoordinator:
         """Stop the automation coordinator."""
         self._running = False
 
-        # Cancel background tasks
-        for task in self._background_tasks:
+        # Cancel background tasks and in-flight scheduled runs
+        instances = [t for runs in self._task_instances.values() for t in runs]
+        for task in self._background_tasks + instances:
             task.cancel()
 
-        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await asyncio.gather(
+            *self._background_tasks, *instances, return_exceptions=True
+        )
         self._background_tasks.clear()
+        self._task_instances.clear()
 
         if self._n8n:
             await self._n8n.close()
@@ -297,48 +333,117 @@ class AutomationCoordinator:
     # ============================================
 
     def schedule(self, task: ScheduledTask):
-        """Schedule a task."""
+        """Schedule a task (replaces any task with the same name)."""
+        if task.interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive: {task.name}")
         self._scheduled_tasks[task.name] = task
+        generation = self._task_generations.get(task.name, 0) + 1
+        self._task_generations[task.name] = generation
+
+        now = time.monotonic()
+        if task.run_immediately and task.last_run is None:
+            due = now
+        elif task.last_run is not None:
+            since_last = (datetime.now() - task.last_run).total_seconds()
+            due = now + max(0.0, task.interval_seconds - since_last)
+        else:
+            due = now + task.interval_seconds
+        self._push_timer(task, due)
 
     def unschedule(self, name: str):
         """Unschedule a task."""
-        self._scheduled_tasks.pop(name, None)
+        if self._scheduled_tasks.pop(name, None) is not None:
+            # Invalidate heap entries lazily; they are dropped when popped
+            self._task_generations[name] = self._task_generations.get(name, 0) + 1
+            self._scheduler_wakeup.set()
+
+    def _push_timer(self, task: ScheduledTask, due: float):
+        """Push the next run of a task onto the timer heap."""
+        fire_at = due
+        if task.jitter_seconds > 0:
+            fire_at += random.uniform(0, task.jitter_seconds)
+        self._timer_seq += 1
+        generation = self._task_generations[task.name]
+        heapq.heappush(
+            self._timer_heap,
+            (fire_at, self._timer_seq, task.name, generation, due),
+        )
+        self._scheduler_wakeup.set()
 
     async def _scheduler_loop(self):
-        """Run scheduled tasks."""
+        """Sleep until the next due task, then dispatch every due task."""
         while self._running:
             try:
-                now = datetime.now()
-
-                for _name, task in self._scheduled_tasks.items():
-                    if not task.enabled:
-                        continue
-
-                    should_run = False
-
-                    if (
-                        task.run_immediately
-                        and task.last_run is None
-                        or task.last_run is None
-                        or (now - task.last_run).total_seconds()
-                        >= task.interval_seconds
-                    ):
-                        should_run = True
-
-                    if should_run:
-                        task.last_run = now
-                        asyncio.create_task(self._run_scheduled_task(task))
-
-                await asyncio.sleep(1)
+                self._scheduler_wakeup.clear()
+                timeout = None
+                if self._timer_heap:
+                    timeout = self._timer_heap[0][0] - time.monotonic()
+
+                if timeout is None or timeout > 0:
+                    try:
+                        await asyncio.wait_for(self._scheduler_wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                self._dispatch_due_tasks()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 secure_logger.error(f"Scheduler error: {e}")
                 await asyncio.sleep(5)
 
-    async def _run_scheduled_task(self, task: ScheduledTask):
+    def _dispatch_due_tasks(self):
+        """Pop and launch all due timers, re-arming each for its next run."""
+        now = time.monotonic()
+        while self._timer_heap and self._timer_heap[0][0] <= now:
+            fire_at, _seq, name, generation, due = heapq.heappop(self._timer_heap)
+            task = self._scheduled_tasks.get(name)
+            if task is None or generation != self._task_generations.get(name):
+                continue
+
+            next_due = due + task.interval_seconds
+            if task.coalesce and next_due <= now:
+                missed = int((now - next_due) // task.interval_seconds) + 1
+                next_due += missed * task.interval_seconds
+            self._push_timer(task, next_due)
+
+            if not task.enabled:
+                continue
+
+            instances = self._task_instances.setdefault(name, set())
+            if len(instances) >= task.max_instances:
+                task.skipped_count += 1
+                secure_logger.debug(
+                    f"Skipping {name}: {len(instances)} instance(s) still running"
+                )
+                continue
+
+            lateness_ms = (now - fire_at) * 1000
+            self._lateness.record(
+                TimingRecord(
+                    action=name,
+                    start_time=fire_at,
+                    end_time=now,
+                    duration_ms=lateness_ms,
+                    success=True,
+                )
+            )
+
+            task.last_run = datetime.now()
+            task.run_count += 1
+            run = asyncio.create_task(self._run_scheduled_task(task, lateness_ms))
+            instances.add(run)
+            run.add_done_callback(instances.discard)
+
+    async def _run_scheduled_task(
+        self,
+        task: ScheduledTask,
+        lateness_ms: float = 0.0,
+    ):
         """Run a scheduled task."""
-        async with ActionTimer(f"scheduled_{task.name}", self._metrics):
+        async with ActionTimer(f"scheduled_{task.name}", self._metrics) as timer:
+            timer.add_metadata({"lateness_ms": round(lateness_ms, 2)})
             try:
                 await task.task_func()
             except Exception as e:
@@ -447,6 +552,7 @@ class AutomationCoordinator:
             "running": self._running,
             "n8n_enabled": self.config.n8n_enabled,
             "scheduled_tasks": list(self._scheduled_tasks.keys()),
+            "scheduler": self.get_scheduler_stats(),
             "event_count": len(self._events),
             "recent_events": [
                 {
@@ -458,6 +564,22 @@ class AutomationCoordinator:
             ],
         }
 
+    def get_scheduler_stats(self) -> dict[str, Any]:
+        """Get per-task run counts, overlap skips and lateness percentiles."""
+        stats = {}
+        for name, task in self._scheduled_tasks.items():
+            lateness = self._lateness.get_metrics(name)
+            duration = self._metrics.get_metrics(f"scheduled_{name}")
+            stats[name] = {
+                "enabled": task.enabled,
+                "runs": task.run_count,
+                "skipped": task.skipped_count,
+                "running": len(self._task_instances.get(name, ())),
+                "lateness_ms": lateness.to_dict() if lateness else None,
+                "duration_ms": duration.to_dict() if duration else None,
+            }
+        return stats
+
     def get_metrics_summary(self) -> dict[str, Any]:
         """Get metrics summary."""
         return self._metrics.get_summary()
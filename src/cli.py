@@ -350,6 +350,7 @@ def synthesize_project(
                 "project_name": project_name,
                 "output_path": output_path,
                 "template": template,
+                "wait": True,
             }
         )
 
@@ -25,19 +25,23 @@ from src.cli_executor.error_recovery import (
 )
 from src.cli_executor.executor import (
     CLIExecutor,
+    CommandQueue,
     CommandResult,
     ExecutionMode,
     ExecutorConfig,
     ShellType,
+    get_command_queue,
 )
 
 __all__ = [
     # Executor
     "CLIExecutor",
+    "CommandQueue",
     "CommandResult",
     "ExecutionMode",
     "ExecutorConfig",
     "ShellType",
+    "get_command_queue",
     # Error Recovery
     "ErrorRecovery",
     "ErrorPattern",
@@ -36,9 +36,12 @@ from pathlib import Path
 from src.cli_executor.error_recovery import ErrorRecovery
 from src.cli_executor.executor import (
     CLIExecutor,
+    CommandQueue,
     CommandResult,
     ExecutionMode,
     ExecutorConfig,
+    OutputCallback,
+    get_command_queue,
 )
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,7 @@ class AgentCLI:
         working_dir: Path | None = None,
         auto_recover: bool = True,
         config: ExecutorConfig | None = None,
+        command_queue: CommandQueue | None = None,
     ):
         """
         Initialize AgentCLI.
@@ -65,13 +69,15 @@ class AgentCLI:
             working_dir: Default working directory for commands
             auto_recover: Whether to automatically attempt error recovery
             config: Custom executor configuration
+            command_queue: Concurrency limit for commands (defaults to the
+                process-wide queue shared by all agents)
         """
         self.working_dir = working_dir or Path.cwd()
         self.auto_recover = auto_recover
 
         # Initialize executor and recovery
         config = config or ExecutorConfig(working_dir=self.working_dir)
-        self.executor = CLIExecutor(config)
+        self.executor = CLIExecutor(config, command_queue or get_command_queue())
         self.recovery = ErrorRecovery(self.executor)
 
         logger.info(f"AgentCLI initialized with working_dir={self.working_dir}")
@@ -82,6 +88,7 @@ class AgentCLI:
         working_dir: Path | None = None,
         auto_recover: bool | None = None,
         mode: ExecutionMode | None = None,
+        on_output: OutputCallback | None = None,
     ) -> CommandResult:
         """
         Execute a command with optional recovery.
@@ -91,6 +98,7 @@ class AgentCLI:
             working_dir: Override working directory
             auto_recover: Override auto-recovery setting
             mode: Execution mode (LOCAL, DOCKER, WSL)
+            on_output: Called with (stream, line) as output arrives
 
         Returns:
             CommandResult
@@ -103,9 +111,12 @@ class AgentCLI:
                 command,
                 working_dir=str(wd),
                 auto_recover=True,
+                on_output=on_output,
             )
         else:
-            return await self.executor.execute(command, working_dir=wd, mode=mode)
+            return await self.executor.execute(
+                command, working_dir=wd, mode=mode, on_output=on_output
+            )
 
     # ========================================================================
     # GIT OPERATIONS
@@ -680,15 +691,19 @@ class AgentCLI:
         command: str,
         path: Path | None = None,
         auto_recover: bool = True,
+        on_output: OutputCallback | None = None,
     ) -> CommandResult:
         """Run a raw command (escape hatch for custom commands)."""
-        return await self._run(command, working_dir=path, auto_recover=auto_recover)
+        return await self._run(
+            command, working_dir=path, auto_recover=auto_recover, on_output=on_output
+        )
 
     def get_stats(self) -> dict:
         """Get execution statistics."""
         return {
             "executor_stats": self.executor.get_stats(),
             "recovery_success_rate": self.recovery.get_success_rate(),
+            "command_queue": self.executor.command_queue.get_stats(),
         }
 
     def get_history(self, limit: int = 50) -> list[CommandResult]:
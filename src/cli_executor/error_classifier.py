@@ -0,0 +1,245 @@
+"""
+VIBE MCP - Error Classifier
+
+Precompiled, shared classifier for command output. Used by CLIExecutor to
+categorize failures and by ErrorRecovery to pick a recovery pattern.
+
+Each rule is compiled once. Before any regex runs, a required literal
+extracted from the pattern is checked against the lowercased text with a
+plain substring search, so on a typical log only the handful of rules
+whose keywords actually occur are evaluated. The tail of the output is
+scanned first, since build tools print the error that matters last; the
+rest is scanned only when the tail matches nothing.
+
+Usage:
+    classifier = get_default_classifier()
+    match = classifier.classify(stderr + stdout)
+    if match:
+        print(match.error_type, match.capture)
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from src.cli_executor.executor import ErrorType
+
+# Trailing characters scanned before falling back to the full output
+DEFAULT_TAIL_CHARS = 64 * 1024
+
+_REGEX_META = set(".^$*+?{}[]|()\\")
+_QUANTIFIERS = set("*+?{")
+_BRACE_QUANTIFIER = re.compile(r"\{\d*(?:,\d*)?\}")
+
+
+@dataclass(frozen=True)
+class ClassifierRule:
+    """A single classification pattern."""
+
+    name: str
+    error_type: ErrorType
+    pattern: str
+    payload: Any = None  # e.g. the ErrorPattern this rule came from
+
+
+@dataclass(frozen=True)
+class ErrorMatch:
+    """Result of classifying a piece of output."""
+
+    rule: ClassifierRule
+    capture: str | None = None
+
+    @property
+    def error_type(self) -> ErrorType:
+        return self.rule.error_type
+
+
+def required_literal(pattern: str) -> str | None:
+    """
+    Extract the longest literal run every match of ``pattern`` must contain.
+
+    Conservative: groups, classes and alternations end a run, and a
+    character followed by a quantifier is dropped. Returns None when no
+    usable literal exists (the rule is then always evaluated).
+    """
+    runs: list[str] = []
+    current: list[str] = []
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal = None
+
+        if in_class:
+            if char == "\\":
+                i += 1
+            elif char == "]":
+                in_class = False
+        elif char == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            i += 1
+            if not nxt.isalnum():
+                literal = nxt
+        elif char == "[":
+            in_class = True
+        elif char == "{":
+            # Skip a {n} / {m,n} body so its digits are not taken as literals
+            quantifier = _BRACE_QUANTIFIER.match(pattern, i)
+            if quantifier:
+                i = quantifier.end() - 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return None
+        elif char not in _REGEX_META and depth == 0:
+            literal = char
+
+        quantified = i + 1 < len(pattern) and pattern[i + 1] in _QUANTIFIERS
+        if literal is not None and not quantified:
+            current.append(literal)
+        else:
+            if current:
+                runs.append("".join(current))
+            current = []
+        i += 1
+
+    if current:
+        runs.append("".join(current))
+    best = max(runs, key=len, default="")
+    return best.lower() if len(best) >= 3 else None
+
+
+class ErrorClassifier:
+    """
+    Classifies output against an ordered list of rules.
+
+    The first rule (in list order) that matches wins, which keeps the
+    priority semantics of the per-pattern loops this replaces.
+    """
+
+    def __init__(
+        self,
+        rules: list[ClassifierRule],
+        tail_chars: int = DEFAULT_TAIL_CHARS,
+        flags: int = re.IGNORECASE | re.MULTILINE,
+    ):
+        self.rules = list(rules)
+        self.tail_chars = tail_chars
+        self._compiled = [
+            (rule, required_literal(rule.pattern), re.compile(rule.pattern, flags))
+            for rule in self.rules
+        ]
+
+    def classify(self, *texts: str) -> ErrorMatch | None:
+        """
+        Return the highest-priority match in ``texts``.
+
+        The tail of each text is scanned first; the full texts are scanned
+        only when the tails match nothing.
+        """
+        texts = tuple(t for t in texts if t)
+        if not texts:
+            return None
+        tails = [t[-self.tail_chars :] for t in texts]
+        match = self._search("\n".join(tails))
+        if match is None and any(len(t) > self.tail_chars for t in texts):
+            match = self._search("\n".join(texts))
+        return match
+
+    def classify_type(self, *texts: str) -> ErrorType:
+        """Return just the error type (UNKNOWN when nothing matches)."""
+        match = self.classify(*texts)
+        return match.error_type if match else ErrorType.UNKNOWN
+
+    def _search(self, text: str) -> ErrorMatch | None:
+        lowered = text.lower()
+        for rule, literal, regex in self._compiled:
+            if literal is not None and literal not in lowered:
+                continue
+            match = regex.search(text)
+            if match:
+                capture = match.group(1) if match.lastindex else None
+                return ErrorMatch(rule=rule, capture=capture)
+        return None
+
+
+# Patterns used to categorize failed commands, in priority order
+DEFAULT_ERROR_TYPE_PATTERNS: dict[ErrorType, list[str]] = {
+    ErrorType.DEPENDENCY_MISSING: [
+        r"modulenotfounderror",
+        r"importerror",
+        r"cannot find module",
+        r"no module named",
+        r"package .* is not installed",
+        r"command not found",
+        r"'.*' is not recognized",
+        r"npm err! 404",
+        r"could not find a version",
+    ],
+    ErrorType.PERMISSION_DENIED: [
+        r"permission denied",
+        r"access is denied",
+        r"eacces",
+        r"operation not permitted",
+        r"requires elevation",
+        r"run as administrator",
+    ],
+    ErrorType.FILE_NOT_FOUND: [
+        r"filenotfounderror",
+        r"no such file or directory",
+        r"cannot find path",
+        r"the system cannot find",
+        r"enoent",
+    ],
+    ErrorType.SYNTAX_ERROR: [
+        r"syntaxerror",
+        r"unexpected token",
+        r"parsing error",
+        r"invalid syntax",
+    ],
+    ErrorType.VERSION_CONFLICT: [
+        r"version conflict",
+        r"incompatible versions",
+        r"version .* not found",
+        r"requires python",
+        r"unsupported python",
+    ],
+    ErrorType.NETWORK_ERROR: [
+        r"connection refused",
+        r"network unreachable",
+        r"timeout",
+        r"could not resolve host",
+        r"ssl certificate",
+        r"connection reset",
+    ],
+    ErrorType.DOCKER_ERROR: [
+        r"docker daemon",
+        r"cannot connect to docker",
+        r"docker: error",
+        r"no such container",
+        r"image not found",
+    ],
+    ErrorType.GIT_ERROR: [
+        r"fatal: not a git repository",
+        r"git: command not found",
+        r"failed to push",
+        r"merge conflict",
+        r"authentication failed",
+    ],
+}
+
+
+@lru_cache(maxsize=1)
+def get_default_classifier() -> ErrorClassifier:
+    """Get the shared classifier for DEFAULT_ERROR_TYPE_PATTERNS."""
+    return ErrorClassifier(
+        [
+            ClassifierRule(name=error_type.value, error_type=error_type, pattern=p)
+            for error_type, patterns in DEFAULT_ERROR_TYPE_PATTERNS.items()
+            for p in patterns
+        ]
+    )
@@ -17,11 +17,16 @@ Usage:
 
 import asyncio
 import logging
-import re
 from dataclasses import dataclass
 from enum import Enum
 
-from src.cli_executor.executor import CLIExecutor, CommandResult, ErrorType
+from src.cli_executor.error_classifier import ClassifierRule, ErrorClassifier
+from src.cli_executor.executor import (
+    CLIExecutor,
+    CommandResult,
+    ErrorType,
+    OutputCallback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -245,6 +250,8 @@ class ErrorRecovery:
         self.patterns = patterns or DEFAULT_ERROR_PATTERNS
         self.max_retries = max_retries
         self._recovery_history: list[RecoveryResult] = []
+        self._classifier: ErrorClassifier | None = None
+        self._classifier_source: list[ErrorPattern] | None = None
 
         # Package name mappings (import name -> pip package)
         self._package_mappings = {
@@ -259,16 +266,30 @@ class ErrorRecovery:
             "dateutil": "python-dateutil",
         }
 
+    def _get_classifier(self) -> ErrorClassifier:
+        """Compile self.patterns once (recompiled if the list is replaced)."""
+        if self._classifier is None or self._classifier_source is not self.patterns:
+            self._classifier = ErrorClassifier(
+                [
+                    ClassifierRule(
+                        name=pattern.name,
+                        error_type=pattern.error_type,
+                        pattern=regex,
+                        payload=pattern,
+                    )
+                    for pattern in self.patterns
+                    for regex in pattern.patterns
+                ]
+            )
+            self._classifier_source = self.patterns
+        return self._classifier
+
     def _match_pattern(self, error_text: str) -> tuple[ErrorPattern | None, str | None]:
         """Match error text against patterns and extract info."""
-        for pattern in self.patterns:
-            for regex in pattern.patterns:
-                match = re.search(regex, error_text, re.IGNORECASE | re.MULTILINE)
-                if match:
-                    # Extract captured group if available
-                    extracted = match.group(1) if match.lastindex else None
-                    return pattern, extracted
-        return None, None
+        match = self._get_classifier().classify(error_text)
+        if match is None:
+            return None, None
+        return match.rule.payload, match.capture
 
     def _resolve_package_name(self, import_name: str) -> str:
         """Resolve import name to actual package name."""
@@ -418,6 +439,7 @@ class ErrorRecovery:
         command: str,
         working_dir: str | None = None,
         auto_recover: bool = True,
+        on_output: OutputCallback | None = None,
     ) -> CommandResult:
         """
         Execute command with automatic recovery on failure.
@@ -426,11 +448,14 @@ class ErrorRecovery:
             command: Command to execute
             working_dir: Working directory
             auto_recover: Whether to attempt auto-recovery
+            on_output: Called with (stream, line) as output arrives
 
         Returns:
             Final CommandResult (either original success or recovered)
         """
-        result = await self.executor.execute(command, working_dir=working_dir)
+        result = await self.executor.execute(
+            command, working_dir=working_dir, on_output=on_output
+        )
 
         if result.success or not auto_recover:
             return result
@@ -8,13 +8,21 @@ Features:
 - Multiple execution modes: LOCAL, DOCKER, WSL, REMOTE
 - Blocked dangerous commands
 - Timeout handling
-- Error type detection
+- Error type detection, streamed while the command runs
 - Async execution support
+- Line-by-line output streaming with bounded tail buffers
+- Shared concurrency-limited command queue
 
 Usage:
     executor = CLIExecutor()
     result = await executor.execute("pip install requests")
 
+    # Stream output as it arrives
+    result = await executor.execute(
+        "npm install",
+        on_output=lambda stream, line: print(stream, line),
+    )
+
     if result.success:
         print(result.stdout)
     else:
@@ -22,15 +30,20 @@ Usage:
 """
 
 import asyncio
+import inspect
 import logging
 import os
 import re
 import subprocess
 import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+from src.core.realtime import EventType, get_event_bus
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,6 +95,7 @@ class CommandResult:
     suggested_fix: str | None = None
     execution_mode: ExecutionMode = ExecutionMode.LOCAL
     working_dir: str | None = None
+    output_truncated: bool = False
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -96,9 +110,122 @@ class CommandResult:
             "suggested_fix": self.suggested_fix,
             "execution_mode": self.execution_mode.value,
             "working_dir": self.working_dir,
+            "output_truncated": self.output_truncated,
+        }
+
+
+# Callback receiving ("stdout" | "stderr", line) for each line of output
+OutputCallback = Callable[[str, str], Awaitable[None] | None]
+
+
+@dataclass
+class ProcessOutput:
+    """Captured output of a finished subprocess."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+    truncated: bool = False
+    detected_error_type: ErrorType | None = None  # Last type seen live
+
+
+class CommandTimeoutError(TimeoutError):
+    """A command ran past its timeout; carries the output captured so far."""
+
+    def __init__(self, output: ProcessOutput):
+        super().__init__("command timed out")
+        self.output = output
+
+
+class TailBuffer:
+    """Keeps the last ``max_bytes`` worth of lines from a stream."""
+
+    def __init__(self, max_bytes: int):
+        self._lines: deque[str] = deque()
+        self._size = 0
+        self._max_bytes = max_bytes
+        self.truncated = False
+
+    def append(self, line: str) -> None:
+        self._lines.append(line)
+        self._size += len(line)
+        while self._size > self._max_bytes and len(self._lines) > 1:
+            self._size -= len(self._lines.popleft())
+            self.truncated = True
+
+    def getvalue(self) -> str:
+        return "".join(self._lines)
+
+
+class CommandQueue:
+    """
+    Concurrency limit shared by executors.
+
+    Commands beyond ``max_concurrent`` wait in FIFO order, so a burst of
+    long-running installs or test runs cannot starve other agents' commands.
+    """
+
+    def __init__(self, max_concurrent: int = 4):
+        self.max_concurrent = max_concurrent
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.running = 0
+        self.waiting = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.completed = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._semaphore
+
+    async def __aenter__(self) -> "CommandQueue":
+        semaphore = self._get_semaphore()
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.running += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.running -= 1
+        self.completed += 1
+        self._get_semaphore().release()
+
+    def get_stats(self) -> dict:
+        """Get queue depth and wait-time statistics."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "avg_wait_ms": (
+                self.total_wait_ms / self.completed if self.completed else 0.0
+            ),
+            "max_wait_ms": self.max_wait_ms,
         }
 
 
+_command_queue: CommandQueue | None = None
+
+
+def get_command_queue() -> CommandQueue:
+    """Get or create the process-wide command queue."""
+    global _command_queue
+    if _command_queue is None:
+        _command_queue = CommandQueue()
+    return _command_queue
+
+
 @dataclass
 class ExecutorConfig:
     """Configuration for CLI executor."""
@@ -159,6 +286,10 @@ class ExecutorConfig:
     # WSL settings
     wsl_distro: str | None = None
 
+    # Streaming settings
+    output_tail_bytes: int = 1024 * 1024  # per stream
+    publish_events: bool = False  # stream command events to the EventBus
+
 
 class CLIExecutor:
     """
@@ -171,11 +302,23 @@ class CLIExecutor:
     - Automatic error type detection
     - Timeout handling
     - Async execution support
+    - Streaming output with bounded memory
     """
 
-    def __init__(self, config: ExecutorConfig | None = None):
-        """Initialize the CLI executor."""
+    def __init__(
+        self,
+        config: ExecutorConfig | None = None,
+        command_queue: CommandQueue | None = None,
+    ):
+        """
+        Initialize the CLI executor.
+
+        Args:
+            config: Executor configuration
+            command_queue: Concurrency limit to run under (None = unlimited)
+        """
         self.config = config or ExecutorConfig()
+        self.command_queue = command_queue
         self._detect_environment()
         self._command_history: list[CommandResult] = []
 
@@ -241,79 +384,10 @@ class CLIExecutor:
         return False
 
     def _detect_error_type(self, stderr: str, stdout: str = "") -> ErrorType:
-        """Detect the type of error from stderr/stdout."""
-        combined = f"{stderr} {stdout}".lower()
-
-        patterns = {
-            ErrorType.DEPENDENCY_MISSING: [
-                r"modulenotfounderror",
-                r"importerror",
-                r"cannot find module",
-                r"no module named",
-                r"package .* is not installed",
-                r"command not found",
-                r"'.*' is not recognized",
-                r"npm err! 404",
-                r"could not find a version",
-            ],
-            ErrorType.PERMISSION_DENIED: [
-                r"permission denied",
-                r"access is denied",
-                r"eacces",
-                r"operation not permitted",
-                r"requires elevation",
-                r"run as administrator",
-            ],
-            ErrorType.FILE_NOT_FOUND: [
-                r"filenotfounderror",
-                r"no such file or directory",
-                r"cannot find path",
-                r"the system cannot find",
-                r"enoent",
-            ],
-            ErrorType.SYNTAX_ERROR: [
-                r"syntaxerror",
-                r"unexpected token",
-                r"parsing error",
-                r"invalid syntax",
-            ],
-            ErrorType.VERSION_CONFLICT: [
-                r"version conflict",
-                r"incompatible versions",
-                r"version .* not found",
-                r"requires python",
-                r"unsupported python",
-            ],
-            ErrorType.NETWORK_ERROR: [
-                r"connection refused",
-                r"network unreachable",
-                r"timeout",
-                r"could not resolve host",
-                r"ssl certificate",
-                r"connection reset",
-            ],
-            ErrorType.DOCKER_ERROR: [
-                r"docker daemon",
-                r"cannot connect to docker",
-                r"docker: error",
-                r"no such container",
-                r"image not found",
-            ],
-            ErrorType.GIT_ERROR: [
-                r"fatal: not a git repository",
-                r"git: command not found",
-                r"failed to push",
-                r"merge conflict",
-                r"authentication failed",
-            ],
-        }
-
-        for error_type, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                if re.search(pattern, combined, re.IGNORECASE):
-                    return error_type
+        """Detect the type of error from stderr/stdout, tails first."""
+        from src.cli_executor.error_classifier import get_default_classifier
 
-        return ErrorType.UNKNOWN
+        return get_default_classifier().classify_type(stderr, stdout)
 
     async def execute(
         self,
@@ -322,6 +396,7 @@ class CLIExecutor:
         working_dir: Path | None = None,
         timeout: int | None = None,
         env: dict | None = None,
+        on_output: OutputCallback | None = None,
     ) -> CommandResult:
         """
         Execute a CLI command.
@@ -332,6 +407,7 @@ class CLIExecutor:
             working_dir: Working directory for the command
             timeout: Timeout in seconds
             env: Additional environment variables
+            on_output: Called with (stream, line) as output arrives
 
         Returns:
             CommandResult with execution details
@@ -361,40 +437,75 @@ class CLIExecutor:
         if self._is_command_dangerous(command):
             logger.warning(f"Executing potentially dangerous command: {command}")
 
+        self._publish(
+            EventType.COMMAND_STARTED, {"command": command, "mode": mode.value}
+        )
+
         try:
             if mode == ExecutionMode.LOCAL:
-                result = await self._execute_local(command, working_dir, timeout, env)
+                argv = self._build_local_command(command)
             elif mode == ExecutionMode.DOCKER:
-                result = await self._execute_docker(command, working_dir, timeout, env)
+                argv = self._build_docker_command(command, working_dir, env)
             elif mode == ExecutionMode.WSL:
-                result = await self._execute_wsl(command, working_dir, timeout, env)
+                argv = self._build_wsl_command(command, working_dir)
             elif mode == ExecutionMode.REMOTE:
                 raise NotImplementedError("Remote execution not yet implemented")
             else:
                 raise ValueError(f"Unsupported execution mode: {mode}")
 
+            cmd_env = None
+            if mode == ExecutionMode.LOCAL:
+                cmd_env = os.environ.copy()
+                if env:
+                    cmd_env.update(env)
+                cwd = working_dir
+            else:
+                cwd = None
+
+            if self.command_queue is None:
+                result = await self._run_process(
+                    command, argv, cwd, cmd_env, timeout, on_output
+                )
+            else:
+                async with self.command_queue:
+                    result = await self._run_process(
+                        command, argv, cwd, cmd_env, timeout, on_output
+                    )
+
             duration_ms = (time.time() - start_time) * 1000
 
-            # Detect error type if command failed
+            # The captured tail decides; the type seen while streaming covers
+            # errors that scrolled out of a truncated tail
             error_type = None
             if result.returncode != 0:
-                stderr_text = result.stderr.decode("utf-8", errors="replace")
-                stdout_text = result.stdout.decode("utf-8", errors="replace")
-                error_type = self._detect_error_type(stderr_text, stdout_text)
+                error_type = self._detect_error_type(result.stderr, result.stdout)
+                if error_type == ErrorType.UNKNOWN and result.detected_error_type:
+                    error_type = result.detected_error_type
 
             cmd_result = CommandResult(
                 command=command,
                 exit_code=result.returncode,
-                stdout=result.stdout.decode("utf-8", errors="replace"),
-                stderr=result.stderr.decode("utf-8", errors="replace"),
+                stdout=result.stdout,
+                stderr=result.stderr,
                 duration_ms=duration_ms,
                 success=result.returncode == 0,
                 error_type=error_type,
                 execution_mode=mode,
                 working_dir=str(working_dir),
+                output_truncated=result.truncated,
             )
 
             self._command_history.append(cmd_result)
+            self._publish(
+                EventType.COMMAND_COMPLETED,
+                {
+                    "command": command,
+                    "exit_code": cmd_result.exit_code,
+                    "success": cmd_result.success,
+                    "error_type": error_type.value if error_type else None,
+                    "duration_ms": duration_ms,
+                },
+            )
 
             # Log result
             if cmd_result.success:
@@ -407,18 +518,21 @@ class CLIExecutor:
 
             return cmd_result
 
-        except TimeoutError:
+        except TimeoutError as e:
             duration_ms = (time.time() - start_time) * 1000
+            partial = getattr(e, "output", None)
             result = CommandResult(
                 command=command,
                 exit_code=-1,
-                stdout="",
-                stderr=f"Command timed out after {timeout} seconds",
+                stdout=partial.stdout if partial else "",
+                stderr=(partial.stderr if partial else "")
+                + f"Command timed out after {timeout} seconds",
                 duration_ms=duration_ms,
                 success=False,
                 error_type=ErrorType.TIMEOUT,
                 execution_mode=mode,
                 working_dir=str(working_dir),
+                output_truncated=partial.truncated if partial else False,
             )
             self._command_history.append(result)
             return result
@@ -440,57 +554,28 @@ class CLIExecutor:
             self._command_history.append(result)
             return result
 
-    async def _execute_local(
-        self,
-        command: str,
-        working_dir: Path,
-        timeout: int,
-        env: dict | None = None,
-    ) -> subprocess.CompletedProcess:
-        """Execute command locally."""
-        # Build environment
-        cmd_env = os.environ.copy()
-        if env:
-            cmd_env.update(env)
-
-        # Build command based on shell
+    def _build_local_command(self, command: str) -> list[str]:
+        """Build argv for local execution."""
         if self.is_windows:
-            full_command = [
+            return [
                 "powershell",
                 "-NoProfile",
                 "-NonInteractive",
                 "-Command",
                 command,
             ]
-        else:
-            full_command = ["bash", "-c", command]
-
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: subprocess.run(
-                full_command,
-                cwd=working_dir,
-                capture_output=True,
-                timeout=timeout,
-                env=cmd_env,
-                creationflags=subprocess.CREATE_NO_WINDOW if self.is_windows else 0,
-            ),
-        )
+        return ["bash", "-c", command]
 
-    async def _execute_docker(
+    def _build_docker_command(
         self,
         command: str,
         working_dir: Path,
-        timeout: int,
         env: dict | None = None,
-    ) -> subprocess.CompletedProcess:
-        """Execute command in Docker container."""
+    ) -> list[str]:
+        """Build argv for execution in a Docker container."""
         if not self.has_docker:
             raise RuntimeError("Docker is not available")
 
-        # Build docker command
         docker_cmd = [
             "docker",
             "run",
@@ -507,26 +592,10 @@ class CLIExecutor:
                 docker_cmd.extend(["-e", f"{key}={value}"])
 
         docker_cmd.extend([self.config.docker_image, "bash", "-c", command])
+        return docker_cmd
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: subprocess.run(
-                docker_cmd,
-                capture_output=True,
-                timeout=timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW if self.is_windows else 0,
-            ),
-        )
-
-    async def _execute_wsl(
-        self,
-        command: str,
-        working_dir: Path,
-        timeout: int,
-        env: dict | None = None,
-    ) -> subprocess.CompletedProcess:
-        """Execute command in WSL."""
+    def _build_wsl_command(self, command: str, working_dir: Path) -> list[str]:
+        """Build argv for execution in WSL."""
         if not self.has_wsl:
             raise RuntimeError("WSL is not available")
 
@@ -535,25 +604,144 @@ class CLIExecutor:
         if len(wsl_path) > 1 and wsl_path[1] == ":":
             wsl_path = f"/mnt/{wsl_path[0].lower()}{wsl_path[2:]}"
 
-        # Build WSL command
-        wsl_command = f"cd {wsl_path} && {command}"
-
         wsl_cmd = ["wsl"]
         if self.config.wsl_distro:
             wsl_cmd.extend(["-d", self.config.wsl_distro])
-        wsl_cmd.extend(["bash", "-c", wsl_command])
+        wsl_cmd.extend(["bash", "-c", f"cd {wsl_path} && {command}"])
+        return wsl_cmd
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: subprocess.run(
-                wsl_cmd,
-                capture_output=True,
+    async def _run_process(
+        self,
+        command: str,
+        argv: list[str],
+        cwd: Path | None,
+        env: dict | None,
+        timeout: int,
+        on_output: OutputCallback | None = None,
+    ) -> ProcessOutput:
+        """
+        Run a subprocess natively on the event loop, streaming its output.
+
+        Both pipes are drained line by line into bounded tail buffers; each
+        line goes to ``on_output`` (and the EventBus when enabled). Lines
+        are classified as they arrive, and COMMAND_ERROR_DETECTED is
+        published whenever the detected error type changes, so a failure
+        is visible before the command exits. On timeout the process is
+        killed and CommandTimeoutError carries the output captured up to
+        that point.
+        """
+        from src.cli_executor.error_classifier import get_default_classifier
+
+        classifier = get_default_classifier()
+        detected_type: ErrorType | None = None
+
+        kwargs = {}
+        if self.is_windows:
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **kwargs,
+        )
+
+        buffers = {
+            "stdout": TailBuffer(self.config.output_tail_bytes),
+            "stderr": TailBuffer(self.config.output_tail_bytes),
+        }
+
+        async def handle_line(stream: str, line: str) -> None:
+            nonlocal detected_type
+            buffers[stream].append(line)
+            # The required-literal prefilter skips most rules on most lines
+            match = classifier.classify(line)
+            if match is not None and match.error_type != detected_type:
+                detected_type = match.error_type
+                self._publish(
+                    EventType.COMMAND_ERROR_DETECTED,
+                    {
+                        "command": command,
+                        "stream": stream,
+                        "error_type": match.error_type.value,
+                        "line": line.rstrip("\r\n"),
+                    },
+                )
+            if on_output is not None:
+                try:
+                    result = on_output(stream, line.rstrip("\r\n"))
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.warning(f"Output callback error: {e}")
+            self._publish(
+                EventType.COMMAND_OUTPUT,
+                {"command": command, "stream": stream, "line": line.rstrip("\r\n")},
+            )
+
+        async def pump(stream: str, reader: asyncio.StreamReader) -> None:
+            partial = b""
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                partial += chunk
+                *lines, partial = partial.split(b"\n")
+                for raw in lines:
+                    line = raw.decode("utf-8", errors="replace") + "\n"
+                    await handle_line(stream, line)
+                # Don't let a single unterminated line grow without bound
+                if len(partial) > self.config.output_tail_bytes:
+                    await handle_line(stream, partial.decode("utf-8", errors="replace"))
+                    partial = b""
+            if partial:
+                await handle_line(stream, partial.decode("utf-8", errors="replace"))
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    pump("stdout", process.stdout),
+                    pump("stderr", process.stderr),
+                    process.wait(),
+                ),
                 timeout=timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            ),
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if isinstance(e, asyncio.TimeoutError):
+                raise CommandTimeoutError(
+                    self._collect(-1, buffers, detected_type)
+                ) from None
+            raise
+
+        return self._collect(process.returncode, buffers, detected_type)
+
+    @staticmethod
+    def _collect(
+        returncode: int,
+        buffers: dict[str, TailBuffer],
+        detected_error_type: ErrorType | None = None,
+    ) -> ProcessOutput:
+        """Build a ProcessOutput from the stream tail buffers."""
+        return ProcessOutput(
+            returncode=returncode,
+            stdout=buffers["stdout"].getvalue(),
+            stderr=buffers["stderr"].getvalue(),
+            truncated=buffers["stdout"].truncated or buffers["stderr"].truncated,
+            detected_error_type=detected_error_type,
         )
 
+    def _publish(self, event_type: EventType, data: dict) -> None:
+        """Publish a command event to the EventBus when enabled."""
+        if not self.config.publish_events:
+            return
+        get_event_bus().emit(event_type, data, source="cli_executor")
+
     def get_history(self, limit: int = 100) -> list[CommandResult]:
         """Get command execution history."""
         return self._command_history[-limit:]
@@ -124,6 +124,19 @@ class LLMSettings(BaseSettings):
         default=True, description="Enable LM Studio integration"
     )
 
+    # Local backend admission control
+    ollama_max_concurrency: int = Field(
+        default=2, ge=1, le=32, description="Concurrent requests sent to Ollama"
+    )
+    lmstudio_max_concurrency: int = Field(
+        default=1, ge=1, le=32, description="Concurrent requests sent to LM Studio"
+    )
+    llm_max_queue: int = Field(
+        default=64,
+        ge=1,
+        description="Requests allowed to queue per local backend before rejecting",
+    )
+
     # Cloud LLM
     cloud_llm_enabled: bool = Field(
         default=False, description="Enable cloud LLM fallback"
@@ -259,6 +272,13 @@ class AppSettings(BaseSettings):
     # Server
     server_host: str = Field(default="localhost", description="Server host")
     server_port: int = Field(default=8000, description="Server port")
+    mcp_prewarm: bool = Field(
+        default=True,
+        description="Load MCP tool handlers in the background after startup",
+    )
+    mcp_prewarm_delay_seconds: float = Field(
+        default=1.0, ge=0.0, description="Delay before MCP handler pre-warm"
+    )
 
     # Paths
     default_output_dir: Path = Field(
@@ -275,6 +275,15 @@ class LLMError(SynthesizerError):
         self.code = "LLM_ERROR"
 
 
+class LLMOverloadedError(LLMError):
+    """Local LLM backend refused a request it could not serve in time."""
+
+    def __init__(self, provider: str, reason: str, retry_after: float | None = None):
+        super().__init__(provider, reason)
+        self.details["retry_after"] = retry_after
+        self.code = "LLM_OVERLOADED"
+
+
 class TimeoutError(SynthesizerError):
     """Operation timed out."""
 
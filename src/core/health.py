@@ -6,14 +6,21 @@ Professional health check system for:
 - Dependency verification
 - API connectivity checks
 - Resource availability
+
+Probes run concurrently, each under its own timeout, and the latest
+snapshot is cached. A single HealthMonitor refreshes it in the background
+and publishes only what changed to WebSocket subscribers.
 """
 
+import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from src.core.realtime import Event, EventBus, EventType, get_event_bus
 from src.core.security import get_secure_logger
 from src.core.version import get_version
 
@@ -51,6 +58,11 @@ class SystemHealth:
     components: list[ComponentHealth]
     timestamp: datetime = field(default_factory=datetime.now)
 
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since this snapshot was taken."""
+        return (datetime.now() - self.timestamp).total_seconds()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -58,6 +70,7 @@ class SystemHealth:
             "version": self.version,
             "uptime_seconds": self.uptime_seconds,
             "timestamp": self.timestamp.isoformat(),
+            "age_seconds": round(self.age_seconds, 3),
             "components": [
                 {
                     "name": c.name,
@@ -75,26 +88,63 @@ class HealthChecker:
     """
     System health checker.
 
-    Monitors all components and provides health status.
+    Monitors all components and provides health status. Probes run
+    concurrently, each bounded by ``probe_timeout``; concurrent
+    ``check_all`` calls share one run.
     """
 
-    def __init__(self):
-        """Initialize health checker."""
+    def __init__(self, probe_timeout: float = 10.0, ttl: float = 30.0):
+        """
+        Initialize health checker.
+
+        Args:
+            probe_timeout: Seconds before a probe is reported as timed out
+            ttl: Age after which ``get_snapshot`` re-checks
+        """
         self._start_time = time.time()
         self._last_check: SystemHealth | None = None
+        self._inflight: asyncio.Task | None = None
+        self.probe_timeout = probe_timeout
+        self.ttl = ttl
+        self._probes: dict[str, Callable[[], Awaitable[ComponentHealth]]] = {
+            "lm_studio": self._check_lm_studio,
+            "ollama": self._check_ollama,
+            "github": self._check_github,
+            "huggingface": self._check_huggingface,
+            "kaggle": self._check_kaggle,
+            "elevenlabs": self._check_elevenlabs,
+            "openai": self._check_openai,
+        }
+
+    @property
+    def last_check(self) -> SystemHealth | None:
+        """Most recent snapshot, however old."""
+        return self._last_check
 
     async def check_all(self) -> SystemHealth:
         """Run all health checks."""
-        components = []
-
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._run_checks())
+        # Shielded so one caller giving up does not cancel the others' check
+        return await asyncio.shield(self._inflight)
+
+    async def get_snapshot(self, max_age: float | None = None) -> SystemHealth:
+        """
+        Cached health, re-checked when older than ``max_age`` (default ttl).
+        """
+        max_age = self.ttl if max_age is None else max_age
+        health = self._last_check
+        if health is not None and health.age_seconds <= max_age:
+            return health
+        return await self.check_all()
+
+    async def _run_checks(self) -> SystemHealth:
         # Check each component
-        components.append(await self._check_lm_studio())
-        components.append(await self._check_ollama())
-        components.append(await self._check_github())
-        components.append(await self._check_huggingface())
-        components.append(await self._check_kaggle())
-        components.append(await self._check_elevenlabs())
-        components.append(await self._check_openai())
+        components = list(
+            await asyncio.gather(
+                *(self._probe(name, check) for name, check in self._probes.items())
+            )
+        )
 
         # Determine overall status
         statuses = [c.status for c in components]
@@ -116,6 +166,29 @@ class HealthChecker:
         self._last_check = health
         return health
 
+    async def _probe(
+        self, name: str, check: Callable[[], Awaitable[ComponentHealth]]
+    ) -> ComponentHealth:
+        """Run one probe under the probe timeout."""
+        start = time.time()
+        try:
+            return await asyncio.wait_for(check(), self.probe_timeout)
+        except TimeoutError:
+            return ComponentHealth(
+                name=name,
+                status=HealthStatus.DEGRADED,
+                message=f"Check timed out after {self.probe_timeout:g}s",
+                latency_ms=(time.time() - start) * 1000,
+            )
+        except Exception as e:
+            secure_logger.warning(f"Health probe {name} failed: {e}")
+            return ComponentHealth(
+                name=name,
+                status=HealthStatus.UNKNOWN,
+                message="Check failed",
+                latency_ms=(time.time() - start) * 1000,
+            )
+
     async def _check_lm_studio(self) -> ComponentHealth:
         """Check LM Studio connectivity."""
         start = time.time()
@@ -337,8 +410,116 @@ class HealthChecker:
         )
 
 
+def diff_health(
+    previous: dict[str, Any] | None, current: dict[str, Any]
+) -> dict[str, Any] | None:
+    """
+    Changes between two ``SystemHealth.to_dict()`` snapshots.
+
+    Only status and message changes count; latency and uptime drift on
+    every check and would make every diff non-empty.
+
+    Returns:
+        ``{"status", "changed", "removed"}`` or None when nothing changed
+    """
+    previous = previous or {"status": None, "components": []}
+    before = {c["name"]: c for c in previous["components"]}
+    after = {c["name"]: c for c in current["components"]}
+
+    changed = [
+        component
+        for name, component in after.items()
+        if name not in before
+        or (component["status"], component["message"])
+        != (before[name]["status"], before[name]["message"])
+    ]
+    removed = [name for name in before if name not in after]
+    if not changed and not removed and previous["status"] == current["status"]:
+        return None
+    return {
+        "status": current["status"],
+        "timestamp": current["timestamp"],
+        "changed": changed,
+        "removed": removed,
+    }
+
+
+class HealthMonitor:
+    """
+    Background health monitor shared by every dashboard WebSocket.
+
+    While anyone holds it (``acquire``/``release``), it re-checks every
+    ``interval`` seconds and publishes a ``HEALTH_CHECK`` event on the
+    event bus only when something changed. Event data is a ``diff_health``
+    diff tagged with ``version`` and ``base_version``; a subscriber whose
+    last version is not the diff's base has missed one and should resync
+    from ``state()``.
+    """
+
+    def __init__(
+        self,
+        checker: HealthChecker | None = None,
+        interval: float = 10.0,
+        bus: EventBus | None = None,
+    ):
+        self.checker = checker or get_health_checker()
+        self.interval = interval
+        self.bus = bus or get_event_bus()
+        self._state: dict[str, Any] | None = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+        self._users = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def acquire(self) -> None:
+        """Register a subscriber, starting the monitor if needed."""
+        self._users += 1
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def release(self) -> None:
+        """Drop a subscriber, stopping the monitor after the last one."""
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def state(self) -> tuple[int, dict[str, Any]]:
+        """Current version and full snapshot, checking once if there is none."""
+        if self._state is None:
+            await self.refresh()
+        return self._version, self._state
+
+    async def refresh(self) -> dict[str, Any] | None:
+        """Re-check and publish the diff, if any."""
+        async with self._lock:
+            current = (await self.checker.check_all()).to_dict()
+            diff = diff_health(self._state, current)
+            self._state = current
+            if diff is None:
+                return None
+            diff["base_version"] = self._version
+            self._version += 1
+            diff["version"] = self._version
+            await self.bus.publish(Event(EventType.HEALTH_CHECK, diff, source="health"))
+            return diff
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                secure_logger.error(f"Health monitor refresh failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
 # Global health checker
 _health_checker: HealthChecker | None = None
+_health_monitor: HealthMonitor | None = None
 
 
 def get_health_checker() -> HealthChecker:
@@ -349,7 +530,23 @@ def get_health_checker() -> HealthChecker:
     return _health_checker
 
 
-async def check_health() -> SystemHealth:
-    """Quick function to check system health."""
+def get_health_monitor() -> HealthMonitor:
+    """Get or create the shared health monitor."""
+    global _health_monitor
+    if _health_monitor is None:
+        _health_monitor = HealthMonitor()
+    return _health_monitor
+
+
+async def check_health(max_age: float | None = None) -> SystemHealth:
+    """
+    Quick function to check system health.
+
+    Args:
+        max_age: Accept a cached snapshot up to this many seconds old
+            (default: always check)
+    """
     checker = get_health_checker()
+    if max_age is not None:
+        return await checker.get_snapshot(max_age)
     return await checker.check_all()
@@ -0,0 +1,565 @@
+"""
+AI Project Synthesizer - Background Jobs
+
+Persistent priority job queue for long-running operations (project
+synthesis, assembly). Submitting returns a job id immediately; a bounded
+pool of asyncio workers runs jobs in priority order and records progress
+in SQLite, so status lookups are a primary-key read and job state
+survives restarts. A worker claims a job atomically and stamps it with its
+queue's owner id, so several processes can share one database; running
+jobs are only re-queued once their owning process is gone.
+
+Usage:
+    queue = get_job_queue()
+    queue.register("synthesize_project", run_synthesis, timeout_seconds=600)
+    job = await queue.submit("synthesize_project", params, priority=JobPriority.HIGH)
+    status = queue.get(job.id)
+    await queue.cancel(job.id)
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum, IntEnum
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from src.core.security import get_secure_logger
+
+secure_logger = get_secure_logger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_final(self) -> bool:
+        return self in (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobPriority(IntEnum):
+    """Lower values run first."""
+
+    HIGH = 0
+    NORMAL = 5
+    LOW = 10
+
+
+@dataclass
+class Job:
+    """A unit of background work."""
+
+    id: str
+    kind: str
+    params: dict[str, Any] = field(default_factory=dict)
+    priority: int = JobPriority.NORMAL
+    status: JobStatus = JobStatus.PENDING
+    progress: int = 0
+    stage: str = ""
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    attempts: int = 0
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: str | None = None
+    completed_at: str | None = None
+    owner: str | None = None  # "<pid>:<queue token>" of the running queue
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "priority": int(self.priority),
+            "status": self.status.value,
+            "progress": self.progress,
+            "stage": self.stage,
+            "result": self.result,
+            "error": self.error,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "owner": self.owner,
+        }
+
+
+class JobStore:
+    """SQLite persistence for jobs (WAL mode, one shared connection)."""
+
+    _COLUMNS = (
+        "id, kind, params, priority, status, progress, stage, result, error, "
+        "attempts, created_at, started_at, completed_at, owner"
+    )
+
+    def __init__(self, db_path: Path | None = None):
+        self._db_path = db_path or Path(os.environ.get("JOBS_DB_PATH", "data/jobs.db"))
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    progress INTEGER DEFAULT 0,
+                    stage TEXT,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    owner TEXT
+                )
+            """)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")
+            }
+            if "owner" not in columns:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status "
+                "ON jobs(status, priority, created_at)"
+            )
+            self._conn.commit()
+
+    def _row_to_job(self, row: tuple) -> Job:
+        return Job(
+            id=row[0],
+            kind=row[1],
+            params=json.loads(row[2]),
+            priority=row[3],
+            status=JobStatus(row[4]),
+            progress=row[5] or 0,
+            stage=row[6] or "",
+            result=json.loads(row[7]) if row[7] else None,
+            error=row[8],
+            attempts=row[9] or 0,
+            created_at=row[10],
+            started_at=row[11],
+            completed_at=row[12],
+            owner=row[13],
+        )
+
+    def save(self, job: Job) -> None:
+        """Insert or replace a job."""
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO jobs ({self._COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.kind,
+                    json.dumps(job.params, default=str),
+                    int(job.priority),
+                    job.status.value,
+                    job.progress,
+                    job.stage,
+                    json.dumps(job.result, default=str) if job.result else None,
+                    job.error,
+                    job.attempts,
+                    job.created_at,
+                    job.started_at,
+                    job.completed_at,
+                    job.owner,
+                ),
+            )
+            self._conn.commit()
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Update selected columns of a job."""
+        if not fields:
+            return
+        if "status" in fields:
+            fields["status"] = JobStatus(fields["status"]).value
+        if "result" in fields and fields["result"] is not None:
+            fields["result"] = json.dumps(fields["result"], default=str)
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+            self._conn.commit()
+
+    def claim(self, job_id: str, owner: str, started_at: str) -> bool:
+        """Atomically move a pending job to running under ``owner``."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = ?, started_at = ?, "
+                "attempts = attempts + 1 WHERE id = ? AND status = ?",
+                (
+                    JobStatus.RUNNING.value,
+                    owner,
+                    started_at,
+                    job_id,
+                    JobStatus.PENDING.value,
+                ),
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def release(self, job_id: str, owner: str | None) -> bool:
+        """Put a running job held by ``owner`` back to pending."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = NULL "
+                "WHERE id = ? AND status = ? AND owner IS ?",
+                (JobStatus.PENDING.value, job_id, JobStatus.RUNNING.value, owner),
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Job | None:
+        """Primary-key lookup."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        statuses: list[JobStatus] | None = None,
+        limit: int = 100,
+    ) -> list[Job]:
+        """List jobs by priority, optionally filtered by status."""
+        query = f"SELECT {self._COLUMNS} FROM jobs"
+        params: list[Any] = []
+        if statuses:
+            query += f" WHERE status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(s.value for s in statuses)
+        query += " ORDER BY priority, created_at LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class JobContext:
+    """Handle passed to job handlers for progress reporting."""
+
+    def __init__(self, queue: "JobQueue", job: Job):
+        self._queue = queue
+        self.job = job
+
+    def report(self, progress: int, stage: str = "") -> None:
+        """Persist progress (0-100) and the current stage."""
+        self.job.progress = max(0, min(100, int(progress)))
+        self.job.stage = stage or self.job.stage
+        self._queue.store.update(
+            self.job.id, progress=self.job.progress, stage=self.job.stage
+        )
+
+
+JobHandler = Callable[[dict[str, Any], JobContext], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class _JobKind:
+    handler: JobHandler
+    timeout_seconds: float | None = None
+    max_attempts: int = 3
+
+
+class JobQueue:
+    """
+    Bounded-concurrency priority queue backed by a JobStore.
+
+    Workers start lazily on the first submit and are bound to that event
+    loop; using the queue from a different loop restarts them there.
+    Persisted work from a previous process is only picked up by start().
+    """
+
+    def __init__(self, store: JobStore | None = None, max_workers: int = 2):
+        self.store = store or JobStore()
+        self.max_workers = max_workers
+        self.owner = f"{os.getpid()}:{uuid.uuid4().hex[:12]}"
+        self._kinds: dict[str, _JobKind] = {}
+        self._heap: list[tuple[int, int, str]] = []
+        self._counter = itertools.count()
+        self._queued: set[str] = set()
+        self._running: dict[str, asyncio.Task] = {}
+        self._done_events: dict[str, asyncio.Event] = {}
+        self._cancelled: set[str] = set()
+        self._workers: list[asyncio.Task] = []
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        timeout_seconds: float | None = None,
+        max_attempts: int = 3,
+    ) -> None:
+        """Register the coroutine that runs jobs of ``kind``."""
+        self._kinds[kind] = _JobKind(handler, timeout_seconds, max_attempts)
+
+    def is_registered(self, kind: str) -> bool:
+        return kind in self._kinds
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+
+        # Tasks and events from a previous loop are unusable; queued job
+        # ids in the heap carry over
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._running.clear()
+        self._done_events.clear()
+        if self._heap:
+            self._wakeup.set()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.max_workers)
+        ]
+
+    def _owner_alive(self, job: Job) -> bool:
+        """Whether the queue that claimed a running job may still run it."""
+        if job.owner is None:
+            return False
+        if job.owner == self.owner:
+            return job.id in self._running
+        pid = int(job.owner.split(":", 1)[0])
+        # Another queue in this process, or a live process, still owns it
+        return pid == os.getpid() or psutil.pid_exists(pid)
+
+    def _recover(self) -> None:
+        """Re-queue pending jobs and running jobs whose owner is gone."""
+        for job in self.store.list_jobs(
+            [JobStatus.PENDING, JobStatus.RUNNING], limit=10_000
+        ):
+            kind = self._kinds.get(job.kind)
+            if kind is None or job.id in self._running:
+                continue
+            running = job.status == JobStatus.RUNNING
+            if running and self._owner_alive(job):
+                continue
+            if job.attempts >= kind.max_attempts:
+                self._finish(
+                    job.id,
+                    status=JobStatus.FAILED,
+                    error=f"Gave up after {job.attempts} attempts",
+                )
+                continue
+            if running:
+                if not self.store.release(job.id, job.owner):
+                    continue  # Claimed or finished by someone else meanwhile
+                secure_logger.info(f"Resuming interrupted job {job.id} ({job.kind})")
+            self._push(job.id, job.priority)
+
+    async def start(self) -> None:
+        """Start workers and resume pending or interrupted persisted jobs."""
+        self._ensure_started()
+        self._recover()
+
+    async def stop(self) -> None:
+        """Stop workers; running jobs are left to resume on next start."""
+        workers, self._workers = self._workers, []
+        tasks = [*workers, *self._running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def submit(
+        self,
+        kind: str,
+        params: dict[str, Any],
+        priority: int = JobPriority.NORMAL,
+        job_id: str | None = None,
+    ) -> Job:
+        """Persist a job and queue it; returns without waiting."""
+        if kind not in self._kinds:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self._ensure_started()
+
+        job = Job(
+            id=job_id or str(uuid.uuid4()),
+            kind=kind,
+            params=params,
+            priority=int(priority),
+        )
+        self.store.save(job)
+        self._push(job.id, job.priority)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Current state of a job (indexed lookup)."""
+        return self.store.get(job_id)
+
+    def list_jobs(
+        self, statuses: list[JobStatus] | None = None, limit: int = 100
+    ) -> list[Job]:
+        """List jobs by priority, optionally filtered by status."""
+        return self.store.list_jobs(statuses, limit)
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a pending or running job. Returns False if already final."""
+        job = self.store.get(job_id)
+        if job is None or job.status.is_final:
+            return False
+
+        task = self._running.get(job_id)
+        if task is not None:
+            self._cancelled.add(job_id)
+            task.cancel()
+        self._finish(job_id, status=JobStatus.CANCELLED, error="Cancelled")
+        return True
+
+    async def wait(self, job_id: str, timeout: float | None = None) -> Job | None:
+        """Wait until a job reaches a final state."""
+        job = self.store.get(job_id)
+        if job is None or job.status.is_final:
+            return job
+        event = self._done_events.setdefault(job_id, asyncio.Event())
+        await asyncio.wait_for(event.wait(), timeout)
+        return self.store.get(job_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue depth and worker utilization."""
+        return {
+            "workers": len(self._workers),
+            "max_workers": self.max_workers,
+            "queued": len(self._queued),
+            "running": len(self._running),
+            "kinds": list(self._kinds),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _push(self, job_id: str, priority: int) -> None:
+        if job_id in self._queued:
+            return
+        heapq.heappush(self._heap, (priority, next(self._counter), job_id))
+        self._queued.add(job_id)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _finish(self, job_id: str, **fields: Any) -> None:
+        fields.setdefault("completed_at", datetime.now().isoformat())
+        self.store.update(job_id, **fields)
+        self._queued.discard(job_id)
+        event = self._done_events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def _worker(self) -> None:
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            _, _, job_id = heapq.heappop(self._heap)
+            if job_id not in self._queued:
+                continue  # cancelled while queued
+            self._queued.discard(job_id)
+
+            job = self.store.get(job_id)
+            if job is None or job.status != JobStatus.PENDING:
+                continue
+
+            task = asyncio.create_task(self._run(job))
+            self._running[job_id] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                if job_id not in self._cancelled:
+                    raise  # worker itself is being stopped
+            finally:
+                self._running.pop(job_id, None)
+                self._cancelled.discard(job_id)
+
+    async def _run(self, job: Job) -> None:
+        kind = self._kinds[job.kind]
+        started_at = datetime.now().isoformat()
+        if not self.store.claim(job.id, self.owner, started_at):
+            return  # Another queue sharing the store got it first
+        job.attempts += 1
+        job.status = JobStatus.RUNNING
+        job.started_at = started_at
+        job.owner = self.owner
+
+        try:
+            result = await asyncio.wait_for(
+                kind.handler(job.params, JobContext(self, job)),
+                timeout=kind.timeout_seconds,
+            )
+        except asyncio.CancelledError:
+            # Shutdown, not a user cancel: leave it to resume on restart
+            self.store.release(job.id, self.owner)
+            raise
+        except TimeoutError:
+            self._finish(
+                job.id,
+                status=JobStatus.FAILED,
+                error=f"Job timed out after {kind.timeout_seconds} seconds",
+            )
+        except Exception as e:
+            secure_logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            self._finish(job.id, status=JobStatus.FAILED, error=str(e))
+        else:
+            if isinstance(result, dict) and result.get("error"):
+                self._finish(
+                    job.id,
+                    status=JobStatus.FAILED,
+                    error=str(result.get("message", "Job failed")),
+                    result=result,
+                )
+            else:
+                self._finish(
+                    job.id, status=JobStatus.COMPLETE, progress=100, result=result
+                )
+
+
+_job_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the global job queue."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -8,10 +8,15 @@ Persistent memory for:
 - User preferences
 - Agent memories
 - Workflow state
+
+Memories and conversation messages are full-text searchable (SQLite FTS5).
 """
 
 import json
+import re
 import sqlite3
+import threading
+import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -92,26 +97,50 @@ class Bookmark:
         return asdict(self)
 
 
+def _content_text(content: Any) -> str:
+    """Values (not keys or JSON punctuation) of memory content, for search."""
+    if isinstance(content, dict):
+        parts = [_content_text(value) for value in content.values()]
+    elif isinstance(content, list | tuple):
+        parts = [_content_text(value) for value in content]
+    elif isinstance(content, bool) or content is None:
+        return ""
+    else:
+        return str(content)
+    return "\n".join(part for part in parts if part)
+
+
 class MemoryStore:
     """
     SQLite-based persistent memory store.
 
     Features:
-    - Conversation history
+    - Conversation history with batch inserts
     - Search history with replay
     - Bookmarks with tags
     - Agent memory persistence
     - Workflow state tracking
+    - Full-text search over memories and conversations (FTS5)
+
+    Each thread reuses its own WAL-mode connection. Tags are kept in join
+    tables so tag filters run in SQL; the JSON ``tags`` column is kept for
+    reading rows back.
     """
 
+    SCHEMA_VERSION = 2
+
     def __init__(self, db_path: Path | None = None):
         self._db_path = db_path or Path("data/memory.db")
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._fts_enabled = False
         self._init_db()
 
     def _init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self._db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         # Memory table
@@ -123,7 +152,8 @@ class MemoryStore:
                 tags TEXT,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
-                metadata TEXT
+                metadata TEXT,
+                search_text TEXT
             )
         """)
 
@@ -175,201 +205,357 @@ class MemoryStore:
             )
         """)
 
+        # Tag join tables (tag first so tag lookups use the primary key)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS memory_tags (
+                tag TEXT NOT NULL,
+                memory_id TEXT NOT NULL,
+                PRIMARY KEY (tag, memory_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS bookmark_tags (
+                tag TEXT NOT NULL,
+                bookmark_id TEXT NOT NULL,
+                PRIMARY KEY (tag, bookmark_id)
+            ) WITHOUT ROWID
+        """)
+
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_type ON memories(type)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memories_type_updated "
+            "ON memories(type, updated_at)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memories_updated ON memories(updated_at)"
+        )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_searches_query ON searches(query)"
         )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_bookmarks_type ON bookmarks(type)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bookmarks_type_created "
+            "ON bookmarks(type, created_at)"
+        )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_conversations_session ON conversations(session_id)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_conversations_session_time "
+            "ON conversations(session_id, timestamp)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memory_tags_memory "
+            "ON memory_tags(memory_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bookmark_tags_bookmark "
+            "ON bookmark_tags(bookmark_id)"
+        )
+
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version < 2:
+            self._migrate_search_text(cursor)
+
+        self._fts_enabled = self._init_fts(cursor)
+
+        if version < self.SCHEMA_VERSION:
+            self._migrate(cursor)
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
 
         conn.commit()
-        conn.close()
+
+    def _init_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """Create external-content FTS5 indexes kept current by triggers."""
+        try:
+            # Memories index the text extracted from their JSON content
+            for table, column in (
+                ("memories", "search_text"),
+                ("conversations", "content"),
+            ):
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts
+                    USING fts5({column}, content='{table}', content_rowid='rowid')
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_fts_insert
+                    AFTER INSERT ON {table} BEGIN
+                        INSERT INTO {table}_fts(rowid, {column})
+                        VALUES (new.rowid, new.{column});
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_fts_delete
+                    AFTER DELETE ON {table} BEGIN
+                        INSERT INTO {table}_fts({table}_fts, rowid, {column})
+                        VALUES ('delete', old.rowid, old.{column});
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_fts_update
+                    AFTER UPDATE OF {column} ON {table} BEGIN
+                        INSERT INTO {table}_fts({table}_fts, rowid, {column})
+                        VALUES ('delete', old.rowid, old.{column});
+                        INSERT INTO {table}_fts(rowid, {column})
+                        VALUES (new.rowid, new.{column});
+                    END
+                """)
+            return True
+        except sqlite3.OperationalError as e:
+            secure_logger.warning(f"FTS5 unavailable, using LIKE for text search: {e}")
+            return False
+
+    def _migrate_search_text(self, cursor: sqlite3.Cursor) -> None:
+        """Add and backfill memories.search_text; drop the v1 JSON index."""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(memories)")}
+        if "search_text" not in columns:
+            cursor.execute("ALTER TABLE memories ADD COLUMN search_text TEXT")
+        for trigger in ("insert", "delete", "update"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS memories_fts_{trigger}")
+        cursor.execute("DROP TABLE IF EXISTS memories_fts")
+        rows = cursor.execute("SELECT id, content FROM memories").fetchall()
+        cursor.executemany(
+            "UPDATE memories SET search_text = ? WHERE id = ?",
+            [(_content_text(json.loads(content)), id_) for id_, content in rows],
+        )
+
+    def _migrate(self, cursor: sqlite3.Cursor) -> None:
+        """Backfill tag tables and FTS indexes for older databases."""
+        cursor.execute("""
+            INSERT OR IGNORE INTO memory_tags (tag, memory_id)
+            SELECT j.value, m.id FROM memories m, json_each(m.tags) j
+            WHERE m.tags IS NOT NULL AND json_valid(m.tags)
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO bookmark_tags (tag, bookmark_id)
+            SELECT j.value, b.id FROM bookmarks b, json_each(b.tags) j
+            WHERE b.tags IS NOT NULL AND json_valid(b.tags)
+        """)
+        if self._fts_enabled:
+            cursor.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+            cursor.execute(
+                "INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild')"
+            )
 
     def _get_conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self._db_path)
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every thread's connection."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """Quote each word so user input can't break FTS5 query syntax."""
+        return " ".join(f'"{word}"' for word in re.findall(r"\w+", text))
+
+    @staticmethod
+    def _like_pattern(text: str) -> str:
+        """Substring LIKE pattern with %, _ and \\ in ``text`` escaped."""
+        escaped = re.sub(r"([\\%_])", r"\\\1", text)
+        return f"%{escaped}%"
+
+    @staticmethod
+    def _tag_filter(tag_table: str, key: str, id_column: str, tags: list[str]):
+        """SQL condition matching rows with any of ``tags``."""
+        placeholders = ", ".join("?" * len(tags))
+        return (
+            f" AND {id_column} IN (SELECT {key} FROM {tag_table} "
+            f"WHERE tag IN ({placeholders}))",
+            list(tags),
+        )
 
     # ============================================
     # Memory Operations
     # ============================================
 
+    @staticmethod
+    def _row_to_memory(row) -> MemoryEntry:
+        return MemoryEntry(
+            id=row[0],
+            type=MemoryType(row[1]),
+            content=json.loads(row[2]),
+            tags=json.loads(row[3]) if row[3] else [],
+            created_at=row[4],
+            updated_at=row[5],
+            metadata=json.loads(row[6]) if row[6] else {},
+        )
+
     def save_memory(self, entry: MemoryEntry) -> str:
         """Save a memory entry."""
         conn = self._get_conn()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO memories
-            (id, type, content, tags, created_at, updated_at, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                entry.id,
-                entry.type.value,
-                json.dumps(entry.content),
-                json.dumps(entry.tags),
-                entry.created_at,
-                datetime.now().isoformat(),
-                json.dumps(entry.metadata),
-            ),
-        )
+        with conn:
+            # Upsert (not REPLACE) so the FTS update trigger fires
+            conn.execute(
+                """
+                INSERT INTO memories
+                (id, type, content, tags, created_at, updated_at, metadata,
+                 search_text)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    type = excluded.type,
+                    content = excluded.content,
+                    tags = excluded.tags,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    metadata = excluded.metadata,
+                    search_text = excluded.search_text
+            """,
+                (
+                    entry.id,
+                    entry.type.value,
+                    json.dumps(entry.content),
+                    json.dumps(entry.tags),
+                    entry.created_at,
+                    datetime.now().isoformat(),
+                    json.dumps(entry.metadata),
+                    _content_text(entry.content),
+                ),
+            )
+            conn.execute("DELETE FROM memory_tags WHERE memory_id = ?", (entry.id,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO memory_tags (tag, memory_id) VALUES (?, ?)",
+                [(tag, entry.id) for tag in entry.tags],
+            )
 
-        conn.commit()
-        conn.close()
         return entry.id
 
     def get_memory(self, memory_id: str) -> MemoryEntry | None:
         """Get a memory entry by ID."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return MemoryEntry(
-                id=row[0],
-                type=MemoryType(row[1]),
-                content=json.loads(row[2]),
-                tags=json.loads(row[3]) if row[3] else [],
-                created_at=row[4],
-                updated_at=row[5],
-                metadata=json.loads(row[6]) if row[6] else {},
-            )
-        return None
+        row = (
+            self._get_conn()
+            .execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
+            .fetchone()
+        )
+        return self._row_to_memory(row) if row else None
 
     def search_memories(
         self,
         type: MemoryType | None = None,
         tags: list[str] | None = None,
         limit: int = 50,
+        query: str | None = None,
     ) -> list[MemoryEntry]:
-        """Search memories by type and tags."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        query = "SELECT * FROM memories WHERE 1=1"
-        params = []
+        """
+        Search memories by type, tags (any match) and content text.
+
+        Results are newest first, or best text match first when ``query``
+        is given.
+        """
+        query = (query or "").strip()
+        text = self._fts_query(query)
+        if query and not text:
+            return []
+
+        if text and self._fts_enabled:
+            sql = (
+                "SELECT memories.* FROM memories_fts "
+                "JOIN memories ON memories.rowid = memories_fts.rowid "
+                "WHERE memories_fts MATCH ?"
+            )
+            params: list[Any] = [text]
+            order = " ORDER BY memories_fts.rank LIMIT ?"
+        else:
+            sql = "SELECT memories.* FROM memories WHERE 1=1"
+            params = []
+            if text:
+                sql += " AND search_text LIKE ? ESCAPE '\\'"
+                params.append(self._like_pattern(query))
+            order = " ORDER BY updated_at DESC LIMIT ?"
 
         if type:
-            query += " AND type = ?"
+            sql += " AND type = ?"
             params.append(type.value)
 
-        query += " ORDER BY updated_at DESC LIMIT ?"
-        params.append(limit)
-
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        if tags:
+            clause, args = self._tag_filter("memory_tags", "memory_id", "id", tags)
+            sql += clause
+            params.extend(args)
 
-        entries = []
-        for row in rows:
-            entry = MemoryEntry(
-                id=row[0],
-                type=MemoryType(row[1]),
-                content=json.loads(row[2]),
-                tags=json.loads(row[3]) if row[3] else [],
-                created_at=row[4],
-                updated_at=row[5],
-                metadata=json.loads(row[6]) if row[6] else {},
-            )
-
-            # Filter by tags if specified
-            if tags:
-                if any(t in entry.tags for t in tags):
-                    entries.append(entry)
-            else:
-                entries.append(entry)
-
-        return entries
+        params.append(limit)
+        rows = self._get_conn().execute(sql + order, params).fetchall()
+        return [self._row_to_memory(row) for row in rows]
 
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory entry."""
         conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
+        with conn:
+            cursor = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+            conn.execute("DELETE FROM memory_tags WHERE memory_id = ?", (memory_id,))
+        return cursor.rowcount > 0
 
     # ============================================
     # Search History
     # ============================================
 
+    @staticmethod
+    def _row_to_search(row) -> SearchEntry:
+        return SearchEntry(
+            id=row[0],
+            query=row[1],
+            platforms=json.loads(row[2]),
+            results_count=row[3],
+            timestamp=row[4],
+            filters=json.loads(row[5]) if row[5] else {},
+        )
+
     def save_search(self, entry: SearchEntry) -> str:
         """Save a search to history."""
         conn = self._get_conn()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO searches
-            (id, query, platforms, results_count, timestamp, filters)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (
-                entry.id,
-                entry.query,
-                json.dumps(entry.platforms),
-                entry.results_count,
-                entry.timestamp,
-                json.dumps(entry.filters),
-            ),
-        )
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO searches
+                (id, query, platforms, results_count, timestamp, filters)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    entry.id,
+                    entry.query,
+                    json.dumps(entry.platforms),
+                    entry.results_count,
+                    entry.timestamp,
+                    json.dumps(entry.filters),
+                ),
+            )
 
-        conn.commit()
-        conn.close()
         return entry.id
 
     def get_search_history(self, limit: int = 50) -> list[SearchEntry]:
         """Get recent search history."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT * FROM searches ORDER BY timestamp DESC LIMIT ?", (limit,)
+        rows = (
+            self._get_conn()
+            .execute("SELECT * FROM searches ORDER BY timestamp DESC LIMIT ?", (limit,))
+            .fetchall()
         )
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [
-            SearchEntry(
-                id=row[0],
-                query=row[1],
-                platforms=json.loads(row[2]),
-                results_count=row[3],
-                timestamp=row[4],
-                filters=json.loads(row[5]) if row[5] else {},
-            )
-            for row in rows
-        ]
+        return [self._row_to_search(row) for row in rows]
 
     def replay_search(self, search_id: str) -> SearchEntry | None:
         """Get a search for replay."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM searches WHERE id = ?", (search_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return SearchEntry(
-                id=row[0],
-                query=row[1],
-                platforms=json.loads(row[2]),
-                results_count=row[3],
-                timestamp=row[4],
-                filters=json.loads(row[5]) if row[5] else {},
-            )
-        return None
+        row = (
+            self._get_conn()
+            .execute("SELECT * FROM searches WHERE id = ?", (search_id,))
+            .fetchone()
+        )
+        return self._row_to_search(row) if row else None
 
     # ============================================
     # Bookmarks
@@ -378,28 +564,33 @@ class MemoryStore:
     def save_bookmark(self, bookmark: Bookmark) -> str:
         """Save a bookmark."""
         conn = self._get_conn()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO bookmarks
-            (id, name, url, type, description, tags, created_at, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                bookmark.id,
-                bookmark.name,
-                bookmark.url,
-                bookmark.type,
-                bookmark.description,
-                json.dumps(bookmark.tags),
-                bookmark.created_at,
-                json.dumps(bookmark.metadata),
-            ),
-        )
+        with conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO bookmarks
+                (id, name, url, type, description, tags, created_at, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    bookmark.id,
+                    bookmark.name,
+                    bookmark.url,
+                    bookmark.type,
+                    bookmark.description,
+                    json.dumps(bookmark.tags),
+                    bookmark.created_at,
+                    json.dumps(bookmark.metadata),
+                ),
+            )
+            conn.execute(
+                "DELETE FROM bookmark_tags WHERE bookmark_id = ?", (bookmark.id,)
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO bookmark_tags (tag, bookmark_id) VALUES (?, ?)",
+                [(tag, bookmark.id) for tag in bookmark.tags],
+            )
 
-        conn.commit()
-        conn.close()
         return bookmark.id
 
     def get_bookmarks(
@@ -408,27 +599,25 @@ class MemoryStore:
         tags: list[str] | None = None,
         limit: int = 100,
     ) -> list[Bookmark]:
-        """Get bookmarks with optional filtering."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
+        """Get bookmarks with optional filtering (tags: any match)."""
         query = "SELECT * FROM bookmarks WHERE 1=1"
-        params = []
+        params: list[Any] = []
 
         if type:
             query += " AND type = ?"
             params.append(type)
 
+        if tags:
+            clause, args = self._tag_filter("bookmark_tags", "bookmark_id", "id", tags)
+            query += clause
+            params.extend(args)
+
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        bookmarks = []
-        for row in rows:
-            bookmark = Bookmark(
+        rows = self._get_conn().execute(query, params).fetchall()
+        return [
+            Bookmark(
                 id=row[0],
                 name=row[1],
                 url=row[2],
@@ -438,24 +627,18 @@ class MemoryStore:
                 created_at=row[6],
                 metadata=json.loads(row[7]) if row[7] else {},
             )
-
-            if tags:
-                if any(t in bookmark.tags for t in tags):
-                    bookmarks.append(bookmark)
-            else:
-                bookmarks.append(bookmark)
-
-        return bookmarks
+            for row in rows
+        ]
 
     def delete_bookmark(self, bookmark_id: str) -> bool:
         """Delete a bookmark."""
         conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM bookmarks WHERE id = ?", (bookmark_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
+        with conn:
+            cursor = conn.execute("DELETE FROM bookmarks WHERE id = ?", (bookmark_id,))
+            conn.execute(
+                "DELETE FROM bookmark_tags WHERE bookmark_id = ?", (bookmark_id,)
+            )
+        return cursor.rowcount > 0
 
     # ============================================
     # Conversations
@@ -469,30 +652,56 @@ class MemoryStore:
         metadata: dict | None = None,
     ) -> str:
         """Save a conversation message."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
+        return self.save_messages(
+            session_id,
+            [{"role": role, "content": content, "metadata": metadata or {}}],
+        )[0]
 
-        msg_id = f"msg_{datetime.now().timestamp()}"
+    def save_messages(
+        self,
+        session_id: str,
+        messages: list[dict[str, Any]],
+    ) -> list[str]:
+        """
+        Save several conversation messages in one transaction.
+
+        Args:
+            session_id: Conversation session
+            messages: Dicts with ``role``, ``content`` and optional
+                ``metadata`` and ``timestamp``
+
+        Returns:
+            The new message IDs, in order.
+        """
+        now = datetime.now()
+        base_id = f"msg_{now.timestamp()}_{uuid.uuid4().hex[:8]}"
+        ids = [
+            base_id if len(messages) == 1 else f"{base_id}_{i}"
+            for i in range(len(messages))
+        ]
 
-        cursor.execute(
-            """
-            INSERT INTO conversations
-            (id, session_id, role, content, timestamp, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (
-                msg_id,
-                session_id,
-                role,
-                content,
-                datetime.now().isoformat(),
-                json.dumps(metadata or {}),
-            ),
-        )
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO conversations
+                (id, session_id, role, content, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        msg_id,
+                        session_id,
+                        message["role"],
+                        message["content"],
+                        message.get("timestamp") or now.isoformat(),
+                        json.dumps(message.get("metadata") or {}),
+                    )
+                    for msg_id, message in zip(ids, messages, strict=True)
+                ],
+            )
 
-        conn.commit()
-        conn.close()
-        return msg_id
+        return ids
 
     def get_conversation(
         self,
@@ -500,23 +709,21 @@ class MemoryStore:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get conversation history for a session."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
+        rows = (
+            self._get_conn()
+            .execute(
+                """
             SELECT role, content, timestamp, metadata
             FROM conversations
             WHERE session_id = ?
             ORDER BY timestamp ASC
             LIMIT ?
         """,
-            (session_id, limit),
+                (session_id, limit),
+            )
+            .fetchall()
         )
 
-        rows = cursor.fetchall()
-        conn.close()
-
         return [
             {
                 "role": row[0],
@@ -527,49 +734,89 @@ class MemoryStore:
             for row in rows
         ]
 
+    def search_conversations(
+        self,
+        query: str,
+        session_id: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Full-text search conversation messages, best match first."""
+        text = self._fts_query(query)
+        if not text:
+            return []
+
+        if self._fts_enabled:
+            sql = """
+                SELECT c.id, c.session_id, c.role, c.content, c.timestamp, c.metadata
+                FROM conversations_fts f
+                JOIN conversations c ON c.rowid = f.rowid
+                WHERE conversations_fts MATCH ?
+            """
+            params: list[Any] = [text]
+            order = " ORDER BY f.rank LIMIT ?"
+        else:
+            sql = """
+                SELECT c.id, c.session_id, c.role, c.content, c.timestamp, c.metadata
+                FROM conversations c WHERE c.content LIKE ? ESCAPE '\\'
+            """
+            params = [self._like_pattern(query.strip())]
+            order = " ORDER BY c.timestamp DESC LIMIT ?"
+
+        if session_id:
+            sql += " AND c.session_id = ?"
+            params.append(session_id)
+        params.append(limit)
+
+        rows = self._get_conn().execute(sql + order, params).fetchall()
+        return [
+            {
+                "id": row[0],
+                "session_id": row[1],
+                "role": row[2],
+                "content": row[3],
+                "timestamp": row[4],
+                "metadata": json.loads(row[5]) if row[5] else {},
+            }
+            for row in rows
+        ]
+
     # ============================================
     # Workflow State
     # ============================================
 
     def save_workflow_state(self, workflow_id: str, state: dict[str, Any]) -> str:
         """Save workflow state."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
         state_id = f"state_{workflow_id}"
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO workflow_states
-            (id, workflow_id, state, updated_at)
-            VALUES (?, ?, ?, ?)
-        """,
-            (
-                state_id,
-                workflow_id,
-                json.dumps(state),
-                datetime.now().isoformat(),
-            ),
-        )
+        conn = self._get_conn()
+        with conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO workflow_states
+                (id, workflow_id, state, updated_at)
+                VALUES (?, ?, ?, ?)
+            """,
+                (
+                    state_id,
+                    workflow_id,
+                    json.dumps(state),
+                    datetime.now().isoformat(),
+                ),
+            )
 
-        conn.commit()
-        conn.close()
         return state_id
 
     def get_workflow_state(self, workflow_id: str) -> dict[str, Any] | None:
         """Get workflow state."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT state FROM workflow_states WHERE workflow_id = ?", (workflow_id,)
+        row = (
+            self._get_conn()
+            .execute(
+                "SELECT state FROM workflow_states WHERE workflow_id = ?",
+                (workflow_id,),
+            )
+            .fetchone()
         )
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return json.loads(row[0])
-        return None
+        return json.loads(row[0]) if row else None
 
 
 # Global memory store
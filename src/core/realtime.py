@@ -7,12 +7,18 @@ Real-time event handling for:
 - Search results streaming
 - Health monitoring
 - Notifications
+
+Publishing never waits on a streaming client: each SSE/WebSocket client
+reads from its own bounded queue, and slow callbacks are cut off by a
+timeout.
 """
 
 import asyncio
-import contextlib
+import inspect
+import itertools
 import json
-from collections.abc import Callable
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -57,6 +63,12 @@ class EventType(str, Enum):
     BOOKMARK_ADDED = "bookmark.added"
     SEARCH_SAVED = "search.saved"
 
+    # Command events
+    COMMAND_STARTED = "command.started"
+    COMMAND_OUTPUT = "command.output"
+    COMMAND_ERROR_DETECTED = "command.error_detected"
+    COMMAND_COMPLETED = "command.completed"
+
     # Voice events
     VOICE_STARTED = "voice.started"
     VOICE_TRANSCRIPTION = "voice.transcription"
@@ -71,6 +83,7 @@ class Event:
     data: dict[str, Any]
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     source: str = "system"
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -81,7 +94,102 @@ class Event:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        # Serialized once, then shared by every SSE/WebSocket client
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+
+
+class QueuePolicy(str, Enum):
+    """What a full subscriber queue does with a new event."""
+
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest pending event
+    COALESCE = "coalesce"  # Replace the latest pending event with the same key
+
+
+def default_coalesce_key(event: Event) -> Hashable:
+    """Events of one type about one workflow/agent/query supersede each other."""
+    data = event.data
+    subject = data.get("workflow_id") or data.get("agent") or data.get("query")
+    return (event.type, event.source, subject)
+
+
+class EventQueue:
+    """
+    Bounded per-subscriber queue; publishing into it never blocks.
+
+    Under ``DROP_OLDEST`` a full queue evicts its oldest event. Under
+    ``COALESCE`` a full queue instead lets a new event replace the latest
+    pending one with the same key in place (so a slow client sees the
+    latest progress, not every step), and only falls back to evicting the
+    oldest when no key matches. Below capacity every event is kept, so
+    distinct events that happen to share a key are never lost.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        policy: QueuePolicy = QueuePolicy.DROP_OLDEST,
+        event_types: Iterable[EventType] | None = None,
+        coalesce_key: Callable[[Event], Hashable] = default_coalesce_key,
+    ):
+        self.maxsize = max(1, maxsize)
+        self.policy = QueuePolicy(policy)
+        self.event_types = frozenset(event_types) if event_types else None
+        self._coalesce_key = coalesce_key
+        self._pending: OrderedDict[int, tuple[Hashable, Event]] = OrderedDict()
+        self._latest: dict[Hashable, int] = {}  # Coalesce key -> pending slot
+        self._counter = itertools.count()
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.coalesced = 0
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        return not self._pending
+
+    def put_nowait(self, event: Event) -> None:
+        """Enqueue an event, applying the overflow policy."""
+        key = None
+        if self.policy == QueuePolicy.COALESCE:
+            key = self._coalesce_key(event)
+
+        if len(self._pending) >= self.maxsize:
+            slot = self._latest.get(key) if key is not None else None
+            if slot is not None:
+                self._pending[slot] = (key, event)
+                self.coalesced += 1
+                return
+            self._pop_oldest()
+            self.dropped += 1
+
+        slot = next(self._counter)
+        self._pending[slot] = (key, event)
+        if key is not None:
+            self._latest[key] = slot
+        self._ready.set()
+
+    def _pop_oldest(self) -> Event:
+        slot, (key, event) = self._pending.popitem(last=False)
+        if key is not None and self._latest.get(key) == slot:
+            del self._latest[key]
+        return event
+
+    def get_nowait(self) -> Event:
+        if not self._pending:
+            raise asyncio.QueueEmpty
+        event = self._pop_oldest()
+        if not self._pending:
+            self._ready.clear()
+        return event
+
+    async def get(self) -> Event:
+        """Wait for the next event."""
+        while not self._pending:
+            await self._ready.wait()
+        return self.get_nowait()
 
 
 class EventBus:
@@ -90,17 +198,35 @@ class EventBus:
 
     Features:
     - Pub/sub pattern
-    - Async event handling
-    - Event filtering
-    - Event history
+    - Async callbacks run concurrently, each bounded by a timeout
+    - Event filtering, indexed by event type
+    - Bounded streaming queues with drop-oldest or coalescing overflow
+    - Ring-buffer event history
     """
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(
+        self,
+        max_history: int = 1000,
+        callback_timeout: float = 5.0,
+        queue_size: int = 256,
+    ):
         self._subscribers: dict[EventType, list[Callable]] = {}
         self._global_subscribers: list[Callable] = []
-        self._history: list[Event] = []
+        self._history: deque[Event] = deque(maxlen=max_history)
         self._max_history = max_history
-        self._queues: set[asyncio.Queue] = set()
+        self.callback_timeout = callback_timeout
+        self.queue_size = queue_size
+        self._queues: set[EventQueue] = set()
+        self._queues_by_type: dict[EventType, set[EventQueue]] = {}
+        self._pending_emits: set[asyncio.Task] = set()
+        self._stats = {
+            "published": 0,
+            "delivered": 0,
+            "callback_errors": 0,
+            "callback_timeouts": 0,
+            "dropped": 0,
+            "coalesced": 0,
+        }
 
     def subscribe(
         self,
@@ -129,38 +255,55 @@ class EventBus:
 
     async def publish(self, event: Event):
         """Publish an event."""
-        # Add to history
         self._history.append(event)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history :]
-
-        # Notify specific subscribers
-        for callback in self._subscribers.get(event.type, []):
+        self._stats["published"] += 1
+
+        # Push to queues (for SSE/WebSocket) first: it never blocks, so
+        # streaming clients are not held up by slow callbacks
+        queues = self._queues_by_type.get(event.type, ())
+        if queues:
+            event.to_json()  # Serialize once for every client
+            for queue in queues:
+                queue.put_nowait(event)
+            self._stats["delivered"] += len(queues)
+
+        callbacks = [
+            *self._subscribers.get(event.type, ()),
+            *self._global_subscribers,
+        ]
+        pending = []
+        for callback in callbacks:
             try:
                 result = callback(event)
-                if asyncio.iscoroutine(result):
-                    await result
             except Exception as e:
+                self._stats["callback_errors"] += 1
                 secure_logger.error(f"Event callback error: {e}")
+                continue
+            if inspect.isawaitable(result):
+                pending.append(self._await_callback(callback, result))
+        if pending:
+            await asyncio.gather(*pending)
 
-        # Notify global subscribers
-        for callback in self._global_subscribers:
-            try:
-                result = callback(event)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                secure_logger.error(f"Global callback error: {e}")
-
-        # Push to queues (for SSE/WebSocket)
-        for queue in self._queues:
-            with contextlib.suppress(Exception):
-                await queue.put(event)
+    async def _await_callback(self, callback: Callable, result: Awaitable) -> None:
+        try:
+            await asyncio.wait_for(result, self.callback_timeout)
+        except TimeoutError:
+            self._stats["callback_timeouts"] += 1
+            name = getattr(callback, "__qualname__", repr(callback))
+            secure_logger.warning(
+                f"Event callback {name} timed out after {self.callback_timeout}s"
+            )
+        except Exception as e:
+            self._stats["callback_errors"] += 1
+            secure_logger.error(f"Event callback error: {e}")
 
     def emit(self, event_type: EventType, data: dict[str, Any], source: str = "system"):
         """Emit an event (sync wrapper)."""
         event = Event(type=event_type, data=data, source=source)
-        asyncio.create_task(self.publish(event))
+        task = asyncio.create_task(self.publish(event))
+        # Keep a reference until done so the task is not garbage collected
+        self._pending_emits.add(task)
+        task.add_done_callback(self._pending_emits.discard)
 
     async def emit_async(
         self, event_type: EventType, data: dict[str, Any], source: str = "system"
@@ -175,39 +318,77 @@ class EventBus:
         limit: int = 100,
     ) -> list[Event]:
         """Get event history."""
-        events = self._history
-
-        if event_type:
-            events = [e for e in events if e.type == event_type]
-
-        return events[-limit:]
-
-    def create_queue(self) -> asyncio.Queue:
-        """Create a queue for streaming events."""
-        queue = asyncio.Queue()
+        if limit <= 0:
+            return []
+
+        if event_type is None:
+            start = max(0, len(self._history) - limit)
+            return list(itertools.islice(self._history, start, None))
+
+        # Walk back from the newest event and stop once enough are found
+        events = []
+        for event in reversed(self._history):
+            if event.type == event_type:
+                events.append(event)
+                if len(events) == limit:
+                    break
+        events.reverse()
+        return events
+
+    def create_queue(
+        self,
+        event_types: Iterable[EventType] | None = None,
+        maxsize: int | None = None,
+        policy: QueuePolicy = QueuePolicy.DROP_OLDEST,
+    ) -> EventQueue:
+        """Create a bounded queue for streaming events."""
+        queue = EventQueue(
+            maxsize=self.queue_size if maxsize is None else maxsize,
+            policy=policy,
+            event_types=event_types,
+        )
         self._queues.add(queue)
+        for event_type in queue.event_types or EventType:
+            self._queues_by_type.setdefault(event_type, set()).add(queue)
         return queue
 
-    def remove_queue(self, queue: asyncio.Queue):
+    def remove_queue(self, queue: EventQueue):
         """Remove a queue."""
-        self._queues.discard(queue)
+        if queue in self._queues:
+            self._queues.discard(queue)
+            self._stats["dropped"] += queue.dropped
+            self._stats["coalesced"] += queue.coalesced
+        for queues in self._queues_by_type.values():
+            queues.discard(queue)
 
     async def stream_events(
         self,
         event_types: list[EventType] | None = None,
+        maxsize: int | None = None,
+        policy: QueuePolicy = QueuePolicy.DROP_OLDEST,
     ):
         """Async generator for streaming events."""
-        queue = self.create_queue()
+        queue = self.create_queue(event_types, maxsize=maxsize, policy=policy)
 
         try:
             while True:
-                event = await queue.get()
-
-                if event_types is None or event.type in event_types:
-                    yield event
+                yield await queue.get()
         finally:
             self.remove_queue(queue)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get fan-out statistics."""
+        return {
+            **self._stats,
+            "dropped": self._stats["dropped"] + sum(q.dropped for q in self._queues),
+            "coalesced": self._stats["coalesced"]
+            + sum(q.coalesced for q in self._queues),
+            "queues": len(self._queues),
+            "subscribers": sum(map(len, self._subscribers.values()))
+            + len(self._global_subscribers),
+            "history": len(self._history),
+        }
+
 
 # Global event bus
 _event_bus: EventBus | None = None
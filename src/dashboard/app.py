@@ -6,22 +6,32 @@ FastAPI-based web dashboard for visual project management.
 
 import asyncio
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 
 from src.core.cache import get_cache
-from src.core.health import check_health
+from src.core.health import HealthMonitor, check_health, get_health_monitor
 from src.core.plugins import get_plugin_manager
+from src.core.realtime import EventQueue, EventType
 from src.core.security import get_secure_logger
 from src.core.version import get_build_info, get_version
 
+if TYPE_CHECKING:
+    from src.discovery.base_client import RepositoryInfo
+    from src.discovery.unified_search import UnifiedSearch
+
 secure_logger = get_secure_logger(__name__)
 
+# Health snapshots younger than this are served from cache
+HEALTH_MAX_AGE = 10.0
+
 
 # Request/Response models
 class SearchRequest(BaseModel):
@@ -37,6 +47,43 @@ class AssembleRequest(BaseModel):
     create_github: bool = True
 
 
+def get_search_service(app: FastAPI) -> "UnifiedSearch":
+    """
+    The app's UnifiedSearch, created on first use.
+
+    One instance per app keeps platform clients, their connection pools and
+    the search cache alive across requests; the lifespan closes it.
+    """
+    search = getattr(app.state, "search", None)
+    if search is None:
+        from src.discovery.unified_search import create_unified_search
+
+        search = create_unified_search()
+        app.state.search = search
+    return search
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close app-scoped services on shutdown."""
+    yield
+    search = getattr(app.state, "search", None)
+    if search is not None:
+        await search.close()
+        app.state.search = None
+
+
+def _repo_summary(repo: "RepositoryInfo") -> dict[str, Any]:
+    return {
+        "name": repo.name,
+        "full_name": repo.full_name,
+        "platform": repo.platform,
+        "url": repo.url,
+        "description": repo.description,
+        "stars": repo.stars,
+    }
+
+
 def create_app() -> FastAPI:
     """Create FastAPI application."""
 
@@ -44,6 +91,7 @@ def create_app() -> FastAPI:
         title="AI Project Synthesizer",
         description="Visual dashboard for intelligent project synthesis",
         version=get_version(),
+        lifespan=lifespan,
     )
 
     # CORS for development
@@ -84,7 +132,7 @@ def create_app() -> FastAPI:
     @app.get("/api/health")
     async def health():
         """Get system health status."""
-        health_status = await check_health()
+        health_status = await check_health(max_age=HEALTH_MAX_AGE)
         return health_status.to_dict()
 
     @app.get("/api/version")
@@ -105,6 +153,13 @@ def create_app() -> FastAPI:
         count = await cache.clear()
         return {"cleared": count}
 
+    @app.get("/api/quota")
+    async def quota_usage():
+        """Get shared API quota usage per consumer."""
+        from src.utils.quota_broker import get_quota_broker
+
+        return {"usage": await get_quota_broker().get_usage()}
+
     @app.get("/api/plugins")
     async def list_plugins():
         """List installed plugins."""
@@ -115,33 +170,79 @@ def create_app() -> FastAPI:
     async def search(request: SearchRequest):
         """Search across platforms."""
         try:
-            from src.discovery.unified_search import create_unified_search
-
-            search = create_unified_search()
-            results = await search.search(
-                query=request.query,
-                platforms=request.platforms,
-                max_results=request.max_results,
-            )
+            from src.utils.quota_broker import QuotaPriority, quota_priority
+
+            search = get_search_service(app)
+            with quota_priority(QuotaPriority.INTERACTIVE):
+                results = await search.search(
+                    query=request.query,
+                    platforms=request.platforms,
+                    max_results=request.max_results,
+                )
 
             return {
                 "query": request.query,
                 "total": len(results.repositories),
-                "results": [
-                    {
-                        "name": r.name,
-                        "full_name": r.full_name,
-                        "platform": r.platform,
-                        "url": r.url,
-                        "description": r.description,
-                        "stars": r.stars,
-                    }
-                    for r in results.repositories
-                ],
+                "results": [_repo_summary(r) for r in results.repositories],
             }
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.post("/api/search/stream")
+    async def search_stream(request: SearchRequest, http_request: Request):
+        """
+        Stream per-platform results as they arrive, then the ranked results.
+
+        NDJSON by default; Server-Sent Events when the client accepts
+        ``text/event-stream``.
+        """
+        from src.utils.quota_broker import QuotaPriority, quota_priority
+
+        search = get_search_service(app)
+        sse = "text/event-stream" in http_request.headers.get("accept", "")
+
+        async def events():
+            with quota_priority(QuotaPriority.INTERACTIVE):
+                stream = search.search_stream(
+                    query=request.query,
+                    platforms=request.platforms,
+                    max_results=request.max_results,
+                )
+                try:
+                    async for event in stream:
+                        if event["type"] == "platform":
+                            repos = event["repositories"]
+                            payload = {
+                                "type": "platform",
+                                "platform": event["platform"],
+                                "count": len(repos),
+                                "results": [_repo_summary(r) for r in repos],
+                                "error": event["error"],
+                            }
+                        else:
+                            result = event["result"]
+                            payload = {
+                                "type": "done",
+                                "query": request.query,
+                                "total": len(result.repositories),
+                                "results": [
+                                    _repo_summary(r) for r in result.repositories
+                                ],
+                                "errors": result.errors,
+                                "search_time_ms": result.search_time_ms,
+                            }
+                        line = json.dumps(payload)
+                        yield f"data: {line}\n\n" if sse else f"{line}\n"
+                except Exception as e:
+                    line = json.dumps({"type": "error", "error": str(e)})
+                    yield f"data: {line}\n\n" if sse else f"{line}\n"
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream" if sse else "application/x-ndjson",
+            headers={"Cache-Control": "no-cache"},
+        )
+
     @app.post("/api/assemble")
     async def assemble(request: AssembleRequest):
         """Assemble a project."""
@@ -206,19 +307,23 @@ def create_app() -> FastAPI:
         """WebSocket for real-time updates."""
         await websocket.accept()
 
+        # One shared monitor probes for every client; each client gets the
+        # full snapshot once, then only diffs
+        monitor = get_health_monitor()
+        bus = monitor.bus
+        queue = bus.create_queue([EventType.HEALTH_CHECK], maxsize=16)
+        monitor.acquire()
+        sender = asyncio.create_task(_send_health_updates(websocket, monitor, queue))
         try:
+            # Clients send nothing; this only notices the disconnect
             while True:
-                # Send health updates every 10 seconds
-                health_status = await check_health()
-                await websocket.send_json(
-                    {
-                        "type": "health",
-                        "data": health_status.to_dict(),
-                    }
-                )
-                await asyncio.sleep(10)
+                await websocket.receive_text()
         except WebSocketDisconnect:
             pass
+        finally:
+            sender.cancel()
+            bus.remove_queue(queue)
+            monitor.release()
 
     # ============================================
     # Metrics & Monitoring Endpoints (for n8n)
@@ -407,9 +512,7 @@ def create_app() -> FastAPI:
     async def test_search():
         """Test search functionality."""
         try:
-            from src.discovery.unified_search import create_unified_search
-
-            search = create_unified_search()
+            search = get_search_service(app)
             results = await search.search("test", platforms=["github"], max_results=1)
             return {"status": "pass", "results": len(results.repositories)}
         except Exception as e:
@@ -430,7 +533,7 @@ def create_app() -> FastAPI:
     @app.get("/api/health/{component}")
     async def health_component(component: str):
         """Check health of specific component."""
-        health_status = await check_health()
+        health_status = await check_health(max_age=HEALTH_MAX_AGE)
 
         for c in health_status.components:
             if c.name == component:
@@ -476,6 +579,30 @@ def create_app() -> FastAPI:
     return app
 
 
+async def _send_health_updates(
+    websocket: WebSocket, monitor: HealthMonitor, queue: EventQueue
+) -> None:
+    """Send one full health snapshot, then each published diff."""
+    try:
+        version, snapshot = await monitor.state()
+        await websocket.send_json({"type": "health", "data": snapshot})
+        while True:
+            diff = (await queue.get()).data
+            if diff["version"] <= version:
+                continue  # Already covered by the snapshot
+            if diff["base_version"] != version:
+                # A diff was dropped; resync from a full snapshot
+                version, snapshot = await monitor.state()
+                await websocket.send_json({"type": "health", "data": snapshot})
+                continue
+            version = diff["version"]
+            await websocket.send_json({"type": "health_diff", "data": diff})
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        secure_logger.debug(f"Health updates stopped: {e}")
+
+
 def get_dashboard_html() -> str:
     """Generate dashboard HTML."""
     return """
@@ -588,34 +715,61 @@ def get_dashboard_html() -> str:
         document.addEventListener('DOMContentLoaded', () => {
             loadHealth();
             loadProjects();
-            setInterval(loadHealth, 30000);
+            watchHealth();
         });
 
+        // Health pushed over the WebSocket: a full snapshot, then diffs
+        let health = null;
+
+        function watchHealth() {
+            const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+            const ws = new WebSocket(`${scheme}://${location.host}/ws`);
+            ws.onmessage = (msg) => {
+                const update = JSON.parse(msg.data);
+                if (update.type === 'health') {
+                    health = update.data;
+                } else if (update.type === 'health_diff' && health) {
+                    const diff = update.data;
+                    const byName = new Map(health.components.map(c => [c.name, c]));
+                    diff.changed.forEach(c => byName.set(c.name, c));
+                    diff.removed.forEach(name => byName.delete(name));
+                    health = {...health, status: diff.status, components: [...byName.values()]};
+                } else {
+                    return;
+                }
+                renderHealth(health);
+            };
+            ws.onclose = () => setTimeout(watchHealth, 10000);
+        }
+
         async function loadHealth() {
             try {
                 const res = await fetch('/api/health');
-                const data = await res.json();
-
-                document.getElementById('health-status').innerHTML = `
-                    <span class="w-3 h-3 ${data.status === 'healthy' ? 'bg-green-400' : 'bg-yellow-400'} rounded-full animate-pulse"></span>
-                    <span class="text-sm">${data.status} | v${data.version}</span>
-                `;
-
-                const container = document.getElementById('health-container');
-                container.innerHTML = data.components.map(c => `
-                    <div class="bg-gray-700 rounded-lg p-4">
-                        <div class="flex items-center justify-between mb-2">
-                            <span class="font-medium">${c.name}</span>
-                            <span class="w-2 h-2 ${c.status === 'healthy' ? 'bg-green-400' : c.status === 'degraded' ? 'bg-yellow-400' : 'bg-gray-400'} rounded-full"></span>
-                        </div>
-                        <p class="text-sm text-gray-400">${c.message}</p>
-                    </div>
-                `).join('');
+                health = await res.json();
+                renderHealth(health);
             } catch (e) {
                 console.error('Health check failed:', e);
             }
         }
 
+        function renderHealth(data) {
+            document.getElementById('health-status').innerHTML = `
+                <span class="w-3 h-3 ${data.status === 'healthy' ? 'bg-green-400' : 'bg-yellow-400'} rounded-full animate-pulse"></span>
+                <span class="text-sm">${data.status} | v${data.version}</span>
+            `;
+
+            const container = document.getElementById('health-container');
+            container.innerHTML = data.components.map(c => `
+                <div class="bg-gray-700 rounded-lg p-4">
+                    <div class="flex items-center justify-between mb-2">
+                        <span class="font-medium">${c.name}</span>
+                        <span class="w-2 h-2 ${c.status === 'healthy' ? 'bg-green-400' : c.status === 'degraded' ? 'bg-yellow-400' : 'bg-gray-400'} rounded-full"></span>
+                    </div>
+                    <p class="text-sm text-gray-400">${c.message}</p>
+                </div>
+            `).join('');
+        }
+
         async function loadProjects() {
             try {
                 const res = await fetch('/api/projects');
@@ -647,31 +801,55 @@ def get_dashboard_html() -> str:
             if (document.getElementById('platform-huggingface').checked) platforms.push('huggingface');
             if (document.getElementById('platform-kaggle').checked) platforms.push('kaggle');
 
+            // Results stream in per platform; the final event is the ranked list
+            const shown = [];
+            document.getElementById('results-section').classList.remove('hidden');
+            renderResults(shown);
+
             try {
-                const res = await fetch('/api/search', {
+                const res = await fetch('/api/search/stream', {
                     method: 'POST',
                     headers: {'Content-Type': 'application/json'},
                     body: JSON.stringify({query, platforms, max_results: 12})
                 });
-                const data = await res.json();
-
-                document.getElementById('results-section').classList.remove('hidden');
-                document.getElementById('results-container').innerHTML = data.results.map(r => `
-                    <div class="bg-gray-700 rounded-lg p-4">
-                        <div class="flex items-center justify-between mb-2">
-                            <span class="text-xs px-2 py-1 bg-purple-600 rounded">${r.platform}</span>
-                            <span class="text-sm">⭐ ${r.stars || 0}</span>
-                        </div>
-                        <h3 class="font-semibold truncate">${r.name}</h3>
-                        <p class="text-sm text-gray-400 line-clamp-2">${r.description || 'No description'}</p>
-                        <a href="${r.url}" target="_blank" class="text-purple-400 text-sm hover:underline mt-2 inline-block">View →</a>
-                    </div>
-                `).join('');
+                const reader = res.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const {done, value} = await reader.read();
+                    if (done) break;
+                    buffer += decoder.decode(value, {stream: true});
+                    const lines = buffer.split('\\n');
+                    buffer = lines.pop();
+                    for (const line of lines.filter(Boolean)) {
+                        const event = JSON.parse(line);
+                        if (event.type === 'platform') {
+                            shown.push(...event.results);
+                            renderResults(shown);
+                        } else if (event.type === 'done') {
+                            renderResults(event.results);
+                        }
+                    }
+                }
             } catch (e) {
                 console.error('Search failed:', e);
             }
         }
 
+        function renderResults(results) {
+            document.getElementById('results-container').innerHTML = results.map(r => `
+                <div class="bg-gray-700 rounded-lg p-4">
+                    <div class="flex items-center justify-between mb-2">
+                        <span class="text-xs px-2 py-1 bg-purple-600 rounded">${r.platform}</span>
+                        <span class="text-sm">⭐ ${r.stars || 0}</span>
+                    </div>
+                    <h3 class="font-semibold truncate">${r.name}</h3>
+                    <p class="text-sm text-gray-400 line-clamp-2">${r.description || 'No description'}</p>
+                    <a href="${r.url}" target="_blank" class="text-purple-400 text-sm hover:underline mt-2 inline-block">View →</a>
+                </div>
+            `).join('');
+        }
+
         async function assembleProject() {
             const idea = document.getElementById('search-input').value;
             if (!idea) {
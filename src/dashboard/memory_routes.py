@@ -67,6 +67,18 @@ class MessageRequest(BaseModel):
     metadata: dict[str, Any] = {}
 
 
+class ConversationMessage(BaseModel):
+    role: str
+    content: str
+    metadata: dict[str, Any] = {}
+    timestamp: str | None = None
+
+
+class MessageBatchRequest(BaseModel):
+    session_id: str
+    messages: list[ConversationMessage]
+
+
 # ============================================
 # Memory Endpoints
 # ============================================
@@ -101,9 +113,10 @@ async def save_memory(request: MemoryRequest) -> dict[str, Any]:
 async def get_memories(
     type: str | None = None,
     tags: str | None = None,
+    q: str | None = None,
     limit: int = 50,
 ) -> dict[str, Any]:
-    """Get memories with optional filtering."""
+    """Get memories with optional type/tag filtering and full-text search."""
     store = get_memory_store()
 
     memory_type = None
@@ -115,7 +128,9 @@ async def get_memories(
 
     tag_list = tags.split(",") if tags else None
 
-    entries = store.search_memories(type=memory_type, tags=tag_list, limit=limit)
+    entries = store.search_memories(
+        type=memory_type, tags=tag_list, limit=limit, query=q
+    )
 
     return {
         "memories": [e.to_dict() for e in entries],
@@ -286,6 +301,36 @@ async def save_message(request: MessageRequest) -> dict[str, Any]:
     return {"success": True, "id": msg_id}
 
 
+@router.post("/conversations/messages")
+async def save_messages(request: MessageBatchRequest) -> dict[str, Any]:
+    """Save a batch of conversation messages in one transaction."""
+    store = get_memory_store()
+
+    msg_ids = store.save_messages(
+        request.session_id,
+        [m.model_dump() for m in request.messages],
+    )
+
+    return {"success": True, "ids": msg_ids, "count": len(msg_ids)}
+
+
+@router.get("/conversations/search")
+async def search_conversations(
+    q: str,
+    session_id: str | None = None,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """Full-text search conversation messages."""
+    store = get_memory_store()
+    messages = store.search_conversations(q, session_id=session_id, limit=limit)
+
+    return {
+        "query": q,
+        "messages": messages,
+        "count": len(messages),
+    }
+
+
 @router.get("/conversations/{session_id}")
 async def get_conversation(session_id: str, limit: int = 100) -> dict[str, Any]:
     """Get conversation history."""
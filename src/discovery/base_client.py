@@ -356,6 +356,9 @@ class PlatformClient(ABC):
 
         return None
 
+    async def close(self):
+        """Release pooled connections. Clients without any keep the default."""
+
     async def check_health(self) -> bool:
         """
         Check if the platform API is accessible.
@@ -0,0 +1,406 @@
+"""
+VIBE MCP - Site Crawler
+
+Breadth-first crawler used by FirecrawlClient when no Firecrawl API key is
+configured.
+
+Features:
+- FIFO URL frontier (breadth-first) drained by a pool of workers
+- Per-host concurrency limits and politeness delay (honours Crawl-delay)
+- robots.txt fetched once per origin and cached
+- Dedupe by normalized URL and by 64-bit content SimHash
+- include/exclude path patterns and maximum link depth
+- Pages are streamed as soon as they are parsed
+
+Usage:
+    crawler = Crawler(session, parse=client._parse_html, limit=50)
+    async for page in crawler.crawl("https://docs.example.com/"):
+        print(page.url)
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+
+from src.core.security import get_secure_logger
+
+if TYPE_CHECKING:
+    from src.discovery.firecrawl_client import ScrapedContent
+
+secure_logger = get_secure_logger(__name__)
+
+PageParser = Callable[[str, str], Awaitable["ScrapedContent"]]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TRACKING_PARAMS = re.compile(r"^(utm_\w+|gclid|fbclid)$")
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_url(url: str, base: str | None = None) -> str | None:
+    """
+    Canonical form of an http(s) URL, or None for anything else.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the query and gives an empty path a ``/``.
+    """
+    if base:
+        url = urljoin(base, url)
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parsed.hostname:
+        return None
+
+    netloc = parsed.hostname.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        return None
+    if port and port != _DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+            if not _TRACKING_PARAMS.match(k)
+        )
+    )
+    return urlunparse((scheme, netloc, parsed.path or "/", "", query, ""))
+
+
+def simhash(text: str, bits: int = 64) -> int:
+    """Charikar SimHash over term-frequency weighted words."""
+    weights = [0] * bits
+    for word, count in Counter(_WORD_RE.findall(text.lower())).items():
+        h = int.from_bytes(
+            hashlib.blake2b(word.encode("utf-8"), digest_size=bits // 8).digest(),
+            "big",
+        )
+        for i in range(bits):
+            weights[i] += count if h >> i & 1 else -count
+    return sum(1 << i for i, w in enumerate(weights) if w > 0)
+
+
+class SimHashIndex:
+    """
+    Finds fingerprints within ``max_distance`` bits of a stored one.
+
+    The 64 bits are split into ``max_distance + 1`` blocks; two fingerprints
+    that differ in at most ``max_distance`` bits must agree exactly on at
+    least one block, so only fingerprints sharing a block are compared.
+    """
+
+    def __init__(self, max_distance: int = 3, bits: int = 64):
+        self.max_distance = max_distance
+        blocks = max_distance + 1
+        width = -(-bits // blocks)
+        self._blocks = [
+            (start, (1 << min(width, bits - start)) - 1)
+            for start in range(0, bits, width)
+        ]
+        self._tables: list[dict[int, list[int]]] = [{} for _ in self._blocks]
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._tables[0].values())
+
+    def find(self, fingerprint: int) -> int | None:
+        for table, (start, mask) in zip(self._tables, self._blocks, strict=True):
+            for other in table.get(fingerprint >> start & mask, ()):
+                if (fingerprint ^ other).bit_count() <= self.max_distance:
+                    return other
+        return None
+
+    def add(self, fingerprint: int) -> None:
+        for table, (start, mask) in zip(self._tables, self._blocks, strict=True):
+            table.setdefault(fingerprint >> start & mask, []).append(fingerprint)
+
+
+class RobotsCache:
+    """robots.txt rules per origin, fetched once and kept for ``ttl`` seconds."""
+
+    def __init__(self, user_agent: str = "VIBE-MCP", ttl: float = 3600.0):
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, RobotFileParser]] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+
+    async def get(self, session: aiohttp.ClientSession, url: str) -> RobotFileParser:
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        cached = self._entries.get(origin)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        # Concurrent workers hitting a new host share one fetch
+        pending = self._pending.get(origin)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[origin] = future
+        try:
+            rules = await self._fetch(session, origin)
+            self._entries[origin] = (time.monotonic(), rules)
+            future.set_result(rules)
+            return rules
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else waits
+            raise
+        finally:
+            del self._pending[origin]
+
+    async def _fetch(
+        self, session: aiohttp.ClientSession, origin: str
+    ) -> RobotFileParser:
+        rules = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            async with session.get(rules.url) as response:
+                if response.status in (401, 403):
+                    rules.disallow_all = True
+                elif response.status < 400:
+                    rules.parse((await response.text()).splitlines())
+                else:
+                    rules.allow_all = True
+        except (aiohttp.ClientError, TimeoutError) as e:
+            secure_logger.debug(f"robots.txt unavailable for {origin}: {e}")
+            rules.allow_all = True
+        return rules
+
+    async def allowed(self, session: aiohttp.ClientSession, url: str) -> bool:
+        rules = await self.get(session, url)
+        return rules.can_fetch(self.user_agent, url)
+
+    async def crawl_delay(self, session: aiohttp.ClientSession, url: str) -> float:
+        rules = await self.get(session, url)
+        return float(rules.crawl_delay(self.user_agent) or 0)
+
+
+class _HostSlot:
+    """Concurrency cap and request spacing for one host."""
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.lock = asyncio.Lock()
+        self.next_time = 0.0
+
+    async def wait_turn(self, delay: float) -> None:
+        if delay <= 0:
+            return
+        async with self.lock:
+            loop = asyncio.get_running_loop()
+            wait = self.next_time - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.next_time = loop.time() + delay
+
+
+@dataclass
+class _CrawlState:
+    """Per-crawl bookkeeping."""
+
+    start_host: str
+    frontier: asyncio.Queue = field(default_factory=asyncio.Queue)
+    results: asyncio.Queue = field(default_factory=asyncio.Queue)
+    seen_urls: set[str] = field(default_factory=set)
+    fingerprints: SimHashIndex = field(default_factory=SimHashIndex)
+    accepted: int = 0
+    stats: dict[str, int] = field(
+        default_factory=lambda: {
+            "fetched": 0,
+            "pages": 0,
+            "duplicate_content": 0,
+            "robots_blocked": 0,
+            "errors": 0,
+        }
+    )
+
+
+class Crawler:
+    """
+    Concurrent breadth-first site crawler.
+
+    Only follows links on the start URL's host. The start URL is always
+    crawled; later URLs must match ``include_paths`` (if given) and none of
+    ``exclude_paths``, both regular expressions searched in the URL path.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        parse: PageParser,
+        limit: int = 10,
+        max_depth: int = 2,
+        include_paths: list[str] | None = None,
+        exclude_paths: list[str] | None = None,
+        concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        delay: float = 0.0,
+        respect_robots: bool = True,
+        robots: RobotsCache | None = None,
+    ):
+        """
+        Initialize crawler.
+
+        Args:
+            session: HTTP session used for pages and robots.txt
+            parse: Coroutine turning ``(url, html)`` into ScrapedContent
+            limit: Maximum pages to return
+            max_depth: Maximum link hops from the start URL
+            include_paths: Path patterns to include
+            exclude_paths: Path patterns to exclude
+            concurrency: Total concurrent fetches
+            per_host_concurrency: Concurrent fetches per host
+            delay: Minimum seconds between requests to one host
+            respect_robots: Obey robots.txt rules and Crawl-delay
+            robots: Shared robots.txt cache
+        """
+        self.session = session
+        self.parse = parse
+        self.limit = limit
+        self.max_depth = max_depth
+        self.include = [re.compile(p) for p in include_paths or []]
+        self.exclude = [re.compile(p) for p in exclude_paths or []]
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.delay = delay
+        self.respect_robots = respect_robots
+        self.robots = robots or RobotsCache()
+        self._hosts: dict[str, _HostSlot] = {}
+        self.last_stats: dict[str, int] = {}
+
+    def _path_allowed(self, url: str) -> bool:
+        path = urlparse(url).path
+        if self.include and not any(p.search(path) for p in self.include):
+            return False
+        return not any(p.search(path) for p in self.exclude)
+
+    def _enqueue(self, state: _CrawlState, url: str, depth: int) -> None:
+        if url in state.seen_urls:
+            return
+        state.seen_urls.add(url)
+        state.frontier.put_nowait((url, depth))
+
+    async def crawl(self, start_url: str) -> AsyncIterator["ScrapedContent"]:
+        """
+        Crawl from ``start_url``, yielding pages as they are parsed.
+
+        Each page's ``metadata`` records its ``depth`` and ``status_code``.
+        """
+        start = normalize_url(start_url)
+        if start is None:
+            raise ValueError(f"Not an http(s) URL: {start_url}")
+
+        state = _CrawlState(start_host=urlparse(start).netloc)
+        self.last_stats = state.stats
+        if self.limit <= 0:
+            return
+        self._enqueue(state, start, 0)
+
+        async def close_when_drained():
+            await state.frontier.join()
+            state.results.put_nowait(None)
+
+        workers = [
+            asyncio.create_task(self._worker(state)) for _ in range(self.concurrency)
+        ]
+        closer = asyncio.create_task(close_when_drained())
+        yielded = 0
+        try:
+            while yielded < self.limit:
+                page = await state.results.get()
+                if page is None:
+                    break
+                yielded += 1
+                yield page
+        finally:
+            for task in (*workers, closer):
+                task.cancel()
+            await asyncio.gather(*workers, closer, return_exceptions=True)
+
+    async def _worker(self, state: _CrawlState) -> None:
+        while True:
+            url, depth = await state.frontier.get()
+            try:
+                if state.accepted < self.limit:
+                    await self._visit(state, url, depth)
+            except Exception as e:
+                state.stats["errors"] += 1
+                secure_logger.warning(f"Crawl of {url} failed: {e}")
+            finally:
+                state.frontier.task_done()
+
+    async def _visit(self, state: _CrawlState, url: str, depth: int) -> None:
+        delay = self.delay
+        if self.respect_robots:
+            if not await self.robots.allowed(self.session, url):
+                state.stats["robots_blocked"] += 1
+                return
+            delay = max(delay, await self.robots.crawl_delay(self.session, url))
+
+        host = urlparse(url).netloc
+        slot = self._hosts.setdefault(host, _HostSlot(self.per_host_concurrency))
+        async with slot.semaphore:
+            await slot.wait_turn(delay)
+            fetched = await self._fetch(url)
+        if fetched is None:
+            return
+        final_url, status, html = fetched
+        state.stats["fetched"] += 1
+
+        # A redirect may land on a page we already have
+        if final_url != url:
+            if final_url in state.seen_urls:
+                return
+            state.seen_urls.add(final_url)
+
+        page = await self.parse(final_url, html)
+        if state.accepted >= self.limit:
+            return
+
+        if page.content.strip():
+            fingerprint = simhash(page.content)
+            if state.fingerprints.find(fingerprint) is not None:
+                state.stats["duplicate_content"] += 1
+                return
+            state.fingerprints.add(fingerprint)
+
+        state.accepted += 1
+        state.stats["pages"] += 1
+        page.metadata.update({"depth": depth, "status_code": status})
+        state.results.put_nowait(page)
+
+        if depth >= self.max_depth:
+            return
+        for link in page.links:
+            target = normalize_url(link, final_url)
+            if (
+                target
+                and urlparse(target).netloc == state.start_host
+                and self._path_allowed(target)
+            ):
+                self._enqueue(state, target, depth + 1)
+
+    async def _fetch(self, url: str) -> tuple[str, int, str] | None:
+        """GET an HTML page; None for errors and non-HTML responses."""
+        async with self.session.get(url, headers={"Accept": "text/html"}) as response:
+            if response.status >= 400:
+                secure_logger.debug(f"Skipping {url}: HTTP {response.status}")
+                return None
+            if "html" not in response.headers.get("Content-Type", "text/html"):
+                return None
+            html = await response.text(errors="replace")
+            return normalize_url(str(response.url)) or url, response.status, html
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters from the most recent crawl."""
+        return dict(self.last_stats)
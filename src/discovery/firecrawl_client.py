@@ -16,6 +16,7 @@ import asyncio
 import json
 import os
 import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -24,10 +25,11 @@ from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
-import markdownify
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup
 
 from src.core.security import get_secure_logger
+from src.discovery.crawler import Crawler, RobotsCache
+from src.discovery.html_extract import ExtractedPage, extract_html
 
 secure_logger = get_secure_logger(__name__)
 
@@ -113,6 +115,7 @@ class FirecrawlClient:
 
         # Session
         self._session: aiohttp.ClientSession | None = None
+        self._robots = RobotsCache(user_agent="VIBE-MCP")
 
         if not self.api_key:
             secure_logger.warning(
@@ -223,79 +226,63 @@ class FirecrawlClient:
             Scraped content
         """
         secure_logger.info(f"Using fallback scraping for {url}")
+        await self._ensure_session()
 
         try:
             async with self._session.get(url) as response:
                 response.raise_for_status()
                 html = await response.text()
+            return await self._parse_html(url, html)
 
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Extract metadata
-                title = soup.find("title")
-                title = title.get_text().strip() if title else ""
-
-                description = soup.find("meta", attrs={"name": "description"})
-                description = description.get("content", "") if description else ""
+        except Exception as e:
+            secure_logger.error(f"Fallback scraping failed: {e}")
+            raise
 
-                # Clean content
-                for script in soup(["script", "style", "nav", "footer"]):
-                    script.decompose()
+    async def _parse_html(self, url: str, html: str) -> ScrapedContent:
+        """
+        Extract metadata, links, images and markdown from a fetched page.
 
-                # Remove comments
-                for comment in soup.find_all(
-                    string=lambda text: isinstance(text, Comment)
-                ):
-                    comment.extract()
-
-                # Extract links
-                links = []
-                for a in soup.find_all("a", href=True):
-                    href = a["href"]
-                    if href.startswith("http"):
-                        links.append(href)
-                    elif href.startswith("/"):
-                        parsed = urlparse(url)
-                        links.append(f"{parsed.scheme}://{parsed.netloc}{href}")
-
-                # Extract images
-                images = []
-                for img in soup.find_all("img", src=True):
-                    src = img["src"]
-                    if src.startswith("http"):
-                        images.append(src)
-                    elif src.startswith("/"):
-                        parsed = urlparse(url)
-                        images.append(f"{parsed.scheme}://{parsed.netloc}{src}")
-
-                # Convert to markdown
-                content = markdownify.markdownify(str(soup), heading_style="ATX")
-
-                # Clean markdown
-                content = re.sub(r"\n{3,}", "\n\n", content)
-                content = content.strip()
+        The page is parsed once, off the event loop (see html_extract).
 
-                # Calculate metrics
-                word_count = len(content.split())
-                reading_time = max(1, word_count // 200)  # 200 words per minute
+        Args:
+            url: Page URL (base for relative links)
+            html: Page HTML
 
-                return ScrapedContent(
-                    url=url,
-                    title=title,
-                    description=description,
-                    content=content,
-                    format=FirecrawlFormat.MARKDOWN,
-                    timestamp=datetime.now(),
-                    links=links,
-                    images=images,
-                    word_count=word_count,
-                    reading_time=reading_time,
-                )
+        Returns:
+            Scraped content
+        """
+        page = await extract_html(url, html)
+        return self._to_scraped_content(url, page, FirecrawlFormat.MARKDOWN)
 
-        except Exception as e:
-            secure_logger.error(f"Fallback scraping failed: {e}")
-            raise
+    def _to_scraped_content(
+        self, url: str, page: ExtractedPage, format: FirecrawlFormat
+    ) -> ScrapedContent:
+        """Build ScrapedContent from an extracted page."""
+        content = page.markdown or page.text
+
+        metadata: dict[str, Any] = dict(page.metadata)
+        if page.tables:
+            metadata["tables"] = page.tables
+        if page.code_blocks:
+            metadata["code_blocks"] = page.code_blocks
+
+        # Calculate metrics
+        word_count = len(content.split())
+        reading_time = max(1, word_count // 200)  # 200 words per minute
+
+        return ScrapedContent(
+            url=url,
+            title=page.title,
+            description=page.description,
+            content=content,
+            format=format,
+            timestamp=datetime.now(),
+            metadata=metadata,
+            links=page.links,
+            images=page.images,
+            word_count=word_count,
+            reading_time=reading_time,
+        )
 
     # ========================================================================
     # SCRAPING OPERATIONS
@@ -399,81 +386,153 @@ class FirecrawlClient:
         Returns:
             List of scraped content
         """
-        if not formats:
-            formats = [FirecrawlFormat.MARKDOWN]
+        return [
+            page
+            async for page in self.crawl_site_stream(
+                url,
+                limit=limit,
+                include_paths=include_paths,
+                exclude_paths=exclude_paths,
+                formats=formats,
+                max_depth=max_depth,
+            )
+        ]
 
-        # Use Firecrawl API if available
-        if self.api_key:
-            data = {
-                "url": url,
-                "limit": limit,
-                "scrapeOptions": {
-                    "formats": [f.value for f in formats],
-                    "onlyMainContent": True,
-                },
-            }
+    async def crawl_site_stream(
+        self,
+        url: str,
+        limit: int = 10,
+        include_paths: list[str] | None = None,
+        exclude_paths: list[str] | None = None,
+        formats: list[FirecrawlFormat] | None = None,
+        max_depth: int = 2,
+        concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        delay: float = 0.0,
+    ) -> AsyncIterator[ScrapedContent]:
+        """
+        Crawl a site, yielding pages as they become available.
 
-            if include_paths:
-                data["includePaths"] = include_paths
+        Uses the Firecrawl crawl API when an API key is configured and the
+        built-in breadth-first crawler otherwise (or if the API fails before
+        returning any page).
 
-            if exclude_paths:
-                data["excludePaths"] = exclude_paths
+        Args:
+            url: Starting URL
+            limit: Maximum pages to crawl
+            include_paths: Path regexes to include
+            exclude_paths: Path regexes to exclude
+            formats: Output formats
+            max_depth: Maximum link depth from the start URL
+            concurrency: Local crawler: concurrent fetches
+            per_host_concurrency: Local crawler: concurrent fetches per host
+            delay: Local crawler: minimum seconds between requests to a host
 
-            if max_depth:
-                data["maxDepth"] = max_depth
+        Yields:
+            Scraped content
+        """
+        if not formats:
+            formats = [FirecrawlFormat.MARKDOWN]
 
+        # Use Firecrawl API if available
+        if self.api_key:
+            yielded = 0
             try:
-                # Start crawl job
-                result = await self._request("POST", "/crawl", data=data)
-                job_id = result.get("jobId")
-
-                if not job_id:
-                    raise RuntimeError("No job ID returned")
+                async for page in self._api_crawl(
+                    url, limit, include_paths, exclude_paths, formats, max_depth
+                ):
+                    yielded += 1
+                    yield page
+                return
+            except Exception as e:
+                if yielded:
+                    secure_logger.warning(f"Firecrawl crawl stopped early: {e}")
+                    return
+                secure_logger.warning(
+                    f"Firecrawl crawl failed, using local crawler: {e}"
+                )
 
-                # Monitor job
-                contents = []
-                while len(contents) < limit:
-                    status = await self._request("GET", f"/crawl/status/{job_id}")
+        await self._ensure_session()
+        crawler = Crawler(
+            self._session,
+            parse=self._parse_html,
+            limit=limit,
+            max_depth=max_depth,
+            include_paths=include_paths,
+            exclude_paths=exclude_paths,
+            concurrency=concurrency,
+            per_host_concurrency=per_host_concurrency,
+            delay=delay,
+            robots=self._robots,
+        )
+        async for page in crawler.crawl(url):
+            yield page
+        secure_logger.info(f"Crawled {url}: {crawler.get_stats()}")
 
-                    if status.get("status") == "completed":
-                        break
+    async def _api_crawl(
+        self,
+        url: str,
+        limit: int,
+        include_paths: list[str] | None,
+        exclude_paths: list[str] | None,
+        formats: list[FirecrawlFormat],
+        max_depth: int,
+    ) -> AsyncIterator[ScrapedContent]:
+        """Run a Firecrawl crawl job, yielding each page once as it appears."""
+        data = {
+            "url": url,
+            "limit": limit,
+            "scrapeOptions": {
+                "formats": [f.value for f in formats],
+                "onlyMainContent": True,
+            },
+        }
 
-                    if status.get("status") == "failed":
-                        raise RuntimeError("Crawl job failed")
+        if include_paths:
+            data["includePaths"] = include_paths
 
-                    # Get current data
-                    data = status.get("data", [])
-                    for item in data:
-                        if len(contents) >= limit:
-                            break
+        if exclude_paths:
+            data["excludePaths"] = exclude_paths
 
-                        content = ScrapedContent(
-                            url=item.get("url", ""),
-                            title=item.get("metadata", {}).get("title", ""),
-                            description=item.get("metadata", {}).get("description", ""),
-                            content=item.get("content", ""),
-                            format=formats[0],
-                            timestamp=datetime.now(),
-                            metadata=item.get("metadata", {}),
-                        )
+        if max_depth:
+            data["maxDepth"] = max_depth
 
-                        # Calculate metrics
-                        content.word_count = len(content.content.split())
-                        content.reading_time = max(1, content.word_count // 200)
+        # Start crawl job
+        result = await self._request("POST", "/crawl", data=data)
+        job_id = result.get("jobId")
 
-                        contents.append(content)
+        if not job_id:
+            raise RuntimeError("No job ID returned")
 
-                    await asyncio.sleep(2)  # Poll interval
+        # Status responses repeat everything crawled so far; only the tail
+        # past what was already yielded is new
+        seen = 0
+        while seen < limit:
+            status = await self._request("GET", f"/crawl/status/{job_id}")
 
-                return contents
+            if status.get("status") == "failed":
+                raise RuntimeError("Crawl job failed")
 
-            except Exception as e:
-                secure_logger.warning(
-                    f"Firecrawl crawl failed, scraping single page: {e}"
+            for item in status.get("data", [])[seen:limit]:
+                seen += 1
+                content = item.get("content", "")
+                word_count = len(content.split())
+                yield ScrapedContent(
+                    url=item.get("url", ""),
+                    title=item.get("metadata", {}).get("title", ""),
+                    description=item.get("metadata", {}).get("description", ""),
+                    content=content,
+                    format=formats[0],
+                    timestamp=datetime.now(),
+                    metadata=item.get("metadata", {}),
+                    word_count=word_count,
+                    reading_time=max(1, word_count // 200),
                 )
 
-        # Fallback: just scrape the main page
-        return [await self.scrape_url(url, formats=formats)]
+            if status.get("status") == "completed":
+                break
+
+            await asyncio.sleep(2)  # Poll interval
 
     async def map_site(
         self,
@@ -17,6 +17,7 @@ import json
 import logging
 import sqlite3
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -24,7 +25,6 @@ from pathlib import Path
 from typing import Any
 
 import tiktoken
-from bs4 import BeautifulSoup
 
 from src.llm.litellm_router import LiteLLMRouter
 from src.platform.browser_automation import (
@@ -34,6 +34,8 @@ from src.platform.browser_automation import (
 )
 
 from .firecrawl_client import FirecrawlClient, FirecrawlFormat, ScrapedContent
+from .html_extract import extract_html
+from .scrape_queue import ScrapeQueue, ScrapeResult
 
 secure_logger = logging.getLogger(__name__)
 
@@ -94,6 +96,7 @@ class RateLimitConfig:
     strategy: RateLimitStrategy = RateLimitStrategy.ADAPTIVE
     max_retries: int = 3
     backoff_factor: float = 2.0
+    per_domain_interval: float = 0.0  # seconds between batch requests per domain
 
 
 @dataclass
@@ -155,9 +158,13 @@ class FirecrawlEnhanced(FirecrawlClient):
         # Browser automation fallback
         self.browser: BrowserAutomation | None = None
 
-        # Content queue for prioritized processing
-        self._content_queue: list[tuple[ContentPriority, dict[str, Any]]] = []
-        self._queue_lock = asyncio.Lock()
+        # Priority work queue for batch scraping
+        self._work_queue = ScrapeQueue(
+            self._scrape_queued,
+            domain_interval=self.rate_limit_config.per_domain_interval,
+            max_retries=self.rate_limit_config.max_retries,
+            backoff_factor=self.rate_limit_config.backoff_factor,
+        )
 
         secure_logger.info(
             f"Enhanced Firecrawl client initialized with {cache_strategy.value} caching"
@@ -419,57 +426,16 @@ class FirecrawlEnhanced(FirecrawlClient):
             # Get page content
             html = await self.browser.get_page_content()
 
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Extract metadata
-            title = soup.find("title")
-            title = title.get_text().strip() if title else ""
-
-            description = soup.find("meta", attrs={"name": "description"})
-            description = description.get("content", "") if description else ""
-
-            # Extract content based on format
-            if FirecrawlFormat.MARKDOWN in formats:
-                import markdownify
-
-                content = markdownify.markdownify(str(soup), heading_style="ATX")
-            else:
-                # Clean text
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                content = soup.get_text(separator="\n", strip=True)
-
-            # Extract links and images
-            links = []
-            images = []
-
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                if href.startswith("http"):
-                    links.append(href)
-
-            for img in soup.find_all("img", src=True):
-                src = img["src"]
-                if src.startswith("http"):
-                    images.append(src)
-
-            # Calculate metrics
-            word_count = len(content.split())
-            reading_time = max(1, word_count // 200)
-
-            return ScrapedContent(
-                url=url,
-                title=title,
-                description=description,
-                content=content,
-                format=formats[0],
-                timestamp=datetime.now(),
-                links=links,
-                images=images,
-                word_count=word_count,
-                reading_time=reading_time,
+            # One off-loop parse yields metadata, links, images and content
+            markdown = FirecrawlFormat.MARKDOWN in formats
+            page = await extract_html(
+                url,
+                html,
+                markdown=markdown,
+                text=not markdown,
+                strip_boilerplate=not markdown,
             )
+            return self._to_scraped_content(url, page, formats[0])
 
         except Exception as e:
             secure_logger.error(f"Browser scraping failed: {e}")
@@ -483,13 +449,11 @@ class FirecrawlEnhanced(FirecrawlClient):
         """Enhance content with AI processing."""
         enhanced = content
 
-        # Extract and enhance tables
-        if config.extract_tables:
-            enhanced = await self._extract_tables(enhanced)
-
-        # Extract and format code blocks
-        if config.extract_code:
-            enhanced = await self._extract_code_blocks(enhanced)
+        # Tables and code blocks share one parse
+        if config.extract_tables or config.extract_code:
+            enhanced = await self._extract_structure(
+                enhanced, tables=config.extract_tables, code=config.extract_code
+            )
 
         # Detect language
         if config.language_detection:
@@ -507,61 +471,43 @@ class FirecrawlEnhanced(FirecrawlClient):
 
         return enhanced
 
-    async def _extract_tables(self, content: ScrapedContent) -> ScrapedContent:
-        """Extract and format tables from content."""
-        soup = BeautifulSoup(content.content, "html.parser")
-        tables = []
-
-        for table in soup.find_all("table"):
-            # Convert table to markdown
-            rows = []
-            for tr in table.find_all("tr"):
-                cells = [td.get_text().strip() for td in tr.find_all(["td", "th"])]
-                if cells:
-                    rows.append(" | ".join(cells))
-
-            if rows:
-                # Add header separator
-                if len(rows) > 1:
-                    rows.insert(1, " | ".join(["---"] * len(rows[0].split(" | "))))
-                tables.append("\n".join(rows))
-
-        if tables:
-            content.metadata["tables"] = tables
+    async def _extract_structure(
+        self, content: ScrapedContent, tables: bool = True, code: bool = True
+    ) -> ScrapedContent:
+        """
+        Extract tables and code blocks from HTML content.
 
-        return content
+        Pages scraped locally already carry both from the extraction pass;
+        otherwise the content is parsed once, and only if it contains the
+        markup in question.
+        """
+        tables = tables and "tables" not in content.metadata
+        code = code and "code_blocks" not in content.metadata
+        if not (tables or code):
+            return content
 
-    async def _extract_code_blocks(self, content: ScrapedContent) -> ScrapedContent:
-        """Extract code blocks with language detection."""
-        soup = BeautifulSoup(content.content, "html.parser")
-        code_blocks = []
-
-        for pre in soup.find_all("pre"):
-            code = pre.get_text()
-            # Try to detect language from class
-            code_class = pre.get("class", [])
-            language = "unknown"
-
-            for cls in code_class:
-                if cls.startswith("language-"):
-                    language = cls[9:]
-                    break
-                elif cls in ["python", "javascript", "java", "cpp", "c"]:
-                    language = cls
-                    break
-
-            code_blocks.append(
-                {
-                    "code": code,
-                    "language": language,
-                }
-            )
+        lowered = content.content.lower()
+        if not (tables and "<table" in lowered) and not (code and "<pre" in lowered):
+            return content
 
-        if code_blocks:
-            content.metadata["code_blocks"] = code_blocks
+        page = await extract_html(
+            content.url, content.content, markdown=False, strip_boilerplate=False
+        )
+        if tables and page.tables:
+            content.metadata["tables"] = page.tables
+        if code and page.code_blocks:
+            content.metadata["code_blocks"] = page.code_blocks
 
         return content
 
+    async def _extract_tables(self, content: ScrapedContent) -> ScrapedContent:
+        """Extract and format tables from content."""
+        return await self._extract_structure(content, tables=True, code=False)
+
+    async def _extract_code_blocks(self, content: ScrapedContent) -> ScrapedContent:
+        """Extract code blocks with language detection."""
+        return await self._extract_structure(content, tables=False, code=True)
+
     async def _detect_language(self, text: str) -> str:
         """Detect content language using simple heuristics."""
         # Simple keyword-based detection
@@ -631,46 +577,52 @@ Summary:
             concurrency: Max concurrent requests
 
         Returns:
-            List of scraped content
+            List of scraped content, in completion order
+        """
+        return [
+            result.value
+            async for result in self.stream_scrape_priority(
+                urls, priorities, concurrency
+            )
+            if result.ok and result.value is not None
+        ]
+
+    async def stream_scrape_priority(
+        self,
+        urls: list[str],
+        priorities: list[ContentPriority] | None = None,
+        concurrency: int = 3,
+    ) -> AsyncIterator[ScrapeResult]:
+        """
+        Scrape URLs through the shared priority queue, yielding as they finish.
+
+        Every URL is processed; higher priorities start first. A URL that
+        another batch already queued is scraped once and shared. Failed
+        scrapes are retried with backoff and finally yielded with ``error``
+        set.
+
+        Args:
+            urls: List of URLs to scrape
+            priorities: Priority for each URL
+            concurrency: Workers in the shared queue
+
+        Yields:
+            ScrapeResult per distinct URL (``value`` is the ScrapedContent)
         """
         if priorities is None:
             priorities = [ContentPriority.NORMAL] * len(urls)
 
-        # Add to priority queue
-        async with self._queue_lock:
-            for url, priority in zip(urls, priorities, strict=False):
-                self._content_queue.append((priority, {"url": url}))
-
-            # Sort by priority (descending)
-            self._content_queue.sort(key=lambda x: x[0].value, reverse=True)
-
-        # Process queue
-        results = []
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def process_item():
-            async with semaphore:
-                async with self._queue_lock:
-                    if not self._content_queue:
-                        return None
-                    priority, item = self._content_queue.pop(0)
-
-                try:
-                    content = await self.scrape_url_enhanced(
-                        item["url"],
-                        priority=priority,
-                    )
-                    return content
-                except Exception as e:
-                    secure_logger.error(f"Failed to scrape {item['url']}: {e}")
-                    return None
-
-        # Run tasks
-        tasks = [process_item() for _ in range(min(len(urls), concurrency * 2))]
-        results = await asyncio.gather(*tasks)
+        self._work_queue.set_concurrency(concurrency)
+        requests = [
+            (url, priority.value)
+            for url, priority in zip(urls, priorities, strict=False)
+        ]
+        async for result in self._work_queue.stream(requests):
+            yield result
 
-        # Filter None results
-        return [r for r in results if r is not None]
+    async def _scrape_queued(self, url: str, priority: int) -> ScrapedContent:
+        """Work queue handler."""
+        return await self.scrape_url_enhanced(url, priority=ContentPriority(priority))
 
     # ========================================================================
     # UTILITY METHODS
@@ -714,6 +666,8 @@ Summary:
 
     async def close(self):
         """Cleanup resources."""
+        await self._work_queue.close()
+
         if self.browser:
             await self.browser.close()
             self.browser = None
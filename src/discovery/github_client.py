@@ -10,6 +10,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+import httpx
+
 from src.core.circuit_breaker import GITHUB_BREAKER_CONFIG, circuit_breaker
 from src.core.observability import correlation_manager, metrics, track_performance
 from src.core.security import InputValidator, get_secure_logger
@@ -23,7 +25,7 @@ from src.discovery.base_client import (
     RepositoryNotFoundError,
     SearchResult,
 )
-from src.utils.rate_limiter import RateLimiter
+from src.utils.quota_broker import get_quota_broker, quota_key
 
 secure_logger = get_secure_logger(__name__)
 
@@ -61,9 +63,22 @@ class GitHubClient(PlatformClient):
         """
         self._token = token
         self._api = None
-        self._rate_limiter = RateLimiter(
+        self._client: httpx.AsyncClient | None = None
+        # Shared with every process using the same token. Search has its
+        # own, much smaller quota (30/min, 10/min anonymous).
+        broker = get_quota_broker()
+        key = quota_key("github", token)
+        self._rate_limiter = broker.limiter(
+            key,
             requests_per_hour=requests_per_hour if token else 60,
             burst_size=30 if token else 10,
+            consumer="github_client",
+        )
+        self._search_limiter = broker.limiter(
+            f"{key}:search",
+            requests_per_hour=1800 if token else 600,
+            burst_size=30 if token else 10,
+            consumer="github_client",
         )
         self._init_api()
 
@@ -78,6 +93,18 @@ class GitHubClient(PlatformClient):
             secure_logger.warning("ghapi not installed, using fallback")
             self._api = None
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
     @property
     def platform_name(self) -> str:
         return "github"
@@ -127,7 +154,7 @@ class GitHubClient(PlatformClient):
         )
 
         # Wait for rate limit
-        await self._rate_limiter.acquire()
+        await self._search_limiter.acquire()
 
         # Build search query
         search_query = query
@@ -154,6 +181,7 @@ class GitHubClient(PlatformClient):
                     order=order,
                     per_page=min(max_results, 100),
                 )
+                await self._record_quota()
 
                 repositories = []
                 for item in results["items"][:max_results]:
@@ -224,6 +252,19 @@ class GitHubClient(PlatformClient):
                 )
                 raise
 
+    async def _record_quota(self, headers: Any = None) -> None:
+        """Seed the shared quota from the last response's rate-limit headers."""
+        if headers is None:
+            # ghapi keeps the headers of its most recent response
+            headers = getattr(self._api, "recv_hdrs", None)
+        if not headers:
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        if resource == "search":
+            await self._search_limiter.update_from_headers(headers)
+        elif resource == "core":
+            await self._rate_limiter.update_from_headers(headers)
+
     async def get_repository(self, repo_id: str) -> RepositoryInfo:
         """Get detailed repository information."""
         await self._rate_limiter.acquire()
@@ -233,6 +274,7 @@ class GitHubClient(PlatformClient):
 
             if self._api:
                 data = self._api.repos.get(owner=owner, repo=repo)
+                await self._record_quota()
                 return self._convert_repo(data)
             else:
                 return await self._get_repo_fallback(repo_id)
@@ -258,6 +300,7 @@ class GitHubClient(PlatformClient):
                 repo=repo,
                 path=path,
             )
+            await self._record_quota()
 
             files = []
             directories = []
@@ -306,6 +349,7 @@ class GitHubClient(PlatformClient):
                 repo=repo,
                 path=file_path,
             )
+            await self._record_quota()
 
             # Decode base64 content
             raw_content = base64.b64decode(content.content)
@@ -396,8 +440,6 @@ class GitHubClient(PlatformClient):
         """Fallback search using httpx when ghapi is unavailable."""
         import time
 
-        import httpx
-
         start_time = time.time()
 
         # Build search query
@@ -431,14 +473,15 @@ class GitHubClient(PlatformClient):
         if sort_field:
             params["sort"] = sort_field
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                "https://api.github.com/search/repositories",
-                params=params,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = await self._get_client()
+        response = await client.get(
+            "https://api.github.com/search/repositories",
+            params=params,
+            headers=headers,
+        )
+        await self._record_quota(response.headers)
+        response.raise_for_status()
+        data = response.json()
 
         # Convert to RepositoryInfo objects
         repositories = []
@@ -487,8 +530,6 @@ class GitHubClient(PlatformClient):
 
     async def _get_repo_fallback(self, repo_id: str) -> RepositoryInfo:
         """Fallback repo fetch using httpx."""
-        import httpx
-
         owner, repo = repo_id.split("/")
 
         headers = {
@@ -498,22 +539,21 @@ class GitHubClient(PlatformClient):
         if self._token:
             headers["Authorization"] = f"token {self._token}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}",
-                headers=headers,
-            )
-            if response.status_code == 404:
-                raise RepositoryNotFoundError(f"Repository not found: {repo_id}")
-            response.raise_for_status()
-            data = response.json()
+        client = await self._get_client()
+        response = await client.get(
+            f"https://api.github.com/repos/{owner}/{repo}",
+            headers=headers,
+        )
+        await self._record_quota(response.headers)
+        if response.status_code == 404:
+            raise RepositoryNotFoundError(f"Repository not found: {repo_id}")
+        response.raise_for_status()
+        data = response.json()
 
         return self._convert_repo_dict(data)
 
     async def _get_contents_fallback(self, repo_id: str, path: str) -> DirectoryListing:
         """Fallback contents fetch using httpx."""
-        import httpx
-
         owner, repo = repo_id.split("/")
 
         headers = {
@@ -525,10 +565,11 @@ class GitHubClient(PlatformClient):
 
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            contents = response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=headers)
+        await self._record_quota(response.headers)
+        response.raise_for_status()
+        contents = response.json()
 
         files = []
         directories = []
@@ -559,8 +600,6 @@ class GitHubClient(PlatformClient):
         """Fallback file fetch using httpx."""
         import base64
 
-        import httpx
-
         owner, repo = repo_id.split("/")
 
         headers = {
@@ -572,10 +611,11 @@ class GitHubClient(PlatformClient):
 
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=headers)
+        await self._record_quota(response.headers)
+        response.raise_for_status()
+        data = response.json()
 
         content = ""
         if data.get("encoding") == "base64" and data.get("content"):
@@ -598,7 +638,9 @@ class GitHubClient(PlatformClient):
         owner, repo = repo_id.split("/")
 
         if self._api:
-            return dict(self._api.repos.list_languages(owner=owner, repo=repo))
+            languages = self._api.repos.list_languages(owner=owner, repo=repo)
+            await self._record_quota()
+            return dict(languages)
         return {}
 
     async def get_topics(self, repo_id: str) -> list[str]:
@@ -609,6 +651,7 @@ class GitHubClient(PlatformClient):
 
         if self._api:
             result = self._api.repos.get_all_topics(owner=owner, repo=repo)
+            await self._record_quota()
             return result.names
         return []
 
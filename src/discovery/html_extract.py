@@ -0,0 +1,221 @@
+"""
+VIBE MCP - HTML Extraction
+
+Single-pass extraction for scraped pages. Each document is parsed once and
+the same tree yields title, meta tags, links, images, tables, code blocks
+and markdown; markdown is rendered from the tree rather than re-parsing
+serialized HTML.
+
+BeautifulSoup uses the lxml tree builder when lxml is installed (several
+times faster than the pure-Python ``html.parser``, which stays the
+fallback). Parsing is CPU-bound, so :func:`extract_html` runs it in a
+shared process pool instead of on the event loop.
+
+Usage:
+    page = await extract_html("https://example.com/", html)
+    page.title, page.links, page.tables, page.markdown
+"""
+
+import asyncio
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Comment
+from markdownify import MarkdownConverter
+
+from src.core.security import get_secure_logger
+
+try:
+    import lxml  # noqa: F401
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+secure_logger = get_secure_logger(__name__)
+
+PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Removed before rendering markdown
+_BOILERPLATE_TAGS = ["script", "style", "nav", "footer", "noscript"]
+
+_CODE_LANGUAGES = {"python", "javascript", "java", "cpp", "c"}
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+@dataclass
+class ExtractedPage:
+    """Everything pulled out of one HTML document."""
+
+    title: str = ""
+    description: str = ""
+    metadata: dict[str, str] = field(default_factory=dict)
+    links: list[str] = field(default_factory=list)
+    images: list[str] = field(default_factory=list)
+    tables: list[str] = field(default_factory=list)
+    code_blocks: list[dict[str, str]] = field(default_factory=list)
+    markdown: str = ""
+    text: str = ""
+
+
+def _absolute(base_url: str, ref: str) -> str | None:
+    url = urljoin(base_url, ref.strip())
+    return url if url.startswith(("http://", "https://")) else None
+
+
+def _table_markdown(table) -> str:
+    rows = []
+    for tr in table.find_all("tr"):
+        cells = [td.get_text().strip() for td in tr.find_all(["td", "th"])]
+        if cells:
+            rows.append(" | ".join(cells))
+    if len(rows) > 1:
+        # Add header separator
+        rows.insert(1, " | ".join(["---"] * len(rows[0].split(" | "))))
+    return "\n".join(rows)
+
+
+def _code_language(pre) -> str:
+    code = pre.find("code")
+    classes = list(pre.get("class", []))
+    if code is not None:
+        classes += code.get("class", [])
+    for cls in classes:
+        if cls.startswith("language-"):
+            return cls[9:]
+        if cls in _CODE_LANGUAGES:
+            return cls
+    return "unknown"
+
+
+def extract_page(
+    url: str,
+    html: str,
+    markdown: bool = True,
+    text: bool = False,
+    strip_boilerplate: bool = True,
+) -> ExtractedPage:
+    """
+    Parse ``html`` once and extract everything from the same tree.
+
+    Args:
+        url: Page URL (base for relative links and images)
+        html: Document to parse
+        markdown: Render markdown
+        text: Extract plain text
+        strip_boilerplate: Drop scripts, styles, navigation and footers
+            before rendering markdown/text
+
+    Returns:
+        Extracted page
+    """
+    soup = BeautifulSoup(html, PARSER)
+    page = ExtractedPage()
+
+    if soup.title is not None:
+        page.title = soup.title.get_text().strip()
+
+    for meta in soup.find_all("meta", content=True):
+        name = meta.get("name") or meta.get("property")
+        if name:
+            page.metadata[name.lower()] = meta["content"]
+    page.description = page.metadata.get("description", "")
+    if soup.html is not None and soup.html.get("lang"):
+        page.metadata["language"] = soup.html["lang"]
+
+    canonical = soup.find("link", rel="canonical", href=True)
+    if canonical is not None:
+        page.metadata["canonical"] = urljoin(url, canonical["href"])
+
+    page.tables = [t for t in map(_table_markdown, soup.find_all("table")) if t]
+    page.code_blocks = [
+        {"code": pre.get_text(), "language": _code_language(pre)}
+        for pre in soup.find_all("pre")
+    ]
+
+    if strip_boilerplate:
+        for tag in soup(_BOILERPLATE_TAGS):
+            tag.decompose()
+        for comment in soup.find_all(string=lambda s: isinstance(s, Comment)):
+            comment.extract()
+
+    # Collected after stripping, matching the links a reader of the page sees
+    page.links = [
+        link
+        for a in soup.find_all("a", href=True)
+        if (link := _absolute(url, a["href"]))
+    ]
+    page.images = [
+        src
+        for img in soup.find_all("img", src=True)
+        if (src := _absolute(url, img["src"]))
+    ]
+
+    if markdown:
+        rendered = MarkdownConverter(heading_style="ATX").convert_soup(soup)
+        page.markdown = _BLANK_LINES_RE.sub("\n\n", rendered).strip()
+    if text:
+        page.text = soup.get_text(separator="\n", strip=True)
+
+    return page
+
+
+# ============================================================================
+# OFF-LOOP EXECUTION
+# ============================================================================
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_extraction_executor() -> ProcessPoolExecutor:
+    """Get or create the shared extraction process pool."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    return _executor
+
+
+def shutdown_extraction_executor() -> None:
+    """Stop the shared process pool (it is recreated on next use)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+async def extract_html(
+    url: str,
+    html: str,
+    executor: Executor | None = None,
+    **options: Any,
+) -> ExtractedPage:
+    """
+    Run :func:`extract_page` without blocking the event loop.
+
+    Uses the shared process pool unless ``executor`` is given. If the pool
+    is unusable (e.g. a worker died), the page is parsed in a thread and
+    the pool is rebuilt on the next call.
+    """
+    global _executor
+    loop = asyncio.get_running_loop()
+    pool = executor or get_extraction_executor()
+    try:
+        return await loop.run_in_executor(
+            pool, _extract_with_options, url, html, options
+        )
+    except BrokenProcessPool as e:
+        secure_logger.warning(f"Extraction pool broken, parsing in a thread: {e}")
+        if pool is _executor:
+            _executor = None
+        return await asyncio.to_thread(extract_page, url, html, **options)
+
+
+def _extract_with_options(url: str, html: str, options: dict) -> ExtractedPage:
+    # Executors only pass positional arguments
+    return extract_page(url, html, **options)
@@ -21,7 +21,7 @@ from src.discovery.base_client import (
     RepositoryNotFoundError,
     SearchResult,
 )
-from src.utils.rate_limiter import RateLimiter
+from src.utils.quota_broker import get_quota_broker, quota_key
 
 logger = logging.getLogger(__name__)
 
@@ -142,9 +142,12 @@ class HuggingFaceClient(PlatformClient):
         """
         self._token = token
         self._api = None
-        self._rate_limiter = RateLimiter(
+        # Shared with every process using the same token
+        self._rate_limiter = get_quota_broker().limiter(
+            quota_key("huggingface", token),
             requests_per_hour=requests_per_minute * 60,
             burst_size=50,
+            consumer="huggingface_client",
         )
         self._init_api()
 
@@ -0,0 +1,293 @@
+"""
+VIBE MCP - Priority Scrape Queue
+
+Heap-backed work queue for batch scraping. Long-lived workers pop the
+highest-priority URL (FIFO within a priority) until the heap is empty, so
+every submitted URL is processed regardless of batch size.
+
+Features:
+- O(log n) submit and pop; re-submitting a queued URL at a higher
+  priority promotes it
+- A URL that is already queued or in flight is not scraped twice; all
+  submitters share one future
+- Per-domain request spacing
+- Retries with exponential backoff that do not hold a worker while waiting
+- Results stream back in completion order
+
+Usage:
+    queue = ScrapeQueue(scrape, concurrency=4, domain_interval=0.5)
+    async for result in queue.stream([(url, priority), ...]):
+        if result.ok:
+            handle(result.value)
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from src.core.security import get_secure_logger
+
+secure_logger = get_secure_logger(__name__)
+
+ScrapeHandler = Callable[[str, int], Awaitable[Any]]
+
+
+@dataclass
+class ScrapeResult:
+    """Outcome of one queued URL."""
+
+    url: str
+    value: Any = None
+    error: str | None = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Item:
+    url: str
+    priority: int
+    future: asyncio.Future
+    attempts: int = 0
+    queued: bool = True
+
+
+@dataclass
+class _Domain:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_time: float = 0.0
+
+
+class ScrapeQueue:
+    """
+    Priority work queue drained by a pool of long-lived workers.
+
+    Higher ``priority`` values run first. Workers start on first submit
+    and idle on an event until more work arrives; call :meth:`close` to
+    stop them.
+    """
+
+    def __init__(
+        self,
+        handler: ScrapeHandler,
+        concurrency: int = 3,
+        domain_interval: float = 0.0,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            handler: Coroutine called as ``handler(url, priority)``
+            concurrency: Number of workers
+            domain_interval: Minimum seconds between requests to one domain
+            max_retries: Retries after the first failed attempt
+            backoff: Delay before the first retry
+            backoff_factor: Multiplier for each further retry
+            max_backoff: Upper bound on a retry delay
+        """
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.domain_interval = domain_interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        self._heap: list[tuple[int, int, _Item]] = []
+        self._counter = itertools.count()
+        self._items: dict[str, _Item] = {}
+        self._domains: dict[str, _Domain] = {}
+        self._workers: list[asyncio.Task] = []
+        self._retry_handles: set[asyncio.TimerHandle] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._stats = {"completed": 0, "failed": 0, "retries": 0, "deduplicated": 0}
+
+    def __len__(self) -> int:
+        """URLs queued or in flight."""
+        return len(self._items)
+
+    # ------------------------------------------------------------------
+    # Submitting
+    # ------------------------------------------------------------------
+
+    def submit(self, url: str, priority: int = 0) -> asyncio.Future:
+        """
+        Queue a URL; returns a future resolving to its ScrapeResult.
+
+        A URL already queued or in flight returns the existing future (and
+        is promoted if ``priority`` is higher and it has not started yet).
+        """
+        self._ensure_started()
+        item = self._items.get(url)
+        if item is not None:
+            self._stats["deduplicated"] += 1
+            if item.queued and priority > item.priority:
+                # The old heap entry becomes stale and is skipped on pop
+                item.priority = priority
+                self._push(item)
+            return item.future
+
+        item = _Item(url, priority, self._loop.create_future())
+        self._items[url] = item
+        self._push(item)
+        return item.future
+
+    async def stream(
+        self, requests: Iterable[tuple[str, int]]
+    ) -> AsyncIterator[ScrapeResult]:
+        """Submit ``(url, priority)`` pairs and yield results as they finish."""
+        futures = {self.submit(url, priority) for url, priority in requests}
+        for next_done in asyncio.as_completed(futures):
+            yield await next_done
+
+    def set_concurrency(self, concurrency: int) -> None:
+        """Grow or shrink the worker pool."""
+        self.concurrency = max(1, concurrency)
+        if self._loop is not None:
+            self._spawn_workers()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Tasks, futures and events from a previous loop are unusable
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._workers = []
+            self._domains.clear()
+            self._heap.clear()
+            self._items.clear()
+        self._spawn_workers()
+
+    def _spawn_workers(self) -> None:
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(self._loop.create_task(self._worker()))
+        self._wakeup.set()  # Let surplus workers notice and exit
+
+    async def close(self) -> None:
+        """Stop workers and fail anything still queued."""
+        for handle in self._retry_handles:
+            handle.cancel()
+        self._retry_handles.clear()
+
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        for item in self._items.values():
+            if not item.future.done():
+                item.future.set_result(
+                    ScrapeResult(item.url, error="Queue closed", attempts=item.attempts)
+                )
+        self._items.clear()
+        self._heap.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "queued": sum(item.queued for item in self._items.values()),
+            "in_flight": sum(not item.queued for item in self._items.values()),
+            "workers": len(self._workers),
+        }
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _push(self, item: _Item) -> None:
+        item.queued = True
+        heapq.heappush(self._heap, (-item.priority, next(self._counter), item))
+        self._wakeup.set()
+
+    def _pop(self) -> _Item | None:
+        while self._heap:
+            neg_priority, _, item = heapq.heappop(self._heap)
+            if item.queued and -neg_priority == item.priority:
+                item.queued = False
+                return item
+        return None
+
+    async def _worker(self) -> None:
+        current = asyncio.current_task()
+        while True:
+            if current not in self._workers[: self.concurrency]:
+                if current in self._workers:
+                    self._workers.remove(current)
+                return
+
+            item = self._pop()
+            if item is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._process(item)
+
+    async def _process(self, item: _Item) -> None:
+        item.attempts += 1
+        try:
+            await self._wait_for_domain(item.url)
+            value = await self.handler(item.url, item.priority)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if item.attempts <= self.max_retries:
+                delay = min(
+                    self.backoff * self.backoff_factor ** (item.attempts - 1),
+                    self.max_backoff,
+                )
+                self._stats["retries"] += 1
+                secure_logger.debug(
+                    f"Retrying {item.url} in {delay:.1f}s "
+                    f"(attempt {item.attempts}): {e}"
+                )
+                self._schedule_retry(item, delay)
+                return
+            self._stats["failed"] += 1
+            secure_logger.error(f"Failed to scrape {item.url}: {e}")
+            self._finish(item, ScrapeResult(item.url, error=str(e)))
+            return
+
+        self._stats["completed"] += 1
+        self._finish(item, ScrapeResult(item.url, value=value))
+
+    def _schedule_retry(self, item: _Item, delay: float) -> None:
+        def requeue():
+            self._retry_handles.discard(handle)
+            if self._items.get(item.url) is item:
+                self._push(item)
+
+        handle = self._loop.call_later(delay, requeue)
+        self._retry_handles.add(handle)
+
+    def _finish(self, item: _Item, result: ScrapeResult) -> None:
+        result.attempts = item.attempts
+        self._items.pop(item.url, None)
+        if not item.future.done():
+            item.future.set_result(result)
+
+    async def _wait_for_domain(self, url: str) -> None:
+        if self.domain_interval <= 0:
+            return
+        domain = self._domains.setdefault(urlparse(url).netloc, _Domain())
+        async with domain.lock:
+            wait = domain.next_time - self._loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            domain.next_time = self._loop.time() + self.domain_interval
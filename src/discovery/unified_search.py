@@ -3,6 +3,10 @@ AI Project Synthesizer - Unified Search
 
 Cross-platform repository search with intelligent ranking.
 Aggregates results from GitHub, HuggingFace, Kaggle, and more.
+
+Identical concurrent searches share one set of platform calls, results are
+cached for an hour, and ``search_stream`` yields each platform's results as
+soon as they arrive.
 """
 
 import asyncio
@@ -10,8 +14,10 @@ import hashlib
 import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC
+from typing import Any
 
 from src.core.config import get_settings
 from src.discovery.base_client import (
@@ -64,6 +70,14 @@ class UnifiedSearchResult:
         }
 
 
+@dataclass
+class _SearchFlight:
+    """An in-flight search, shared by identical concurrent requests."""
+
+    platform_tasks: dict[str, asyncio.Task]
+    result: asyncio.Task
+
+
 class UnifiedSearch:
     """
     Unified search across multiple code hosting platforms.
@@ -72,7 +86,8 @@ class UnifiedSearch:
     - Parallel search across platforms
     - Result deduplication
     - Intelligent ranking
-    - Caching
+    - Caching, and coalescing of identical in-flight searches
+    - Streaming of per-platform results
     - Error handling per platform
 
     Example:
@@ -101,8 +116,11 @@ class UnifiedSearch:
             kaggle_credentials: Kaggle API credentials dict
         """
         self._clients: dict[str, PlatformClient] = {}
-        self._cache: dict[str, UnifiedSearchResult] = {}
+        self._cache: dict[str, tuple[float, UnifiedSearchResult]] = {}
         self._cache_ttl = 3600  # 1 hour
+        self._cache_max_entries = 256
+        self._inflight: dict[str, _SearchFlight] = {}
+        self._stats = {"searches": 0, "cache_hits": 0, "coalesced": 0}
 
         # Initialize available clients
         self._init_clients(github_token, huggingface_token, kaggle_credentials)
@@ -187,53 +205,207 @@ class UnifiedSearch:
         Returns:
             UnifiedSearchResult with aggregated results
         """
-        start_time = time.time()
+        platforms = self._resolve_platforms(platforms)
+        if not platforms:
+            logger.warning("No platforms available for search")
+            return self._empty_result(query)
 
+        # Check cache
+        cache_key = self._cache_key(
+            query, platforms, language_filter, min_stars, max_results, sort_by
+        )
+        if use_cache:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                logger.debug(f"Cache hit for query: {query}")
+                return cached
+
+        flight = self._join_flight(
+            cache_key,
+            query,
+            platforms,
+            max_results,
+            language_filter,
+            min_stars,
+            sort_by,
+            use_cache,
+        )
+        # Shielded so one caller giving up does not cancel the others' search
+        return await asyncio.shield(flight.result)
+
+    async def search_stream(
+        self,
+        query: str,
+        platforms: list[str] | None = None,
+        max_results: int = 20,
+        language_filter: str | None = None,
+        min_stars: int = 0,
+        sort_by: str = "relevance",
+        use_cache: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Search like ``search``, yielding each platform's results as they arrive.
+
+        Yields ``{"type": "platform", "platform", "repositories", "error"}``
+        once per platform, in completion order, then ``{"type": "done",
+        "result": UnifiedSearchResult}`` with the deduplicated, ranked results.
+        """
+        platforms = self._resolve_platforms(platforms)
+        if not platforms:
+            yield {"type": "done", "result": self._empty_result(query)}
+            return
+
+        cache_key = self._cache_key(
+            query, platforms, language_filter, min_stars, max_results, sort_by
+        )
+        cached = self._get_cached(cache_key) if use_cache else None
+        if cached is not None:
+            for platform in platforms:
+                yield {
+                    "type": "platform",
+                    "platform": platform,
+                    "repositories": [
+                        r for r in cached.repositories if r.platform == platform
+                    ],
+                    "error": cached.errors.get(platform),
+                }
+            yield {"type": "done", "result": cached}
+            return
+
+        flight = self._join_flight(
+            cache_key,
+            query,
+            platforms,
+            max_results,
+            language_filter,
+            min_stars,
+            sort_by,
+            use_cache,
+        )
+        pending = {task: name for name, task in flight.platform_tasks.items()}
+        while pending:
+            # asyncio.wait never cancels the shared tasks, even if we are cancelled
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                platform = pending.pop(task)
+                # close() cancels in-flight platform searches
+                error = "cancelled" if task.cancelled() else task.exception()
+                yield {
+                    "type": "platform",
+                    "platform": platform,
+                    "repositories": [] if error else task.result().repositories,
+                    "error": str(error) if error else None,
+                }
+        if flight.result.cancelled():
+            return
+        yield {"type": "done", "result": await asyncio.shield(flight.result)}
+
+    def _resolve_platforms(self, platforms: list[str] | None) -> list[str]:
         # Default to all available platforms
         if platforms is None:
-            platforms = self.available_platforms
-        else:
-            # Filter to only available platforms
-            platforms = [p for p in platforms if p in self._clients]
+            return self.available_platforms
+        # Filter to only available platforms
+        return [p for p in platforms if p in self._clients]
 
-        if not platforms:
-            logger.warning("No platforms available for search")
-            return UnifiedSearchResult(
-                query=query,
-                platforms_searched=[],
-                total_count=0,
-                repositories=[],
-                search_time_ms=0,
-                errors={"general": "No platforms available"},
-            )
+    def _empty_result(self, query: str) -> UnifiedSearchResult:
+        return UnifiedSearchResult(
+            query=query,
+            platforms_searched=[],
+            total_count=0,
+            repositories=[],
+            search_time_ms=0,
+            errors={"general": "No platforms available"},
+        )
 
-        # Check cache
-        cache_key = self._cache_key(query, platforms, language_filter, min_stars)
-        if use_cache and cache_key in self._cache:
-            cached = self._cache[cache_key]
-            logger.debug(f"Cache hit for query: {query}")
-            return cached
+    def _get_cached(self, cache_key: str) -> UnifiedSearchResult | None:
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self._cache_ttl:
+            del self._cache[cache_key]
+            return None
+        self._stats["cache_hits"] += 1
+        return result
 
+    def _join_flight(
+        self,
+        cache_key: str,
+        query: str,
+        platforms: list[str],
+        max_results: int,
+        language_filter: str | None,
+        min_stars: int,
+        sort_by: str,
+        use_cache: bool = True,
+    ) -> _SearchFlight:
+        """
+        Return the in-flight search for ``cache_key``, starting it if needed.
+
+        Searches with ``use_cache=False`` neither read nor write the cache, so
+        they only coalesce with each other.
+        """
+        flight_key = cache_key if use_cache else f"nocache:{cache_key}"
+        flight = self._inflight.get(flight_key)
+        if flight is not None:
+            self._stats["coalesced"] += 1
+            return flight
+
+        self._stats["searches"] += 1
         # Search all platforms in parallel
-        tasks = {}
-        for platform in platforms:
-            client = self._clients[platform]
-            tasks[platform] = asyncio.create_task(
+        platform_tasks = {
+            platform: asyncio.create_task(
                 self._search_platform(
-                    client,
+                    self._clients[platform],
                     query,
                     language_filter,
                     min_stars,
                     max_results,
                 )
             )
+            for platform in platforms
+        }
+        result = asyncio.create_task(
+            self._collect(
+                cache_key if use_cache else None,
+                query,
+                platform_tasks,
+                max_results,
+                sort_by,
+            )
+        )
+        flight = _SearchFlight(platform_tasks, result)
+        self._inflight[flight_key] = flight
+
+        def finished(task: asyncio.Task) -> None:
+            if self._inflight.get(flight_key) is flight:
+                del self._inflight[flight_key]
+            # Nobody may be waiting on it; retrieve the outcome to avoid warnings
+            task.cancelled() or task.exception()
+
+        result.add_done_callback(finished)
+        return flight
+
+    async def _collect(
+        self,
+        cache_key: str | None,
+        query: str,
+        platform_tasks: dict[str, asyncio.Task],
+        max_results: int,
+        sort_by: str,
+    ) -> UnifiedSearchResult:
+        """
+        Gather platform results, then deduplicate and rank them; cached
+        under ``cache_key`` unless it is None.
+        """
+        start_time = time.time()
 
         # Gather results
         all_repos: list[RepositoryInfo] = []
         platform_counts: dict[str, int] = {}
         errors: dict[str, str] = {}
 
-        for platform, task in tasks.items():
+        for platform, task in platform_tasks.items():
             try:
                 result = await task
                 all_repos.extend(result.repositories)
@@ -249,11 +421,11 @@ class UnifiedSearch:
         ranked_repos = self._rank_results(unique_repos, query, sort_by)
 
         # Limit total results
-        final_repos = ranked_repos[: max_results * len(platforms)]
+        final_repos = ranked_repos[: max_results * len(platform_tasks)]
 
         result = UnifiedSearchResult(
             query=query,
-            platforms_searched=platforms,
+            platforms_searched=list(platform_tasks),
             total_count=len(final_repos),
             repositories=final_repos,
             search_time_ms=int((time.time() - start_time) * 1000),
@@ -261,9 +433,12 @@ class UnifiedSearch:
             errors=errors,
         )
 
-        # Cache result
-        if use_cache:
-            self._cache[cache_key] = result
+        # Cache result; bounded, oldest entries go first
+        if cache_key is not None:
+            self._cache.pop(cache_key, None)
+            self._cache[cache_key] = (time.monotonic(), result)
+            while len(self._cache) > self._cache_max_entries:
+                del self._cache[next(iter(self._cache))]
 
         return result
 
@@ -408,6 +583,8 @@ class UnifiedSearch:
         platforms: list[str],
         language: str | None,
         min_stars: int,
+        max_results: int | None = None,
+        sort_by: str | None = None,
     ) -> str:
         """Generate cache key for search parameters."""
         key_data = {
@@ -415,6 +592,8 @@ class UnifiedSearch:
             "platforms": sorted(platforms),
             "language": language,
             "min_stars": min_stars,
+            "max_results": max_results,
+            "sort_by": sort_by,
         }
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_str.encode()).hexdigest()
@@ -424,6 +603,28 @@ class UnifiedSearch:
         self._cache.clear()
         logger.info("Search cache cleared")
 
+    def get_stats(self) -> dict[str, Any]:
+        """Search, cache and coalescing counters."""
+        return {
+            **self._stats,
+            "cached": len(self._cache),
+            "inflight": len(self._inflight),
+            "platforms": self.available_platforms,
+        }
+
+    async def close(self):
+        """Cancel in-flight searches and close platform clients."""
+        for flight in list(self._inflight.values()):
+            flight.result.cancel()
+            for task in flight.platform_tasks.values():
+                task.cancel()
+        self._inflight.clear()
+        for client in self._clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.debug(f"Failed to close {client.platform_name} client: {e}")
+
     async def get_repository(
         self,
         repo_url: str,
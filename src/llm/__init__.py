@@ -26,7 +26,9 @@ from src.llm.providers import (
     ProviderStatus,
     get_provider_registry,
 )
+from src.llm.response_cache import ResponseCache, get_response_cache
 from src.llm.router import LLMRouter, ProviderType, TaskComplexity
+from src.llm.scheduler import RequestLane, get_backend_scheduler, request_lane
 
 __all__ = [
     # Legacy clients
@@ -48,4 +50,11 @@ __all__ = [
     "TaskType",
     "RouterConfig",
     "get_litellm_router",
+    # Response cache
+    "ResponseCache",
+    "get_response_cache",
+    # Local backend scheduling
+    "RequestLane",
+    "request_lane",
+    "get_backend_scheduler",
 ]
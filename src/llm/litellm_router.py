@@ -30,6 +30,7 @@ Usage:
     ], task_type="coding")
 """
 
+import contextlib
 import logging
 import time
 from collections.abc import AsyncIterator
@@ -37,6 +38,17 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from src.core.observability import metrics
+from src.llm.response_cache import (
+    fingerprint,
+    get_response_cache,
+    replay_stream,
+    result_from_payload,
+    result_to_payload,
+    should_cache,
+)
+from src.llm.scheduler import BackendScheduler, get_backend_scheduler
+
 logger = logging.getLogger(__name__)
 
 # Try to import litellm
@@ -104,6 +116,26 @@ class CompletionResult:
     cost: float = 0.0
     finish_reason: str = "stop"
     raw_response: Any = None
+    cached: bool = False
+
+
+class StreamEventType(Enum):
+    """Kinds of events in a streamed completion."""
+
+    TEXT = "text"  # Text delta
+    USAGE = "usage"  # Token usage, when the provider reports it
+    FINISH = "finish"  # Last event of a successful stream
+
+
+@dataclass
+class StreamEvent:
+    """One event of a streamed completion."""
+
+    type: StreamEventType
+    text: str = ""
+    model: str = ""
+    usage: dict = field(default_factory=dict)
+    finish_reason: str | None = None
 
 
 @dataclass
@@ -160,6 +192,41 @@ class RouterConfig:
     local_only: bool = False
 
 
+# LiteLLM provider prefixes served by a local model server, mapped to the
+# backend kind whose scheduler (and ``<kind>_host`` setting) they share
+LOCAL_BACKENDS = {
+    "ollama": "ollama",
+    "ollama_chat": "ollama",
+    "lm_studio": "lmstudio",
+}
+
+_DEFAULT_LOCAL_HOSTS = {
+    "ollama": "http://localhost:11434",
+    "lmstudio": "http://localhost:1234",
+}
+
+
+def _local_scheduler(
+    model: str, api_base: str | None = None
+) -> BackendScheduler | None:
+    """
+    Scheduler of the local server behind ``model``, shared with OllamaClient
+    and LMStudioClient; None for hosted providers.
+    """
+    kind = LOCAL_BACKENDS.get(model.split("/", 1)[0]) if "/" in model else None
+    if kind is None:
+        return None
+    if api_base is None:
+        try:
+            from src.core.config import get_settings
+
+            api_base = getattr(get_settings().llm, f"{kind}_host")
+        except Exception as e:
+            logger.debug(f"Using default {kind} host: {e}")
+            api_base = _DEFAULT_LOCAL_HOSTS[kind]
+    return get_backend_scheduler(f"{kind}:{api_base.rstrip('/')}")
+
+
 # Pre-configured models
 MODELS = {
     # Ollama (Local, Free)
@@ -275,6 +342,9 @@ class LiteLLMRouter:
         self._cost_tracker: dict = {"total": 0.0, "by_model": {}}
         self._request_count = 0
         self._error_count = 0
+        self._cache_hits = 0
+        self._stream_stats: dict[str, dict] = {}
+        self._ollama_client = None  # Pooled fallback client, created lazily
 
         # Configure LiteLLM if available
         if LITELLM_AVAILABLE:
@@ -383,13 +453,33 @@ class LiteLLMRouter:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             stream: Whether to stream the response
-            **kwargs: Additional arguments for the LLM
+            **kwargs: Additional arguments for the LLM. ``cache`` forces the
+                response cache on or off (default: on at temperature 0) and
+                ``cache_caller`` labels the request in cache hit rates.
 
         Returns:
             CompletionResult with the generated text
         """
+        cache = kwargs.pop("cache", None)
+        caller = kwargs.pop("cache_caller", None) or "litellm"
+
         # Select model
         selected_model = model or self._get_model_for_task(task_type)
+
+        use_cache = should_cache(temperature, cache)
+        if use_cache:
+            start_time = time.time()
+            cache_key = fingerprint(
+                "litellm", selected_model, messages, temperature, max_tokens, **kwargs
+            )
+            payload = get_response_cache().lookup(cache_key, caller)
+            if payload is not None:
+                self._cache_hits += 1
+                result = result_from_payload(CompletionResult, payload)
+                result.latency_ms = (time.time() - start_time) * 1000
+                result.cost = 0.0
+                return result
+
         fallback_chain = self._get_fallback_chain(selected_model)
 
         # Try primary model and fallbacks
@@ -407,6 +497,20 @@ class LiteLLMRouter:
                     **kwargs,
                 )
                 self._request_count += 1
+                if use_cache:
+                    # Keyed by the model that answered, not the one requested
+                    get_response_cache().store(
+                        fingerprint(
+                            "litellm",
+                            attempt_model,
+                            messages,
+                            temperature,
+                            max_tokens,
+                            **kwargs,
+                        ),
+                        result_to_payload(result),
+                        caller,
+                    )
                 return result
 
             except Exception as e:
@@ -428,51 +532,50 @@ class LiteLLMRouter:
         **kwargs,
     ) -> CompletionResult:
         """Call a specific model."""
+        if stream:
+            return await self._collect_stream(
+                model, messages, max_tokens, temperature, **kwargs
+            )
+
         start_time = time.time()
 
         if not LITELLM_AVAILABLE:
             # Fallback to local Ollama client
             return await self._fallback_ollama(messages, max_tokens, temperature)
 
-        try:
-            response = await acompletion(
+        def call():
+            return acompletion(
                 model=model,
                 messages=messages,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                stream=stream,
+                stream=False,
                 timeout=self.config.timeout,
                 **kwargs,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Extract content
-            if stream:
-                # Handle streaming response
-                content = ""
-                async for chunk in response:
-                    if chunk.choices[0].delta.content:
-                        content += chunk.choices[0].delta.content
+        try:
+            # Local servers get the same admission control as their clients
+            scheduler = _local_scheduler(model, kwargs.get("api_base"))
+            if scheduler is None:
+                response = await call()
             else:
-                content = response.choices[0].message.content
+                response = await scheduler.run(
+                    call,
+                    key=fingerprint(
+                        "litellm", model, messages, temperature, max_tokens, **kwargs
+                    ),
+                    deadline=time.monotonic() + self.config.timeout,
+                )
+
+            latency_ms = (time.time() - start_time) * 1000
+            content = response.choices[0].message.content
 
-            # Calculate cost
             usage = (
                 response.usage.model_dump()
                 if hasattr(response, "usage") and response.usage
                 else {}
             )
-            model_config = MODELS.get(model)
-            cost = 0.0
-            if model_config and usage:
-                input_cost = (
-                    usage.get("prompt_tokens", 0) / 1000
-                ) * model_config.cost_per_1k_input
-                output_cost = (
-                    usage.get("completion_tokens", 0) / 1000
-                ) * model_config.cost_per_1k_output
-                cost = input_cost + output_cost
 
             return CompletionResult(
                 content=content,
@@ -480,7 +583,7 @@ class LiteLLMRouter:
                 provider=model.split("/")[0] if "/" in model else "unknown",
                 usage=usage,
                 latency_ms=latency_ms,
-                cost=cost,
+                cost=self._estimate_cost(model, usage),
                 finish_reason=response.choices[0].finish_reason
                 if response.choices
                 else "stop",
@@ -491,6 +594,27 @@ class LiteLLMRouter:
             logger.error(f"LiteLLM call failed for {model}: {e}")
             raise
 
+    def _estimate_cost(self, model: str, usage: dict) -> float:
+        """Cost of a call from its token usage and the model's pricing."""
+        model_config = MODELS.get(model)
+        if not model_config or not usage:
+            return 0.0
+        input_cost = (
+            (usage.get("prompt_tokens") or 0) / 1000
+        ) * model_config.cost_per_1k_input
+        output_cost = (
+            (usage.get("completion_tokens") or 0) / 1000
+        ) * model_config.cost_per_1k_output
+        return input_cost + output_cost
+
+    def _get_ollama_client(self):
+        """Ollama client shared by every fallback call of this router."""
+        if self._ollama_client is None:
+            from src.llm.ollama_client import OllamaClient
+
+            self._ollama_client = OllamaClient()
+        return self._ollama_client
+
     async def _fallback_ollama(
         self,
         messages: list[dict],
@@ -498,10 +622,8 @@ class LiteLLMRouter:
         temperature: float,
     ) -> CompletionResult:
         """Fallback to direct Ollama call when LiteLLM unavailable."""
-        from src.llm.ollama_client import OllamaClient
-
         start_time = time.time()
-        client = OllamaClient()
+        client = self._get_ollama_client()
 
         # Convert messages to prompt
         prompt = "\n".join([f"{m['role']}: {m['content']}" for m in messages])
@@ -516,16 +638,300 @@ class LiteLLMRouter:
 
         return CompletionResult(
             content=result.content,
-            model="ollama/llama3.1",
+            model=f"ollama/{result.model}",
             provider="ollama",
             usage={
                 "prompt_tokens": result.prompt_tokens,
                 "completion_tokens": result.completion_tokens,
+                "total_tokens": result.tokens_used,
             },
             latency_ms=latency_ms,
             cost=0.0,  # Local is free
+            finish_reason=result.finish_reason,
         )
 
+    async def _collect_stream(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+        **kwargs,
+    ) -> CompletionResult:
+        """Consume a model's stream into one CompletionResult."""
+        start_time = time.time()
+        parts: list[str] = []
+        finish = StreamEvent(StreamEventType.FINISH, model=model)
+        async for event in self._stream_model(
+            model, messages, max_tokens, temperature, **kwargs
+        ):
+            if event.type is StreamEventType.TEXT:
+                parts.append(event.text)
+            elif event.type is StreamEventType.FINISH:
+                finish = event
+
+        reported = finish.model or model
+        return CompletionResult(
+            content="".join(parts),
+            model=reported,
+            provider=reported.split("/")[0] if "/" in reported else "unknown",
+            usage=finish.usage,
+            latency_ms=(time.time() - start_time) * 1000,
+            cost=self._estimate_cost(model, finish.usage),
+            finish_reason=finish.finish_reason or "stop",
+        )
+
+    async def _stream_model(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+        **kwargs,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Typed events from one model, recording time-to-first-token and
+        tokens/second for it.
+        """
+        if LITELLM_AVAILABLE:
+            events = self._stream_litellm(
+                model, messages, max_tokens, temperature, **kwargs
+            )
+        else:
+            events = self._stream_ollama(model, messages, max_tokens, temperature)
+
+        start = time.perf_counter()
+        first_token: float | None = None
+        deltas = 0
+        async for event in events:
+            if event.type is StreamEventType.TEXT:
+                deltas += 1
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+            elif event.type is StreamEventType.FINISH:
+                # Providers without usage reports count roughly a token a delta
+                tokens = event.usage.get("completion_tokens") or deltas
+                self._record_stream(
+                    event.model or model,
+                    first_token,
+                    tokens,
+                    time.perf_counter() - start,
+                )
+            yield event
+
+    async def _stream_litellm(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+        **kwargs,
+    ) -> AsyncIterator[StreamEvent]:
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        scheduler = _local_scheduler(model, kwargs.get("api_base"))
+        # A local stream holds one scheduler slot until it ends
+        slot = (
+            contextlib.nullcontext()
+            if scheduler is None
+            else scheduler.slot(deadline=time.monotonic() + self.config.timeout)
+        )
+
+        usage: dict = {}
+        finish_reason = "stop"
+        async with slot:
+            response = await acompletion(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                timeout=self.config.timeout,
+                **kwargs,
+            )
+            async for chunk in response:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage.model_dump()
+                    yield StreamEvent(StreamEventType.USAGE, model=model, usage=usage)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    yield StreamEvent(
+                        StreamEventType.TEXT, text=choice.delta.content, model=model
+                    )
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+        yield StreamEvent(
+            StreamEventType.FINISH,
+            model=model,
+            usage=usage,
+            finish_reason=finish_reason,
+        )
+
+    async def _stream_ollama(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncIterator[StreamEvent]:
+        provider, _, model_id = model.partition("/")
+        if LOCAL_BACKENDS.get(provider) != "ollama":
+            # Without LiteLLM only Ollama can serve a stream; let the caller
+            # move on to the next model in the chain
+            raise RuntimeError(f"{model} needs LiteLLM, which is not installed")
+        client = self._get_ollama_client()
+        async for chunk in client.stream_chat(
+            messages, model=model_id, temperature=temperature, max_tokens=max_tokens
+        ):
+            text = chunk.get("message", {}).get("content")
+            if text:
+                yield StreamEvent(StreamEventType.TEXT, text=text, model=model)
+            if chunk.get("done"):
+                prompt_tokens = chunk.get("prompt_eval_count", 0)
+                completion_tokens = chunk.get("eval_count", 0)
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                }
+                yield StreamEvent(StreamEventType.USAGE, model=model, usage=usage)
+                yield StreamEvent(
+                    StreamEventType.FINISH,
+                    model=model,
+                    usage=usage,
+                    finish_reason=chunk.get("done_reason", "stop"),
+                )
+
+    def _record_stream(
+        self,
+        model: str,
+        first_token_s: float | None,
+        tokens: int,
+        total_s: float,
+    ) -> None:
+        """Fold one finished stream into the per-model streaming stats."""
+        stats = self._stream_stats.setdefault(
+            model, {"streams": 0, "ttft_ms": None, "tokens_per_second": None}
+        )
+        stats["streams"] += 1
+        tags = {"model": model}
+
+        def ewma(old: float | None, new: float) -> float:
+            return new if old is None else old + 0.2 * (new - old)
+
+        if first_token_s is not None:
+            stats["ttft_ms"] = ewma(stats["ttft_ms"], first_token_s * 1000)
+            metrics.record_timer("llm_time_to_first_token_seconds", first_token_s, tags)
+            generating = total_s - first_token_s
+            if generating > 0 and tokens:
+                rate = tokens / generating
+                stats["tokens_per_second"] = ewma(stats["tokens_per_second"], rate)
+                metrics.record_histogram("llm_tokens_per_second", rate, tags)
+
+    async def stream_chat(
+        self,
+        messages: list[dict],
+        task_type: TaskType = TaskType.CHAT,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a chat completion as typed events.
+
+        Text arrives as TEXT events while the provider generates it, followed
+        by USAGE (when reported) and a closing FINISH event. The fallback
+        chain is only walked until a model has produced its first event;
+        after that a failure is raised to the caller.
+
+        Args:
+            messages: Chat messages
+            task_type: Type of task for routing
+            model: Override model selection
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional arguments for the LLM, plus ``cache`` and
+                ``cache_caller`` as in chat()
+
+        Yields:
+            StreamEvent objects
+        """
+        cache = kwargs.pop("cache", None)
+        caller = kwargs.pop("cache_caller", None) or "litellm"
+        selected_model = model or self._get_model_for_task(task_type)
+
+        use_cache = should_cache(temperature, cache)
+        if use_cache:
+            cache_key = fingerprint(
+                "litellm", selected_model, messages, temperature, max_tokens, **kwargs
+            )
+            payload = get_response_cache().lookup(cache_key, caller)
+            if payload is not None:
+                self._cache_hits += 1
+                cached_model = payload.get("model", selected_model)
+                async for chunk in replay_stream(payload["content"]):
+                    yield StreamEvent(
+                        StreamEventType.TEXT, text=chunk, model=cached_model
+                    )
+                yield StreamEvent(
+                    StreamEventType.FINISH,
+                    model=cached_model,
+                    usage=payload.get("usage") or {},
+                    finish_reason=payload.get("finish_reason", "stop"),
+                )
+                return
+
+        last_error = None
+        for attempt_model in [selected_model] + self._get_fallback_chain(
+            selected_model
+        ):
+            parts: list[str] = []
+            finish = None
+            try:
+                async for event in self._stream_model(
+                    attempt_model, messages, max_tokens, temperature, **kwargs
+                ):
+                    if event.type is StreamEventType.TEXT:
+                        parts.append(event.text)
+                    elif event.type is StreamEventType.FINISH:
+                        finish = event
+                    yield event
+            except Exception as e:
+                self._error_count += 1
+                if parts or finish:
+                    raise
+                logger.warning(f"Model {attempt_model} failed: {e}")
+                last_error = e
+                continue
+
+            self._request_count += 1
+            # Only a stream that ran to completion is cached, keyed by the
+            # model that produced it
+            if use_cache and finish is not None:
+                reported = finish.model or attempt_model
+                result = CompletionResult(
+                    content="".join(parts),
+                    model=reported,
+                    provider=reported.split("/")[0] if "/" in reported else "unknown",
+                    usage=finish.usage,
+                    finish_reason=finish.finish_reason or "stop",
+                )
+                cache_key = fingerprint(
+                    "litellm",
+                    attempt_model,
+                    messages,
+                    temperature,
+                    max_tokens,
+                    **kwargs,
+                )
+                get_response_cache().store(cache_key, result_to_payload(result), caller)
+            return
+
+        raise RuntimeError(f"All models failed. Last error: {last_error}")
+
     async def stream(
         self,
         prompt: str,
@@ -540,32 +946,15 @@ class LiteLLMRouter:
             prompt: The prompt to complete
             task_type: Type of task for routing
             model: Override model selection
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments, as for stream_chat()
 
         Yields:
             Chunks of generated text
         """
-        selected_model = model or self._get_model_for_task(task_type)
-
-        if not LITELLM_AVAILABLE:
-            # Fallback - just return full response
-            result = await self.complete(prompt, task_type, model, **kwargs)
-            yield result.content
-            return
-
         messages = [{"role": "user", "content": prompt}]
-
-        response = await acompletion(
-            model=selected_model,
-            messages=messages,
-            stream=True,
-            timeout=self.config.timeout,
-            **kwargs,
-        )
-
-        async for chunk in response:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        async for event in self.stream_chat(messages, task_type, model, **kwargs):
+            if event.type is StreamEventType.TEXT:
+                yield event.text
 
     def get_stats(self) -> dict:
         """Get router statistics."""
@@ -573,6 +962,10 @@ class LiteLLMRouter:
             "request_count": self._request_count,
             "error_count": self._error_count,
             "error_rate": self._error_count / max(self._request_count, 1) * 100,
+            "cache_hits": self._cache_hits,
+            "streaming": {
+                model: dict(stats) for model, stats in self._stream_stats.items()
+            },
             "total_cost": self._cost_tracker["total"],
             "cost_by_model": self._cost_tracker["by_model"],
             "litellm_available": LITELLM_AVAILABLE,
@@ -597,6 +990,8 @@ class LiteLLMRouter:
         self._cost_tracker = {"total": 0.0, "by_model": {}}
         self._request_count = 0
         self._error_count = 0
+        self._cache_hits = 0
+        self._stream_stats = {}
 
 
 # Global instance
@@ -5,6 +5,7 @@ Client for local LLM inference using LM Studio.
 LM Studio provides an OpenAI-compatible API for local model serving.
 """
 
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -13,6 +14,8 @@ from openai import AsyncOpenAI
 from src.core.circuit_breaker import OLLAMA_BREAKER_CONFIG, circuit_breaker
 from src.core.observability import correlation_manager, metrics, track_performance
 from src.core.security import get_secure_logger
+from src.llm.response_cache import fingerprint
+from src.llm.scheduler import get_backend_scheduler
 
 secure_logger = get_secure_logger(__name__)
 
@@ -26,6 +29,7 @@ class CompletionResult:
     tokens_used: int
     finish_reason: str
     duration_ms: int
+    cached: bool = False
 
 
 class LMStudioClient:
@@ -47,6 +51,7 @@ class LMStudioClient:
         api_key: str = "lm-studio",  # LM Studio doesn't require real API key
         default_model: str = None,
         timeout: float = 120.0,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize LM Studio client.
@@ -56,12 +61,17 @@ class LMStudioClient:
             api_key: API key (LM Studio accepts any string)
             default_model: Default model to use
             timeout: Request timeout in seconds
+            max_concurrency: Concurrent requests for this host (default:
+                ``lmstudio_max_concurrency`` setting); shared by all clients
         """
         self.host = host.rstrip("/")
         self.api_key = api_key
         self.default_model = default_model or "local-model"  # Generic name
         self.timeout = timeout
         self._client: AsyncOpenAI | None = None
+        self._scheduler = get_backend_scheduler(
+            f"lmstudio:{self.host}", max_concurrency
+        )
 
     async def _get_client(self) -> AsyncOpenAI:
         """Get or create OpenAI client."""
@@ -154,15 +164,6 @@ class LMStudioClient:
             metrics.increment("lmstudio_list_models_error_total")
             return []
 
-    @circuit_breaker(
-        name="lmstudio_complete",
-        failure_threshold=OLLAMA_BREAKER_CONFIG.failure_threshold,
-        recovery_timeout=OLLAMA_BREAKER_CONFIG.recovery_timeout,
-        success_threshold=OLLAMA_BREAKER_CONFIG.success_threshold,
-        timeout=OLLAMA_BREAKER_CONFIG.timeout,
-        expected_exception=Exception,
-    )
-    @track_performance("lmstudio_complete")
     async def complete(
         self,
         prompt: str,
@@ -175,6 +176,10 @@ class LMStudioClient:
         """
         Generate completion from prompt.
 
+        Requests go through the shared backend scheduler: at most
+        ``max_concurrency`` reach LM Studio at once and identical in-flight
+        prompts share one call.
+
         Args:
             prompt: User prompt
             model: Model to use (defaults to configured default)
@@ -185,9 +190,44 @@ class LMStudioClient:
 
         Returns:
             CompletionResult with generated content
+
+        Raises:
+            LLMOverloadedError: The request could not start within ``timeout``
         """
-        import time
+        model = model or self.default_model
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        return await self._scheduler.run(
+            lambda: self._complete(
+                prompt, model, system_prompt, temperature, max_tokens, stream
+            ),
+            key=fingerprint(
+                "lmstudio", model, messages, temperature, max_tokens, stream=stream
+            ),
+            deadline=time.monotonic() + self.timeout,
+        )
 
+    @circuit_breaker(
+        name="lmstudio_complete",
+        failure_threshold=OLLAMA_BREAKER_CONFIG.failure_threshold,
+        recovery_timeout=OLLAMA_BREAKER_CONFIG.recovery_timeout,
+        success_threshold=OLLAMA_BREAKER_CONFIG.success_threshold,
+        timeout=OLLAMA_BREAKER_CONFIG.timeout,
+        expected_exception=Exception,
+    )
+    @track_performance("lmstudio_complete")
+    async def _complete(
+        self,
+        prompt: str,
+        model: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        stream: bool,
+    ) -> CompletionResult:
+        """Send one completion request; admission is handled by complete()."""
         start_time = time.time()
 
         correlation_id = correlation_manager.get_correlation_id()
@@ -4,11 +4,18 @@ AI Project Synthesizer - Ollama Client
 Client for local LLM inference using Ollama.
 """
 
+import json
 import logging
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from typing import Any
 
 import httpx
 
+from src.llm.response_cache import fingerprint
+from src.llm.scheduler import get_backend_scheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +28,9 @@ class CompletionResult:
     tokens_used: int
     finish_reason: str
     duration_ms: int
+    cached: bool = False
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
 
 
 class OllamaClient:
@@ -46,6 +56,7 @@ class OllamaClient:
         host: str = "http://localhost:11434",
         default_model: str = None,
         timeout: float = 120.0,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize Ollama client.
@@ -54,11 +65,16 @@ class OllamaClient:
             host: Ollama server URL
             default_model: Default model to use
             timeout: Request timeout in seconds
+            max_concurrency: Concurrent requests for this host (default:
+                ``ollama_max_concurrency`` setting); shared by all clients
         """
         self.host = host.rstrip("/")
         self.default_model = default_model or self.DEFAULT_MODELS["balanced"]
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        self._scheduler = get_backend_scheduler(
+            f"ollama:{self.host}", max_concurrency
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -118,11 +134,11 @@ class OllamaClient:
 
         Returns:
             CompletionResult with generated content
-        """
-        import time
-
-        start_time = time.time()
 
+        Raises:
+            LLMOverloadedError: The backend scheduler could not start the
+                request within ``timeout``
+        """
         model = model or self.default_model
 
         # Build messages
@@ -131,6 +147,25 @@ class OllamaClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
+        return await self._scheduler.run(
+            lambda: self._chat(model, messages, temperature, max_tokens, stream),
+            key=fingerprint(
+                "ollama", model, messages, temperature, max_tokens, stream=stream
+            ),
+            deadline=time.monotonic() + self.timeout,
+        )
+
+    async def _chat(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        stream: bool,
+    ) -> CompletionResult:
+        """Send one chat request; admission is handled by complete()."""
+        start_time = time.time()
+
         # Make request
         client = await self._get_client()
 
@@ -154,14 +189,17 @@ class OllamaClient:
             data = response.json()
 
             content = data.get("message", {}).get("content", "")
-            tokens = data.get("eval_count", 0) + data.get("prompt_eval_count", 0)
+            prompt_tokens = data.get("prompt_eval_count", 0)
+            completion_tokens = data.get("eval_count", 0)
 
             return CompletionResult(
                 content=content,
                 model=model,
-                tokens_used=tokens,
+                tokens_used=prompt_tokens + completion_tokens,
                 finish_reason=data.get("done_reason", "stop"),
                 duration_ms=int((time.time() - start_time) * 1000),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
             )
 
         except httpx.TimeoutException:
@@ -170,6 +208,54 @@ class OllamaClient:
             logger.error(f"Ollama completion failed: {e}")
             raise
 
+    async def stream_chat(
+        self,
+        messages: list[dict[str, str]],
+        model: str = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream a chat completion as Ollama's NDJSON chunks.
+
+        The stream holds one backend scheduler slot until it ends. The last
+        chunk has ``done`` set and carries ``prompt_eval_count``,
+        ``eval_count`` and ``done_reason``.
+
+        Args:
+            messages: Chat messages
+            model: Model to use (defaults to balanced)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Decoded response chunks
+        """
+        model = model or self.default_model
+        async with self._scheduler.slot(deadline=time.monotonic() + self.timeout):
+            client = await self._get_client()
+            async with client.stream(
+                "POST",
+                "/api/chat",
+                json={
+                    "model": model,
+                    "messages": messages,
+                    "stream": True,
+                    "options": {
+                        "temperature": temperature,
+                        "num_predict": max_tokens,
+                    },
+                },
+            ) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    raise Exception(
+                        f"Ollama error: {body.decode('utf-8', errors='replace')}"
+                    )
+                async for line in response.aiter_lines():
+                    if line:
+                        yield json.loads(line)
+
     async def analyze_code(
         self,
         code: str,
@@ -0,0 +1,249 @@
+"""
+AI Project Synthesizer - Provider Selection
+
+Latency-aware provider selection for LLMRouter.
+
+Instead of probing every provider before each request, the selector keeps a
+health snapshot that is refreshed in the background (stale-while-revalidate)
+and per provider/model latency and error EWMAs fed by real calls. Providers
+are ranked by expected latency, and an optional hedge fires a backup request
+when the primary runs past its own p95.
+
+Usage:
+    selector = ProviderSelector({"ollama": ollama.is_available})
+    await selector.ensure_fresh()
+    ranked = selector.rank(["ollama", "lmstudio"], preferred="ollama")
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+HealthProbe = Callable[[], Awaitable[bool]]
+
+
+@dataclass
+class LatencyStats:
+    """EWMAs of latency and error rate, plus a window for the p95."""
+
+    alpha: float = 0.2
+    latency_ms: float | None = None
+    error_rate: float = 0.0
+    samples: int = 0
+    window: deque = field(default_factory=lambda: deque(maxlen=100))
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        self.samples += 1
+        self.error_rate += self.alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if not ok:
+            return
+        self.window.append(latency_ms)
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += self.alpha * (latency_ms - self.latency_ms)
+
+    @property
+    def expected_ms(self) -> float | None:
+        """Latency inflated by the retries the error rate implies."""
+        if self.latency_ms is None:
+            return None
+        return self.latency_ms / max(1.0 - self.error_rate, 0.05)
+
+    def percentile(self, q: float) -> float | None:
+        if not self.window:
+            return None
+        ordered = sorted(self.window)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ProviderSelector:
+    """
+    Health snapshot plus latency statistics for a set of providers.
+
+    A snapshot younger than ``refresh_interval`` is used as is; an older one
+    is still used but triggers one background refresh; one older than
+    ``ttl`` (or missing) is refreshed before answering. Failed calls mark a
+    provider unhealthy immediately, so it is skipped until the next probe.
+    """
+
+    def __init__(
+        self,
+        probes: dict[str, HealthProbe],
+        refresh_interval: float = 15.0,
+        ttl: float = 60.0,
+        switch_ratio: float = 0.5,
+        min_hedge_samples: int = 10,
+    ):
+        """
+        Initialize selector.
+
+        Args:
+            probes: Health check coroutine per provider name
+            refresh_interval: Snapshot age that triggers a background refresh
+            ttl: Snapshot age after which requests wait for a refresh
+            switch_ratio: Leave the preferred provider only for one expected
+                to take less than this fraction of its latency
+            min_hedge_samples: Latency samples needed before hedging
+        """
+        self.probes = probes
+        self.refresh_interval = refresh_interval
+        self.ttl = ttl
+        self.switch_ratio = switch_ratio
+        self.min_hedge_samples = min_hedge_samples
+
+        self._health: dict[str, bool] = {}
+        self._checked_at = 0.0
+        self._refreshing: asyncio.Task | None = None
+        self._stats: dict[tuple[str, str], LatencyStats] = {}
+        self._provider_stats: dict[str, LatencyStats] = {}
+
+    # ------------------------------------------------------------------
+    # Health snapshot
+    # ------------------------------------------------------------------
+
+    async def refresh(self) -> dict[str, bool]:
+        """Probe every provider concurrently; concurrent callers share one run."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._probe_all())
+        return await asyncio.shield(self._refreshing)
+
+    async def _probe_all(self) -> dict[str, bool]:
+        names = list(self.probes)
+        results = await asyncio.gather(
+            *(self.probes[name]() for name in names), return_exceptions=True
+        )
+        for name, healthy in zip(names, results, strict=True):
+            if isinstance(healthy, Exception):
+                logger.warning(f"Health check failed for {name}: {healthy}")
+            self._health[name] = healthy is True
+        self._checked_at = time.monotonic()
+        return dict(self._health)
+
+    async def ensure_fresh(self) -> None:
+        """Make the snapshot usable, refreshing in the background if aging."""
+        age = time.monotonic() - self._checked_at
+        if not self._health or age > self.ttl:
+            await self.refresh()
+        elif age > self.refresh_interval and (
+            self._refreshing is None or self._refreshing.done()
+        ):
+            self._refreshing = asyncio.create_task(self._probe_all())
+
+    def is_healthy(self, name: str) -> bool | None:
+        """Health from the snapshot; None if never probed."""
+        return self._health.get(name)
+
+    def set_health(self, name: str, healthy: bool) -> None:
+        self._health[name] = healthy
+
+    # ------------------------------------------------------------------
+    # Latency statistics
+    # ------------------------------------------------------------------
+
+    def record(self, name: str, model: str, latency_ms: float, ok: bool) -> None:
+        """Feed the outcome of a real call."""
+        self._stats.setdefault((name, model), LatencyStats()).record(latency_ms, ok)
+        self._provider_stats.setdefault(name, LatencyStats()).record(latency_ms, ok)
+        if not ok:
+            self.set_health(name, False)
+
+    def expected_ms(self, name: str, model: str | None = None) -> float | None:
+        stats = self._stats.get((name, model)) if model else None
+        stats = stats or self._provider_stats.get(name)
+        return stats.expected_ms if stats else None
+
+    def hedge_delay(self, name: str, model: str) -> float | None:
+        """Seconds to wait before hedging: the primary's p95, once known."""
+        stats = self._stats.get((name, model))
+        if stats is None or len(stats.window) < self.min_hedge_samples:
+            return None
+        return stats.percentile(0.95) / 1000
+
+    def rank(
+        self,
+        names: list[str],
+        preferred: str | None = None,
+        models: dict[str, str] | None = None,
+    ) -> list[str]:
+        """
+        Healthy providers, fastest expected first.
+
+        Providers without latency data rank after those with data. The
+        preferred provider keeps first place unless both have data and the
+        other is expected to take under ``switch_ratio`` of its latency.
+        """
+        models = models or {}
+        healthy = [name for name in names if self._health.get(name)]
+        expected = {name: self.expected_ms(name, models.get(name)) for name in healthy}
+
+        ranked = sorted(
+            healthy, key=lambda name: (expected[name] is None, expected[name] or 0.0)
+        )
+        if preferred in ranked and ranked[0] != preferred:
+            fastest, current = expected[ranked[0]], expected[preferred]
+            if fastest is None or current is None or (
+                fastest >= current * self.switch_ratio
+            ):
+                ranked.remove(preferred)
+                ranked.insert(0, preferred)
+        return ranked
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "health": dict(self._health),
+            "snapshot_age_s": time.monotonic() - self._checked_at
+            if self._checked_at
+            else None,
+            "models": {
+                f"{name}/{model}": {
+                    "latency_ms": stats.latency_ms,
+                    "error_rate": stats.error_rate,
+                    "p95_ms": stats.percentile(0.95),
+                    "samples": stats.samples,
+                }
+                for (name, model), stats in self._stats.items()
+            },
+        }
+
+
+async def hedged(
+    primary: Callable[[], Awaitable[Any]],
+    backup: Callable[[], Awaitable[Any]],
+    delay: float,
+) -> Any:
+    """
+    Run ``primary``; if it has not finished after ``delay`` seconds, also run
+    ``backup``. The first successful result wins and the other is cancelled.
+    Raises the last error if both fail; a primary failing before the delay
+    raises at once so the caller's own fallback can take over.
+    """
+    first = asyncio.ensure_future(primary())
+    pending = {first}
+    try:
+        try:
+            return await asyncio.wait_for(asyncio.shield(first), delay)
+        except TimeoutError:
+            pass
+
+        pending.add(asyncio.ensure_future(backup()))
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # Also reached when the caller is cancelled during the shielded wait
+        for task in pending:
+            task.cancel()
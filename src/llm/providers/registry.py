@@ -21,6 +21,13 @@ from src.llm.providers.base import (
     ProviderStatus,
     ProviderType,
 )
+from src.llm.response_cache import (
+    fingerprint,
+    get_response_cache,
+    result_from_payload,
+    result_to_payload,
+    should_cache,
+)
 
 secure_logger = get_secure_logger(__name__)
 
@@ -268,11 +275,80 @@ class ProviderRegistry:
             max_tokens: Maximum tokens
             provider_name: Specific provider to use
             fallback: Enable fallback to other providers
-            **kwargs: Additional provider-specific arguments
+            **kwargs: Additional provider-specific arguments. ``cache`` forces
+                the response cache on or off (default: on at temperature 0)
+                and ``cache_caller`` labels the request in cache hit rates.
 
         Returns:
             CompletionResult from successful provider
         """
+        cache = kwargs.pop("cache", None)
+        caller = kwargs.pop("cache_caller", None) or "provider_registry"
+        if not should_cache(temperature, cache):
+            result, _ = await self._complete_with_fallback(
+                prompt,
+                model,
+                system_prompt,
+                temperature,
+                max_tokens,
+                provider_name,
+                fallback,
+                **kwargs,
+            )
+            return result
+
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        def cache_key(route: str) -> str:
+            return fingerprint(
+                "provider_registry",
+                f"{route}/{model or 'default'}",
+                messages,
+                temperature,
+                max_tokens,
+                **kwargs,
+            )
+
+        response_cache = get_response_cache()
+        payload = response_cache.lookup(cache_key(provider_name or "auto"), caller)
+        if payload is not None:
+            return result_from_payload(CompletionResult, payload)
+
+        result, fallback_provider = await self._complete_with_fallback(
+            prompt,
+            model,
+            system_prompt,
+            temperature,
+            max_tokens,
+            provider_name,
+            fallback,
+            **kwargs,
+        )
+        # A fallback answer is stored under the provider that gave it, never
+        # under the one that was asked for
+        route = fallback_provider or provider_name or "auto"
+        response_cache.store(cache_key(route), result_to_payload(result), caller)
+        return result
+
+    async def _complete_with_fallback(
+        self,
+        prompt: str,
+        model: str | None,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        provider_name: str | None,
+        fallback: bool,
+        **kwargs,
+    ) -> tuple[CompletionResult, str | None]:
+        """
+        Try providers in priority order until one succeeds.
+
+        Returns the result and, when the first choice failed, the name of
+        the fallback provider that answered.
+        """
         correlation_id = correlation_manager.get_correlation_id()
         excluded = []
 
@@ -301,7 +377,7 @@ class ProviderRegistry:
                 if info:
                     info.success_count += 1
 
-                return result
+                return result, provider.name if excluded else None
 
             except Exception as e:
                 secure_logger.warning(
@@ -0,0 +1,273 @@
+"""
+AI Project Synthesizer - LLM Response Cache
+
+Deterministic response cache shared by LiteLLMRouter, LLMRouter and
+ProviderRegistry.
+
+Requests are keyed by a canonical fingerprint of (router, model, messages,
+temperature, max_tokens, tools and other request parameters). A response is
+only reused when sampling is deterministic (temperature 0) or the caller opts
+in with ``cache=True``; ``cache=False`` always bypasses it.
+
+Entries live in SQLite (``.cache/llm_responses.db``) so repeated synthesis
+runs share them, behind a small in-process LRU. Entries expire after a TTL
+and the least recently used ones are evicted beyond ``max_entries``. Hit
+rates are tracked per caller.
+
+Usage:
+    cache = get_response_cache()
+    key = fingerprint("litellm", model, messages, 0.0, 1024)
+    payload = cache.lookup(key, caller="readme")
+    if payload is None:
+        result = await call_model(...)
+        cache.store(key, result_to_payload(result))
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Payload fields that are never cached (provider objects, not data)
+_SKIP_FIELDS = {"raw_response"}
+
+
+def should_cache(temperature: float | None, cache: bool | None = None) -> bool:
+    """Explicit opt-in/out wins; otherwise only deterministic sampling caches."""
+    if cache is not None:
+        return cache
+    return temperature is not None and float(temperature) == 0.0
+
+
+def fingerprint(
+    router: str,
+    model: str | None,
+    messages: list[dict[str, Any]],
+    temperature: float | None,
+    max_tokens: int | None,
+    tools: Any = None,
+    **params: Any,
+) -> str:
+    """
+    Canonical SHA-256 fingerprint of a completion request.
+
+    Dict key order, ``0`` vs ``0.0`` and ``None``-valued message fields do
+    not change the key; any difference in text does.
+    """
+    body = {
+        "router": router,
+        "model": model,
+        "messages": [
+            {k: v for k, v in message.items() if v is not None} for message in messages
+        ],
+        "temperature": None if temperature is None else float(temperature),
+        "max_tokens": max_tokens,
+        "tools": tools,
+        "params": {k: v for k, v in params.items() if v is not None},
+    }
+    canonical = json.dumps(
+        body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def result_to_payload(result: Any) -> dict[str, Any]:
+    """Cacheable fields of a CompletionResult dataclass."""
+    return {
+        f.name: getattr(result, f.name)
+        for f in dataclasses.fields(result)
+        if f.name not in _SKIP_FIELDS
+    }
+
+
+def result_from_payload(result_type: type, payload: dict[str, Any]) -> Any:
+    """Rebuild a CompletionResult, marked as cached where the type allows."""
+    names = {f.name for f in dataclasses.fields(result_type)}
+    result = result_type(**{k: v for k, v in payload.items() if k in names})
+    if "cached" in names:
+        result.cached = True
+    return result
+
+
+async def replay_stream(content: str, chunk_chars: int = 64) -> AsyncIterator[str]:
+    """Yield a cached response in chunks, as a live stream would."""
+    for start in range(0, len(content), chunk_chars):
+        yield content[start : start + chunk_chars]
+        await asyncio.sleep(0)
+
+
+class ResponseCache:
+    """SQLite-backed response cache with an in-process LRU in front."""
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        max_entries: int = 5000,
+        ttl_seconds: float = 7 * 24 * 3600,
+        memory_entries: int = 256,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            db_path: SQLite file shared across runs and processes
+            max_entries: Entries kept before least recently used are evicted
+            ttl_seconds: Age after which an entry is ignored and removed
+            memory_entries: Size of the in-process LRU
+        """
+        self._db_path = db_path or Path(".cache/llm_responses.db")
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._callers: dict[str, dict[str, int]] = {}
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    hits INTEGER DEFAULT 0
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_used "
+                "ON responses(last_used)"
+            )
+            self._conn.commit()
+
+    def _count(self, caller: str, outcome: str) -> None:
+        counts = self._callers.setdefault(
+            caller, {"hits": 0, "misses": 0, "stores": 0}
+        )
+        counts[outcome] += 1
+
+    def lookup(self, key: str, caller: str = "default") -> dict[str, Any] | None:
+        """Cached payload for ``key``, or None (counted as a miss)."""
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None and now - cached[1] < self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self._count(caller, "hits")
+                # Decoded per hit so callers never share mutable payloads
+                return json.loads(cached[0])
+
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] >= self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self._memory.pop(key, None)
+                self._count(caller, "misses")
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            self._remember(key, row[0], row[1])
+            self._count(caller, "hits")
+            return json.loads(row[0])
+
+    def store(self, key: str, payload: dict[str, Any], caller: str = "default") -> None:
+        """Save a response and evict expired or least recently used entries."""
+        now = time.time()
+        try:
+            data = json.dumps(payload, default=str)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Response not cacheable: {e}")
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, payload, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+            self._remember(key, data, now)
+            self._count(caller, "stores")
+
+    def _remember(self, key: str, data: str, created_at: float) -> None:
+        self._memory[key] = (data, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> int:
+        """Remove every entry; returns how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._memory.clear()
+            return cursor.rowcount
+
+    def get_stats(self) -> dict[str, Any]:
+        """Entry count and hit rates, overall and per caller."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            by_caller = {
+                caller: {
+                    **counts,
+                    "hit_rate": counts["hits"]
+                    / max(counts["hits"] + counts["misses"], 1),
+                }
+                for caller, counts in self._callers.items()
+            }
+        hits = sum(c["hits"] for c in by_caller.values())
+        misses = sum(c["misses"] for c in by_caller.values())
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / max(hits + misses, 1),
+            "by_caller": by_caller,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
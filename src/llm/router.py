@@ -5,11 +5,21 @@ Intelligent routing between local and cloud LLMs based on task complexity.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 
 from src.llm.lmstudio_client import LMStudioClient
 from src.llm.ollama_client import CompletionResult, OllamaClient
+from src.llm.provider_selection import ProviderSelector, hedged
+from src.llm.response_cache import (
+    fingerprint,
+    get_response_cache,
+    result_from_payload,
+    result_to_payload,
+    should_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +33,9 @@ class ProviderType(Enum):
     ANTHROPIC = "anthropic"
 
 
+LOCAL_PROVIDERS = [ProviderType.OLLAMA, ProviderType.LMSTUDIO]
+
+
 class TaskComplexity(Enum):
     """Task complexity levels for routing decisions."""
 
@@ -55,6 +68,10 @@ class LLMRouter:
     - Fallback between local providers (Ollama ↔ LM Studio)
     - Cloud fallback when enabled
 
+    Provider health comes from a background-refreshed snapshot, and healthy
+    local providers are ranked by per-model latency/error EWMAs. With
+    ``hedge_requests`` a slow request is raced against a backup provider.
+
     Usage:
         router = LLMRouter()
         result = await router.complete(
@@ -77,6 +94,8 @@ class LLMRouter:
         cloud_threshold: float = 0.7,
         model_size_preference: str = "medium",
         fallback_enabled: bool = True,
+        hedge_requests: bool = False,
+        health_refresh_interval: float = 15.0,
     ):
         """
         Initialize the router.
@@ -89,12 +108,17 @@ class LLMRouter:
             cloud_threshold: Complexity threshold for cloud (0-1)
             model_size_preference: Model size preference (tiny, small, medium, large)
             fallback_enabled: Enable fallback between providers
+            hedge_requests: Start a backup local provider when the primary
+                runs past its p95 latency; the first response wins
+            health_refresh_interval: Seconds between background health
+                snapshot refreshes
         """
         self.preferred_provider = ProviderType(preferred_provider.lower())
         self.fallback_enabled = fallback_enabled
         self.cloud_enabled = cloud_enabled
         self.cloud_threshold = cloud_threshold
         self.model_size_preference = model_size_preference
+        self.hedge_requests = hedge_requests
 
         # Initialize clients
         self.ollama_client = ollama_client or OllamaClient()
@@ -118,9 +142,24 @@ class LLMRouter:
 
         self._cloud_client = None  # Lazy initialization
 
+        # Probes resolve the clients at call time so they can be swapped
+        self._selector = ProviderSelector(
+            {
+                ProviderType.OLLAMA.value: lambda: self.ollama_client.is_available(),
+                ProviderType.LMSTUDIO.value: lambda: (
+                    self.lmstudio_client.is_available()
+                ),
+            },
+            refresh_interval=health_refresh_interval,
+            ttl=health_refresh_interval * 4,
+        )
+
     async def check_provider_health(self, provider: ProviderType) -> bool:
         """
-        Check if a provider is available.
+        Check if a provider is available with a live probe.
+
+        Routing reads the cached snapshot instead (see get_best_provider);
+        a local provider's result is written back into that snapshot.
 
         Args:
             provider: Provider to check
@@ -130,45 +169,75 @@ class LLMRouter:
         """
         try:
             if provider == ProviderType.OLLAMA:
-                return await self.ollama_client.is_available()
+                healthy = await self.ollama_client.is_available()
             elif provider == ProviderType.LMSTUDIO:
-                return await self.lmstudio_client.is_available()
+                healthy = await self.lmstudio_client.is_available()
             elif provider in [ProviderType.OPENAI, ProviderType.ANTHROPIC]:
                 # // DONE: Implement cloud provider health checks
                 return self.cloud_enabled
-            return False
+            else:
+                return False
         except Exception as e:
             logger.warning(f"Health check failed for {provider}: {e}")
-            return False
+            healthy = False
+        self._selector.set_health(provider.value, healthy)
+        return healthy
 
-    async def get_best_provider(self) -> ProviderType:
+    def _rank_local(
+        self,
+        providers: list[ProviderType],
+        complexity: TaskComplexity | None = None,
+    ) -> list[ProviderType]:
+        """Healthy local providers from the snapshot, fastest expected first."""
+        models = {}
+        if complexity is not None:
+            for provider in providers:
+                decision = self.route(complexity, 0, provider)
+                models[provider.value] = decision.model
+        ranked = self._selector.rank(
+            [provider.value for provider in providers],
+            preferred=self.preferred_provider.value,
+            models=models,
+        )
+        return [ProviderType(name) for name in ranked]
+
+    async def get_best_provider(
+        self, complexity: TaskComplexity | None = None
+    ) -> ProviderType:
         """
         Get the best available provider with fallback logic.
 
+        Uses the background-refreshed health snapshot rather than probing
+        providers on every request, and ranks healthy local providers by
+        expected latency for the models ``complexity`` would route to.
+
+        Args:
+            complexity: Task complexity, to rank by per-model latency
+
         Returns:
             Best available provider
         """
-        # Try preferred provider first
-        if await self.check_provider_health(self.preferred_provider):
+        if self.preferred_provider not in LOCAL_PROVIDERS and self.cloud_enabled:
             return self.preferred_provider
 
+        await self._selector.ensure_fresh()
+        candidates = (
+            LOCAL_PROVIDERS if self.fallback_enabled else [self.preferred_provider]
+        )
+        ranked = self._rank_local(
+            [p for p in candidates if p in LOCAL_PROVIDERS], complexity
+        )
+        if ranked:
+            if ranked[0] != self.preferred_provider:
+                logger.info(f"Routing from {self.preferred_provider} to {ranked[0]}")
+            return ranked[0]
+
         if not self.fallback_enabled:
             logger.warning(
                 f"Preferred provider {self.preferred_provider} unavailable, fallback disabled"
             )
             return self.preferred_provider
 
-        # Try other local providers
-        local_providers = [ProviderType.OLLAMA, ProviderType.LMSTUDIO]
-        for provider in local_providers:
-            if provider != self.preferred_provider and await self.check_provider_health(
-                provider
-            ):
-                logger.info(
-                    f"Falling back from {self.preferred_provider} to {provider}"
-                )
-                return provider
-
         # Fall back to cloud if enabled
         if self.cloud_enabled:
             logger.info("Local providers unavailable, falling back to cloud")
@@ -178,6 +247,10 @@ class LLMRouter:
         logger.error("No LLM providers available")
         return self.preferred_provider
 
+    def get_selection_stats(self) -> dict:
+        """Health snapshot and per-model latency statistics."""
+        return self._selector.get_stats()
+
     def estimate_complexity(
         self,
         prompt: str,
@@ -314,6 +387,8 @@ class LLMRouter:
         system_prompt: str = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache: bool | None = None,
+        cache_caller: str | None = None,
     ) -> CompletionResult:
         """
         Complete prompt with automatic routing and fallback.
@@ -324,6 +399,9 @@ class LLMRouter:
             system_prompt: Optional system prompt
             temperature: Sampling temperature
             max_tokens: Maximum tokens
+            cache: Force the response cache on or off (default: on at
+                temperature 0)
+            cache_caller: Label for this request in cache hit rates
 
         Returns:
             CompletionResult from chosen model
@@ -332,8 +410,61 @@ class LLMRouter:
         if complexity is None:
             complexity = self.estimate_complexity(prompt)
 
+        if not should_cache(temperature, cache):
+            result, _ = await self._route_and_complete(
+                prompt, complexity, system_prompt, temperature, max_tokens
+            )
+            return result
+
+        # Keyed on the model the preferred provider would use, so a hit
+        # skips the provider health checks too
+        planned = self.route(complexity, len(prompt) // 4, self.preferred_provider)
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        caller = cache_caller or "llm_router"
+        response_cache = get_response_cache()
+
+        payload = response_cache.lookup(
+            fingerprint(
+                "llm_router",
+                f"{planned.provider.value}/{planned.model}",
+                messages,
+                temperature,
+                max_tokens,
+            ),
+            caller,
+        )
+        if payload is not None:
+            return result_from_payload(CompletionResult, payload)
+
+        result, answered = await self._route_and_complete(
+            prompt, complexity, system_prompt, temperature, max_tokens
+        )
+        # Stored under the route that answered: a fallback or hedge backup
+        # response must not be served as the planned model's answer
+        response_cache.store(
+            fingerprint("llm_router", answered, messages, temperature, max_tokens),
+            result_to_payload(result),
+            caller,
+        )
+        return result
+
+    async def _route_and_complete(
+        self,
+        prompt: str,
+        complexity: TaskComplexity,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[CompletionResult, str]:
+        """
+        Pick a provider and model, then complete with fallback.
+
+        Returns the result and the ``provider/model`` route that produced it.
+        """
         # Get best available provider
-        best_provider = await self.get_best_provider()
+        best_provider = await self.get_best_provider(complexity)
 
         # Get routing decision
         context_length = len(prompt) // 4
@@ -341,86 +472,152 @@ class LLMRouter:
 
         logger.info(f"Routing: {decision.reason}")
 
+        primary = partial(
+            self._answer,
+            decision.provider,
+            decision.model,
+            prompt,
+            system_prompt,
+            temperature,
+            max_tokens,
+        )
+
         # Execute with chosen provider
         try:
-            if decision.provider == ProviderType.OLLAMA:
-                return await self.ollama_client.complete(
-                    prompt=prompt,
-                    model=decision.model,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-            elif decision.provider == ProviderType.LMSTUDIO:
-                return await self.lmstudio_client.complete(
-                    prompt=prompt,
-                    model=decision.model,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-            elif decision.provider in [ProviderType.OPENAI, ProviderType.ANTHROPIC]:
-                # Cloud completion (to be implemented)
-                return await self._cloud_complete(
-                    prompt=prompt,
-                    model=decision.model,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-            else:
-                raise ValueError(f"Unknown provider: {decision.provider}")
+            backup = self._hedge_backup(decision, complexity, context_length)
+            if backup is None:
+                return await primary()
+            delay, backup_decision = backup
+            logger.debug(
+                f"Hedging {decision.provider} with {backup_decision.provider} "
+                f"after {delay:.2f}s"
+            )
+            return await hedged(
+                primary,
+                partial(
+                    self._answer,
+                    backup_decision.provider,
+                    backup_decision.model,
+                    prompt,
+                    system_prompt,
+                    temperature,
+                    max_tokens,
+                ),
+                delay,
+            )
 
         except Exception as e:
             logger.error(f"Completion failed with {decision.provider}: {e}")
 
-            # Try fallback if enabled and this wasn't already a fallback
-            if self.fallback_enabled and decision.provider == self.preferred_provider:
+            if self.fallback_enabled:
                 logger.info("Primary provider failed, trying fallback providers")
 
-                # Try other local providers
-                for fallback_provider in [ProviderType.OLLAMA, ProviderType.LMSTUDIO]:
-                    if fallback_provider != decision.provider:
-                        try:
-                            if await self.check_provider_health(fallback_provider):
-                                logger.info(f"Falling back to {fallback_provider}")
-
-                                if fallback_provider == ProviderType.OLLAMA:
-                                    return await self.ollama_client.complete(
-                                        prompt=prompt,
-                                        model=self.local_models["ollama"]["medium"],
-                                        system_prompt=system_prompt,
-                                        temperature=temperature,
-                                        max_tokens=max_tokens,
-                                    )
-                                else:  # LMSTUDIO
-                                    return await self.lmstudio_client.complete(
-                                        prompt=prompt,
-                                        model=self.local_models["lmstudio"]["medium"],
-                                        system_prompt=system_prompt,
-                                        temperature=temperature,
-                                        max_tokens=max_tokens,
-                                    )
-                        except Exception as fallback_error:
-                            logger.warning(
-                                f"Fallback to {fallback_provider} also failed: {fallback_error}"
-                            )
-                            continue
+                # Try other healthy local providers, fastest first
+                for fallback_provider in self._rank_local(LOCAL_PROVIDERS):
+                    if fallback_provider == decision.provider:
+                        continue
+                    try:
+                        logger.info(f"Falling back to {fallback_provider}")
+                        return await self._answer(
+                            fallback_provider,
+                            self.local_models[fallback_provider.value]["medium"],
+                            prompt,
+                            system_prompt,
+                            temperature,
+                            max_tokens,
+                        )
+                    except Exception as fallback_error:
+                        logger.warning(
+                            f"Fallback to {fallback_provider} also failed: {fallback_error}"
+                        )
+                        continue
 
                 # Try cloud as last resort
                 if self.cloud_enabled:
                     logger.info("Local fallbacks failed, trying cloud")
-                    return await self._cloud_complete(
-                        prompt=prompt,
-                        model="gpt-4-turbo-preview",
-                        system_prompt=system_prompt,
-                        temperature=temperature,
-                        max_tokens=max_tokens,
+                    return await self._answer(
+                        ProviderType.OPENAI,
+                        "gpt-4-turbo-preview",
+                        prompt,
+                        system_prompt,
+                        temperature,
+                        max_tokens,
                     )
 
             # No fallback worked, re-raise original error
             raise
 
+    def _hedge_backup(
+        self,
+        decision: RoutingDecision,
+        complexity: TaskComplexity,
+        context_length: int,
+    ) -> tuple[float, RoutingDecision] | None:
+        """Hedge delay and backup route, when hedging applies to ``decision``."""
+        if not self.hedge_requests or decision.provider not in LOCAL_PROVIDERS:
+            return None
+        delay = self._selector.hedge_delay(decision.provider.value, decision.model)
+        if delay is None:
+            return None
+        for provider in self._rank_local(LOCAL_PROVIDERS, complexity):
+            if provider != decision.provider:
+                backup = self.route(complexity, context_length, provider)
+                if backup.provider in LOCAL_PROVIDERS:
+                    return delay, backup
+        return None
+
+    async def _answer(
+        self,
+        provider: ProviderType,
+        model: str,
+        *args,
+    ) -> tuple[CompletionResult, str]:
+        """Complete with one provider, also returning its route."""
+        result = await self._call_provider(provider, model, *args)
+        return result, f"{provider.value}/{model}"
+
+    async def _call_provider(
+        self,
+        provider: ProviderType,
+        model: str,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> CompletionResult:
+        """Complete with one provider, feeding its latency statistics."""
+        if provider in [ProviderType.OPENAI, ProviderType.ANTHROPIC]:
+            return await self._cloud_complete(
+                prompt=prompt,
+                model=model,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        if provider == ProviderType.OLLAMA:
+            client = self.ollama_client
+        elif provider == ProviderType.LMSTUDIO:
+            client = self.lmstudio_client
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        start = time.perf_counter()
+        try:
+            result = await client.complete(
+                prompt=prompt,
+                model=model,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except Exception:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._selector.record(provider.value, model, elapsed_ms, ok=False)
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._selector.record(provider.value, model, elapsed_ms, ok=True)
+        return result
+
     async def _cloud_complete(
         self,
         prompt: str,
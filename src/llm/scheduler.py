@@ -0,0 +1,350 @@
+"""
+AI Project Synthesizer - Local Backend Scheduler
+
+Admission control for local model servers (Ollama, LM Studio).
+
+A local backend serves only a few generations at once; firing dozens at it
+makes every request slow and most of them time out. Each backend gets one
+shared scheduler that:
+
+- caps concurrent requests (``max_concurrency``)
+- queues the rest by lane: interactive chat, then background review, then
+  memory consolidation
+- rejects a request up front when its expected queue wait would overrun its
+  deadline, and drops queued requests whose deadline passes
+- coalesces identical in-flight prompts into one backend call
+
+Queue depth, wait time, rejections and coalesced requests are reported
+through ``core.observability.metrics``.
+
+Usage:
+    scheduler = get_backend_scheduler("ollama:http://localhost:11434")
+    with request_lane(RequestLane.INTERACTIVE):
+        result = await scheduler.run(call, key=prompt_key, deadline=deadline)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from enum import IntEnum
+from typing import Any
+
+from src.core.exceptions import LLMOverloadedError
+from src.core.observability import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLane(IntEnum):
+    """Queue lanes; lower values are served first."""
+
+    INTERACTIVE = 0
+    REVIEW = 1
+    CONSOLIDATION = 2
+
+
+_lane: contextvars.ContextVar[RequestLane] = contextvars.ContextVar(
+    "llm_request_lane", default=RequestLane.REVIEW
+)
+
+
+@contextlib.contextmanager
+def request_lane(lane: RequestLane) -> Iterator[None]:
+    """Run a block (and tasks it creates) in the given scheduler lane."""
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def current_request_lane() -> RequestLane:
+    """Lane used by requests that do not pass one."""
+    return _lane.get()
+
+
+class BackendScheduler:
+    """Concurrency cap, lane-ordered queue and coalescing for one backend."""
+
+    def __init__(
+        self,
+        backend: str,
+        max_concurrency: int = 2,
+        max_queue: int = 64,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            backend: Backend label used in metrics and errors
+            max_concurrency: Requests sent to the backend at once
+            max_queue: Requests allowed to wait before new ones are rejected
+        """
+        self.backend = backend
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+
+        self._running = 0
+        self._waiting: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._service_ewma: float | None = None
+        self._waits: deque[float] = deque(maxlen=500)
+        self._counts = {"admitted": 0, "rejected": 0, "coalesced": 0, "failed": 0}
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiting)
+
+    def estimate_wait(self, lane: RequestLane) -> float:
+        """Seconds a new request in ``lane`` is expected to queue."""
+        if self._running < self.max_concurrency and not self._waiting:
+            return 0.0
+        if self._service_ewma is None:
+            return 0.0
+        ahead = sum(1 for entry in self._waiting if entry[0] <= lane)
+        return (ahead + 1) / self.max_concurrency * self._service_ewma
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        key: str | None = None,
+        lane: RequestLane | None = None,
+        deadline: float | None = None,
+    ) -> Any:
+        """
+        Run ``call`` once a slot is free.
+
+        Args:
+            call: Coroutine factory performing the backend request
+            key: Identity of the request; concurrent calls with the same key
+                share one backend call
+            lane: Queue lane (default: the current ``request_lane``)
+            deadline: ``time.monotonic()`` by which the request must start
+
+        Raises:
+            LLMOverloadedError: Queue full, or the deadline cannot be met
+        """
+        lane = current_request_lane() if lane is None else lane
+        if key is None:
+            return await self._admit_and_run(call, lane, deadline)
+
+        shared = self._inflight.get(key)
+        if shared is not None:
+            self._counts["coalesced"] += 1
+            metrics.increment(
+                "llm_scheduler_coalesced_total", tags={"backend": self.backend}
+            )
+            try:
+                return await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                if not shared.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # Only the leader was cancelled; issue the request ourselves
+                return await self.run(call, key, lane, deadline)
+
+        shared = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting on it; retrieve the outcome to avoid warnings
+        shared.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = shared
+        try:
+            result = await self._admit_and_run(call, lane, deadline)
+        except Exception as e:
+            shared.set_exception(e)
+            raise
+        except BaseException:
+            shared.cancel()
+            raise
+        else:
+            shared.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, lane: RequestLane | None = None, deadline: float | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Hold one slot for the duration of the block, e.g. a whole stream.
+
+        Raises:
+            LLMOverloadedError: Queue full, or the deadline cannot be met
+        """
+        lane = current_request_lane() if lane is None else lane
+        queued_at = time.monotonic()
+        await self._acquire(lane, deadline)
+        self._record_wait(time.monotonic() - queued_at, lane)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _admit_and_run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        lane: RequestLane,
+        deadline: float | None,
+    ) -> Any:
+        async with self.slot(lane, deadline):
+            started = time.monotonic()
+            try:
+                result = await call()
+            except Exception:
+                self._counts["failed"] += 1
+                raise
+        elapsed = time.monotonic() - started
+        if self._service_ewma is None:
+            self._service_ewma = elapsed
+        else:
+            self._service_ewma += 0.2 * (elapsed - self._service_ewma)
+        return result
+
+    async def _acquire(self, lane: RequestLane, deadline: float | None) -> None:
+        if self._running < self.max_concurrency and not self._waiting:
+            self._running += 1
+            return
+
+        if len(self._waiting) >= self.max_queue:
+            self._reject(lane, f"queue full ({self.max_queue} waiting)")
+        now = time.monotonic()
+        if deadline is not None:
+            expected = self.estimate_wait(lane)
+            if now + expected > deadline:
+                self._reject(
+                    lane,
+                    f"expected queue wait {expected:.1f}s exceeds deadline",
+                    retry_after=expected,
+                )
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (int(lane), next(self._seq), waiter)
+        heapq.heappush(self._waiting, entry)
+        self._report_depth()
+        try:
+            timeout = None if deadline is None else max(deadline - now, 0)
+            await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            self._forget(entry)
+            self._reject(lane, "deadline passed while queued")
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we were cancelled
+                self._release()
+            else:
+                self._forget(entry)
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while self._waiting:
+            _, _, waiter = heapq.heappop(self._waiting)
+            if not waiter.done():
+                waiter.set_result(None)
+                self._report_depth()
+                return
+        self._running -= 1
+        self._report_depth()
+
+    def _forget(self, entry: tuple[int, int, asyncio.Future]) -> None:
+        with contextlib.suppress(ValueError):
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+        self._report_depth()
+
+    def _reject(
+        self, lane: RequestLane, reason: str, retry_after: float | None = None
+    ) -> None:
+        self._counts["rejected"] += 1
+        metrics.increment(
+            "llm_scheduler_rejected_total",
+            tags={"backend": self.backend, "lane": lane.name.lower()},
+        )
+        logger.warning(
+            f"Rejected {lane.name.lower()} request to {self.backend}: {reason}"
+        )
+        raise LLMOverloadedError(self.backend, reason, retry_after=retry_after)
+
+    def _record_wait(self, waited: float, lane: RequestLane) -> None:
+        self._counts["admitted"] += 1
+        self._waits.append(waited)
+        metrics.record_timer(
+            "llm_scheduler_wait_seconds",
+            waited,
+            tags={"backend": self.backend, "lane": lane.name.lower()},
+        )
+
+    def _report_depth(self) -> None:
+        metrics.set_gauge(
+            "llm_scheduler_queue_depth",
+            len(self._waiting),
+            tags={"backend": self.backend},
+        )
+        metrics.set_gauge(
+            "llm_scheduler_running", self._running, tags={"backend": self.backend}
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "backend": self.backend,
+            "max_concurrency": self.max_concurrency,
+            "running": self._running,
+            "queue_depth": len(self._waiting),
+            "inflight_keys": len(self._inflight),
+            "service_time_s": self._service_ewma,
+            "wait_p50_s": waits[len(waits) // 2] if waits else None,
+            "wait_p95_s": waits[int(len(waits) * 0.95)] if waits else None,
+            **self._counts,
+        }
+
+
+_schedulers: dict[str, BackendScheduler] = {}
+
+
+def _configured_limits(backend: str) -> tuple[int, int]:
+    """Concurrency and queue limits from LLM settings for ``kind:host``."""
+    kind = backend.split(":", 1)[0]
+    try:
+        from src.core.config import get_settings
+
+        llm = get_settings().llm
+        return getattr(llm, f"{kind}_max_concurrency", 2), llm.llm_max_queue
+    except Exception as e:
+        logger.debug(f"Using default scheduler limits for {backend}: {e}")
+        return 2, 64
+
+
+def get_backend_scheduler(
+    backend: str,
+    max_concurrency: int | None = None,
+    max_queue: int | None = None,
+) -> BackendScheduler:
+    """
+    Get the scheduler shared by every client of ``backend``.
+
+    ``backend`` is ``"<kind>:<host>"``; unset limits come from the
+    ``<kind>_max_concurrency`` and ``llm_max_queue`` settings. The limits
+    given by the first caller win; later callers share them.
+    """
+    scheduler = _schedulers.get(backend)
+    if scheduler is None:
+        default_concurrency, default_queue = _configured_limits(backend)
+        scheduler = BackendScheduler(
+            backend,
+            max_concurrency or default_concurrency,
+            max_queue or default_queue,
+        )
+        _schedulers[backend] = scheduler
+    return scheduler
+
+
+def get_scheduler_stats() -> list[dict[str, Any]]:
+    """Stats for every backend scheduler created so far."""
+    return [scheduler.get_stats() for scheduler in _schedulers.values()]
@@ -418,6 +418,9 @@ async def consolidate_memories(request: ConsolidateRequest) -> dict[str, Any]:
             "success": report.get("success", False),
             "consolidated": report.get("consolidated", {}),
             "total_consolidated": report.get("total_consolidated", 0),
+            "duplicates_collapsed": report.get("duplicates_collapsed", 0),
+            "llm_calls": report.get("llm_calls", 0),
+            "tokens_saved": report.get("tokens_saved", 0),
             "timestamp": report.get("timestamp", datetime.now().isoformat()),
             "error": report.get("error"),
         }
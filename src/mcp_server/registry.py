@@ -0,0 +1,170 @@
+"""
+AI Project Synthesizer - Lazy Tool Registry
+
+Maps MCP tool names to their handlers without importing them. Handler
+modules (and the analysis, synthesis and discovery stacks they pull in)
+are imported on the first call to a tool, or ahead of time by a background
+pre-warm once the client handshake has completed, so ``list_tools`` can
+answer as soon as the server process is up.
+
+Handlers are looked up on their module at call time, which keeps
+``patch("src.mcp_server.tools.handle_x")`` working in tests.
+
+Usage:
+    registry = get_tool_registry()
+    handler = await registry.aget_handler("search_repositories")
+    result = await handler(arguments)
+"""
+
+import asyncio
+import importlib
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from types import ModuleType
+from typing import Any
+
+from src.core.security import get_secure_logger
+
+secure_logger = get_secure_logger(__name__)
+
+ToolHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+_TOOLS_MODULE = "src.mcp_server.tools"
+
+# Tool name -> "module:attribute" of its handler
+DEFAULT_TOOL_HANDLERS: dict[str, str] = {
+    "search_repositories": f"{_TOOLS_MODULE}:handle_search_repositories",
+    "analyze_repository": f"{_TOOLS_MODULE}:handle_analyze_repository",
+    "check_compatibility": f"{_TOOLS_MODULE}:handle_check_compatibility",
+    "resolve_dependencies": f"{_TOOLS_MODULE}:handle_resolve_dependencies",
+    "synthesize_project": f"{_TOOLS_MODULE}:handle_synthesize_project",
+    "generate_documentation": f"{_TOOLS_MODULE}:handle_generate_documentation",
+    "get_synthesis_status": f"{_TOOLS_MODULE}:handle_get_synthesis_status",
+    "cancel_synthesis": f"{_TOOLS_MODULE}:handle_cancel_synthesis",
+    # Assistant tools
+    "assistant_chat": f"{_TOOLS_MODULE}:handle_assistant_chat",
+    "assistant_speak": f"{_TOOLS_MODULE}:handle_assistant_voice",
+    "assistant_toggle_voice": f"{_TOOLS_MODULE}:handle_assistant_toggle_voice",
+    "get_voices": f"{_TOOLS_MODULE}:handle_get_voices",
+    "speak_fast": f"{_TOOLS_MODULE}:handle_speak_fast",
+    "assemble_project": f"{_TOOLS_MODULE}:handle_assemble_project",
+    # AI Agent tools
+    "auto_fix_code": f"{_TOOLS_MODULE}:handle_auto_fix_code",
+    "generate_tests": f"{_TOOLS_MODULE}:handle_generate_tests",
+    "review_code": f"{_TOOLS_MODULE}:handle_review_code",
+    "project_health": f"{_TOOLS_MODULE}:handle_project_health",
+    "ci_repair": f"{_TOOLS_MODULE}:handle_run_ci_repair",
+}
+
+
+class ToolRegistry:
+    """
+    Lazily-loaded mapping of tool names to handlers.
+
+    Module imports are serialized by a lock so a call racing the
+    background pre-warm imports each module exactly once.
+    """
+
+    def __init__(self, handlers: dict[str, str] | None = None):
+        self._targets: dict[str, tuple[str, str]] = {}
+        self._modules: dict[str, ModuleType] = {}
+        self._load_times_ms: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._prewarm_task: asyncio.Task | None = None
+
+        for name, target in (handlers or DEFAULT_TOOL_HANDLERS).items():
+            self.register(name, target)
+
+    def register(self, name: str, target: str) -> None:
+        """Register a handler by "module:attribute" path."""
+        module, _, attr = target.partition(":")
+        if not module or not attr:
+            raise ValueError(f"Handler target must be 'module:attribute': {target}")
+        self._targets[name] = (module, attr)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._targets
+
+    @property
+    def tool_names(self) -> list[str]:
+        return list(self._targets)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether the tool's handler module has been imported."""
+        target = self._targets.get(name)
+        return target is not None and target[0] in self._modules
+
+    def _load_module(self, module_name: str) -> ModuleType:
+        module = self._modules.get(module_name)
+        if module is not None:
+            return module
+
+        with self._lock:
+            module = self._modules.get(module_name)
+            if module is None:
+                start = time.perf_counter()
+                module = importlib.import_module(module_name)
+                self._load_times_ms[module_name] = (time.perf_counter() - start) * 1000
+                self._modules[module_name] = module
+                secure_logger.debug(
+                    f"Loaded tool module {module_name} in "
+                    f"{self._load_times_ms[module_name]:.1f}ms"
+                )
+        return module
+
+    def get_handler(self, name: str) -> ToolHandler | None:
+        """Get a handler, importing its module if needed (blocking)."""
+        target = self._targets.get(name)
+        if target is None:
+            return None
+        module_name, attr = target
+        return getattr(self._load_module(module_name), attr)
+
+    async def aget_handler(self, name: str) -> ToolHandler | None:
+        """Get a handler, importing its module off the event loop."""
+        if name not in self._targets or self.is_loaded(name):
+            return self.get_handler(name)
+        return await asyncio.to_thread(self.get_handler, name)
+
+    def prewarm(self, names: list[str] | None = None) -> None:
+        """Import the handler modules for ``names`` (default: all tools)."""
+        for name in names or self.tool_names:
+            try:
+                self.get_handler(name)
+            except Exception as e:
+                # A broken optional dependency surfaces on the actual call
+                secure_logger.warning(f"Pre-warm failed for tool {name}: {e}")
+
+    def start_prewarm(self, delay_seconds: float = 0.0) -> asyncio.Task:
+        """Pre-warm all handlers in a worker thread after ``delay_seconds``."""
+        if self._prewarm_task is None or self._prewarm_task.done():
+
+            async def _run():
+                if delay_seconds > 0:
+                    await asyncio.sleep(delay_seconds)
+                await asyncio.to_thread(self.prewarm)
+
+            self._prewarm_task = asyncio.create_task(_run())
+        return self._prewarm_task
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get loaded modules and their import times."""
+        return {
+            "tools": len(self._targets),
+            "loaded_tools": sum(1 for name in self._targets if self.is_loaded(name)),
+            "module_load_ms": {
+                name: round(ms, 2) for name, ms in self._load_times_ms.items()
+            },
+        }
+
+
+_tool_registry: ToolRegistry | None = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Get or create the MCP tool registry."""
+    global _tool_registry
+    if _tool_registry is None:
+        _tool_registry = ToolRegistry()
+    return _tool_registry
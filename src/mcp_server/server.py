@@ -57,10 +57,11 @@ See docs/MCP_CLIENT_SUPPORT.md for full configuration guide.
 """
 
 import asyncio
+import importlib
 import json
+import sys
 import time
 from typing import Any
-from unittest.mock import MagicMock
 
 # Import from external mcp package
 from mcp.server import Server
@@ -70,26 +71,10 @@ from src.core.config import get_settings
 from src.core.lifecycle import lifecycle
 from src.core.observability import correlation_manager, metrics, track_performance
 from src.core.security import SecretManager, get_secure_logger
-from src.mcp_server.tools import (
-    handle_analyze_repository,
-    handle_assemble_project,
-    handle_assistant_chat,
-    handle_assistant_toggle_voice,
-    handle_assistant_voice,
-    handle_auto_fix_code,
-    handle_check_compatibility,
-    handle_generate_documentation,
-    handle_generate_tests,
-    handle_get_synthesis_status,
-    handle_get_voices,
-    handle_project_health,
-    handle_resolve_dependencies,
-    handle_review_code,
-    handle_run_ci_repair,
-    handle_search_repositories,
-    handle_speak_fast,
-    handle_synthesize_project,
-)
+
+# Tool handlers (and the analysis/synthesis stacks behind them) are imported
+# on first use so the server can answer list_tools immediately
+from src.mcp_server.registry import get_tool_registry
 
 # Configure secure logging
 secure_logger = get_secure_logger(__name__)
@@ -101,38 +86,62 @@ server = Server("ai-project-synthesizer")
 # Get settings
 settings = get_settings()
 
-# Initialize global components
+# Lazy tool handler registry
+tool_registry = get_tool_registry()
+
+# Global components (created on first access)
 llm_router = None
 memory_system = None
 
 
-class MCPServer:
-    """Wrapper class for MCP server to support testing."""
-
-    def __init__(self):
-        global llm_router, memory_system
-
-        # Initialize LLM router
+def get_llm_router():
+    """Get or create the LLM router."""
+    global llm_router
+    if llm_router is None:
         try:
             from src.llm.litellm_router import LiteLLMRouter
 
             llm_router = LiteLLMRouter()
         except Exception:
             # Fallback for testing
+            from unittest.mock import MagicMock
+
             llm_router = MagicMock()
+    return llm_router
+
 
-        # Initialize memory system
+def get_memory_system():
+    """Get or create the memory system."""
+    global memory_system
+    if memory_system is None:
         try:
             from src.memory.mem0_integration import MemorySystem
 
             memory_system = MemorySystem()
         except Exception:
             # Fallback for testing
+            from unittest.mock import MagicMock
+
             memory_system = MagicMock()
+    return memory_system
+
 
-        self.llm_router = llm_router
-        self.memory_system = memory_system
+class MCPServer:
+    """Wrapper class for MCP server to support testing."""
+
+    def __init__(self):
         self.server = server
+        self.tool_registry = tool_registry
+
+    @property
+    def llm_router(self):
+        """LLM router, created on first access."""
+        return get_llm_router()
+
+    @property
+    def memory_system(self):
+        """Memory system, created on first access."""
+        return get_memory_system()
 
     async def start(self):
         """Start the MCP server."""
@@ -271,7 +280,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="synthesize_project",
-            description="Create a unified project by intelligently combining code, dependencies, and structure from multiple repositories",
+            description="Create a unified project by intelligently combining code, dependencies, and structure from multiple repositories. Runs as a background job; poll get_synthesis_status with the returned synthesis_id",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -311,6 +320,16 @@ async def list_tools() -> list[Tool]:
                         "default": "python-default",
                         "description": "Project template (python-default, python-ml, python-web, minimal)",
                     },
+                    "priority": {
+                        "type": "string",
+                        "default": "normal",
+                        "description": "Queue priority: high, normal, low",
+                    },
+                    "wait": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Wait for completion instead of returning a job ID",
+                    },
                 },
                 "required": ["repositories", "project_name", "output_path"],
             },
@@ -354,6 +373,20 @@ async def list_tools() -> list[Tool]:
                 "required": ["synthesis_id"],
             },
         ),
+        Tool(
+            name="cancel_synthesis",
+            description="Cancel a queued or running synthesize_project / assemble_project job",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "synthesis_id": {
+                        "type": "string",
+                        "description": "Job ID returned from synthesize_project or assemble_project",
+                    }
+                },
+                "required": ["synthesis_id"],
+            },
+        ),
         # ==================== ASSISTANT TOOLS ====================
         Tool(
             name="assistant_chat",
@@ -452,6 +485,16 @@ async def list_tools() -> list[Tool]:
                         "default": True,
                         "description": "Create a GitHub repository for the project",
                     },
+                    "priority": {
+                        "type": "string",
+                        "default": "normal",
+                        "description": "Queue priority: high, normal, low",
+                    },
+                    "wait": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Wait for completion instead of returning a job ID",
+                    },
                 },
                 "required": ["idea"],
             },
@@ -572,7 +615,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Handle tool calls from Windsurf.
 
     Dispatches to the appropriate handler based on tool name.
-    All handlers are implemented in src/mcp/tools.py
+    Handlers are implemented in src/mcp_server/tools.py and loaded
+    through the lazy tool registry.
     """
     # Generate correlation ID for request tracing
     correlation_id = correlation_manager.generate_id()
@@ -592,45 +636,10 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
     try:
         # Route to appropriate handler with performance tracking
+        handler = await tool_registry.aget_handler(name)
         with track_performance(f"tool_{name}"):
-            if name == "search_repositories":
-                result = await handle_search_repositories(arguments)
-            elif name == "analyze_repository":
-                result = await handle_analyze_repository(arguments)
-            elif name == "check_compatibility":
-                result = await handle_check_compatibility(arguments)
-            elif name == "resolve_dependencies":
-                result = await handle_resolve_dependencies(arguments)
-            elif name == "synthesize_project":
-                result = await handle_synthesize_project(arguments)
-            elif name == "generate_documentation":
-                result = await handle_generate_documentation(arguments)
-            elif name == "get_synthesis_status":
-                result = await handle_get_synthesis_status(arguments)
-            # Assistant tools
-            elif name == "assistant_chat":
-                result = await handle_assistant_chat(arguments)
-            elif name == "assistant_speak":
-                result = await handle_assistant_voice(arguments)
-            elif name == "assistant_toggle_voice":
-                result = await handle_assistant_toggle_voice(arguments)
-            elif name == "get_voices":
-                result = await handle_get_voices(arguments)
-            elif name == "speak_fast":
-                result = await handle_speak_fast(arguments)
-            elif name == "assemble_project":
-                result = await handle_assemble_project(arguments)
-            # AI Agent tools
-            elif name == "auto_fix_code":
-                result = await handle_auto_fix_code(arguments)
-            elif name == "generate_tests":
-                result = await handle_generate_tests(arguments)
-            elif name == "review_code":
-                result = await handle_review_code(arguments)
-            elif name == "project_health":
-                result = await handle_project_health(arguments)
-            elif name == "ci_repair":
-                result = await handle_run_ci_repair(arguments)
+            if handler is not None:
+                result = await handler(arguments)
             else:
                 result = {"error": f"Unknown tool: {name}"}
                 metrics.increment(
@@ -681,6 +690,29 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         correlation_manager.clear_correlation_id()
 
 
+async def resume_background_jobs(delay_seconds: float = 0.0):
+    """Restart background jobs interrupted by a previous shutdown or crash."""
+    if delay_seconds > 0:
+        await asyncio.sleep(delay_seconds)
+    try:
+        tools = await asyncio.to_thread(importlib.import_module, "src.mcp_server.tools")
+        memory = await asyncio.to_thread(
+            importlib.import_module, "src.memory.mem0_integration"
+        )
+        queue = tools.get_tool_job_queue()
+        # Every persisted kind needs its handler before recovery runs
+        memory.register_consolidation_job(queue)
+        await queue.start()
+    except Exception as e:
+        secure_logger.error(f"Failed to resume background jobs: {e}")
+
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    """Log an exception that escaped a background task."""
+    if not task.cancelled() and task.exception() is not None:
+        secure_logger.error(f"Task {task.get_name()} failed: {task.exception()}")
+
+
 async def main():
     """
     Main entry point for the MCP server.
@@ -702,6 +734,10 @@ async def main():
     async def shutdown_mcp_server():
         """Shutdown MCP server gracefully."""
         secure_logger.info("Shutting down MCP server")
+        tools = sys.modules.get("src.mcp_server.tools")
+        if tools is not None:
+            # Running jobs are left pending and resume on next start
+            await tools.get_tool_job_queue().stop()
 
     lifecycle.add_shutdown_task("mcp_server", shutdown_mcp_server, priority=100)
 
@@ -709,8 +745,19 @@ async def main():
     metrics.set_gauge("server_startup_time", time.time())
     metrics.increment("server_startups_total")
 
+    resume_task: asyncio.Task | None = None
     try:
         async with stdio_server() as (read_stream, write_stream):
+            # Handler imports run in a worker thread once the client has
+            # had time to complete the handshake and list tools
+            if settings.app.mcp_prewarm:
+                tool_registry.start_prewarm(settings.app.mcp_prewarm_delay_seconds)
+            # Held until shutdown so the task is neither collected nor orphaned
+            resume_task = asyncio.create_task(
+                resume_background_jobs(settings.app.mcp_prewarm_delay_seconds),
+                name="resume-background-jobs",
+            )
+            resume_task.add_done_callback(_log_task_failure)
             await server.run(
                 read_stream, write_stream, server.create_initialization_options()
             )
@@ -719,6 +766,8 @@ async def main():
         metrics.increment("server_errors_total")
         raise
     finally:
+        if resume_task is not None and not resume_task.done():
+            resume_task.cancel()
         metrics.set_gauge("server_shutdown_time", time.time())
 
 
@@ -10,8 +10,6 @@ import logging
 import re
 import tempfile
 import threading
-import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -21,12 +19,14 @@ from src.analysis.compatibility_checker import CompatibilityChecker
 from src.analysis.dependency_analyzer import DependencyAnalyzer
 from src.analysis.quality_scorer import QualityScorer
 from src.core.config import get_settings
+from src.core.jobs import Job, JobPriority, JobQueue, JobStatus, get_job_queue
 from src.core.observability import correlation_manager, metrics, track_performance
 from src.core.security import InputValidator, get_secure_logger
 from src.discovery.unified_search import UnifiedSearch, create_unified_search
 from src.generation.diagram_generator import DiagramGenerator
 from src.generation.readme_generator import ReadmeGenerator
 from src.synthesis.project_builder import ProjectBuilder
+from src.utils.quota_broker import QuotaPriority, quota_priority
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +46,26 @@ _synthesis_jobs_lock = threading.Lock()  # Thread-safe access to synthesis jobs
 
 
 def get_synthesis_job(job_id: str) -> dict[str, Any] | None:
-    """Thread-safe getter for synthesis job."""
+    """Thread-safe getter for synthesis job (falls back to the job store)."""
     with _synthesis_jobs_lock:
-        return _synthesis_jobs.get(job_id)
+        job = _synthesis_jobs.get(job_id)
+    if job is not None:
+        return job
+
+    stored = get_tool_job_queue().get(job_id)
+    if stored is None:
+        return None
+    return {
+        "id": stored.id,
+        "kind": stored.kind,
+        "status": stored.status.value,
+        "progress": stored.progress,
+        "stage": stored.stage,
+        "started_at": stored.started_at or stored.created_at,
+        "completed_at": stored.completed_at,
+        "error": stored.error,
+        "result": stored.result,
+    }
 
 
 def set_synthesis_job(job_id: str, job_data: dict[str, Any]) -> None:
@@ -64,6 +81,60 @@ def update_synthesis_job(job_id: str, **updates) -> None:
             _synthesis_jobs[job_id].update(updates)
 
 
+def get_tool_job_queue() -> JobQueue:
+    """Get the background job queue with the long-running tools registered."""
+    queue = get_job_queue()
+    if not queue.is_registered("synthesize_project"):
+        queue.register(
+            "synthesize_project", _run_synthesis_job, timeout_seconds=TIMEOUT_SYNTHESIS
+        )
+        # Assembly can create a GitHub repository; never re-run it blindly
+        queue.register("assemble_project", _run_assembly_job, max_attempts=1)
+    return queue
+
+
+def _parse_priority(value: Any) -> int:
+    """Accept "high"/"normal"/"low" or an integer (lower runs first)."""
+    if isinstance(value, str):
+        try:
+            return JobPriority[value.upper()]
+        except KeyError:
+            return JobPriority.NORMAL
+    if isinstance(value, int):
+        return value
+    return JobPriority.NORMAL
+
+
+async def _submit_job(kind: str, params: dict, args: dict) -> dict:
+    """Queue a job, optionally waiting for it to finish."""
+    queue = get_tool_job_queue()
+    job = await queue.submit(kind, params, priority=_parse_priority(args.get("priority")))
+    logger.info(f"Queued {kind} job {job.id}")
+
+    if args.get("wait", False):
+        job = await queue.wait(job.id)
+        return _job_response(job)
+
+    return {
+        "status": "queued",
+        "synthesis_id": job.id,
+        "job_status": job.status.value,
+        "priority": job.priority,
+        "message": "Use get_synthesis_status to track progress",
+    }
+
+
+def _job_response(job: Job) -> dict:
+    """Final tool response for a finished job."""
+    if job.result is not None:
+        return job.result
+    return {
+        "error": True,
+        "message": job.error or f"Job {job.status.value}",
+        "synthesis_id": job.id,
+    }
+
+
 def get_unified_search() -> UnifiedSearch:
     """Get or create unified search instance."""
     global _unified_search
@@ -147,16 +218,17 @@ async def handle_search_repositories(args: dict) -> dict:
         search = get_unified_search()
 
         # Add timeout protection to search operation
-        result = await asyncio.wait_for(
-            search.search(
-                query=query,
-                platforms=platforms,
-                max_results=max_results,
-                language_filter=language_filter,
-                min_stars=min_stars,
-            ),
-            timeout=TIMEOUT_API_CALL,
-        )
+        with quota_priority(QuotaPriority.INTERACTIVE):
+            result = await asyncio.wait_for(
+                search.search(
+                    query=query,
+                    platforms=platforms,
+                    max_results=max_results,
+                    language_filter=language_filter,
+                    min_stars=min_stars,
+                ),
+                timeout=TIMEOUT_API_CALL,
+            )
 
         secure_logger.info(
             "Search completed successfully",
@@ -489,9 +561,12 @@ async def handle_synthesize_project(args: dict) -> dict:
         project_name: Name for the synthesized project
         output_path: Output directory path
         template: Project template to use
+        priority: "high", "normal" or "low" (default: normal)
+        wait: Block until the build finishes (default: false)
 
     Returns:
-        Synthesis result with project path and status
+        Queued job id for get_synthesis_status, or the synthesis
+        result with project path when wait is set
     """
     repositories = args.get("repositories", [])
     project_name = args.get("project_name", "")
@@ -535,80 +610,47 @@ async def handle_synthesize_project(args: dict) -> dict:
                 "message": f"Invalid repository URL: {repo_url}",
             }
 
-    # Create synthesis job (thread-safe)
-    job_id = str(uuid.uuid4())
-    set_synthesis_job(
-        job_id,
+    return await _submit_job(
+        "synthesize_project",
         {
-            "id": job_id,
-            "status": "started",
-            "progress": 0,
-            "started_at": datetime.now().isoformat(),
-            "repositories": len(repositories),
+            "repositories": repositories,
+            "project_name": project_name,
+            "output_path": output_path,
+            "template": template,
         },
+        args,
     )
 
-    logger.info(f"Starting synthesis job {job_id}: {project_name}")
 
-    try:
-        builder = ProjectBuilder()
-
-        # Update progress (thread-safe)
-        update_synthesis_job(job_id, status="cloning", progress=10)
-
-        # Add timeout protection to synthesis operation
-        result = await asyncio.wait_for(
-            builder.build(
-                repositories=repositories,
-                project_name=project_name,
-                output_path=Path(output_path),
-                template=template,
-                progress_callback=lambda p, s: _update_job(job_id, p, s),
-            ),
-            timeout=TIMEOUT_SYNTHESIS,
-        )
-
-        update_synthesis_job(
-            job_id,
-            status="complete",
-            progress=100,
-            completed_at=datetime.now().isoformat(),
-        )
+async def _run_synthesis_job(params: dict, ctx) -> dict:
+    """Background job: build a project from repositories."""
+    job_id = ctx.job.id
+    project_name = params["project_name"]
+    logger.info(f"Starting synthesis job {job_id}: {project_name}")
 
-        return {
-            "status": "success",
-            "synthesis_id": job_id,
-            "project_path": str(result.project_path),
-            "project_name": project_name,
-            "repositories_processed": result.repos_processed,
-            "components_extracted": result.components_extracted,
-            "dependencies_merged": result.deps_merged,
-            "files_created": result.files_created,
-            "documentation": result.docs_generated,
-            "warnings": result.warnings,
-        }
+    builder = ProjectBuilder()
+    ctx.report(10, "cloning")
 
-    except TimeoutError:
-        update_synthesis_job(
-            job_id,
-            status="failed",
-            error=f"Synthesis timed out after {TIMEOUT_SYNTHESIS} seconds",
-        )
-        return {
-            "error": True,
-            "message": f"Synthesis timed out after {TIMEOUT_SYNTHESIS} seconds",
-            "synthesis_id": job_id,
-        }
-
-    except Exception as e:
-        logger.exception("Synthesis failed")
-        update_synthesis_job(job_id, status="failed", error=str(e))
+    result = await builder.build(
+        repositories=params["repositories"],
+        project_name=project_name,
+        output_path=Path(params["output_path"]),
+        template=params.get("template", "python-default"),
+        progress_callback=ctx.report,
+    )
 
-        return {
-            "error": True,
-            "message": str(e),
-            "synthesis_id": job_id,
-        }
+    return {
+        "status": "success",
+        "synthesis_id": job_id,
+        "project_path": str(result.project_path),
+        "project_name": project_name,
+        "repositories_processed": result.repos_processed,
+        "components_extracted": result.components_extracted,
+        "dependencies_merged": result.deps_merged,
+        "files_created": result.files_created,
+        "documentation": result.docs_generated,
+        "warnings": result.warnings,
+    }
 
 
 def _update_job(job_id: str, progress: int, status: str):
@@ -746,9 +788,41 @@ async def handle_get_synthesis_status(args: dict) -> dict:
         "synthesis_id": synthesis_id,
         "job_status": job["status"],
         "progress": job["progress"],
+        "stage": job.get("stage"),
         "started_at": job.get("started_at"),
         "completed_at": job.get("completed_at"),
         "error": job.get("error"),
+        "result": job.get("result"),
+    }
+
+
+async def handle_cancel_synthesis(args: dict) -> dict:
+    """
+    Cancel a queued or running synthesis/assembly job.
+
+    Args:
+        synthesis_id: ID returned by synthesize_project or assemble_project
+
+    Returns:
+        Whether the job was cancelled
+    """
+    synthesis_id = args.get("synthesis_id", "")
+    if not synthesis_id:
+        return {"error": True, "message": "Synthesis ID is required"}
+
+    queue = get_tool_job_queue()
+    if queue.get(synthesis_id) is None:
+        return {
+            "error": True,
+            "message": f"Synthesis job not found: {synthesis_id}",
+        }
+
+    cancelled = await queue.cancel(synthesis_id)
+    return {
+        "status": "success",
+        "synthesis_id": synthesis_id,
+        "cancelled": cancelled,
+        "job_status": queue.get(synthesis_id).status.value,
     }
 
 
@@ -1151,9 +1225,10 @@ async def handle_synthesize_from_idea(arguments: dict[str, Any]) -> dict[str, An
     Alias for handle_assemble_project for backward compatibility.
 
     This function synthesizes a project from an idea by searching,
-    downloading, and assembling compatible resources.
+    downloading, and assembling compatible resources. Unlike
+    assemble_project it waits for the result by default.
     """
-    return await handle_assemble_project(arguments)
+    return await handle_assemble_project({"wait": True, **arguments})
 
 
 async def handle_assemble_project(arguments: dict[str, Any]) -> dict[str, Any]:
@@ -1173,9 +1248,12 @@ async def handle_assemble_project(arguments: dict[str, Any]) -> dict[str, Any]:
         name: Project name (optional, auto-generated)
         output_dir: Output directory (default: G:/)
         create_github: Create GitHub repo (default: true)
+        priority: "high", "normal" or "low" (default: normal)
+        wait: Block until assembly finishes (default: false)
 
     Returns:
-        Project details and location
+        Queued job id for get_synthesis_status, or project details and
+        location when wait is set
     """
     idea = arguments.get("idea", "")
     name = arguments.get("name")
@@ -1185,21 +1263,37 @@ async def handle_assemble_project(arguments: dict[str, Any]) -> dict[str, Any]:
     if not idea:
         return {"error": True, "message": "Please provide a project idea"}
 
+    return await _submit_job(
+        "assemble_project",
+        {
+            "idea": idea,
+            "name": name,
+            "output_dir": output_dir,
+            "create_github": create_github,
+        },
+        arguments,
+    )
+
+
+async def _run_assembly_job(params: dict[str, Any], ctx) -> dict[str, Any]:
+    """Background job: assemble a project from an idea."""
     try:
         from pathlib import Path
 
         from src.synthesis.project_assembler import AssemblerConfig, ProjectAssembler
 
         config = AssemblerConfig(
-            base_output_dir=Path(output_dir),
-            create_github_repo=create_github,
+            base_output_dir=Path(params["output_dir"]),
+            create_github_repo=params["create_github"],
         )
 
+        ctx.report(5, "assembling")
         assembler = ProjectAssembler(config)
-        project = await assembler.assemble(idea, name)
+        project = await assembler.assemble(params["idea"], params.get("name"))
 
         return {
             "success": True,
+            "synthesis_id": ctx.job.id,
             "project": {
                 "name": project.name,
                 "path": str(project.base_path),
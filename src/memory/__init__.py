@@ -7,6 +7,9 @@ and error solutions across sessions.
 
 Components:
 - mem0_integration: Core Mem0 wrapper with enhanced features
+- search_index: BM25 inverted index for the local fallback store
+- record_log: Append-only segment log backing the local fallback store
+- semantic_index: Offline embedding index for local semantic search
 - memory_types: Memory categories and schemas
 
 Usage:
@@ -24,6 +27,7 @@ Usage:
     context = await memory.get_context_for_task("build an API")
 """
 
+from src.memory.clustering import cluster_texts
 from src.memory.mem0_integration import (
     MemoryCategory,
     MemoryConfig,
@@ -31,6 +35,8 @@ from src.memory.mem0_integration import (
     MemorySystem,
     get_memory_system,
 )
+from src.memory.search_index import BM25Index
+from src.memory.semantic_index import HashingEmbedder, VectorIndex
 
 __all__ = [
     "MemorySystem",
@@ -38,4 +44,8 @@ __all__ = [
     "MemoryCategory",
     "MemoryConfig",
     "get_memory_system",
+    "BM25Index",
+    "HashingEmbedder",
+    "VectorIndex",
+    "cluster_texts",
 ]
@@ -0,0 +1,178 @@
+"""
+VIBE MCP - Memory Clustering
+
+Groups memories with overlapping text without comparing every pair. Each
+text is reduced to a set of hashed word shingles and a MinHash signature;
+signatures are split into LSH bands, and only texts sharing a band bucket
+are compared by their exact shingle Jaccard similarity. Matches are merged
+with union-find, so clusters are transitive.
+
+Consolidation uses two passes: 3-word shingles at a high threshold find
+near-duplicates, and single words at a lower threshold find related
+memories worth summarizing together.
+
+Usage:
+    clusters = cluster_texts({"a": "...", "b": "..."}, threshold=0.8)
+    # [["a", "b"], ...] largest first
+"""
+
+import random
+import zlib
+from collections.abc import Iterable
+
+from src.memory.search_index import tokenize
+from src.memory.semantic_index import _STOPWORDS, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+_MASK64 = (1 << 64) - 1
+_EMPTY_HASH = (1 << 32) - 1
+
+# Texts compared per LSH bucket; bounds the work when a very common
+# shingle puts most texts in one bucket
+_MAX_BUCKET_PROBES = 32
+
+
+def normalize(text: str) -> str:
+    """Case- and punctuation-insensitive form used for exact duplicates."""
+    return " ".join(tokenize(text))
+
+
+def shingles(text: str, size: int = 3) -> set[int]:
+    """Hashed word ``size``-grams (single words drop stopwords)."""
+    words = tokenize(text)
+    if size == 1:
+        words = [w for w in words if w not in _STOPWORDS] or words
+    if len(words) < size:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+    return {zlib.crc32(g.encode("utf-8")) for g in grams}
+
+
+def jaccard(a: set[int], b: set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def lsh_params(num_perm: int, threshold: float) -> tuple[int, int]:
+    """
+    Pick ``(bands, rows)`` whose match curve rises just below ``threshold``.
+
+    Erring low favours recall; candidate pairs are verified exactly anyway.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class MinHasher:
+    """MinHash signatures using multiply-shift hashing (a*x + b mod 2^64)."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._a = [rng.getrandbits(64) | 1 for _ in range(num_perm)]
+        self._b = [rng.getrandbits(64) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+    def signature(self, values: set[int]) -> tuple[int, ...]:
+        if not values:
+            return (_EMPTY_HASH,) * self.num_perm
+        if NUMPY_AVAILABLE:
+            x = np.fromiter(values, dtype=np.uint64, count=len(values))
+            hashed = (self._a_np * x + self._b_np) >> np.uint64(32)
+            return tuple(hashed.min(axis=1).tolist())
+        return tuple(
+            min(((a * x + b) & _MASK64) >> 32 for x in values)
+            for a, b in zip(self._a, self._b, strict=True)
+        )
+
+
+class _UnionFind:
+    def __init__(self, items: Iterable[str]):
+        self.parent = {item: item for item in items}
+
+    def find(self, item: str) -> str:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: str, b: str) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+    def groups(self) -> list[list[str]]:
+        groups: dict[str, list[str]] = {}
+        for item in self.parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return sorted(groups.values(), key=len, reverse=True)
+
+
+def cluster_texts(
+    texts: dict[str, str],
+    threshold: float = 0.8,
+    shingle_size: int = 3,
+    num_perm: int = 64,
+) -> list[list[str]]:
+    """
+    Cluster texts whose shingle Jaccard similarity reaches ``threshold``.
+
+    Texts that normalize to the same string are always grouped, without
+    hashing.
+
+    Args:
+        texts: Text by ID
+        threshold: Minimum Jaccard similarity for two texts to be linked
+        shingle_size: Words per shingle
+        num_perm: MinHash signature length
+
+    Returns:
+        Every ID exactly once, grouped into clusters (largest first, IDs in
+        input order within a cluster)
+    """
+    uf = _UnionFind(texts)
+
+    # Exact duplicates: one representative goes on to LSH
+    seen: dict[str, str] = {}
+    unique: list[str] = []
+    for item_id, text in texts.items():
+        key = normalize(text)
+        if key in seen:
+            uf.union(seen[key], item_id)
+        else:
+            seen[key] = item_id
+            unique.append(item_id)
+
+    if len(unique) > 1:
+        hasher = MinHasher(num_perm)
+        bands, rows = lsh_params(num_perm, threshold)
+        sets = {item_id: shingles(texts[item_id], shingle_size) for item_id in unique}
+        buckets: dict[tuple, list[str]] = {}
+
+        for item_id in unique:
+            sig = hasher.signature(sets[item_id])
+            for band in range(bands):
+                key = (band, sig[band * rows : (band + 1) * rows])
+                members = buckets.setdefault(key, [])
+                for other in members[:_MAX_BUCKET_PROBES]:
+                    if uf.find(other) == uf.find(item_id):
+                        continue
+                    if jaccard(sets[item_id], sets[other]) >= threshold:
+                        uf.union(other, item_id)
+                members.append(item_id)
+
+    return uf.groups()
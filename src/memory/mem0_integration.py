@@ -38,9 +38,15 @@ import asyncio
 import hashlib
 import json
 import logging
+import re
+import threading
+import weakref
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -63,6 +69,20 @@ try:
 except ImportError:
     LITELLM_AVAILABLE = False
 
+from src.core.jobs import (
+    Job,
+    JobContext,
+    JobPriority,
+    JobQueue,
+    JobStatus,
+    get_job_queue,
+)
+from src.llm.scheduler import RequestLane, request_lane
+from src.memory.clustering import cluster_texts
+from src.memory.record_log import DELETE, PUT, RecordLog, RecordRef
+from src.memory.search_index import BM25Index
+from src.memory.semantic_index import NUMPY_AVAILABLE, VectorIndex
+
 
 class MemoryCategory(Enum):
     """Categories for organizing memories."""
@@ -188,44 +208,185 @@ class MemoryConfig:
     enable_consolidation: bool = True
     consolidation_interval: int = 24  # hours
     consolidation_threshold: int = 100  # memories per category
+    consolidation_duplicate_similarity: float = 0.8  # 3-word shingle Jaccard
+    consolidation_cluster_similarity: float = 0.4  # word Jaccard
+    consolidation_min_cluster: int = 3  # memories per LLM summary
+    consolidation_batch_size: int = 5  # clusters per LLM prompt
     enable_analytics: bool = True
     cache_ttl: int = 3600  # seconds
 
+    # Semantic search for the local store (needs NumPy)
+    enable_semantic_search: bool = True
+    semantic_ann_threshold: int = 20000  # vectors before IVF search
+    semantic_min_score: float = 0.2  # cosine similarity
+
 
 class LocalMemoryStore:
-    """Local fallback memory storage using JSON files."""
+    """
+    Local fallback memory storage using an append-only record log.
+
+    Each add/update/delete appends a single record (see ``record_log``), and
+    a background thread compacts the log once superseded records outnumber
+    live ones. Memories are parsed lazily from the memory-mapped segments on
+    first access, and the BM25 search index is built on the first search and
+    then updated incrementally.
+    """
+
+    # Compact once this many superseded records have piled up...
+    COMPACT_MIN_RECORDS = 1000
+    # ...or once restarts have left this many segments behind
+    COMPACT_MAX_SEGMENTS = 8
 
-    def __init__(self, storage_path: Path):
-        """Initialize local storage."""
+    def __init__(self, storage_path: Path, fsync: bool = False):
+        """
+        Initialize local storage.
+
+        Args:
+            storage_path: Directory holding the log segments
+            fsync: fsync every write (survives power loss, slower)
+        """
         self.storage_path = storage_path
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self._memories: dict[str, MemoryEntry] = {}
+        # Parsed entries, or the log location of entries not yet read
+        self._memories: dict[str, MemoryEntry | RecordRef] = {}
+        self._index = BM25Index()
+        self._index_ready = False
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compaction: threading.Thread | None = None
+        self._log = RecordLog(storage_path, prefix="memories", fsync=fsync)
         self._load()
 
-    def _get_storage_file(self) -> Path:
-        """Get the storage file path."""
+    def _get_legacy_file(self) -> Path:
+        """Get the pre-log JSON storage file path."""
         return self.storage_path / "memories.json"
 
     def _load(self) -> None:
-        """Load memories from disk."""
-        storage_file = self._get_storage_file()
-        if storage_file.exists():
-            try:
-                data = json.loads(storage_file.read_text(encoding="utf-8"))
-                self._memories = {k: MemoryEntry.from_dict(v) for k, v in data.items()}
-                logger.info(f"Loaded {len(self._memories)} memories from local storage")
-            except Exception as e:
-                logger.error(f"Failed to load memories: {e}")
-                self._memories = {}
+        """Replay the log, recording where each memory lives."""
+        legacy_file = self._get_legacy_file()
+        if self._log.is_empty() and legacy_file.exists():
+            self._migrate_legacy(legacy_file)
+
+        for op, memory_id, ref in self._log.replay():
+            if op == PUT:
+                self._memories[memory_id] = ref
+            elif op == DELETE:
+                self._memories.pop(memory_id, None)
+            else:
+                self._memories.clear()
+        logger.info(f"Loaded {len(self._memories)} memories from local storage")
+        self._maybe_compact()
+
+    def _migrate_legacy(self, legacy_file: Path) -> None:
+        """Import a memories.json file as the first log segment."""
+        try:
+            data = json.loads(legacy_file.read_text(encoding="utf-8"))
+            records = [
+                (k, self._encode(MemoryEntry.from_dict(v))) for k, v in data.items()
+            ]
+        except Exception as e:
+            logger.error(f"Failed to load memories: {e}")
+            return
+
+        seq = self._log.rotate()
+        tmp, _ = self._log.write_snapshot(seq, records)
+        self._log.install_snapshot(seq, tmp, len(records))
+        legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
+        logger.info(f"Migrated {len(records)} memories to the record log")
+
+    @staticmethod
+    def _encode(entry: MemoryEntry) -> bytes:
+        return json.dumps(entry.to_dict(), separators=(",", ":")).encode("utf-8")
+
+    def _entry(self, memory_id: str) -> MemoryEntry | None:
+        """Get a parsed entry, reading it from the log if needed."""
+        value = self._memories.get(memory_id)
+        if not isinstance(value, RecordRef):
+            return value
+        try:
+            entry = MemoryEntry.from_dict(json.loads(self._log.read(value)))
+        except Exception as e:
+            logger.error(f"Failed to load memory {memory_id}: {e}")
+            del self._memories[memory_id]
+            return None
+        self._memories[memory_id] = entry
+        return entry
+
+    def _entries(self) -> list[MemoryEntry]:
+        """Get every entry, parsing any not yet read."""
+        with self._lock:
+            for memory_id in list(self._memories):
+                self._entry(memory_id)
+            return list(self._memories.values())
+
+    def _ensure_index(self) -> None:
+        """Build the search index on first use."""
+        if not self._index_ready:
+            self._index_ready = True
+            self._index.clear()
+            for entry in self._entries():
+                self._index_entry(entry)
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Add or refresh an entry in the search index once it is built."""
+        if self._index_ready:
+            self._index.add(entry.id, entry.content, entry.category.value, entry.agent_id)
+
+    def _write(self, entry: MemoryEntry) -> None:
+        """Append the current state of an entry to the log."""
+        self._log.append_put(entry.id, self._encode(entry))
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Start a background compaction when the log has grown stale."""
+        live = len(self._memories)
+        dead = self._log.record_count - live
+        stale = dead >= self.COMPACT_MIN_RECORDS and dead > live
+        if not stale and len(self._log.segments) <= self.COMPACT_MAX_SEGMENTS:
+            return
+        if self._compaction is None or not self._compaction.is_alive():
+            self._compaction = threading.Thread(
+                target=self._compact_in_background,
+                name="memory-compaction",
+                daemon=True,
+            )
+            self._compaction.start()
 
-    def _save(self) -> None:
-        """Save memories to disk."""
-        storage_file = self._get_storage_file()
+    def _compact_in_background(self) -> None:
         try:
-            data = {k: v.to_dict() for k, v in self._memories.items()}
-            storage_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self.compact()
         except Exception as e:
-            logger.error(f"Failed to save memories: {e}")
+            # The previous segments are still intact; retry on a later write
+            logger.error(f"Memory log compaction failed: {e}")
+
+    def compact(self) -> None:
+        """
+        Rewrite the log with only the live memories.
+
+        Writes continue to a fresh segment while the snapshot is written;
+        the store lock is only held to capture the snapshot and to swap it in.
+        """
+        with self._compact_lock:
+            with self._lock:
+                seq = self._log.rotate()
+                records = [
+                    (
+                        memory_id,
+                        self._log.read(value)
+                        if isinstance(value, RecordRef)
+                        else self._encode(value),
+                    )
+                    for memory_id, value in self._memories.items()
+                ]
+
+            tmp, refs = self._log.write_snapshot(seq, records)
+
+            with self._lock:
+                self._log.install_snapshot(seq, tmp, len(records))
+                for memory_id, value in self._memories.items():
+                    if isinstance(value, RecordRef):
+                        self._memories[memory_id] = refs[memory_id]
+            logger.debug(f"Compacted memory log to {len(records)} records")
 
     def _generate_id(self, content: str) -> str:
         """Generate a unique ID for content."""
@@ -238,6 +399,9 @@ class LocalMemoryStore:
         category: MemoryCategory,
         tags: list[str] = None,
         metadata: dict = None,
+        agent_id: str | None = None,
+        session_id: str | None = None,
+        importance_score: float = 0.5,
     ) -> MemoryEntry:
         """Add a memory."""
         entry = MemoryEntry(
@@ -246,9 +410,14 @@ class LocalMemoryStore:
             category=category,
             tags=tags or [],
             metadata=metadata or {},
+            agent_id=agent_id,
+            session_id=session_id,
+            importance_score=importance_score,
         )
-        self._memories[entry.id] = entry
-        self._save()
+        with self._lock:
+            self._memories[entry.id] = entry
+            self._index_entry(entry)
+            self._write(entry)
         return entry
 
     def search(
@@ -256,71 +425,195 @@ class LocalMemoryStore:
         query: str,
         category: MemoryCategory | None = None,
         limit: int = 10,
+        agent_id: str | None = None,
     ) -> list[MemoryEntry]:
-        """Search memories (simple keyword matching for local store)."""
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-
-        results = []
-        for entry in self._memories.values():
-            # Filter by category if specified
-            if category and entry.category != category:
-                continue
-
-            # Simple relevance scoring based on word overlap
-            content_lower = entry.content.lower()
-            content_words = set(content_lower.split())
-
-            # Check for matches
-            overlap = query_words & content_words
-            if overlap or query_lower in content_lower:
-                score = len(overlap) / len(query_words) if query_words else 0
-                if query_lower in content_lower:
-                    score += 0.5
-                results.append((entry, score))
+        """Search memories by BM25 relevance, optionally filtered."""
+        category_value = category.value if category else None
+
+        with self._lock:
+            self._ensure_index()
+            if not query.strip():
+                # Nothing to rank on: return the filtered memories in order
+                allowed = self._index.filter_ids(category_value, agent_id)
+                ids = (
+                    self._memories
+                    if allowed is None
+                    else (i for i in self._memories if i in allowed)
+                )
+                return [self._memories[i] for i in islice(ids, limit)]
 
-        # Sort by score and return top results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return [entry for entry, _ in results[:limit]]
+            ranked = self._index.search(query, limit, category_value, agent_id)
+            return [self._memories[doc_id] for doc_id, _ in ranked]
 
     def get(self, memory_id: str) -> MemoryEntry | None:
         """Get a specific memory."""
-        entry = self._memories.get(memory_id)
-        if entry:
-            entry.access_count += 1
-            entry.updated_at = datetime.now()
-            self._save()
-        return entry
+        with self._lock:
+            entry = self._entry(memory_id)
+            if entry:
+                entry.access_count += 1
+                entry.updated_at = datetime.now()
+                self._write(entry)
+            return entry
 
     def update(self, memory_id: str, content: str) -> MemoryEntry | None:
         """Update a memory."""
-        if memory_id in self._memories:
-            self._memories[memory_id].content = content
-            self._memories[memory_id].updated_at = datetime.now()
-            self._save()
-            return self._memories[memory_id]
-        return None
+        with self._lock:
+            entry = self._entry(memory_id)
+            if entry:
+                entry.content = content
+                entry.updated_at = datetime.now()
+                self._index_entry(entry)
+                self._write(entry)
+            return entry
 
     def delete(self, memory_id: str) -> bool:
         """Delete a memory."""
-        if memory_id in self._memories:
-            del self._memories[memory_id]
-            self._save()
-            return True
-        return False
+        with self._lock:
+            if memory_id in self._memories:
+                del self._memories[memory_id]
+                self._index.remove(memory_id)
+                self._log.append_delete(memory_id)
+                self._maybe_compact()
+                return True
+            return False
+
+    def mark_consolidated(self, memory_ids: list[str], consolidated_into: str) -> int:
+        """Flag memories as folded into another one; returns how many exist."""
+        now = datetime.now()
+        marked = 0
+        with self._lock:
+            for memory_id in memory_ids:
+                entry = self._entry(memory_id)
+                if entry is None:
+                    continue
+                entry.consolidated = True
+                entry.last_consolidated = now
+                entry.metadata["consolidated"] = True
+                entry.metadata["consolidated_into"] = consolidated_into
+                self._write(entry)
+                marked += 1
+        return marked
+
+    def ids(self) -> list[str]:
+        """Get the IDs of all memories without loading them."""
+        with self._lock:
+            return list(self._memories)
+
+    def get_entries(self, memory_ids: list[str]) -> list[MemoryEntry]:
+        """Get memories by ID without counting an access."""
+        with self._lock:
+            entries = (self._entry(memory_id) for memory_id in memory_ids)
+            return [e for e in entries if e is not None]
+
+    def filter_ids(
+        self,
+        category: MemoryCategory | None = None,
+        agent_id: str | None = None,
+    ) -> set[str] | None:
+        """IDs matching the filters, or None when there are none."""
+        with self._lock:
+            self._ensure_index()
+            return self._index.filter_ids(
+                category.value if category else None, agent_id
+            )
 
     def get_by_category(self, category: MemoryCategory) -> list[MemoryEntry]:
         """Get all memories in a category."""
-        return [e for e in self._memories.values() if e.category == category]
+        return [e for e in self._entries() if e.category == category]
 
     def get_all(self) -> list[MemoryEntry]:
         """Get all memories."""
-        return list(self._memories.values())
+        return self._entries()
 
     def clear(self) -> None:
         """Clear all memories."""
-        self._memories.clear()
-        self._save()
+        with self._lock:
+            self._memories.clear()
+            self._index.clear()
+            self._index_ready = True
+            self._log.append_reset()
+            self._maybe_compact()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get storage statistics."""
+        with self._lock:
+            return {
+                "memories": len(self._memories),
+                "loaded": sum(
+                    not isinstance(v, RecordRef) for v in self._memories.values()
+                ),
+                "log_records": self._log.record_count,
+                "segments": len(self._log.segments),
+                "index_ready": self._index_ready,
+            }
+
+    def close(self) -> None:
+        """Wait for any running compaction and close the log."""
+        if self._compaction is not None:
+            self._compaction.join()
+        self._log.close()
+
+
+# ============================================================================
+# CONSOLIDATION HELPERS
+# ============================================================================
+
+CONSOLIDATION_JOB = "consolidate_memories"
+
+# Memories quoted per group in a summary prompt
+_PROMPT_MEMORIES_PER_GROUP = 10
+
+_SUMMARY_MARKER_RE = re.compile(r"^\s*\[(\d+)\]\s*", re.MULTILINE)
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4  # Rough token estimate
+
+
+def _memory_importance(memory: dict) -> float:
+    return memory.get("metadata", {}).get(
+        "importance", memory.get("importance_score", 0.5)
+    )
+
+
+def _group_label(memories: list[dict]) -> str:
+    """Most common first tag of a group."""
+    tags = Counter(m["tags"][0] for m in memories if m.get("tags"))
+    return tags.most_common(1)[0][0] if tags else "untagged"
+
+
+def _consolidation_prompt(
+    category: MemoryCategory, groups: list[tuple[str, list[dict]]]
+) -> str:
+    """One prompt asking for a numbered summary per group."""
+    sections = []
+    for number, (label, memories) in enumerate(groups, 1):
+        lines = "\n".join(
+            f"- {m['content']}" for m in memories[:_PROMPT_MEMORIES_PER_GROUP]
+        )
+        sections.append(f"[{number}] Group: {label}\n{lines}")
+
+    return (
+        "Summarize each numbered group of related memories into a concise, "
+        "comprehensive summary that captures the key information and insights.\n"
+        f"Category: {category.value}\n"
+        'Start each summary with its group number, e.g. "[1] ...".\n\n'
+        + "\n\n".join(sections)
+    )
+
+
+def _parse_summaries(text: str, count: int) -> dict[int, str]:
+    """Split an LLM reply into summaries by group number (1-based)."""
+    parts = _SUMMARY_MARKER_RE.split(text)
+    summaries: dict[int, str] = {}
+    for number, body in zip(parts[1::2], parts[2::2], strict=True):
+        n, body = int(number), body.strip()
+        if 1 <= n <= count and body and n not in summaries:
+            summaries[n] = body
+    if not summaries and count == 1 and text.strip():
+        # A single group may come back without its marker
+        summaries[1] = text.strip()
+    return summaries
 
 
 class MemorySystem:
@@ -342,12 +635,17 @@ class MemorySystem:
         self.config = config or MemoryConfig()
         self._mem0: Memory | None = None
         self._local_store: LocalMemoryStore | None = None
+        self._semantic: VectorIndex | None = None
+        self._semantic_synced = False
 
         # Advanced features
         self._llm_router: LiteLLMRouter | None = None
         self._cache: dict[str, list[dict]] = {}
         self._cache_expiry: dict[str, datetime] = {}
         self._consolidation_history: list[dict] = []
+        # Mem0 cannot store our metadata updates; consolidated ids are
+        # recorded in a ledger next to the other local state instead
+        self._mem0_consolidated: dict[str, str] | None = None
         self._analytics: dict[str, Any] = {
             "total_additions": 0,
             "total_searches": 0,
@@ -357,6 +655,7 @@ class MemorySystem:
         }
 
         self._initialize()
+        _live_systems[str(self.config.storage_path)] = self
 
     def _initialize(self) -> None:
         """Initialize the appropriate storage backend."""
@@ -396,10 +695,72 @@ class MemorySystem:
 
             except Exception as e:
                 logger.warning(f"Failed to initialize Mem0: {e}. Using local fallback.")
-                self._local_store = LocalMemoryStore(self.config.storage_path)
+                self._init_local_store()
         else:
             logger.info("Using local memory storage (Mem0 not available)")
-            self._local_store = LocalMemoryStore(self.config.storage_path)
+            self._init_local_store()
+
+    def _init_local_store(self) -> None:
+        """Initialize the local store and, if possible, its semantic index."""
+        self._local_store = LocalMemoryStore(self.config.storage_path)
+
+        if self.config.enable_semantic_search and NUMPY_AVAILABLE:
+            try:
+                self._semantic = VectorIndex(
+                    self.config.storage_path / "vectors",
+                    ann_threshold=self.config.semantic_ann_threshold,
+                )
+            except Exception as e:
+                logger.warning(f"Semantic memory index unavailable: {e}")
+
+    def _sync_semantic_index(self) -> None:
+        """Bring the semantic index in line with the local store (once)."""
+        if self._semantic_synced:
+            return
+        store_ids = self._local_store.ids()
+        indexed = self._semantic.ids()
+        for memory_id in indexed - set(store_ids):
+            self._semantic.remove(memory_id)
+        missing = [i for i in store_ids if i not in indexed]
+        if missing:
+            logger.info(f"Embedding {len(missing)} memories for semantic search")
+            self._semantic.add_many(
+                (e.id, e.content) for e in self._local_store.get_entries(missing)
+            )
+        self._semantic_synced = True
+
+    def _local_search(
+        self,
+        query: str,
+        category: MemoryCategory | None,
+        limit: int,
+        agent_id: str | None,
+    ) -> list[MemoryEntry]:
+        """
+        Hybrid keyword + semantic search over the local store.
+
+        BM25 and vector rankings are merged with reciprocal rank fusion, so
+        memories found by either method surface and those found by both
+        rank first.
+        """
+        keyword = self._local_store.search(query, category, limit, agent_id)
+        if self._semantic is None or not query.strip():
+            return keyword
+
+        self._sync_semantic_index()
+        allowed = self._local_store.filter_ids(category, agent_id)
+        semantic = [
+            memory_id
+            for memory_id, score in self._semantic.search(query, limit, allowed)
+            if score >= self.config.semantic_min_score
+        ]
+
+        fused: dict[str, float] = {}
+        for ranking in ([e.id for e in keyword], semantic):
+            for rank, memory_id in enumerate(ranking):
+                fused[memory_id] = fused.get(memory_id, 0.0) + 1.0 / (60 + rank)
+        best = sorted(fused, key=fused.get, reverse=True)[:limit]
+        return self._local_store.get_entries(best)
 
     @property
     def is_mem0_active(self) -> bool:
@@ -478,12 +839,17 @@ class MemorySystem:
                 # Fall through to local store
 
         if self._local_store:
-            entry = self._local_store.add(content, category, tags, metadata)
-            # Update entry with advanced fields
-            entry.agent_id = agent_id
-            entry.session_id = session_id
-            entry.importance_score = importance
-            self._local_store._save()
+            entry = self._local_store.add(
+                content,
+                category,
+                tags,
+                metadata,
+                agent_id=agent_id,
+                session_id=session_id,
+                importance_score=importance,
+            )
+            if self._semantic:
+                self._semantic.add(entry.id, content)
             logger.debug(f"Added memory to local store: {entry.id}")
             return entry.id
 
@@ -553,12 +919,9 @@ class MemorySystem:
                 logger.error(f"Mem0 search failed: {e}")
 
         if self._local_store:
-            entries = self._local_store.search(query, category, limit)
-
-            # Filter by agent if specified
-            if agent_id:
-                entries = [e for e in entries if e.agent_id == agent_id]
-
+            entries = await asyncio.to_thread(
+                self._local_search, query, category, limit, agent_id
+            )
             results = [e.to_dict() for e in entries]
 
             # Cache results
@@ -597,6 +960,8 @@ class MemorySystem:
 
         if self._local_store:
             result = self._local_store.update(memory_id, content)
+            if result and self._semantic:
+                self._semantic.add(memory_id, content)
             return result is not None
 
         return False
@@ -611,6 +976,8 @@ class MemorySystem:
                 logger.error(f"Mem0 delete failed: {e}")
 
         if self._local_store:
+            if self._semantic:
+                self._semantic.remove(memory_id)
             return self._local_store.delete(memory_id)
 
         return False
@@ -822,138 +1189,308 @@ class MemorySystem:
         self,
         category: MemoryCategory | None = None,
         agent_id: str | None = None,
+        run_id: str | None = None,
+        progress: Callable[[int, str], None] | None = None,
     ) -> dict:
         """
         Consolidate old memories to save space and improve relevance.
 
+        Candidates are clustered locally first: exact and near-duplicates
+        collapse into their most important member without an LLM call, and
+        only clusters of at least ``consolidation_min_cluster`` related
+        memories are summarized, several clusters per prompt. Without an LLM
+        router only the duplicate pass runs.
+
         Args:
             category: Category to consolidate (None for all)
             agent_id: Agent to consolidate for (None for all)
+            run_id: Checkpoint key; rerunning with the same ID skips the
+                categories an interrupted run already finished
+            progress: Called with ``(percent, stage)`` per category
 
         Returns:
-            Consolidation report
+            Consolidation report, including LLM prompt tokens used and the
+            estimate saved against one prompt per group
         """
         if not self._llm_router:
-            logger.warning("LiteLLM router not available for consolidation")
-            return {"success": False, "error": "LLM router not available"}
+            logger.warning("LiteLLM router not available; only collapsing duplicates")
 
         categories = [category] if category else list(MemoryCategory)
-        report = {
+        checkpoint = (
+            self.config.storage_path / "consolidation" / f"{run_id}.json"
+            if run_id
+            else None
+        )
+        state = {}
+        if checkpoint and checkpoint.exists():
+            state = json.loads(checkpoint.read_text(encoding="utf-8"))
+            logger.info(f"Resuming consolidation {run_id}")
+
+        report = state.get("report") or {
             "success": True,
             "consolidated": {},
             "total_consolidated": 0,
+            "duplicates_collapsed": 0,
+            "clusters_summarized": 0,
+            "llm_calls": 0,
+            "llm_prompt_tokens": 0,
+            "naive_prompt_tokens": 0,
+            "tokens_saved": 0,
             "timestamp": datetime.now().isoformat(),
         }
+        done = set(state.get("categories_done", []))
 
-        for cat in categories:
-            # Get old memories for category
-            memories = await self.get_all(category=cat)
+        for position, cat in enumerate(categories):
+            if cat.value in done:
+                continue
+            if progress:
+                progress(
+                    position * 100 // len(categories), f"consolidating {cat.value}"
+                )
 
-            # Filter by agent if specified
-            if agent_id:
-                memories = [
-                    m
-                    for m in memories
-                    if m.get("metadata", {}).get("agent_id") == agent_id
-                ]
+            candidates = await self._consolidation_candidates(cat, agent_id)
+            if len(candidates) >= 5:  # Need at least 5 to consolidate
+                summary = await self._consolidate_category(
+                    cat, candidates, agent_id, report
+                )
+                if summary["memories"]:
+                    report["consolidated"][cat.value] = summary
+                    report["total_consolidated"] += summary["memories"]
+
+            done.add(cat.value)
+            if checkpoint:
+                checkpoint.parent.mkdir(parents=True, exist_ok=True)
+                tmp = checkpoint.with_suffix(".tmp")
+                tmp.write_text(
+                    json.dumps({"categories_done": sorted(done), "report": report}),
+                    encoding="utf-8",
+                )
+                tmp.replace(checkpoint)
 
-            # Filter for consolidation candidates
-            cutoff_date = datetime.now() - timedelta(
-                days=self.config.consolidation_interval
-            )
-            candidates = [
-                m
-                for m in memories
-                if datetime.fromisoformat(m["created_at"]) < cutoff_date
-                and not m.get("metadata", {}).get("consolidated", False)
-                and len(memories) > self.config.consolidation_threshold
-            ]
+        report["tokens_saved"] = max(
+            0, report["naive_prompt_tokens"] - report["llm_prompt_tokens"]
+        )
 
-            if len(candidates) < 5:  # Need at least 5 to consolidate
-                continue
+        # Update analytics
+        self._analytics["consolidations"] += 1
+        self._consolidation_history.append(report)
 
-            # Group memories by similarity (simplified - by tags)
-            groups = {}
-            for memory in candidates:
-                tags = memory.get("tags", [])
-                key = tags[0] if tags else "untagged"
-                if key not in groups:
-                    groups[key] = []
-                groups[key].append(memory)
-
-            # Consolidate each group
-            for group_key, group_memories in groups.items():
-                if len(group_memories) < 3:
-                    continue
+        # Clear cache
+        self._cache.clear()
+        self._cache_expiry.clear()
 
-                # Create summary using LLM
-                memories_text = "\n".join(
-                    [f"- {m['content']}" for m in group_memories[:10]]
-                )
+        if checkpoint:
+            checkpoint.unlink(missing_ok=True)
+        return report
 
-                prompt = f"""
-                Summarize these related memories into a concise, comprehensive summary:
-                Category: {cat.value}
-                Group: {group_key}
+    async def _consolidation_candidates(
+        self, category: MemoryCategory, agent_id: str | None
+    ) -> list[dict]:
+        """Old, not yet consolidated memories of a category over the threshold."""
+        memories = await self.get_all(category=category)
 
-                Memories:
-                {memories_text}
+        # Filter by agent if specified
+        if agent_id:
+            memories = [
+                m for m in memories if m.get("metadata", {}).get("agent_id") == agent_id
+            ]
+        if len(memories) <= self.config.consolidation_threshold:
+            return []
 
-                Create a summary that captures the key information and insights.
-                """
+        cutoff_date = datetime.now() - timedelta(
+            days=self.config.consolidation_interval
+        )
+        ledger = self._load_mem0_consolidated() if self._mem0 else {}
+        return [
+            m
+            for m in memories
+            if datetime.fromisoformat(m["created_at"]) < cutoff_date
+            and not m.get("consolidated", False)
+            and not m.get("metadata", {}).get("consolidated", False)
+            and m["id"] not in ledger
+        ]
+
+    async def _consolidate_category(
+        self,
+        category: MemoryCategory,
+        candidates: list[dict],
+        agent_id: str | None,
+        report: dict,
+    ) -> dict:
+        """Collapse duplicates, then summarize dense clusters in batches."""
+        config = self.config
+        by_id = {m["id"]: m for m in candidates}
+        summary = {"groups": 0, "memories": 0, "duplicates": 0, "consolidated_ids": []}
+
+        # Pass 1: near-duplicates fold into their most important member
+        duplicate_clusters = await asyncio.to_thread(
+            cluster_texts,
+            {m["id"]: m["content"] for m in candidates},
+            config.consolidation_duplicate_similarity,
+            3,
+        )
+        members_of: dict[str, list[dict]] = {}
+        for ids in duplicate_clusters:
+            members = [by_id[i] for i in ids]
+            keep = max(members, key=_memory_importance)
+            members_of[keep["id"]] = members
+            if len(members) == 1:
+                continue
+            await self._mark_consolidated(
+                [m for m in members if m is not keep], keep["id"]
+            )
+            summary["duplicates"] += len(members) - 1
+            if len(members) >= config.consolidation_min_cluster:
+                report["naive_prompt_tokens"] += _estimate_tokens(
+                    _consolidation_prompt(category, [(_group_label(members), members)])
+                )
+        summary["memories"] += summary["duplicates"]
+        report["duplicates_collapsed"] += summary["duplicates"]
+
+        if not self._llm_router:
+            return summary
+
+        # Pass 2: related survivors form the clusters worth an LLM summary
+        survivors = {keep_id: by_id[keep_id]["content"] for keep_id in members_of}
+        related = await asyncio.to_thread(
+            cluster_texts, survivors, config.consolidation_cluster_similarity, 1
+        )
+        groups = []
+        for ids in related:
+            if len(ids) < config.consolidation_min_cluster:
+                continue
+            originals = [m for i in ids for m in members_of[i]]
+            representatives = [by_id[i] for i in ids]
+            groups.append((_group_label(originals), representatives, originals))
+            report["naive_prompt_tokens"] += _estimate_tokens(
+                _consolidation_prompt(category, [(_group_label(originals), originals)])
+            )
 
-                try:
+        batch_size = max(1, config.consolidation_batch_size)
+        for offset in range(0, len(groups), batch_size):
+            batch = groups[offset : offset + batch_size]
+            prompt = _consolidation_prompt(
+                category, [(label, reps) for label, reps, _ in batch]
+            )
+            try:
+                with request_lane(RequestLane.CONSOLIDATION):
                     result = await self._llm_router.complete(
-                        prompt=prompt, task_type=TaskType.SIMPLE, max_tokens=500
+                        prompt=prompt,
+                        task_type=TaskType.SIMPLE,
+                        max_tokens=500 * len(batch),
                     )
+            except Exception as e:
+                logger.error(f"Failed to consolidate {category.value} batch: {e}")
+                continue
 
-                    # Add consolidated memory
-                    consolidated_id = await self.add(
-                        content=result.content,
-                        category=cat,
-                        tags=["consolidated", group_key],
-                        metadata={
-                            "consolidated": True,
-                            "original_count": len(group_memories),
-                            "date_range": (
-                                min(m["created_at"] for m in group_memories),
-                                max(m["created_at"] for m in group_memories),
-                            ),
-                            "agent_id": agent_id,
-                        },
-                        importance=sum(
-                            m.get("metadata", {}).get("importance", 0.5)
-                            for m in group_memories
-                        )
-                        / len(group_memories),
+            report["llm_calls"] += 1
+            report["llm_prompt_tokens"] += (result.usage or {}).get(
+                "prompt_tokens"
+            ) or _estimate_tokens(prompt)
+
+            summaries = _parse_summaries(result.content, len(batch))
+            for number, (label, reps, originals) in enumerate(batch, 1):
+                text = summaries.get(number)
+                if not text:
+                    logger.warning(
+                        f"No summary returned for {category.value}/{label}; "
+                        "leaving it for the next run"
                     )
-
-                    # Mark original memories as consolidated
-                    for memory in group_memories:
-                        memory["metadata"]["consolidated"] = True
-                        memory["metadata"]["consolidated_into"] = consolidated_id
-                        await self.update(memory["id"], memory["content"])
-
-                    report["consolidated"][cat.value] = {
-                        "groups": len(groups),
-                        "memories": len(candidates),
-                        "consolidated_id": consolidated_id,
-                    }
-                    report["total_consolidated"] += len(candidates)
-
-                except Exception as e:
-                    logger.error(f"Failed to consolidate {cat.value}/{group_key}: {e}")
                     continue
 
-        # Update analytics
-        self._analytics["consolidations"] += 1
-        self._consolidation_history.append(report)
+                consolidated_id = await self.add(
+                    content=text,
+                    category=category,
+                    tags=["consolidated", label],
+                    metadata={
+                        "consolidated": True,
+                        "original_count": len(originals),
+                        "date_range": (
+                            min(m["created_at"] for m in originals),
+                            max(m["created_at"] for m in originals),
+                        ),
+                        "agent_id": agent_id,
+                    },
+                    importance=sum(_memory_importance(m) for m in originals)
+                    / len(originals),
+                )
+                await self._mark_consolidated(reps, consolidated_id)
 
-        # Clear cache
-        self._cache.clear()
-        self._cache_expiry.clear()
+                summary["groups"] += 1
+                summary["memories"] += len(reps)
+                summary["consolidated_ids"].append(consolidated_id)
+                report["clusters_summarized"] += 1
 
-        return report
+        return summary
+
+    async def _mark_consolidated(
+        self, memories: list[dict], consolidated_into: str
+    ) -> None:
+        """Record that memories were folded into another memory."""
+        for memory in memories:
+            memory.setdefault("metadata", {})["consolidated"] = True
+            memory["metadata"]["consolidated_into"] = consolidated_into
+
+        if self._local_store:
+            self._local_store.mark_consolidated(
+                [m["id"] for m in memories], consolidated_into
+            )
+        if self._mem0:
+            ledger = self._load_mem0_consolidated()
+            ledger.update((m["id"], consolidated_into) for m in memories)
+            path = self.config.storage_path / "mem0_consolidated.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(ledger), encoding="utf-8")
+            tmp.replace(path)
+
+    def _load_mem0_consolidated(self) -> dict[str, str]:
+        """Mem0 memory id -> id of the memory it was consolidated into."""
+        if self._mem0_consolidated is None:
+            path = self.config.storage_path / "mem0_consolidated.json"
+            self._mem0_consolidated = (
+                json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+            )
+        return self._mem0_consolidated
+
+    async def submit_consolidation(
+        self,
+        category: MemoryCategory | None = None,
+        agent_id: str | None = None,
+        priority: int = JobPriority.LOW,
+    ) -> Job:
+        """
+        Queue consolidation as a persistent background job.
+
+        The scope and storage path travel in the job's params, so an
+        interrupted job resumes from its checkpoint after a restart. A
+        scope that already has a job in flight reuses it.
+        """
+        queue = get_job_queue()
+        register_consolidation_job(queue)
+
+        scope = f"{category.value if category else '*'}:{agent_id or '*'}"
+        storage_path = str(self.config.storage_path)
+        for job in queue.list_jobs(
+            [JobStatus.PENDING, JobStatus.RUNNING], limit=10_000
+        ):
+            if (
+                job.kind == CONSOLIDATION_JOB
+                and job.params.get("scope") == scope
+                and job.params.get("storage_path") == storage_path
+            ):
+                return job
+
+        return await queue.submit(
+            CONSOLIDATION_JOB,
+            {
+                "scope": scope,
+                "category": category.value if category else None,
+                "agent_id": agent_id,
+                "storage_path": storage_path,
+            },
+            priority=priority,
+        )
 
     async def get_memory_insights(
         self,
@@ -1164,8 +1701,8 @@ class MemorySystem:
 
         if len(memories) > self.config.consolidation_threshold:
             logger.info(f"Consolidation threshold reached for {category.value}")
-            # Run consolidation in background
-            asyncio.create_task(self.consolidate_memories(category=category))
+            # Run consolidation as a resumable background job
+            await self.submit_consolidation(category=category)
 
     # ========================================================================
     # STATISTICS
@@ -1197,6 +1734,46 @@ class MemorySystem:
         }
 
 
+# Live systems by storage path, so queued jobs find the one that owns them
+_live_systems: "weakref.WeakValueDictionary[str, MemorySystem]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+async def run_consolidation_job(params: dict, ctx: JobContext) -> dict:
+    """Job handler for CONSOLIDATION_JOB; resumes from the job's checkpoint.
+
+    The job runs against the system that owns its storage path, opening
+    one for that path if none is live (e.g. after a restart).
+    """
+    storage_path = params.get("storage_path")
+    if not storage_path:
+        raise ValueError("Consolidation job has no storage_path")
+
+    system = _live_systems.get(storage_path)
+    owned = system is None
+    if owned:
+        system = MemorySystem(MemoryConfig(storage_path=Path(storage_path)))
+
+    category = params.get("category")
+    try:
+        return await system.consolidate_memories(
+            category=MemoryCategory(category) if category else None,
+            agent_id=params.get("agent_id"),
+            run_id=ctx.job.id,
+            progress=ctx.report,
+        )
+    finally:
+        if owned and system._local_store is not None:
+            system._local_store.close()
+
+
+def register_consolidation_job(queue: JobQueue) -> None:
+    """Register the consolidation handler; call before ``queue.start()``."""
+    if not queue.is_registered(CONSOLIDATION_JOB):
+        queue.register(CONSOLIDATION_JOB, run_consolidation_job)
+
+
 # Global instance
 _memory_system: MemorySystem | None = None
 
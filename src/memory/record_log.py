@@ -0,0 +1,296 @@
+"""
+VIBE MCP - Append-Only Record Log
+
+Write-ahead storage for the local memory store. Every change is appended to
+the active segment as one line, so a write costs O(1) I/O regardless of how
+many records exist:
+
+    P\t<key>\t<json payload>\n    put (insert or replace)
+    D\t<key>\n                    delete
+    R\n                           reset (drop everything before it)
+
+Segments are named ``<prefix>-<seq>.log`` and replayed in sequence order.
+Sealed segments are memory-mapped, and replay only records each key's byte
+range, so payloads are read and parsed on demand.
+
+A write torn by a crash leaves a final line without a newline, which replay
+skips. Compaction seals the active segment, writes the live records to a
+temporary file, fsyncs it and atomically renames it over the last sealed
+segment. The snapshot starts with a reset record, so a crash before the
+older segments are removed still replays to the right state.
+
+Usage:
+    log = RecordLog(path, prefix="memories")
+    ref = log.append_put("abc", b'{"content": "..."}')
+    for op, key, ref in log.replay():
+        ...
+"""
+
+import logging
+import mmap
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+PUT = "put"
+DELETE = "del"
+RESET = "reset"
+
+
+class RecordRef(NamedTuple):
+    """Location of a put payload: segment sequence and byte range."""
+
+    seq: int
+    start: int
+    end: int
+
+
+class RecordLog:
+    """
+    Segmented append-only log of keyed records.
+
+    Appends and segment swaps are serialized by an internal lock; reads of
+    sealed segments go straight to their memory maps.
+    """
+
+    def __init__(self, directory: Path, prefix: str = "log", fsync: bool = False):
+        """
+        Open (or create) a log.
+
+        Args:
+            directory: Directory holding the segment files
+            prefix: Segment file name prefix
+            fsync: fsync after every append (survives power loss, not just
+                process crashes)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.fsync = fsync
+        self._pattern = re.compile(rf"^{re.escape(prefix)}-(\d{{8}})\.log$")
+        self._lock = threading.Lock()
+        self._maps: dict[int, mmap.mmap | None] = {}
+        self._record_counts: dict[int, int] = {}
+        self._active = None
+
+        for tmp in self.directory.glob(f"{prefix}-*.log.tmp"):
+            # Left behind by a compaction that did not finish
+            tmp.unlink(missing_ok=True)
+
+        seqs = sorted(
+            int(m.group(1))
+            for p in self.directory.iterdir()
+            if (m := self._pattern.match(p.name))
+        )
+        for seq in seqs:
+            self._map_segment(seq)
+        self._active_seq = seqs[-1] + 1 if seqs else 0
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.directory / f"{self.prefix}-{seq:08d}.log"
+
+    def _map_segment(self, seq: int) -> None:
+        with open(self._segment_path(seq), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._maps[seq] = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+        self._record_counts.setdefault(seq, 0)
+
+    def _unmap_segment(self, seq: int) -> None:
+        mm = self._maps.pop(seq, None)
+        if mm is not None:
+            mm.close()
+        self._record_counts.pop(seq, None)
+
+    @property
+    def segments(self) -> list[int]:
+        """Sealed segment sequence numbers, oldest first."""
+        return sorted(self._maps)
+
+    @property
+    def record_count(self) -> int:
+        """Records replayed or appended since the log was opened."""
+        return sum(self._record_counts.values())
+
+    def is_empty(self) -> bool:
+        return not self._maps and self._active is None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def replay(self) -> Iterator[tuple[str, str, RecordRef | None]]:
+        """Yield ``(op, key, ref)`` for every record in the sealed segments."""
+        for seq in self.segments:
+            mm = self._maps[seq]
+            if mm is None:
+                continue
+            count = 0
+            pos, size = 0, len(mm)
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    logger.warning(
+                        f"Ignoring torn record at {self._segment_path(seq)}:{pos}"
+                    )
+                    break
+
+                op = mm[pos : pos + 1]
+                if op == b"R":
+                    yield RESET, "", None
+                    count += 1
+                elif op in (b"P", b"D"):
+                    tab = mm.find(b"\t", pos + 2, end)
+                    key_end = tab if tab != -1 else end
+                    key = mm[pos + 2 : key_end].decode("utf-8")
+                    if op == b"P" and tab != -1:
+                        yield PUT, key, RecordRef(seq, tab + 1, end)
+                        count += 1
+                    elif op == b"D":
+                        yield DELETE, key, None
+                        count += 1
+                else:
+                    logger.warning(
+                        f"Skipping unknown record at {self._segment_path(seq)}:{pos}"
+                    )
+                pos = end + 1
+            self._record_counts[seq] = count
+
+    def read(self, ref: RecordRef) -> bytes:
+        """Read a put payload."""
+        mm = self._maps.get(ref.seq)
+        if mm is None:
+            raise KeyError(f"Segment {ref.seq} is not mapped")
+        return mm[ref.start : ref.end]
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _append(self, line: bytes) -> tuple[int, int]:
+        """Append one line to the active segment; returns (seq, offset)."""
+        with self._lock:
+            if self._active is None:
+                self._active = open(self._segment_path(self._active_seq), "ab")
+            offset = self._active.tell()
+            self._active.write(line)
+            self._active.flush()
+            if self.fsync:
+                os.fsync(self._active.fileno())
+            self._record_counts[self._active_seq] = (
+                self._record_counts.get(self._active_seq, 0) + 1
+            )
+            return self._active_seq, offset
+
+    def append_put(self, key: str, payload: bytes) -> RecordRef:
+        """Append a put record."""
+        prefix = f"P\t{key}\t".encode()
+        seq, offset = self._append(prefix + payload + b"\n")
+        start = offset + len(prefix)
+        return RecordRef(seq, start, start + len(payload))
+
+    def append_delete(self, key: str) -> None:
+        """Append a delete record."""
+        self._append(f"D\t{key}\n".encode())
+
+    def append_reset(self) -> None:
+        """Append a reset record; replay discards everything before it."""
+        self._append(b"R\n")
+
+    def rotate(self) -> int:
+        """
+        Seal the active segment and start a new one.
+
+        Returns:
+            Sequence number of the sealed segment (the compaction target).
+        """
+        with self._lock:
+            sealed = self._active_seq
+            if self._active is not None:
+                os.fsync(self._active.fileno())
+                self._active.close()
+                self._active = None
+                appended = self._record_counts.pop(sealed, 0)
+                self._map_segment(sealed)
+                self._record_counts[sealed] = appended
+            self._active_seq += 1
+            return sealed
+
+    def write_snapshot(
+        self, seq: int, records: Iterable[tuple[str, bytes]]
+    ) -> tuple[Path, dict[str, RecordRef]]:
+        """
+        Write a compacted segment to a temporary file.
+
+        Safe to call without holding any caller lock; nothing is visible to
+        replay until :meth:`install_snapshot`.
+
+        Returns:
+            The temporary path and the new location of each key.
+        """
+        tmp = self._segment_path(seq).with_suffix(".log.tmp")
+        refs: dict[str, RecordRef] = {}
+        with open(tmp, "wb") as f:
+            f.write(b"R\n")
+            offset = 2
+            for key, payload in records:
+                prefix = f"P\t{key}\t".encode()
+                f.write(prefix)
+                f.write(payload)
+                f.write(b"\n")
+                start = offset + len(prefix)
+                refs[key] = RecordRef(seq, start, start + len(payload))
+                offset = start + len(payload) + 1
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp, refs
+
+    def install_snapshot(self, seq: int, tmp: Path, record_count: int) -> None:
+        """Atomically replace sealed segments up to ``seq`` with a snapshot."""
+        with self._lock:
+            if seq >= self._active_seq:
+                raise ValueError("Only sealed segments can be replaced")
+            replaced = [s for s in self.segments if s <= seq]
+            for s in replaced:
+                self._unmap_segment(s)
+
+            os.replace(tmp, self._segment_path(seq))
+            self._fsync_directory()
+            for s in replaced:
+                if s != seq:
+                    self._segment_path(s).unlink(missing_ok=True)
+
+            self._map_segment(seq)
+            self._record_counts[seq] = record_count
+
+    def _fsync_directory(self) -> None:
+        """Persist the rename itself (POSIX only)."""
+        if os.name != "posix":
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def __del__(self):
+        # Don't leak the append handle if the owner never called close()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Close the active segment and all memory maps."""
+        with self._lock:
+            if self._active is not None:
+                self._active.close()
+                self._active = None
+            for seq in list(self._maps):
+                self._unmap_segment(seq)
@@ -0,0 +1,195 @@
+"""
+VIBE MCP - Memory Search Index
+
+Incrementally maintained inverted index with BM25 ranking for the local
+memory store. Each token maps to a posting list of ``{doc_id: term
+frequency}``, so adding, updating or removing a memory touches only that
+memory's tokens instead of rescanning every stored entry.
+
+Category and agent filters are kept as their own posting sets and are
+intersected (smallest first) before scoring; the top ``limit`` results are
+picked with a heap rather than a full sort.
+
+Usage:
+    index = BM25Index()
+    index.add("abc", "User prefers FastAPI over Flask", category="preference")
+    index.search("fastapi", limit=5)  # [("abc", 0.87)]
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens used for both documents and queries."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    """
+    Inverted index over memory contents with Okapi BM25 scoring.
+
+    Documents are identified by memory ID. ``category`` and ``agent_id`` are
+    optional filter fields stored as separate posting sets.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._fields: dict[str, dict[str, set[str]]] = {"category": {}, "agent_id": {}}
+        self._doc_fields: dict[str, dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_lengths
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._postings)
+
+    @property
+    def average_length(self) -> float:
+        return self._total_length / len(self) if len(self) else 0.0
+
+    def add(
+        self,
+        doc_id: str,
+        text: str,
+        category: str | None = None,
+        agent_id: str | None = None,
+    ) -> None:
+        """Index a document, replacing any previous version of it."""
+        if doc_id in self:
+            self.remove(doc_id)
+
+        terms = Counter(tokenize(text))
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        self._doc_terms[doc_id] = terms
+        length = sum(terms.values())
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+
+        fields = {"category": category, "agent_id": agent_id}
+        self._doc_fields[doc_id] = {}
+        for name, value in fields.items():
+            if value is not None:
+                self._fields[name].setdefault(value, set()).add(doc_id)
+                self._doc_fields[doc_id][name] = value
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from the index."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+
+        for term in terms:
+            posting = self._postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+
+        for name, value in self._doc_fields.pop(doc_id).items():
+            members = self._fields[name][value]
+            members.discard(doc_id)
+            if not members:
+                del self._fields[name][value]
+        return True
+
+    def clear(self) -> None:
+        """Remove every document."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
+        for values in self._fields.values():
+            values.clear()
+        self._doc_fields.clear()
+
+    def filter_ids(
+        self, category: str | None = None, agent_id: str | None = None
+    ) -> set[str] | None:
+        """Intersect the requested field posting sets (None = unfiltered)."""
+        sets = []
+        for name, value in (("category", category), ("agent_id", agent_id)):
+            if value is None:
+                continue
+            members = self._fields[name].get(value)
+            if not members:
+                return set()
+            sets.append(members)
+        if not sets:
+            return None
+        sets.sort(key=len)
+        result = set(sets[0])
+        for members in sets[1:]:
+            result &= members
+        return result
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        category: str | None = None,
+        agent_id: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank documents against ``query``.
+
+        Returns:
+            Up to ``limit`` ``(doc_id, score)`` pairs, best first.
+        """
+        if limit <= 0 or not len(self):
+            return []
+
+        allowed = self.filter_ids(category, agent_id)
+        if allowed is not None and not allowed:
+            return []
+
+        n_docs = len(self)
+        avg_length = self.average_length
+        k1, b = self.k1, self.b
+        scores: dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+            if allowed is None:
+                matches = posting.items()
+            elif len(allowed) < df:
+                matches = ((d, posting[d]) for d in allowed if d in posting)
+            else:
+                matches = ((d, tf) for d, tf in posting.items() if d in allowed)
+
+            for doc_id, tf in matches:
+                norm = k1 * (1 - b + b * self._doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (
+                    tf + norm
+                )
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size statistics."""
+        return {
+            "documents": len(self),
+            "terms": self.vocabulary_size,
+            "postings": sum(len(p) for p in self._postings.values()),
+            "average_length": round(self.average_length, 2),
+        }
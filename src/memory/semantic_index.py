@@ -0,0 +1,437 @@
+"""
+VIBE MCP - Semantic Memory Index
+
+Local vector index used by MemorySystem when Mem0 is unavailable, so
+context retrieval can find related memories that share no exact keywords.
+
+- Embedders are pluggable (anything with ``name``, ``dim`` and
+  ``embed(texts) -> float32 matrix``). The default HashingEmbedder needs no
+  model or network: it hashes words, word bigrams and character trigrams
+  into a fixed number of signed buckets.
+- Vectors, IDs and IVF list assignments live in memory-mapped files, so
+  opening an index only reads the IDs and a write touches one row.
+- Below ``ann_threshold`` vectors, search is an exact brute-force dot
+  product with ``argpartition`` top-k. Above it, an IVF index (spherical
+  k-means centroids, ``nprobe`` lists scanned) is trained and retrained as
+  the index doubles in size.
+- New memories are buffered and embedded in batches.
+
+Requires NumPy; MemorySystem skips semantic search without it.
+
+Usage:
+    index = VectorIndex(path)
+    index.add("abc", "Deploy the API with docker compose")
+    index.search("container deployment", k=5)  # [("abc", 0.41)]
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_TOKEN_RE = re.compile(r"\w+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or that the "
+    "this to was were will with".split()
+)
+
+
+class Embedder(Protocol):
+    """Turns texts into L2-normalized float32 vectors."""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: list[str]) -> "np.ndarray": ...
+
+
+class HashingEmbedder:
+    """
+    Dependency-free embedder using signed feature hashing.
+
+    Words, adjacent word pairs and character trigrams are hashed (crc32, so
+    vectors are stable across processes) into ``dim`` buckets with
+    sublinear term frequency. Trigrams relate inflections such as
+    "deploy"/"deployment" that a keyword index treats as different words.
+    """
+
+    def __init__(self, dim: int = 256, trigram_weight: float = 0.5):
+        self.dim = dim
+        self.trigram_weight = trigram_weight
+        self.name = f"hashing-v1-{dim}-{trigram_weight}"
+
+    def _features(self, text: str) -> Counter:
+        words = [
+            w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOPWORDS
+        ]
+        features: Counter = Counter()
+        for word in words:
+            features[word] += 1.0
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                features["#" + padded[i : i + 3]] += self.trigram_weight
+        for first, second in zip(words, words[1:], strict=False):
+            features[f"{first} {second}"] += 0.5
+        return features
+
+    def embed(self, texts: list[str]) -> "np.ndarray":
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text).items():
+                h = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if h & 0x80000000 else -1.0
+                vectors[row, h % self.dim] += sign * (1.0 + math.log(weight + 1.0))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class VectorIndex:
+    """
+    Memory-mapped vector index with exact and IVF search.
+
+    All public methods are thread-safe.
+    """
+
+    ID_BYTES = 64
+
+    def __init__(
+        self,
+        path: Path,
+        embedder: Embedder | None = None,
+        ann_threshold: int = 20000,
+        nprobe: int = 16,
+        batch_size: int = 64,
+    ):
+        """
+        Open (or create) an index.
+
+        Args:
+            path: Directory for the index files
+            embedder: Embedder to use (default: HashingEmbedder)
+            ann_threshold: Vector count at which IVF search takes over
+            nprobe: IVF lists scanned per query
+            batch_size: Pending texts embedded together
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for the semantic memory index")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.embedder = embedder or HashingEmbedder()
+        self.dim = self.embedder.dim
+        self.ann_threshold = ann_threshold
+        self.nprobe = nprobe
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        self._pending: dict[str, str] = {}
+        self._row_of: dict[str, int] = {}
+        self._count = 0
+        self._capacity = 0
+        self._vectors = None
+        self._ids = None
+        self._lists = None
+        self._centroids = None
+        self._trained_at = 0
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _meta_file(self) -> Path:
+        return self.path / "index.json"
+
+    def _open(self) -> None:
+        meta: dict[str, Any] = {}
+        if self._meta_file().exists():
+            try:
+                meta = json.loads(self._meta_file().read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.warning(f"Unreadable semantic index metadata, rebuilding: {e}")
+
+        if meta.get("embedder") != self.embedder.name or meta.get("dim") != self.dim:
+            if meta:
+                logger.info("Embedder changed; rebuilding semantic index")
+            for name in ("vectors.f32", "ids.bin", "lists.i32", "centroids.npy"):
+                (self.path / name).unlink(missing_ok=True)
+            return
+
+        vectors_file = self.path / "vectors.f32"
+        if not vectors_file.exists():
+            return
+        capacity = vectors_file.stat().st_size // (4 * self.dim)
+        if capacity == 0:
+            return
+        self._map(capacity)
+        self._count = min(meta.get("count", 0), capacity)
+        for row in range(self._count):
+            self._row_of[self._ids[row].decode("ascii")] = row
+
+        centroids_file = self.path / "centroids.npy"
+        if meta.get("trained_at") and centroids_file.exists():
+            self._centroids = np.load(centroids_file)
+            self._trained_at = meta["trained_at"]
+
+    def _map(self, capacity: int) -> None:
+        """(Re)map the row files at ``capacity`` rows, growing them if needed."""
+        for array in (self._vectors, self._ids, self._lists):
+            if array is not None:
+                array.flush()
+
+        def mapped(name, dtype, shape):
+            file = self.path / name
+            size = capacity * np.dtype(dtype).itemsize * math.prod(shape)
+            with open(file, "a+b") as f:
+                if os.fstat(f.fileno()).st_size < size:
+                    f.truncate(size)
+            return np.memmap(file, dtype=dtype, mode="r+", shape=(capacity, *shape))
+
+        self._vectors = mapped("vectors.f32", np.float32, (self.dim,))
+        self._ids = mapped("ids.bin", f"S{self.ID_BYTES}", ())
+        self._lists = mapped("lists.i32", np.int32, ())
+        self._capacity = capacity
+
+    def _save_meta(self) -> None:
+        meta = {
+            "embedder": self.embedder.name,
+            "dim": self.dim,
+            "count": self._count,
+            "trained_at": self._trained_at,
+        }
+        tmp = self._meta_file().with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, self._meta_file())
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count + sum(1 for i in self._pending if i not in self._row_of)
+
+    def ids(self) -> set[str]:
+        """IDs in the index, including ones waiting to be embedded."""
+        with self._lock:
+            return set(self._row_of) | set(self._pending)
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Queue a document for embedding (replaces any previous version)."""
+        if len(doc_id.encode("ascii")) > self.ID_BYTES:
+            raise ValueError(f"Document IDs are limited to {self.ID_BYTES} bytes")
+        with self._lock:
+            self._pending[doc_id] = text
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def add_many(self, docs: Iterable[tuple[str, str]]) -> None:
+        """Queue several documents."""
+        for doc_id, text in docs:
+            self.add(doc_id, text)
+
+    def flush(self) -> None:
+        """Embed pending documents in batches and write them."""
+        with self._lock:
+            if not self._pending:
+                return
+            pending = list(self._pending.items())
+            self._pending.clear()
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start : start + self.batch_size]
+                vectors = self.embedder.embed([text for _, text in batch])
+                self._write_rows([doc_id for doc_id, _ in batch], vectors)
+            self._save_meta()
+
+    def _write_rows(self, doc_ids: list[str], vectors: "np.ndarray") -> None:
+        new = sum(1 for doc_id in doc_ids if doc_id not in self._row_of)
+        if self._count + new > self._capacity:
+            self._map(max(1024, self._capacity * 2, self._count + new))
+
+        rows = []
+        for doc_id in doc_ids:
+            row = self._row_of.get(doc_id)
+            if row is None:
+                row = self._row_of[doc_id] = self._count
+                self._ids[row] = doc_id.encode("ascii")
+                self._count += 1
+            rows.append(row)
+
+        rows = np.asarray(rows)
+        self._vectors[rows] = vectors
+        if self._centroids is not None:
+            self._lists[rows] = np.argmax(vectors @ self._centroids.T, axis=1)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document (the last row moves into its slot)."""
+        with self._lock:
+            queued = self._pending.pop(doc_id, None) is not None
+            row = self._row_of.pop(doc_id, None)
+            if row is None:
+                return queued
+
+            last = self._count - 1
+            if row != last:
+                moved = self._ids[last].decode("ascii")
+                self._vectors[row] = self._vectors[last]
+                self._ids[row] = self._ids[last]
+                self._lists[row] = self._lists[last]
+                self._row_of[moved] = row
+            self._count = last
+            self._save_meta()
+            return True
+
+    def clear(self) -> None:
+        """Remove every document."""
+        with self._lock:
+            self._pending.clear()
+            self._row_of.clear()
+            self._count = 0
+            self._centroids = None
+            self._trained_at = 0
+            (self.path / "centroids.npy").unlink(missing_ok=True)
+            self._save_meta()
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def _train(self, iterations: int = 8) -> None:
+        """Cluster the vectors with spherical k-means and assign every row."""
+        n = self._count
+        nlist = max(1, int(math.sqrt(n)))
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(rng.choice(n, size=min(n, nlist * 64), replace=False))
+        sample = np.asarray(self._vectors[sample_rows])
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)]
+
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+        for start in range(0, n, 8192):
+            chunk = np.asarray(self._vectors[start : min(n, start + 8192)])
+            self._lists[start : start + len(chunk)] = np.argmax(
+                chunk @ centroids.T, axis=1
+            )
+
+        self._centroids = centroids.astype(np.float32)
+        self._trained_at = n
+        np.save(self.path / "centroids.npy", self._centroids)
+        self._save_meta()
+        logger.info(f"Trained semantic IVF index: {n} vectors, {nlist} lists")
+
+    def _ivf_rows(self, query: "np.ndarray") -> "np.ndarray":
+        if self._centroids is None or self._count >= 2 * self._trained_at:
+            self._train()
+        nprobe = min(self.nprobe, len(self._centroids))
+        probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        probe_mask = np.zeros(len(self._centroids), dtype=bool)
+        probe_mask[probes] = True
+        return np.flatnonzero(probe_mask[self._lists[: self._count]])
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        allowed: set[str] | None = None,
+        exact: bool | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the documents most similar to ``query``.
+
+        Args:
+            query: Query text
+            k: Number of results
+            allowed: Restrict results to these IDs
+            exact: Force brute-force (True) or IVF (False) search; by default
+                IVF is used at or above ``ann_threshold`` vectors
+
+        Returns:
+            Up to ``k`` ``(doc_id, cosine similarity)`` pairs, best first.
+        """
+        with self._lock:
+            self.flush()
+            if k <= 0 or self._count == 0:
+                return []
+            q = self.embedder.embed([query])[0]
+
+            allowed_rows = None
+            if allowed is not None:
+                allowed_rows = np.fromiter(
+                    (self._row_of[i] for i in allowed if i in self._row_of),
+                    dtype=np.int64,
+                )
+
+            use_ivf = self._count >= self.ann_threshold if exact is None else not exact
+            rows = self._ivf_rows(q) if use_ivf else None
+            if allowed_rows is not None:
+                if rows is not None:
+                    rows = np.intersect1d(rows, allowed_rows, assume_unique=True)
+                if rows is None or len(rows) < k:
+                    # Too few filtered hits in the probed lists: go exact
+                    rows = allowed_rows
+
+            if rows is None:
+                scores = self._vectors[: self._count] @ q
+                rows = np.arange(self._count)
+            else:
+                scores = self._vectors[rows] @ q
+
+            if len(scores) > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top])]
+
+            return [
+                (self._ids[rows[i]].decode("ascii"), float(scores[i])) for i in top
+            ]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            return {
+                "vectors": self._count,
+                "pending": len(self._pending),
+                "dim": self.dim,
+                "embedder": self.embedder.name,
+                "ivf_lists": 0 if self._centroids is None else len(self._centroids),
+                "mode": "ivf" if self._count >= self.ann_threshold else "exact",
+            }
+
+    def close(self) -> None:
+        """Embed pending documents and flush the mapped files."""
+        with self._lock:
+            self.flush()
+            for array in (self._vectors, self._ids, self._lists):
+                if array is not None:
+                    array.flush()
+            self._save_meta()
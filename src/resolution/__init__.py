@@ -5,12 +5,27 @@ Dependency resolution using uv/pip-tools for Python and npm for Node.js.
 """
 
 from src.resolution.conflict_detector import ConflictDetector
-from src.resolution.python_resolver import PythonResolver, ResolutionResult
+from src.resolution.python_resolver import (
+    PythonResolver,
+    ResolutionCache,
+    ResolutionResult,
+    get_resolution_cache,
+)
+from src.resolution.specifiers import (
+    SpecifierConflict,
+    find_conflicts,
+    specifiers_compatible,
+)
 from src.resolution.unified_resolver import UnifiedResolver
 
 __all__ = [
     "PythonResolver",
     "ResolutionResult",
+    "ResolutionCache",
+    "get_resolution_cache",
     "ConflictDetector",
     "UnifiedResolver",
+    "SpecifierConflict",
+    "find_conflicts",
+    "specifiers_compatible",
 ]
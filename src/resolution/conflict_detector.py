@@ -8,6 +8,7 @@ import logging
 from dataclasses import dataclass
 
 from src.analysis.dependency_analyzer import Dependency, DependencyGraph
+from src.resolution.specifiers import specifiers_compatible
 
 logger = logging.getLogger(__name__)
 
@@ -147,36 +148,30 @@ class ConflictDetector:
         if len(version_specs) <= 1:
             return None
 
-        # Check for exact version conflicts
-        exact_versions = {}
-        for source, spec in version_specs.items():
-            if spec.startswith("=="):
-                exact_versions[source] = spec[2:].strip()
+        if specifiers_compatible(*version_specs.values()):
+            return None
 
+        exact_versions = {
+            source: spec[2:].strip()
+            for source, spec in version_specs.items()
+            if spec.startswith("==") and "," not in spec
+        }
         if len(set(exact_versions.values())) > 1:
-            return ConflictInfo(
-                package_name=package_name,
-                conflict_type="version",
-                sources=version_specs,
-                description=f"Exact version conflict: {exact_versions}",
-                severity="error",
-                resolvable=False,
-                resolution_suggestion="Remove exact version pins or align versions",
-            )
-
-        # Check for potentially incompatible ranges
-        if not self._ranges_compatible(list(version_specs.values())):
-            return ConflictInfo(
-                package_name=package_name,
-                conflict_type="version",
-                sources=version_specs,
-                description="Potentially incompatible version ranges",
-                severity="warning",
-                resolvable=True,
-                resolution_suggestion="Use dependency resolver to find compatible version",
-            )
-
-        return None
+            description = f"Exact version conflict: {exact_versions}"
+            suggestion = "Remove exact version pins or align versions"
+        else:
+            description = "Incompatible version ranges: no version satisfies all specs"
+            suggestion = "Relax the version constraints so their ranges overlap"
+
+        return ConflictInfo(
+            package_name=package_name,
+            conflict_type="version",
+            sources=version_specs,
+            description=description,
+            severity="error",
+            resolvable=False,
+            resolution_suggestion=suggestion,
+        )
 
     def _check_extras_conflict(
         self, package_name: str, source_deps: dict[str, Dependency]
@@ -198,52 +193,5 @@ class ConflictDetector:
         return None
 
     def _ranges_compatible(self, specs: list[str]) -> bool:
-        """
-        Check if version ranges might be compatible.
-
-        This is a simplified check - full resolution needs SAT solver.
-        """
-        # If any spec is empty (no constraint), it's compatible
-        if any(not spec for spec in specs):
-            return True
-
-        # Extract min/max versions from specs
-        mins = []
-        maxs = []
-
-        for spec in specs:
-            for part in spec.split(","):
-                part = part.strip()
-                if part.startswith(">="):
-                    mins.append(part[2:].strip())
-                elif part.startswith(">"):
-                    mins.append(part[1:].strip())
-                elif part.startswith("<="):
-                    maxs.append(part[2:].strip())
-                elif part.startswith("<"):
-                    maxs.append(part[1:].strip())
-
-        # Simple check: if min > max for any combo, incompatible
-        for min_v in mins:
-            for max_v in maxs:
-                if self._version_greater(min_v, max_v):
-                    return False
-
-        return True
-
-    def _version_greater(self, v1: str, v2: str) -> bool:
-        """Check if v1 > v2."""
-
-        def to_tuple(v: str) -> tuple:
-            parts = []
-            for p in v.split("."):
-                try:
-                    parts.append(int(p.split("-")[0].split("+")[0]))
-                except ValueError:
-                    parts.append(0)
-            return tuple(parts)
-
-        try:
-            return to_tuple(v1) > to_tuple(v2)
-        except Exception:
-            return False
+        """Check if some version satisfies every spec (exact PEP 440 check)."""
+        return specifiers_compatible(*specs)
@@ -3,18 +3,61 @@ AI Project Synthesizer - Python Resolver
 
 Resolves Python dependencies using uv or pip-tools.
 Handles version conflicts with SAT solver.
+
+Tool discovery runs once per process, and successful lockfiles are memoized
+by (requirements, constraints, Python version, platform) so repeat and
+subset resolutions never re-run the external solver.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import platform
 import re
 import subprocess
+import sys
 import tempfile
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+
+from src.resolution.specifiers import find_conflicts
 
 logger = logging.getLogger(__name__)
 
+# Tool name -> whether "<tool> --version" succeeded, shared by all resolvers
+_tool_availability: dict[str, bool] = {}
+_tool_lock = threading.Lock()
+
+
+def _tool_available(tool: str) -> bool:
+    """Check (once per process) whether a CLI tool is available."""
+    with _tool_lock:
+        if tool not in _tool_availability:
+            try:
+                # nosec B603 B607 - hardcoded safe command, no user input
+                result = subprocess.run(
+                    [tool, "--version"],
+                    capture_output=True,
+                    text=True,
+                )
+                _tool_availability[tool] = result.returncode == 0
+            except FileNotFoundError:
+                _tool_availability[tool] = False
+        return _tool_availability[tool]
+
+
+def clear_tool_cache() -> None:
+    """Forget discovered tools (e.g. after installing uv)."""
+    with _tool_lock:
+        _tool_availability.clear()
+
 
 @dataclass
 class ResolvedPackage:
@@ -55,6 +98,296 @@ class ResolutionResult:
         }
 
 
+def normalize_requirement(line: str) -> str:
+    """Canonical form of a requirement string, used for cache keys."""
+    try:
+        req = Requirement(line)
+    except InvalidRequirement:
+        return line.strip()
+    normalized = canonicalize_name(req.name)
+    if req.extras:
+        normalized += f"[{','.join(sorted(req.extras))}]"
+    if req.url:
+        normalized += f" @ {req.url}"
+    normalized += str(req.specifier)
+    if req.marker:
+        normalized += f"; {req.marker}"
+    return normalized
+
+
+def current_platform() -> str:
+    """Platform tag the external resolvers resolve for."""
+    return f"{sys.platform}-{platform.machine().lower()}"
+
+
+@dataclass
+class _CachedResolution:
+    """A memoized successful resolution."""
+
+    requirements: frozenset[str]
+    context: tuple[str, str, str]  # (constraints, python version, platform)
+    result: ResolutionResult
+
+
+def _parse_lock_graph(lockfile: str) -> dict[str, tuple[str, set[str]]] | None:
+    """
+    Parse an annotated lockfile into {package: (block text, parents)}.
+
+    Returns None when any pin lacks a "# via" annotation, in which case the
+    dependency graph is unknown and subsets cannot be derived.
+    """
+    graph: dict[str, tuple[list[str], set[str]]] = {}
+    current: str | None = None
+    in_via = False
+
+    for line in lockfile.splitlines():
+        stripped = line.strip()
+        match = re.match(r"^([a-zA-Z0-9][-a-zA-Z0-9._]*)(?:\[[^\]]+\])?==", stripped)
+        if match and not line[:1].isspace():
+            current = canonicalize_name(match.group(1))
+            graph[current] = ([line], set())
+            in_via = False
+            continue
+        if current is None or not stripped.startswith("#"):
+            continue
+        comment = stripped.lstrip("#").strip()
+        if comment.startswith("via"):
+            in_via = True
+            comment = comment[3:].strip()
+        elif not in_via or not line[:1].isspace():
+            continue
+        graph[current][0].append(line)
+        if comment and not comment.startswith(("-r", "-c")):
+            graph[current][1].add(canonicalize_name(comment.split()[0]))
+        elif comment:
+            graph[current][1].add("")  # direct requirement
+
+    if not graph or any(not parents for _, parents in graph.values()):
+        return None
+    return {name: ("\n".join(block), parents) for name, (block, parents) in graph.items()}
+
+
+class ResolutionCache:
+    """
+    Memoizes successful resolutions.
+
+    Entries are keyed by the normalized, sorted requirement set plus the
+    constraints, Python version and platform. A request whose requirements
+    are a subset of a cached resolution (same constraints, Python and
+    platform) is served from that lockfile by walking its "# via"
+    annotations. With ``persist=True`` exact results are also written to
+    the shared CacheManager store so other workers can reuse them.
+
+    Example:
+        cache = ResolutionCache(persist=True)
+        resolver = PythonResolver(cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        persist: bool = False,
+        ttl_seconds: int = 7 * 86400,
+        allow_subsets: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.allow_subsets = allow_subsets
+        self._entries: OrderedDict[str, _CachedResolution] = OrderedDict()
+        self._store = None
+        if persist:
+            from src.core.cache import get_cache
+
+            self._store = get_cache()
+        self._hits = 0
+        self._subset_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key_parts(
+        requirements: list[str],
+        constraints: list[str] | None,
+        python_version: str,
+        platform_tag: str,
+    ) -> tuple[frozenset[str], tuple[str, str, str]]:
+        reqs = frozenset(normalize_requirement(r) for r in requirements if r.strip())
+        cons = "\n".join(
+            sorted({normalize_requirement(c) for c in constraints or [] if c.strip()})
+        )
+        return reqs, (cons, python_version, platform_tag)
+
+    @staticmethod
+    def fingerprint(
+        requirements: frozenset[str], context: tuple[str, str, str]
+    ) -> str:
+        payload = json.dumps([sorted(requirements), list(context)])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(
+        self,
+        requirements: list[str],
+        constraints: list[str] | None,
+        python_version: str,
+        platform_tag: str | None = None,
+    ) -> ResolutionResult | None:
+        """Return a cached (or subset-derived) result, or None."""
+        reqs, context = self._key_parts(
+            requirements, constraints, python_version, platform_tag or current_platform()
+        )
+        key = self.fingerprint(reqs, context)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return _copy_result(entry.result)
+
+        if self._store is not None:
+            data = await self._store.get(f"resolution:{key}")
+            if data is not None:
+                result = _result_from_dict(data)
+                self._remember(key, reqs, context, result)
+                self._hits += 1
+                return _copy_result(result)
+
+        if self.allow_subsets:
+            result = self._from_superset(reqs, context)
+            if result is not None:
+                self._subset_hits += 1
+                return result
+
+        self._misses += 1
+        return None
+
+    async def put(
+        self,
+        requirements: list[str],
+        constraints: list[str] | None,
+        python_version: str,
+        result: ResolutionResult,
+        platform_tag: str | None = None,
+    ) -> None:
+        """Memoize a successful resolution."""
+        if not result.success:
+            return
+        reqs, context = self._key_parts(
+            requirements, constraints, python_version, platform_tag or current_platform()
+        )
+        key = self.fingerprint(reqs, context)
+        self._remember(key, reqs, context, _copy_result(result))
+
+        if self._store is not None:
+            await self._store.set(
+                f"resolution:{key}", _result_to_dict(result), self.ttl_seconds
+            )
+
+    def _remember(
+        self,
+        key: str,
+        reqs: frozenset[str],
+        context: tuple[str, str, str],
+        result: ResolutionResult,
+    ) -> None:
+        self._entries[key] = _CachedResolution(reqs, context, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _from_superset(
+        self, reqs: frozenset[str], context: tuple[str, str, str]
+    ) -> ResolutionResult | None:
+        # Prefer the smallest superset: its pins are the least constrained
+        candidates = sorted(
+            (
+                entry
+                for entry in self._entries.values()
+                if entry.context == context and reqs < entry.requirements
+            ),
+            key=lambda entry: len(entry.requirements),
+        )
+        roots = {canonicalize_name(re.split(r"[\[<>=!~;@ ]", r, 1)[0]) for r in reqs}
+
+        for entry in candidates:
+            graph = _parse_lock_graph(entry.result.lockfile_content)
+            if graph is None or not roots <= graph.keys():
+                continue
+
+            needed = set(roots)
+            changed = True
+            while changed:
+                changed = False
+                for name, (_, parents) in graph.items():
+                    if name not in needed and parents & needed:
+                        needed.add(name)
+                        changed = True
+
+            packages = [
+                pkg
+                for pkg in entry.result.packages
+                if canonicalize_name(pkg.name) in needed
+            ]
+            lockfile = "\n".join(
+                block for name, (block, _) in graph.items() if name in needed
+            )
+            return ResolutionResult(
+                success=True,
+                packages=[ResolvedPackage(**asdict(p)) for p in packages],
+                warnings=list(entry.result.warnings),
+                lockfile_content=lockfile + "\n",
+            )
+        return None
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._hits + self._subset_hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "subset_hits": self._subset_hits,
+            "misses": self._misses,
+            "hit_rate": (
+                (self._hits + self._subset_hits) / lookups if lookups else 0.0
+            ),
+            "persistent": self._store is not None,
+        }
+
+
+def _result_to_dict(result: ResolutionResult) -> dict:
+    return {
+        "packages": [asdict(p) for p in result.packages],
+        "warnings": result.warnings,
+        "lockfile_content": result.lockfile_content,
+    }
+
+
+def _result_from_dict(data: dict) -> ResolutionResult:
+    return ResolutionResult(
+        success=True,
+        packages=[ResolvedPackage(**p) for p in data.get("packages", [])],
+        warnings=data.get("warnings", []),
+        lockfile_content=data.get("lockfile_content", ""),
+    )
+
+
+def _copy_result(result: ResolutionResult) -> ResolutionResult:
+    return _result_from_dict(_result_to_dict(result))
+
+
+_resolution_cache: ResolutionCache | None = None
+
+
+def get_resolution_cache(persist: bool = False) -> ResolutionCache:
+    """Get or create the process-wide resolution cache."""
+    global _resolution_cache
+    if _resolution_cache is None:
+        _resolution_cache = ResolutionCache(persist=persist)
+    return _resolution_cache
+
+
 class PythonResolver:
     """
     Python dependency resolver using uv SAT solver.
@@ -64,6 +397,7 @@ class PythonResolver:
     - Fallback to pip-compile
     - Conflict detection and resolution
     - Lock file generation
+    - Memoized results shared across resolver instances
 
     Example:
         resolver = PythonResolver()
@@ -79,6 +413,8 @@ class PythonResolver:
         self,
         python_version: str = "3.11",
         prefer_uv: bool = True,
+        cache: ResolutionCache | None = None,
+        use_cache: bool = True,
     ):
         """
         Initialize the Python resolver.
@@ -86,37 +422,23 @@ class PythonResolver:
         Args:
             python_version: Target Python version
             prefer_uv: Try uv first, fallback to pip-tools
+            cache: Resolution cache (defaults to the process-wide one)
+            use_cache: Set False to always run the external resolver
         """
         self.python_version = python_version
         self.prefer_uv = prefer_uv
+        self.cache = cache or get_resolution_cache()
+        self.use_cache = use_cache
         self._uv_available = self._check_uv()
         self._pip_compile_available = self._check_pip_compile()
 
     def _check_uv(self) -> bool:
         """Check if uv is available."""
-        try:
-            # nosec B603 B607 - hardcoded safe command, no user input
-            result = subprocess.run(
-                ["uv", "--version"],
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return _tool_available("uv")
 
     def _check_pip_compile(self) -> bool:
         """Check if pip-compile is available."""
-        try:
-            # nosec B603 B607 - hardcoded safe command, no user input
-            result = subprocess.run(
-                ["pip-compile", "--version"],
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return _tool_available("pip-compile")
 
     async def resolve(
         self,
@@ -145,6 +467,25 @@ class PythonResolver:
         if constraints:
             all_reqs.extend(constraints)
 
+        # Guaranteed conflicts never need an external resolver round-trip
+        conflicts = find_conflicts(all_reqs, python_version=python_ver)
+        if conflicts:
+            return ResolutionResult(
+                success=False,
+                conflicts=[c.package for c in conflicts],
+                warnings=[c.describe() for c in conflicts],
+                resolution_time_ms=int((time.time() - start_time) * 1000),
+            )
+
+        use_solver = (self.prefer_uv and self._uv_available) or (
+            self._pip_compile_available
+        )
+        if use_solver and self.use_cache:
+            cached = await self.cache.get(requirements, constraints, python_ver)
+            if cached is not None:
+                cached.resolution_time_ms = int((time.time() - start_time) * 1000)
+                return cached
+
         # Try uv first
         if self.prefer_uv and self._uv_available:
             result = await self._resolve_with_uv(all_reqs, python_ver)
@@ -154,6 +495,9 @@ class PythonResolver:
             # Fallback to simple parsing
             result = self._simple_resolve(all_reqs)
 
+        if use_solver and self.use_cache and result.success:
+            await self.cache.put(requirements, constraints, python_ver, result)
+
         result.resolution_time_ms = int((time.time() - start_time) * 1000)
         return result
 
@@ -366,39 +710,22 @@ class PythonResolver:
     async def check_conflicts(
         self,
         requirements: list[str],
+        python_version: str | None = None,
     ) -> list[str]:
         """
-        Check for potential conflicts without full resolution.
+        Check for conflicts without full resolution.
+
+        Uses exact in-process specifier intersection, so every reported
+        conflict is real (no version can satisfy all requirements).
 
         Args:
             requirements: List of requirements to check
+            python_version: Target Python version for environment markers
 
         Returns:
-            List of potential conflict descriptions
+            List of conflict descriptions
         """
-        # Group by package name
-        by_name: dict[str, list[str]] = {}
-
-        for req in requirements:
-            match = re.match(r"^([a-zA-Z0-9][-a-zA-Z0-9._]*)", req)
-            if match:
-                name = match.group(1).lower().replace("_", "-")
-                by_name.setdefault(name, []).append(req)
-
-        conflicts = []
-
-        for name, reqs in by_name.items():
-            if len(reqs) > 1:
-                # Check if versions are compatible
-                exact_versions = set()
-                for req in reqs:
-                    match = re.search(r"==([^\s,]+)", req)
-                    if match:
-                        exact_versions.add(match.group(1))
-
-                if len(exact_versions) > 1:
-                    conflicts.append(
-                        f"{name}: conflicting exact versions {exact_versions}"
-                    )
-
-        return conflicts
+        conflicts = find_conflicts(
+            requirements, python_version=python_version or self.python_version
+        )
+        return [conflict.describe() for conflict in conflicts]
@@ -0,0 +1,366 @@
+"""
+AI Project Synthesizer - Specifier Intersection
+
+In-process PEP 440 conflict detection. Every specifier is normalized into a
+set of disjoint version intervals, and the sets for one package are
+intersected without a round-trip to uv or pip-compile. Before an empty
+intersection is reported, the boundary versions named by the specifiers are
+checked against packaging's own SpecifierSet, so corner cases the interval
+model does not capture (local version labels, for one) never produce a
+false conflict.
+
+Handles ==, !=, <, <=, >, >=, ~=, === and prefix (``==1.2.*``) clauses,
+pre-release semantics (pre-releases only satisfy a set when a clause names
+one) and environment markers (requirements whose marker is false for the
+target environment are ignored).
+"""
+
+import logging
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from packaging.markers import InvalidMarker, Marker, UndefinedEnvironmentName
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+logger = logging.getLogger(__name__)
+
+# Large post-release used to express "strictly above V and all of V's
+# post-releases" for the exclusive > operator
+_POST_INFINITY = sys.maxsize
+
+_CLAUSE_PATTERN = re.compile(r"^\s*(===|~=|==|!=|<=|>=|<|>)\s*(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class Interval:
+    """A contiguous range of versions; None bounds are unbounded."""
+
+    lower: Version | None = None
+    lower_inclusive: bool = False
+    upper: Version | None = None
+    upper_inclusive: bool = False
+
+    def is_empty(self) -> bool:
+        if self.lower is None or self.upper is None:
+            return False
+        if self.lower > self.upper:
+            return True
+        if self.lower == self.upper:
+            return not (self.lower_inclusive and self.upper_inclusive)
+        return False
+
+    def intersect(self, other: "Interval") -> "Interval":
+        lower, lower_inc = self.lower, self.lower_inclusive
+        if other.lower is not None and (
+            lower is None
+            or other.lower > lower
+            or (other.lower == lower and not other.lower_inclusive)
+        ):
+            lower, lower_inc = other.lower, other.lower_inclusive
+
+        upper, upper_inc = self.upper, self.upper_inclusive
+        if other.upper is not None and (
+            upper is None
+            or other.upper < upper
+            or (other.upper == upper and not other.upper_inclusive)
+        ):
+            upper, upper_inc = other.upper, other.upper_inclusive
+
+        return Interval(lower, lower_inc, upper, upper_inc)
+
+    def has_final_release(self) -> bool:
+        """Whether the interval contains any non-pre-release version."""
+        if self.lower is None or self.upper is None:
+            return True
+
+        # Smallest non-pre-release version inside the lower bound
+        lower = self.lower
+        if lower.is_prerelease:
+            if lower.post is not None:
+                candidate = Version(f"{_release_str(lower)}.post{lower.post}")
+            else:
+                candidate = _base_release(lower)
+        elif self.lower_inclusive:
+            candidate = lower
+        else:
+            post = 0 if lower.post is None else lower.post + 1
+            candidate = Version(f"{_release_str(lower)}.post{post}")
+
+        return candidate < self.upper or (
+            self.upper_inclusive and candidate == self.upper
+        )
+
+
+@dataclass(frozen=True)
+class VersionSet:
+    """A union of disjoint intervals; the empty tuple is the empty set."""
+
+    intervals: tuple[Interval, ...] = (Interval(),)
+    allows_prereleases: bool = False
+
+    def intersect(self, other: "VersionSet") -> "VersionSet":
+        result = []
+        for a in self.intervals:
+            for b in other.intervals:
+                merged = a.intersect(b)
+                if not merged.is_empty():
+                    result.append(merged)
+        return VersionSet(
+            tuple(result),
+            self.allows_prereleases or other.allows_prereleases,
+        )
+
+    def is_empty(self) -> bool:
+        if not self.intervals:
+            return True
+        if self.allows_prereleases:
+            return False
+        return not any(interval.has_final_release() for interval in self.intervals)
+
+
+ANY_VERSION = VersionSet()
+
+
+@dataclass
+class SpecifierConflict:
+    """A package whose requirements cannot all be satisfied."""
+
+    package: str
+    requirements: list[tuple[str, str]]  # (source, requirement string)
+    environment: dict[str, str] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        specs = ", ".join(
+            f"{req} ({source})" if source else req for source, req in self.requirements
+        )
+        return f"{self.package}: no version satisfies {specs}"
+
+
+def _release_str(version: Version) -> str:
+    release = ".".join(str(part) for part in version.release)
+    return f"{version.epoch}!{release}" if version.epoch else release
+
+
+def _base_release(version: Version) -> Version:
+    return Version(_release_str(version))
+
+
+def _prefix_interval(prefix: str) -> Interval:
+    """Versions matching ``==prefix.*`` (pre/dev/post releases included)."""
+    base = Version(prefix)
+    release = list(base.release)
+    upper_release = release[:-1] + [release[-1] + 1]
+    epoch = f"{base.epoch}!" if base.epoch else ""
+    return Interval(
+        Version(f"{epoch}{'.'.join(map(str, release))}.dev0"),
+        True,
+        Version(f"{epoch}{'.'.join(map(str, upper_release))}.dev0"),
+        False,
+    )
+
+
+def _complement(interval: Interval) -> tuple[Interval, ...]:
+    return (
+        Interval(None, False, interval.lower, not interval.lower_inclusive),
+        Interval(interval.upper, not interval.upper_inclusive, None, False),
+    )
+
+
+def _clause_to_set(op: str, raw: str) -> VersionSet:
+    """Translate a single PEP 440 clause into a VersionSet."""
+    if raw.endswith(".*"):
+        if op not in ("==", "!="):
+            raise InvalidVersion(f"Wildcard not allowed with {op}: {raw}")
+        interval = _prefix_interval(raw[:-2])
+        if op == "==":
+            return VersionSet((interval,), False)
+        return VersionSet(_complement(interval), False)
+
+    version = Version(raw)
+    prerelease = version.is_prerelease
+
+    if op in ("==", "==="):
+        return VersionSet((Interval(version, True, version, True),), prerelease)
+    if op == "!=":
+        return VersionSet(
+            _complement(Interval(version, True, version, True)), False
+        )
+    if op == ">=":
+        return VersionSet((Interval(lower=version, lower_inclusive=True),), prerelease)
+    if op == "<=":
+        return VersionSet((Interval(upper=version, upper_inclusive=True),), prerelease)
+    if op == ">":
+        # >V excludes V's post-releases unless V is itself a post-release
+        lower = version
+        if not version.is_postrelease and version.dev is None:
+            lower = Version(f"{version.public}.post{_POST_INFINITY}")
+        return VersionSet((Interval(lower=lower),), prerelease)
+    if op == "<":
+        # <V excludes V's pre-releases unless V is itself a pre-release
+        if prerelease:
+            return VersionSet((Interval(upper=version),), True)
+        base = _base_release(version)
+        intervals = [Interval(upper=Version(f"{base}.dev0"))]
+        if version.is_postrelease:
+            # <V.postN still admits V itself and its earlier post-releases
+            intervals.append(Interval(base, True, version, False))
+        return VersionSet(tuple(intervals), False)
+    if op == "~=":
+        if len(version.release) < 2:
+            raise InvalidVersion(f"~= requires at least two release segments: {raw}")
+        prefix = ".".join(str(part) for part in version.release[:-1])
+        if version.epoch:
+            prefix = f"{version.epoch}!{prefix}"
+        upper = _prefix_interval(prefix)
+        return VersionSet(
+            (Interval(version, True, upper.upper, False),), prerelease
+        )
+    raise InvalidVersion(f"Unsupported operator: {op}")
+
+
+@lru_cache(maxsize=4096)
+def parse_specifier(spec: str) -> VersionSet:
+    """
+    Normalize a comma-separated specifier string into a VersionSet.
+
+    Raises:
+        InvalidVersion: If a clause cannot be parsed
+    """
+    result = ANY_VERSION
+    for clause in spec.split(","):
+        if not clause.strip():
+            continue
+        match = _CLAUSE_PATTERN.match(clause)
+        if not match:
+            raise InvalidVersion(f"Invalid specifier clause: {clause!r}")
+        result = result.intersect(_clause_to_set(*match.groups()))
+    return result
+
+
+def _satisfied_at_boundaries(specs: list[str]) -> bool:
+    """
+    Whether a version named by ``specs`` satisfies all of them, according
+    to packaging itself. Used to confirm an empty interval intersection.
+    """
+    try:
+        combined = SpecifierSet(",".join(spec for spec in specs if spec))
+    except InvalidSpecifier:
+        return True
+    candidates = set()
+    for spec in combined:
+        raw = spec.version.removesuffix(".*")
+        try:
+            candidates.add(Version(raw))
+        except InvalidVersion:
+            continue
+    return any(combined.contains(candidate) for candidate in candidates)
+
+
+def specifiers_compatible(*specs: str) -> bool:
+    """
+    Check whether some version satisfies every specifier.
+
+    Unparseable specifiers are treated as compatible, leaving the final
+    word to the external resolver.
+    """
+    combined = ANY_VERSION
+    for spec in specs:
+        if not spec:
+            continue
+        try:
+            combined = combined.intersect(parse_specifier(spec))
+        except InvalidVersion:
+            logger.debug(f"Cannot analyze specifier: {spec}")
+            return True
+        if combined.is_empty():
+            return _satisfied_at_boundaries(list(specs))
+    return True
+
+
+def target_environment(python_version: str | None = None) -> dict[str, str]:
+    """Marker environment for the current platform and a target Python."""
+    from packaging.markers import default_environment
+
+    env = dict(default_environment())
+    if python_version:
+        parts = python_version.split(".")
+        env["python_version"] = ".".join(parts[:2])
+        env["python_full_version"] = (
+            python_version if len(parts) >= 3 else f"{python_version}.0"
+        )
+    return env
+
+
+def _marker_applies(marker: Marker | None, environment: dict[str, str]) -> bool:
+    if marker is None:
+        return True
+    try:
+        return marker.evaluate({"extra": "", **environment})
+    except (InvalidMarker, UndefinedEnvironmentName):
+        return True
+
+
+def find_conflicts(
+    requirements: dict[str, list[str]] | list[str],
+    python_version: str | None = None,
+    environment: dict[str, str] | None = None,
+) -> list[SpecifierConflict]:
+    """
+    Detect unsatisfiable packages across all sources in one pass.
+
+    Args:
+        requirements: Requirement strings, optionally grouped by source
+            (e.g. repository) so conflicts can name where each came from
+        python_version: Target Python version for marker evaluation
+        environment: Full marker environment (overrides python_version)
+
+    Returns:
+        One SpecifierConflict per package with an empty intersection
+    """
+    if isinstance(requirements, list):
+        requirements = {"": requirements}
+    env = environment or target_environment(python_version)
+
+    combined: dict[str, VersionSet] = {}
+    contributors: dict[str, list[tuple[str, str]]] = {}
+    specifiers: dict[str, list[str]] = {}
+    conflicted: set[str] = set()
+
+    for source, reqs in requirements.items():
+        for line in reqs:
+            try:
+                req = Requirement(line)
+                spec_set = parse_specifier(str(req.specifier))
+            except (InvalidRequirement, InvalidVersion):
+                logger.debug(f"Skipping unparseable requirement: {line}")
+                continue
+            if not _marker_applies(req.marker, env):
+                continue
+
+            name = canonicalize_name(req.name)
+            contributors.setdefault(name, []).append((source, line))
+            specifiers.setdefault(name, []).append(str(req.specifier))
+            if name in conflicted:
+                continue
+            merged = combined.get(name, ANY_VERSION).intersect(spec_set)
+            combined[name] = merged
+            if merged.is_empty():
+                conflicted.add(name)
+
+    conflicted = {
+        name
+        for name in conflicted
+        if not _satisfied_at_boundaries(specifiers[name])
+    }
+    env_summary = {
+        k: env[k] for k in ("python_version", "sys_platform") if k in env
+    }
+    return [
+        SpecifierConflict(name, contributors[name], env_summary)
+        for name in sorted(conflicted)
+    ]
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from src.analysis.dependency_analyzer import DependencyAnalyzer, DependencyGraph
 from src.resolution.python_resolver import PythonResolver, ResolvedPackage
+from src.resolution.specifiers import find_conflicts
 
 logger = logging.getLogger(__name__)
 
@@ -95,12 +96,14 @@ class UnifiedResolver:
         result = UnifiedResolutionResult(success=False)
         all_requirements: list[str] = []
         seen_packages: dict[str, list[str]] = {}  # package -> versions
+        requirements_by_source: dict[str, list[str]] = {}
 
         # Analyze each repository
         for repo_url in repository_urls:
             try:
                 deps = await self._extract_dependencies(repo_url)
                 result.repository_deps[repo_url] = len(deps)
+                requirements_by_source[repo_url] = deps
 
                 for dep in deps:
                     name = dep.lower().replace("_", "-")
@@ -127,11 +130,15 @@ class UnifiedResolver:
         # Add additional constraints
         if additional_constraints:
             all_requirements.extend(additional_constraints)
+            requirements_by_source["constraints"] = additional_constraints
 
-        # Detect potential conflicts before resolution
-        conflicts = await self.python_resolver.check_conflicts(all_requirements)
+        # Detect conflicts across every repository in one in-process pass;
+        # a guaranteed conflict short-circuits the external resolver
+        conflicts = find_conflicts(requirements_by_source, python_version=python_version)
         if conflicts:
-            result.warnings.extend(conflicts)
+            result.warnings.extend(c.describe() for c in conflicts)
+            result.resolution_time_ms = int((time.time() - start_time) * 1000)
+            return result
 
         # Resolve dependencies
         if all_requirements:
@@ -612,6 +612,7 @@ class SynthesizerTUI:
 
         try:
             from src.llm import LMStudioClient
+            from src.llm.scheduler import RequestLane, request_lane
 
             client = LMStudioClient()
 
@@ -630,10 +631,11 @@ class SynthesizerTUI:
                 ) as progress:
                     task = progress.add_task("Thinking...", total=None)
 
-                    response = await client.complete(
-                        user_input,
-                        system_prompt="You are a helpful AI assistant for the AI Project Synthesizer.",
-                    )
+                    with request_lane(RequestLane.INTERACTIVE):
+                        response = await client.complete(
+                            user_input,
+                            system_prompt="You are a helpful AI assistant for the AI Project Synthesizer.",
+                        )
 
                     progress.remove_task(task)
 
@@ -0,0 +1,718 @@
+"""
+AI Project Synthesizer - Quota Broker
+
+Token buckets for platform API quotas, shared by every process on the host.
+
+``RateLimiter`` keeps its bucket in process memory, so each client instance,
+MCP server, dashboard worker and CLI run believes it owns the whole quota.
+The broker keeps one bucket per quota key (e.g. one per GitHub token) in a
+shared backend and takes tokens atomically:
+
+- SQLite (default ``data/quota.db``, or ``QUOTA_DB_PATH``): ``BEGIN
+  IMMEDIATE`` transactions serialize takes across processes; they run in a
+  worker thread so a busy lock never stalls the event loop
+- Redis (optional, ``QUOTA_REDIS_URL``): optimistic WATCH/MULTI transactions
+
+Buckets are seeded from the platform's own ``X-RateLimit-*`` headers, so a
+quota already spent by another tool is respected. Priority classes reserve
+headroom: background work stops while the bucket or the server-reported
+remaining quota is below its reserve, leaving the rest for interactive
+requests. Usage is recorded per consumer.
+
+Usage:
+    limiter = get_quota_broker().limiter(
+        "github:abc123", requests_per_hour=5000, burst_size=30, consumer="github"
+    )
+    await limiter.acquire()
+    response = await client.get(url)
+    await limiter.update_from_headers(response.headers)
+
+    with quota_priority(QuotaPriority.BACKGROUND):
+        await research()  # every acquire inside waits behind interactive work
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis_asyncio
+    from redis.exceptions import WatchError
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    WatchError = None
+    REDIS_AVAILABLE = False
+
+
+class QuotaPriority(IntEnum):
+    """Priority classes, most urgent first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+# Fraction of the bucket (and of the server-reported limit) each class
+# must leave untouched
+PRIORITY_RESERVE = {
+    QuotaPriority.INTERACTIVE: 0.0,
+    QuotaPriority.NORMAL: 0.1,
+    QuotaPriority.BACKGROUND: 0.3,
+}
+
+# Longest single sleep in acquire(); the bucket is re-read afterwards because
+# another process may have refreshed it from headers
+MAX_WAIT_SLICE = 60.0
+
+_priority: contextvars.ContextVar[QuotaPriority] = contextvars.ContextVar(
+    "quota_priority", default=QuotaPriority.NORMAL
+)
+
+
+@contextlib.contextmanager
+def quota_priority(priority: QuotaPriority) -> Iterator[None]:
+    """Run a block (and tasks it creates) at the given quota priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_quota_priority() -> QuotaPriority:
+    """Priority used by acquire() calls that do not pass one."""
+    return _priority.get()
+
+
+def quota_key(platform: str, token: str | None) -> str:
+    """Bucket key for a platform credential; the token itself is not stored."""
+    if not token:
+        return f"{platform}:anonymous"
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    return f"{platform}:{digest}"
+
+
+def parse_rate_limit_headers(
+    headers: Any, now: float | None = None
+) -> tuple[int, int, float] | None:
+    """
+    Read ``(limit, remaining, reset_at)`` from response headers.
+
+    Understands GitHub-style ``X-RateLimit-*`` headers (reset as epoch
+    seconds) and the IETF draft ``RateLimit-*`` headers (reset as seconds
+    from now). Returns None when the headers are missing or malformed.
+    """
+    now = time.time() if now is None else now
+    try:
+        lowered = {str(k).lower(): str(v) for k, v in headers.items()}
+    except (AttributeError, TypeError):
+        return None
+
+    for prefix in ("x-ratelimit-", "ratelimit-"):
+        try:
+            limit = int(lowered[prefix + "limit"])
+            remaining = int(lowered[prefix + "remaining"])
+            reset = float(lowered[prefix + "reset"])
+        except (KeyError, ValueError):
+            continue
+        # Epoch timestamps are far larger than any window length
+        reset_at = reset if reset > 1e9 else now + reset
+        return limit, max(0, remaining), reset_at
+    return None
+
+
+@dataclass
+class BucketState:
+    """
+    One shared bucket.
+
+    ``tokens`` refills at ``rate`` per second up to ``capacity``. When the
+    platform has reported its quota, ``remaining`` counts down until
+    ``reset_at``; after that the local bucket alone applies until fresh
+    headers arrive.
+    """
+
+    capacity: float
+    rate: float
+    tokens: float
+    updated_at: float
+    remaining: int | None = None
+    limit: int | None = None
+    reset_at: float | None = None
+
+    def refill(self, now: float) -> None:
+        if now > self.updated_at:
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+        if self.reset_at is not None and now >= self.reset_at:
+            self.remaining = self.limit = self.reset_at = None
+
+    def take(self, tokens: int, priority: QuotaPriority, now: float) -> float:
+        """Take ``tokens`` if allowed; returns 0 or the seconds to wait."""
+        self.refill(now)
+        reserve = PRIORITY_RESERVE[priority]
+
+        floor = min(reserve * self.capacity, max(self.capacity - tokens, 0))
+        wait = 0.0
+        if self.tokens - tokens < floor:
+            wait = (floor + tokens - self.tokens) / self.rate
+
+        if self.remaining is not None:
+            server_floor = min(
+                reserve * (self.limit or 0), max((self.limit or 0) - tokens, 0)
+            )
+            if self.remaining - tokens < server_floor:
+                wait = max(wait, self.reset_at - now)
+
+        if wait > 0:
+            return wait
+        self.tokens -= tokens
+        if self.remaining is not None:
+            self.remaining -= tokens
+        return 0.0
+
+    def apply_headers(self, limit: int, remaining: int, reset_at: float) -> None:
+        """Adopt the server's view of the quota."""
+        if self.remaining is not None and self.reset_at == reset_at:
+            # Same window: responses can arrive out of order, so the lowest
+            # count is the freshest
+            remaining = min(remaining, self.remaining)
+        self.limit, self.remaining, self.reset_at = limit, remaining, reset_at
+        self.tokens = min(self.tokens, float(remaining))
+
+
+class SQLiteQuotaBackend:
+    """Buckets in a SQLite file shared by all local processes."""
+
+    def __init__(self, db_path: Path | None = None):
+        self._db_path = db_path or Path(
+            os.environ.get("QUOTA_DB_PATH", "data/quota.db")
+        )
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._db_path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS quota_buckets (
+                    key TEXT PRIMARY KEY,
+                    capacity REAL NOT NULL,
+                    rate REAL NOT NULL,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    remaining INTEGER,
+                    quota_limit INTEGER,
+                    reset_at REAL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS quota_usage (
+                    key TEXT NOT NULL,
+                    consumer TEXT NOT NULL,
+                    granted INTEGER DEFAULT 0,
+                    throttled INTEGER DEFAULT 0,
+                    wait_seconds REAL DEFAULT 0,
+                    last_used REAL,
+                    PRIMARY KEY (key, consumer)
+                )
+            """)
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent
+        # read-modify-write cycles from other processes cannot interleave
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _load(
+        self, conn: sqlite3.Connection, key: str, capacity: float, rate: float
+    ) -> BucketState:
+        row = conn.execute(
+            "SELECT tokens, updated_at, remaining, quota_limit, reset_at "
+            "FROM quota_buckets WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return BucketState(capacity, rate, capacity, time.time())
+        # The latest configuration wins; tokens carry over
+        return BucketState(capacity, rate, min(row[0], capacity), *row[1:])
+
+    def _save(self, conn: sqlite3.Connection, key: str, state: BucketState) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO quota_buckets VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                state.capacity,
+                state.rate,
+                state.tokens,
+                state.updated_at,
+                state.remaining,
+                state.limit,
+                state.reset_at,
+            ),
+        )
+
+    async def take(
+        self,
+        key: str,
+        consumer: str,
+        tokens: int,
+        priority: QuotaPriority,
+        capacity: float,
+        rate: float,
+        waited: float,
+    ) -> float:
+        return await asyncio.to_thread(
+            self._take, key, consumer, tokens, priority, capacity, rate, waited
+        )
+
+    def _take(
+        self,
+        key: str,
+        consumer: str,
+        tokens: int,
+        priority: QuotaPriority,
+        capacity: float,
+        rate: float,
+        waited: float,
+    ) -> float:
+        now = time.time()
+        with self._transaction() as conn:
+            state = self._load(conn, key, capacity, rate)
+            wait = state.take(tokens, priority, now)
+            self._save(conn, key, state)
+            if wait == 0:
+                conn.execute(
+                    "INSERT INTO quota_usage VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key, consumer) DO UPDATE SET "
+                    "granted = granted + excluded.granted, "
+                    "throttled = throttled + excluded.throttled, "
+                    "wait_seconds = wait_seconds + excluded.wait_seconds, "
+                    "last_used = excluded.last_used",
+                    (key, consumer, tokens, int(waited > 0), waited, now),
+                )
+        return wait
+
+    async def update(
+        self,
+        key: str,
+        limit: int,
+        remaining: int,
+        reset_at: float,
+        capacity: float,
+        rate: float,
+    ) -> None:
+        await asyncio.to_thread(
+            self._update, key, limit, remaining, reset_at, capacity, rate
+        )
+
+    def _update(
+        self,
+        key: str,
+        limit: int,
+        remaining: int,
+        reset_at: float,
+        capacity: float,
+        rate: float,
+    ) -> None:
+        with self._transaction() as conn:
+            state = self._load(conn, key, capacity, rate)
+            state.refill(time.time())
+            state.apply_headers(limit, remaining, reset_at)
+            self._save(conn, key, state)
+
+    async def get_bucket(self, key: str) -> BucketState | None:
+        # The lock may be held by a transaction waiting on another process
+        row = await asyncio.to_thread(self._fetch_bucket, key)
+        if row is None:
+            return None
+        state = BucketState(*row)
+        state.refill(time.time())
+        return state
+
+    def _fetch_bucket(self, key: str) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT capacity, rate, tokens, updated_at, remaining, "
+                "quota_limit, reset_at FROM quota_buckets WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+    async def get_usage(self, key: str | None = None) -> list[dict[str, Any]]:
+        rows = await asyncio.to_thread(self._fetch_usage, key)
+        return [
+            {
+                "key": row[0],
+                "consumer": row[1],
+                "granted": row[2],
+                "throttled": row[3],
+                "wait_seconds": row[4],
+                "last_used": row[5],
+            }
+            for row in rows
+        ]
+
+    def _fetch_usage(self, key: str | None) -> list[tuple]:
+        query = (
+            "SELECT key, consumer, granted, throttled, wait_seconds, last_used "
+            "FROM quota_usage"
+        )
+        params: tuple = ()
+        if key is not None:
+            query += " WHERE key = ?"
+            params = (key,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY key, consumer", params)
+            return rows.fetchall()
+
+    async def reset(self, key: str | None = None) -> None:
+        await asyncio.to_thread(self._reset, key)
+
+    def _reset(self, key: str | None) -> None:
+        with self._transaction() as conn:
+            if key is None:
+                conn.execute("DELETE FROM quota_buckets")
+                conn.execute("DELETE FROM quota_usage")
+            else:
+                conn.execute("DELETE FROM quota_buckets WHERE key = ?", (key,))
+                conn.execute("DELETE FROM quota_usage WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisQuotaBackend:
+    """Buckets in Redis, shared across hosts."""
+
+    _FIELDS = (
+        "capacity",
+        "rate",
+        "tokens",
+        "updated_at",
+        "remaining",
+        "limit",
+        "reset_at",
+    )
+
+    def __init__(self, url: str = "redis://localhost:6379", prefix: str = "quota:"):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("Redis not installed. Run: pip install redis")
+        self._client = redis_asyncio.from_url(url, decode_responses=True)
+        self._prefix = prefix
+
+    def _bucket_key(self, key: str) -> str:
+        return f"{self._prefix}bucket:{key}"
+
+    def _usage_key(self, key: str) -> str:
+        return f"{self._prefix}usage:{key}"
+
+    def _decode(self, raw: dict, capacity: float, rate: float) -> BucketState:
+        if not raw:
+            return BucketState(capacity, rate, capacity, time.time())
+
+        def number(name, cast):
+            value = raw.get(name, "")
+            return cast(value) if value != "" else None
+
+        return BucketState(
+            capacity,
+            rate,
+            min(float(raw["tokens"]), capacity),
+            float(raw["updated_at"]),
+            number("remaining", int),
+            number("limit", int),
+            number("reset_at", float),
+        )
+
+    def _encode(self, state: BucketState) -> dict[str, str]:
+        return {
+            name: "" if getattr(state, name) is None else str(getattr(state, name))
+            for name in self._FIELDS
+        }
+
+    async def _modify(self, key: str, capacity: float, rate: float, change) -> Any:
+        """Apply ``change(state)`` atomically, retrying on concurrent writes."""
+        bucket_key = self._bucket_key(key)
+        async with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(bucket_key)
+                    state = self._decode(await pipe.hgetall(bucket_key), capacity, rate)
+                    result = change(state)
+                    pipe.multi()
+                    pipe.hset(bucket_key, mapping=self._encode(state))
+                    await pipe.execute()
+                    return result
+                except WatchError:
+                    continue
+
+    async def take(
+        self,
+        key: str,
+        consumer: str,
+        tokens: int,
+        priority: QuotaPriority,
+        capacity: float,
+        rate: float,
+        waited: float,
+    ) -> float:
+        now = time.time()
+        wait = await self._modify(
+            key, capacity, rate, lambda state: state.take(tokens, priority, now)
+        )
+        if wait == 0:
+            usage_key = self._usage_key(key)
+            pipe = self._client.pipeline(transaction=False)
+            pipe.hincrby(usage_key, f"{consumer}|granted", tokens)
+            pipe.hincrby(usage_key, f"{consumer}|throttled", int(waited > 0))
+            pipe.hincrbyfloat(usage_key, f"{consumer}|wait_seconds", waited)
+            pipe.hset(usage_key, f"{consumer}|last_used", now)
+            await pipe.execute()
+        return wait
+
+    async def update(
+        self,
+        key: str,
+        limit: int,
+        remaining: int,
+        reset_at: float,
+        capacity: float,
+        rate: float,
+    ) -> None:
+        def change(state: BucketState) -> None:
+            state.refill(time.time())
+            state.apply_headers(limit, remaining, reset_at)
+
+        await self._modify(key, capacity, rate, change)
+
+    async def get_bucket(self, key: str) -> BucketState | None:
+        raw = await self._client.hgetall(self._bucket_key(key))
+        if not raw:
+            return None
+        state = self._decode(raw, float(raw["capacity"]), float(raw["rate"]))
+        state.refill(time.time())
+        return state
+
+    async def get_usage(self, key: str | None = None) -> list[dict[str, Any]]:
+        if key is not None:
+            usage_keys = [self._usage_key(key)]
+        else:
+            usage_keys = sorted(
+                [k async for k in self._client.scan_iter(self._usage_key("*"))]
+            )
+
+        usage = []
+        for usage_key in usage_keys:
+            consumers: dict[str, dict[str, Any]] = {}
+            for field, value in (await self._client.hgetall(usage_key)).items():
+                consumer, metric = field.rsplit("|", 1)
+                consumers.setdefault(consumer, {})[metric] = value
+            bucket = usage_key[len(self._usage_key("")) :]
+            for consumer, metrics in sorted(consumers.items()):
+                usage.append(
+                    {
+                        "key": bucket,
+                        "consumer": consumer,
+                        "granted": int(metrics.get("granted", 0)),
+                        "throttled": int(metrics.get("throttled", 0)),
+                        "wait_seconds": float(metrics.get("wait_seconds", 0)),
+                        "last_used": float(metrics.get("last_used", 0)),
+                    }
+                )
+        return usage
+
+    async def reset(self, key: str | None = None) -> None:
+        if key is None:
+            keys = [k async for k in self._client.scan_iter(f"{self._prefix}*")]
+        else:
+            keys = [self._bucket_key(key), self._usage_key(key)]
+        if keys:
+            await self._client.delete(*keys)
+
+    def close(self) -> None:
+        pass
+
+
+class QuotaBroker:
+    """
+    Hands out API quota from shared buckets.
+
+    Example:
+        broker = get_quota_broker()
+        await broker.acquire("github:abc", capacity=30, requests_per_hour=5000)
+        await broker.update_from_headers("github:abc", response.headers)
+    """
+
+    def __init__(self, backend: SQLiteQuotaBackend | RedisQuotaBackend | None = None):
+        self.backend = backend or SQLiteQuotaBackend()
+        # Bucket shape per key, needed to create or refill it
+        self._shapes: dict[str, tuple[float, float]] = {}
+
+    def configure(self, key: str, capacity: float, requests_per_hour: float) -> None:
+        """Set the burst size and sustained rate for a bucket."""
+        capacity = float(min(capacity, requests_per_hour))
+        self._shapes[key] = (capacity, requests_per_hour / 3600)
+
+    def _shape(self, key: str) -> tuple[float, float]:
+        if key not in self._shapes:
+            raise KeyError(f"Quota bucket not configured: {key}")
+        return self._shapes[key]
+
+    async def acquire(
+        self,
+        key: str,
+        consumer: str = "default",
+        tokens: int = 1,
+        priority: QuotaPriority | None = None,
+    ) -> float:
+        """
+        Take tokens from a bucket, waiting as long as needed.
+
+        Args:
+            key: Configured bucket key
+            consumer: Name recorded in the usage metrics
+            tokens: Tokens to take
+            priority: Defaults to the priority of the current context
+
+        Returns:
+            Time waited in seconds
+        """
+        priority = current_quota_priority() if priority is None else priority
+        capacity, rate = self._shape(key)
+        waited = 0.0
+        while True:
+            wait = await self.backend.take(
+                key, consumer, tokens, priority, capacity, rate, waited
+            )
+            if wait == 0:
+                return waited
+            sleep_time = min(wait, MAX_WAIT_SLICE)
+            logger.debug(
+                f"Quota {key} throttling {consumer} "
+                f"({priority.name.lower()}) for {sleep_time:.2f}s"
+            )
+            await asyncio.sleep(sleep_time)
+            waited += sleep_time
+
+    async def update_from_headers(self, key: str, headers: Any) -> bool:
+        """Seed a bucket from rate-limit response headers; False if none."""
+        parsed = parse_rate_limit_headers(headers)
+        if parsed is None:
+            return False
+        capacity, rate = self._shape(key)
+        await self.backend.update(key, *parsed, capacity, rate)
+        return True
+
+    async def get_bucket(self, key: str) -> BucketState | None:
+        """Current shared state of a bucket."""
+        return await self.backend.get_bucket(key)
+
+    async def get_usage(self, key: str | None = None) -> list[dict[str, Any]]:
+        """Granted tokens, throttled acquires and wait time per consumer."""
+        return await self.backend.get_usage(key)
+
+    async def reset(self, key: str | None = None) -> None:
+        """Forget bucket state and usage for one key or all keys."""
+        await self.backend.reset(key)
+
+    def limiter(
+        self,
+        key: str,
+        requests_per_hour: int,
+        burst_size: int,
+        consumer: str = "default",
+    ) -> "QuotaLimiter":
+        """A RateLimiter-compatible handle on one shared bucket."""
+        self.configure(key, burst_size, requests_per_hour)
+        return QuotaLimiter(self, key, consumer)
+
+
+class QuotaLimiter:
+    """
+    Drop-in for ``RateLimiter.acquire`` backed by a shared bucket.
+
+    Also keeps local statistics in the same shape as ``RateLimiter``.
+    """
+
+    def __init__(self, broker: QuotaBroker, key: str, consumer: str):
+        self.broker = broker
+        self.key = key
+        self.consumer = consumer
+        self._requests_made = 0
+        self._wait_time_total = 0.0
+
+    async def acquire(
+        self, tokens: int = 1, priority: QuotaPriority | None = None
+    ) -> float:
+        """Acquire tokens, waiting if necessary; returns time waited."""
+        waited = await self.broker.acquire(self.key, self.consumer, tokens, priority)
+        self._requests_made += 1
+        self._wait_time_total += waited
+        return waited
+
+    async def update_from_headers(self, headers: Any) -> bool:
+        """Feed rate-limit headers from a response back into the bucket."""
+        try:
+            return await self.broker.update_from_headers(self.key, headers)
+        except Exception as e:
+            # Quota bookkeeping must never fail the request it follows
+            logger.warning(f"Could not record quota headers for {self.key}: {e}")
+            return False
+
+    def get_stats(self) -> dict:
+        """Get limiter statistics for this process."""
+        return {
+            "key": self.key,
+            "consumer": self.consumer,
+            "requests_made": self._requests_made,
+            "total_wait_time": self._wait_time_total,
+        }
+
+
+_quota_broker: QuotaBroker | None = None
+
+
+def get_quota_broker() -> QuotaBroker:
+    """
+    Get the global quota broker (Redis if QUOTA_REDIS_URL is set, else
+    SQLite at QUOTA_DB_PATH).
+    """
+    global _quota_broker
+    if _quota_broker is None:
+        redis_url = os.environ.get("QUOTA_REDIS_URL")
+        if redis_url and REDIS_AVAILABLE:
+            _quota_broker = QuotaBroker(RedisQuotaBackend(redis_url))
+        else:
+            if redis_url:
+                logger.warning("QUOTA_REDIS_URL set but redis is not installed")
+            _quota_broker = QuotaBroker()
+    return _quota_broker
@@ -8,18 +8,20 @@ Provides project context for prompt enhancement:
 - Current working directory context
 - Git status and recent changes
 
-Integrates with Mem0 to learn from project history.
+Integrates with Mem0 to learn from project history. Gathered context is
+packed into a token budget per prompt (see context_packer).
 """
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from src.core.config import get_settings
 from src.memory.mem0_integration import MemorySystem
+from src.vibe.context_packer import ContextPacker, ContextSnippet, budget_for_model
 
 
 @dataclass
@@ -35,6 +37,7 @@ class ProjectContext:
     recent_changes: list[str]
     environment: dict[str, Any]
     git_status: dict[str, Any] | None = None
+    packing: dict[str, Any] | None = None  # Token budget report
 
 
 class ContextInjector:
@@ -47,11 +50,16 @@ class ContextInjector:
     - History tracking via Mem0
     - Git integration
     - Environment awareness
+    - Token-budgeted packing of the gathered context
     """
 
+    # Candidate components gathered before packing picks the relevant ones
+    MAX_COMPONENTS = 100
+
     def __init__(self):
         self.config = get_settings()
         self.memory = MemorySystem()
+        self.packer = ContextPacker()
 
         # Cache for context
         self._cache = {}
@@ -78,7 +86,11 @@ class ContextInjector:
         }
 
     async def get_context(
-        self, prompt: str, project_context: dict[str, Any] | None = None
+        self,
+        prompt: str,
+        project_context: dict[str, Any] | None = None,
+        model: str | None = None,
+        token_budget: int | None = None,
     ) -> ProjectContext:
         """
         Get comprehensive project context.
@@ -86,24 +98,68 @@ class ContextInjector:
         Args:
             prompt: The user prompt (used to determine relevant context)
             project_context: Optional pre-defined context
+            model: Model the prompt is for, to size the token budget
+            token_budget: Explicit budget for the packed lists (overrides
+                ``model``)
 
         Returns:
-            ProjectContext with all relevant information
+            ProjectContext packed for this prompt, with a ``packing`` report
         """
         # Check cache first
         cache_key = self._get_cache_key()
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            if datetime.now() - cached["timestamp"] < self._cache_ttl:
-                return cached["context"]
-
-        # Build context
-        context = await self._build_context(prompt, project_context)
-
-        # Cache result
-        self._cache[cache_key] = {"context": context, "timestamp": datetime.now()}
+        cached = self._cache.get(cache_key)
+        if cached and datetime.now() - cached["timestamp"] < self._cache_ttl:
+            context = cached["context"]
+        else:
+            # Build context
+            context = await self._build_context(prompt, project_context)
+
+            # Cache the unpacked result; packing depends on the prompt
+            self._cache[cache_key] = {"context": context, "timestamp": datetime.now()}
+
+        budget = token_budget if token_budget is not None else budget_for_model(model)
+        return self.pack_context(context, prompt, budget)
+
+    def context_snippets(self, context: ProjectContext) -> list[ContextSnippet]:
+        """Candidate snippets for the variable-length parts of ``context``."""
+        snippets = [
+            ContextSnippet("state", context.current_state, priority=1.0, pinned=True)
+        ]
+        snippets += [
+            ContextSnippet("decisions", d, priority=0.7) for d in context.past_decisions
+        ]
+        if context.git_status:
+            git = context.git_status
+            snippets.append(
+                ContextSnippet(
+                    "git",
+                    f"Branch {git.get('branch')}, "
+                    f"{git.get('changed_files', 0)} uncommitted files",
+                    priority=0.5,
+                )
+            )
+        snippets += [
+            ContextSnippet("components", c, priority=0.4) for c in context.components
+        ]
+        snippets += [
+            ContextSnippet("changes", c, priority=0.3) for c in context.recent_changes
+        ]
+        return snippets
 
-        return context
+    def pack_context(
+        self, context: ProjectContext, prompt: str, budget: int
+    ) -> ProjectContext:
+        """Keep the context snippets most relevant to ``prompt`` within budget."""
+        result = self.packer.pack(prompt, self.context_snippets(context), budget)
+        return replace(
+            context,
+            current_state="; ".join(result.texts("state")) or context.current_state,
+            components=result.texts("components"),
+            past_decisions=result.texts("decisions"),
+            recent_changes=result.texts("changes"),
+            git_status=context.git_status if result.texts("git") else None,
+            packing=result.to_dict(),
+        )
 
     async def _build_context(
         self, prompt: str, project_context: dict[str, Any] | None
@@ -304,7 +360,7 @@ class ContextInjector:
                             pass
 
         # Limit number and prioritize
-        if len(components) > 20:
+        if len(components) > self.MAX_COMPONENTS:
             # Prioritize based on location and name
             components = sorted(
                 components,
@@ -314,7 +370,7 @@ class ContextInjector:
                     0 if "app" in x else 1,
                     x,
                 ),
-            )[:20]
+            )[: self.MAX_COMPONENTS]
 
         return components
 
@@ -0,0 +1,300 @@
+"""
+Context Packer for VIBE MCP
+
+Fits prompt context into a token budget instead of pasting everything in:
+
+1. Token counting with tiktoken when its encoding is available, otherwise a
+   calibrated estimator (word pieces, scaled against reference counts)
+2. Relevance ranking of candidate snippets against the prompt (BM25 over
+   identifier-split text, blended with a per-snippet priority)
+3. Dedupe of exact and overlapping snippets
+4. Greedy packing, best score first, within a per-model budget; pinned
+   snippets go first and are truncated rather than dropped when too long
+
+Every pack reports the tokens it saved against sending all candidates.
+
+Usage:
+    packer = ContextPacker()
+    snippets = [ContextSnippet("components", "src.api.auth", priority=0.5)]
+    result = packer.pack("Add OAuth to the auth API", snippets, budget=800)
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from src.memory.search_index import BM25Index, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Word pieces for the estimator: letter runs, digit runs, single symbols
+_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+# Word ends for truncating estimated text
+_WORD_RE = re.compile(r"\S+")
+
+# Identifier separators, so "context_injector" also matches "context"
+_SPLIT_RE = re.compile(r"[._/\\:-]+")
+
+# Budget bounds when derived from a model's context window
+DEFAULT_BUDGET = 1500
+MIN_BUDGET = 256
+MAX_BUDGET = 4000
+BUDGET_FRACTION = 0.1
+
+
+class TokenEstimator:
+    """
+    Token counts for budgeting.
+
+    Uses tiktoken's ``cl100k_base`` encoding when it can be loaded. The
+    fallback estimate counts letter runs as one token per six characters,
+    digit runs per three and each symbol as one, then applies ``scale``,
+    which ``calibrate`` fits against known token counts.
+    """
+
+    def __init__(self, use_tiktoken: bool = True, scale: float = 1.0):
+        self.scale = scale
+        self._encoding = None
+        if use_tiktoken:
+            try:
+                import tiktoken
+
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                logger.debug(f"tiktoken unavailable, estimating tokens: {e}")
+
+    @property
+    def exact(self) -> bool:
+        return self._encoding is not None
+
+    def _estimate(self, text: str) -> float:
+        total = 0
+        for piece in _PIECE_RE.findall(text):
+            if piece[0].isalpha():
+                total += 1 + (len(piece) - 1) // 6
+            elif piece[0].isdigit():
+                total += 1 + (len(piece) - 1) // 3
+            else:
+                total += 1
+        return total
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return max(1, round(self._estimate(text) * self.scale))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of ``text`` that counts at most ``max_tokens``."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            return self._encoding.decode(tokens[:max_tokens])
+        # Binary search over whole-word prefixes
+        ends = [match.end() for match in _WORD_RE.finditer(text)]
+        low, high = 0, len(ends)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.count(text[: ends[mid - 1]]) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[: ends[low - 1]] if low else ""
+
+    def calibrate(self, samples: list[tuple[str, int]]) -> float:
+        """Fit ``scale`` to ``(text, true token count)`` samples."""
+        estimated = sum(self._estimate(text) for text, _ in samples)
+        actual = sum(tokens for _, tokens in samples)
+        if estimated and actual:
+            self.scale = actual / estimated
+        return self.scale
+
+
+_estimator: TokenEstimator | None = None
+
+
+def get_token_estimator() -> TokenEstimator:
+    """Get the shared token estimator."""
+    global _estimator
+    if _estimator is None:
+        _estimator = TokenEstimator()
+    return _estimator
+
+
+def budget_for_model(model: str | None = None) -> int:
+    """
+    Context budget for ``model``: a tenth of its context window, within
+    [MIN_BUDGET, MAX_BUDGET]; DEFAULT_BUDGET for unknown models.
+    """
+    if not model:
+        return DEFAULT_BUDGET
+    try:
+        from src.llm.litellm_router import MODELS
+    except ImportError:
+        return DEFAULT_BUDGET
+    config = MODELS.get(model)
+    if config is None:
+        return DEFAULT_BUDGET
+    budget = int(config.context_window * BUDGET_FRACTION)
+    return max(MIN_BUDGET, min(MAX_BUDGET, budget))
+
+
+@dataclass
+class ContextSnippet:
+    """One candidate piece of prompt context."""
+
+    source: str  # e.g. "components", "decisions", "rules:security"
+    text: str
+    priority: float = 0.5  # Prior importance in [0, 1]
+    pinned: bool = False  # Packed first; truncated to fit, never dropped
+    tokens: int = 0
+    score: float = 0.0
+
+
+@dataclass
+class PackResult:
+    """Snippets chosen for a prompt and what packing saved."""
+
+    snippets: list[ContextSnippet]
+    budget: int
+    tokens_used: int
+    candidate_tokens: int
+    duplicates: int = 0
+    truncated: int = 0
+    dropped: list[ContextSnippet] = field(default_factory=list)
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.candidate_tokens - self.tokens_used
+
+    def texts(self, source: str) -> list[str]:
+        """Packed texts from ``source``, in their original order."""
+        return [s.text for s in self.snippets if s.source == source]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "budget": self.budget,
+            "tokens_used": self.tokens_used,
+            "candidate_tokens": self.candidate_tokens,
+            "tokens_saved": self.tokens_saved,
+            "snippets": len(self.snippets),
+            "dropped": len(self.dropped),
+            "duplicates": self.duplicates,
+            "truncated": self.truncated,
+        }
+
+
+class ContextPacker:
+    """
+    Ranks, dedupes and greedily packs context snippets into a budget.
+
+    ``relevance_weight`` blends prompt relevance (BM25, normalized to the
+    best match) with each snippet's own priority.
+    """
+
+    def __init__(
+        self,
+        estimator: TokenEstimator | None = None,
+        relevance_weight: float = 0.6,
+        overlap_threshold: float = 0.8,
+    ):
+        self.estimator = estimator or get_token_estimator()
+        self.relevance_weight = relevance_weight
+        self.overlap_threshold = overlap_threshold
+
+    def pack(
+        self,
+        prompt: str,
+        snippets: list[ContextSnippet],
+        budget: int,
+    ) -> PackResult:
+        """
+        Choose the snippets that best serve ``prompt`` within ``budget``.
+
+        A pinned snippet longer than the budget left is cut to fit; it is
+        dropped only when earlier pinned snippets used the whole budget.
+
+        Returns:
+            PackResult whose snippets keep their input order
+        """
+        for snippet in snippets:
+            snippet.tokens = self.estimator.count(snippet.text)
+        candidate_tokens = sum(s.tokens for s in snippets)
+
+        self._score(prompt, snippets)
+        unique, duplicates = self._dedupe(snippets)
+
+        chosen: set[int] = set()
+        used = 0
+        truncated = 0
+        ranked = sorted(
+            range(len(unique)),
+            key=lambda i: (not unique[i].pinned, -unique[i].score, i),
+        )
+        for i in ranked:
+            snippet = unique[i]
+            if snippet.pinned and used + snippet.tokens > budget:
+                text = self.estimator.truncate(snippet.text, budget - used)
+                if text:
+                    tokens = self.estimator.count(text)
+                    snippet = unique[i] = replace(snippet, text=text, tokens=tokens)
+                    truncated += 1
+            if used + snippet.tokens <= budget:
+                chosen.add(i)
+                used += snippet.tokens
+
+        return PackResult(
+            snippets=[s for i, s in enumerate(unique) if i in chosen],
+            budget=budget,
+            tokens_used=used,
+            candidate_tokens=candidate_tokens,
+            duplicates=len(duplicates),
+            truncated=truncated,
+            dropped=[s for i, s in enumerate(unique) if i not in chosen] + duplicates,
+        )
+
+    def _score(self, prompt: str, snippets: list[ContextSnippet]) -> None:
+        index = BM25Index()
+        for i, snippet in enumerate(snippets):
+            index.add(str(i), _SPLIT_RE.sub(" ", snippet.text))
+        query = _SPLIT_RE.sub(" ", prompt)
+        relevance = dict(index.search(query, limit=len(snippets)))
+        best = max(relevance.values(), default=0.0) or 1.0
+
+        weight = self.relevance_weight
+        for i, snippet in enumerate(snippets):
+            related = relevance.get(str(i), 0.0) / best
+            snippet.score = weight * related + (1 - weight) * snippet.priority
+
+    def _dedupe(
+        self, snippets: list[ContextSnippet]
+    ) -> tuple[list[ContextSnippet], list[ContextSnippet]]:
+        """Drop repeats and snippets mostly contained in a better one."""
+        kept: list[tuple[ContextSnippet, set[str], str]] = []
+        duplicates: list[ContextSnippet] = []
+        order = sorted(snippets, key=lambda s: (not s.pinned, -s.score, -s.tokens))
+        for snippet in order:
+            # Padded so containment only matches whole words
+            normalized = f" {' '.join(tokenize(snippet.text))} "
+            terms = set(normalized.split())
+            if any(
+                normalized in other_text or self._overlaps(terms, other_terms)
+                for _, other_terms, other_text in kept
+            ):
+                duplicates.append(snippet)
+                continue
+            kept.append((snippet, terms, normalized))
+
+        kept_ids = {id(snippet) for snippet, _, _ in kept}
+        return [s for s in snippets if id(s) in kept_ids], duplicates
+
+    def _overlaps(self, terms: set[str], other: set[str]) -> bool:
+        if not terms:
+            return True
+        return len(terms & other) / len(terms) >= self.overlap_threshold
@@ -7,6 +7,7 @@ Automatically structures user prompts into 3-layer format:
 3. Constraints Layer: Security rules, style guidelines, patterns
 
 Orchestrates RulesEngine and ContextInjector to create enhanced prompts.
+Context and constraints share a per-model token budget (see context_packer).
 """
 
 import json
@@ -19,6 +20,7 @@ from typing import Any
 from src.core.config import get_settings
 from src.memory.mem0_integration import MemorySystem
 from src.vibe.context_injector import ContextInjector
+from src.vibe.context_packer import ContextPacker, ContextSnippet, budget_for_model
 from src.vibe.rules_engine import RulesEngine
 
 
@@ -37,6 +39,7 @@ class PromptLayer:
     name: str
     content: str
     priority: int  # 1 = highest priority
+    packing: dict[str, Any] | None = None  # Token budget report
 
 
 @dataclass
@@ -60,18 +63,22 @@ class PromptEnhancer:
     - Context awareness
     - Complexity detection
     - Learning from successful prompts
+    - Per-model token budget shared by context and constraints
     """
 
+    # Share of the token budget reserved for constraints
+    CONSTRAINTS_SHARE = 0.4
+
     def __init__(self):
         self.config = get_settings()
         self.rules_engine = RulesEngine()
         self.context_injector = ContextInjector()
         self.memory = MemorySystem()
+        self.packer = ContextPacker()
 
-        # Enhancement configuration
-        self.enable_enhancement = self.config.get("prompt_enhancement", {}).get(
-            "enabled", True
-        )
+        # Enhancement configuration (Settings has no prompt_enhancement section)
+        enhancement = getattr(self.config, "prompt_enhancement", None) or {}
+        self.enable_enhancement = enhancement.get("enabled", True)
         self.min_complexity_for_enhancement = PromptComplexity.SIMPLE
 
         # Layer templates
@@ -112,6 +119,8 @@ Additional Constraints:
         user_prompt: str,
         project_context: dict[str, Any] | None = None,
         force_enhance: bool = False,
+        model: str | None = None,
+        token_budget: int | None = None,
     ) -> EnhancedPrompt:
         """
         Enhance a user prompt with context and constraints.
@@ -120,6 +129,9 @@ Additional Constraints:
             user_prompt: Original user prompt
             project_context: Project-specific context
             force_enhance: Force enhancement even for simple prompts
+            model: Model the prompt is for, to size the token budget
+            token_budget: Explicit budget for context plus constraints
+                (overrides ``model``)
 
         Returns:
             EnhancedPrompt with structured layers
@@ -140,11 +152,24 @@ Additional Constraints:
                 metadata={"enhanced": False},
             )
 
+        budget = token_budget if token_budget is not None else budget_for_model(model)
+
         # Build layers
         layers = []
 
+        # Layer 3: Constraints (priority 2), packed first so the context
+        # layer gets whatever budget the rules leave
+        constraints_layer = await self._build_constraints_layer(
+            user_prompt, project_context, int(budget * self.CONSTRAINTS_SHARE)
+        )
+        if constraints_layer.content.strip():
+            layers.append(constraints_layer)
+        used = constraints_layer.packing["tokens_used"]
+
         # Layer 1: Context (priority 3)
-        context_layer = await self._build_context_layer(user_prompt, project_context)
+        context_layer = await self._build_context_layer(
+            user_prompt, project_context, budget - used
+        )
         if context_layer.content.strip():
             layers.append(context_layer)
 
@@ -152,16 +177,11 @@ Additional Constraints:
         task_layer = self._build_task_layer(user_prompt)
         layers.append(task_layer)
 
-        # Layer 3: Constraints (priority 2)
-        constraints_layer = await self._build_constraints_layer(
-            user_prompt, project_context
-        )
-        if constraints_layer.content.strip():
-            layers.append(constraints_layer)
-
         # Sort by priority
         layers.sort(key=lambda x: x.priority)
 
+        packed = [constraints_layer.packing, context_layer.packing]
+
         # Create enhanced prompt
         enhanced = EnhancedPrompt(
             original=user_prompt,
@@ -172,6 +192,9 @@ Additional Constraints:
                 "layer_count": len(layers),
                 "project_context": bool(project_context),
                 "timestamp": self._get_timestamp(),
+                "token_budget": budget,
+                "context_tokens": sum(p["tokens_used"] for p in packed),
+                "tokens_saved": sum(p["tokens_saved"] for p in packed),
             },
         )
 
@@ -213,24 +236,32 @@ Additional Constraints:
         return PromptComplexity.MODERATE
 
     async def _build_context_layer(
-        self, prompt: str, _project_context: dict[str, Any] | None
+        self,
+        prompt: str,
+        _project_context: dict[str, Any] | None,
+        budget: int | None = None,
     ) -> PromptLayer:
         """Build the context layer of the enhanced prompt."""
-        # Get context from injector
-        context_data = await self.context_injector.get_context(prompt, _project_context)
+        # Get context from injector, packed for this prompt
+        context_data = await self.context_injector.get_context(
+            prompt, _project_context, token_budget=budget
+        )
 
         # Format using template
         content = self.layer_templates["context"].format(
-            project_name=context_data.get("project_name", "Unknown"),
-            tech_stack=", ".join(context_data.get("tech_stack", [])),
-            current_state=context_data.get("current_state", "Not specified"),
-            components="\n".join(f"- {c}" for c in context_data.get("components", [])),
-            decisions="\n".join(
-                f"- {d}" for d in context_data.get("past_decisions", [])[:3]
-            ),
+            project_name=context_data.project_name or "Unknown",
+            tech_stack=", ".join(context_data.tech_stack),
+            current_state=context_data.current_state or "Not specified",
+            components="\n".join(f"- {c}" for c in context_data.components),
+            decisions="\n".join(f"- {d}" for d in context_data.past_decisions),
         )
 
-        return PromptLayer(name="context", content=content.strip(), priority=3)
+        return PromptLayer(
+            name="context",
+            content=content.strip(),
+            priority=3,
+            packing=context_data.packing,
+        )
 
     def _build_task_layer(self, prompt: str) -> PromptLayer:
         """Build the task layer from user prompt."""
@@ -251,31 +282,55 @@ Additional Constraints:
         return PromptLayer(name="task", content=content.strip(), priority=1)
 
     async def _build_constraints_layer(
-        self, prompt: str, _project_context: dict[str, Any] | None
+        self,
+        prompt: str,
+        _project_context: dict[str, Any] | None,
+        budget: int | None = None,
     ) -> PromptLayer:
         """Build the constraints layer using rules engine."""
         # Get applicable rules
         rules = await self.rules_engine.get_applicable_rules(prompt, _project_context)
 
         # Categorize rules
-        security_rules = [r for r in rules if r.category == "security"]
-        style_rules = [r for r in rules if r.category == "style"]
-        code_patterns = [r for r in rules if r.category == "pattern"]
-        other_rules = [
-            r for r in rules if r.category not in ["security", "style", "pattern"]
-        ]
+        categories = {"security": 5, "style": 5, "pattern": 5}
+        snippets = []
+        for category, limit in categories.items():
+            matching = [r for r in rules if r.category.value == category]
+            snippets += [self._rule_snippet(category, r) for r in matching[:limit]]
+        other_rules = [r for r in rules if r.category.value not in categories]
+        snippets += [self._rule_snippet("other", r) for r in other_rules[:3]]
+
+        # Critical rules are pinned; the rest compete for the budget
+        result = self.packer.pack(
+            prompt, snippets, budget if budget is not None else budget_for_model()
+        )
+
+        def bullets(category: str) -> str:
+            return "\n".join(f"- {text}" for text in result.texts(category))
 
         # Format using template
         content = self.layer_templates["constraints"].format(
-            security_rules="\n".join(f"- {r.description}" for r in security_rules[:5]),
-            style_rules="\n".join(f"- {r.description}" for r in style_rules[:5]),
-            code_patterns="\n".join(f"- {r.description}" for r in code_patterns[:5]),
-            additional_constraints="\n".join(
-                f"- {r.description}" for r in other_rules[:3]
-            ),
+            security_rules=bullets("security"),
+            style_rules=bullets("style"),
+            code_patterns=bullets("pattern"),
+            additional_constraints=bullets("other"),
         )
 
-        return PromptLayer(name="constraints", content=content.strip(), priority=2)
+        return PromptLayer(
+            name="constraints",
+            content=content.strip(),
+            priority=2,
+            packing=result.to_dict(),
+        )
+
+    def _rule_snippet(self, category: str, rule: Any) -> ContextSnippet:
+        # RulePriority runs CRITICAL=1 .. LOW=4
+        return ContextSnippet(
+            category,
+            rule.description,
+            priority=(5 - rule.priority.value) / 4,
+            pinned=rule.priority.value == 1,
+        )
 
     def _extract_requirements(self, prompt: str) -> list[str]:
         """Extract explicit requirements from prompt."""
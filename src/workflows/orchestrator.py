@@ -10,6 +10,9 @@ Central orchestrator that coordinates:
 """
 
 import asyncio
+import hashlib
+import json
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -52,6 +55,7 @@ class WorkflowStep:
     parameters: dict[str, Any] = field(default_factory=dict)
     depends_on: list[str] = field(default_factory=list)
     timeout_seconds: int = 60
+    cacheable: bool = False  # Opt in only for side-effect-free steps
 
 
 @dataclass
@@ -76,6 +80,35 @@ class WorkflowResult:
     errors: list[str] = field(default_factory=list)
     duration_ms: float = 0
     steps_completed: int = 0
+    skipped_steps: list[str] = field(default_factory=list)
+    cached_steps: list[str] = field(default_factory=list)
+    step_durations_ms: dict[str, float] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_ms: float = 0
+
+
+@dataclass
+class _StepRun:
+    """Timing record for one executed (or memoized) step."""
+
+    started_at: float
+    finished_at: float
+    cached: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.finished_at - self.started_at) * 1000
+
+
+# Max concurrent steps per engine within a single workflow execution.
+# Engines missing from this mapping are unbounded.
+DEFAULT_ENGINE_LIMITS: dict[WorkflowEngine, int] = {
+    WorkflowEngine.LANGCHAIN: 4,
+    WorkflowEngine.PYDANTIC_AI: 4,
+    WorkflowEngine.N8N: 8,
+}
+
+_MISSING = object()
 
 
 class WorkflowOrchestrator:
@@ -101,12 +134,28 @@ class WorkflowOrchestrator:
         result = await orchestrator.execute(workflow_definition)
     """
 
-    def __init__(self):
-        """Initialize orchestrator."""
+    def __init__(
+        self,
+        engine_limits: dict[WorkflowEngine, int] | None = None,
+        step_cache_ttl_seconds: int = 86400,
+    ):
+        """
+        Initialize orchestrator.
+
+        Args:
+            engine_limits: Max concurrent steps per engine (defaults to
+                DEFAULT_ENGINE_LIMITS)
+            step_cache_ttl_seconds: TTL for persisted step results
+        """
         self._langchain = None
         self._n8n = None
         self._cache = get_cache()
         self._telemetry = get_telemetry()
+        self._engine_limits = dict(
+            DEFAULT_ENGINE_LIMITS if engine_limits is None else engine_limits
+        )
+        self._step_cache_ttl = step_cache_ttl_seconds
+        self._step_results: dict[str, Any] = {}
 
     async def _get_langchain(self):
         """Get LangChain orchestrator."""
@@ -367,57 +416,329 @@ class WorkflowOrchestrator:
     # Custom Workflow Execution
     # ============================================
 
-    async def execute(self, workflow: WorkflowDefinition) -> WorkflowResult:
+    async def execute(
+        self,
+        workflow: WorkflowDefinition,
+        fail_fast: bool = False,
+        use_cache: bool = True,
+    ) -> WorkflowResult:
         """
         Execute a custom workflow definition.
 
-        Supports mixed engines (LangChain, Pydantic AI, n8n).
+        Supports mixed engines (LangChain, Pydantic AI, n8n). Each step is
+        launched as soon as all of its dependencies have succeeded, subject
+        to the per-engine concurrency limits. When a step fails, every step
+        depending on it (transitively) is skipped; with ``fail_fast`` the
+        steps still running are cancelled as well.
+
+        Args:
+            workflow: Workflow definition to run
+            fail_fast: Cancel in-flight steps on the first failure
+            use_cache: Reuse memoized results of identical cacheable steps
+
+        Returns:
+            WorkflowResult with per-step timings and the critical path
         """
-        start_time = asyncio.get_event_loop().time()
-        results = {}
-        errors = []
-        steps_completed = 0
-
-        # Build dependency graph
-        pending = {step.name: step for step in workflow.steps}
-        completed = set()
-
-        while pending:
-            # Find steps with satisfied dependencies
-            ready = [
-                name
-                for name, step in pending.items()
-                if all(dep in completed for dep in step.depends_on)
-            ]
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        steps = {step.name: step for step in workflow.steps}
 
-            if not ready:
-                errors.append("Circular dependency detected")
-                break
+        errors = self._validate_workflow(workflow.steps)
+        if errors:
+            return WorkflowResult(
+                workflow_id=workflow.id,
+                success=False,
+                errors=errors,
+                skipped_steps=list(steps),
+            )
+
+        dependents: dict[str, list[str]] = defaultdict(list)
+        waiting_on: dict[str, int] = {}
+        for step in workflow.steps:
+            deps = set(step.depends_on)
+            waiting_on[step.name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(step.name)
+
+        semaphores = {
+            engine: asyncio.Semaphore(limit)
+            for engine, limit in self._engine_limits.items()
+            if limit > 0
+        }
+        results: dict[str, Any] = {}
+        runs: dict[str, _StepRun] = {}
+        failed: set[str] = set()
+        running: dict[asyncio.Task, str] = {}
+
+        def launch(name: str) -> None:
+            step = steps[name]
+            task = asyncio.create_task(
+                self._run_step(step, results, semaphores.get(step.engine), use_cache)
+            )
+            running[task] = name
 
-            # Execute ready steps in parallel
-            tasks = []
-            for name in ready:
-                step = pending.pop(name)
-                tasks.append(self._execute_step(step, results))
+        for name, count in waiting_on.items():
+            if count == 0:
+                launch(name)
 
-            step_results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = running.pop(task)
+                    try:
+                        result, run = task.result()
+                    except Exception as e:
+                        failed.add(name)
+                        errors.append(f"{name}: {e}")
+                        continue
 
-            for name, result in zip(ready, step_results, strict=False):
-                if isinstance(result, Exception):
-                    errors.append(f"{name}: {result}")
-                else:
                     results[name] = result
-                    completed.add(name)
-                    steps_completed += 1
+                    runs[name] = run
+                    for dependent in dependents[name]:
+                        waiting_on[dependent] -= 1
+                        if waiting_on[dependent] == 0:
+                            launch(dependent)
+
+                if failed and fail_fast and running:
+                    for task in running:
+                        task.cancel()
+                    await asyncio.gather(*running.keys(), return_exceptions=True)
+                    for name in running.values():
+                        failed.add(name)
+                        errors.append(f"{name}: cancelled")
+                    running.clear()
+        finally:
+            # If execute() itself is cancelled, don't leave step tasks unowned
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        skipped = [
+            step.name
+            for step in workflow.steps
+            if step.name not in results and step.name not in failed
+        ]
+        for name in skipped:
+            blockers = [
+                dep for dep in steps[name].depends_on if dep not in results
+            ]
+            errors.append(f"{name}: skipped (blocked by {', '.join(blockers)})")
+
+        critical_path = self._critical_path(steps, runs)
 
         return WorkflowResult(
             workflow_id=workflow.id,
             success=len(errors) == 0,
             data=results,
             errors=errors,
-            duration_ms=(asyncio.get_event_loop().time() - start_time) * 1000,
-            steps_completed=steps_completed,
+            duration_ms=(loop.time() - start_time) * 1000,
+            steps_completed=len(results),
+            skipped_steps=skipped,
+            cached_steps=[name for name, run in runs.items() if run.cached],
+            step_durations_ms={name: run.duration_ms for name, run in runs.items()},
+            critical_path=critical_path,
+            critical_path_ms=sum(runs[name].duration_ms for name in critical_path),
+        )
+
+    def _validate_workflow(self, steps: list[WorkflowStep]) -> list[str]:
+        """Check for duplicate names, unknown dependencies and cycles."""
+        errors = []
+        names = [step.name for step in steps]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            errors.append(f"Duplicate step names: {', '.join(duplicates)}")
+
+        graph = {step.name: step.depends_on for step in steps}
+        for step in steps:
+            for dep in step.depends_on:
+                if dep not in graph:
+                    errors.append(f"{step.name}: unknown dependency '{dep}'")
+        if errors:
+            return errors
+
+        # Iterative DFS with colouring; grey-on-grey edge means a cycle
+        state: dict[str, int] = {}
+        for root in graph:
+            if root in state:
+                continue
+            stack = [(root, iter(graph[root]))]
+            path = [root]
+            state[root] = 1
+            while stack:
+                node, deps = stack[-1]
+                dep = next(deps, None)
+                if dep is None:
+                    state[node] = 2
+                    stack.pop()
+                    path.pop()
+                elif state.get(dep) == 1:
+                    cycle = path[path.index(dep):] + [dep]
+                    return [f"Circular dependency detected: {' -> '.join(cycle)}"]
+                elif dep not in state:
+                    state[dep] = 1
+                    stack.append((dep, iter(graph[dep])))
+                    path.append(dep)
+        return errors
+
+    @staticmethod
+    def _critical_path(
+        steps: dict[str, WorkflowStep],
+        runs: dict[str, _StepRun],
+    ) -> list[str]:
+        """Walk back from the last step to finish via its gating dependency."""
+        if not runs:
+            return []
+        current = max(runs, key=lambda name: runs[name].finished_at)
+        path = [current]
+        while True:
+            deps = [dep for dep in steps[current].depends_on if dep in runs]
+            if not deps:
+                break
+            current = max(deps, key=lambda name: runs[name].finished_at)
+            path.append(current)
+        path.reverse()
+        return path
+
+    async def _run_step(
+        self,
+        step: WorkflowStep,
+        context: dict[str, Any],
+        semaphore: asyncio.Semaphore | None,
+        use_cache: bool,
+    ) -> tuple[Any, _StepRun]:
+        """Run one step under its engine limit, timeout and memoization."""
+        loop = asyncio.get_event_loop()
+        key = None
+        if use_cache and step.cacheable:
+            key = self._step_cache_key(step, context)
+
+        if key is not None:
+            started = loop.time()
+            cached_result = await self._get_step_result(key)
+            if cached_result is not _MISSING:
+                secure_logger.debug(f"Step cache hit: {step.name}")
+                return cached_result, _StepRun(started, loop.time(), cached=True)
+
+        if semaphore is None:
+            started = loop.time()
+            result = await self._execute_step_with_timeout(step, context)
+        else:
+            async with semaphore:
+                started = loop.time()
+                result = await self._execute_step_with_timeout(step, context)
+        run = _StepRun(started, loop.time())
+
+        if key is not None:
+            await self._store_step_result(key, result)
+        return result, run
+
+    async def _execute_step_with_timeout(
+        self,
+        step: WorkflowStep,
+        context: dict[str, Any],
+    ) -> Any:
+        """Execute a step, enforcing its timeout."""
+        try:
+            return await asyncio.wait_for(
+                self._execute_step(step, context),
+                timeout=step.timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"timed out after {step.timeout_seconds}s") from None
+
+    # ============================================
+    # Step Result Memoization
+    # ============================================
+
+    def _step_cache_key(
+        self,
+        step: WorkflowStep,
+        context: dict[str, Any],
+    ) -> str | None:
+        """
+        Build a memoization key from engine, action, parameters and the
+        results of the step's dependencies.
+
+        Returns None when the step has no stable identity: a ``_function``
+        that is a lambda, closure or local function, or upstream results
+        that are not JSON-serializable.
+        """
+        params = {}
+        for name, value in step.parameters.items():
+            if name == "_function":
+                identity = self._function_identity(value)
+                if identity is None:
+                    return None
+                params[name] = identity
+            elif not name.startswith("_"):
+                params[name] = value
+        try:
+            upstream = json.dumps(
+                {dep: context.get(dep) for dep in sorted(step.depends_on)},
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+        payload = json.dumps(
+            {
+                "engine": step.engine.value,
+                "action": step.action,
+                "parameters": params,
+                "upstream": upstream,
+            },
+            sort_keys=True,
+            default=str,
         )
+        return "workflow_step:" + hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _function_identity(func: Any) -> str | None:
+        """Importable name of a module-level function, else None."""
+        qualname = getattr(func, "__qualname__", None)
+        module = getattr(func, "__module__", None)
+        if not callable(func) or qualname is None or module is None:
+            return None
+        if "<lambda>" in qualname or "<locals>" in qualname:
+            return None
+        if getattr(func, "__closure__", None):
+            return None
+        return f"{module}.{qualname}"
+
+    async def _get_step_result(self, key: str) -> Any:
+        """Look up a memoized step result (in-process first, then cache)."""
+        if key in self._step_results:
+            return self._step_results[key]
+        try:
+            result = await self._cache.get(key)
+        except Exception as e:
+            secure_logger.warning(f"Step cache lookup failed: {e}")
+            return _MISSING
+        if result is None:
+            return _MISSING
+        self._step_results[key] = result
+        return result
+
+    async def _store_step_result(self, key: str, result: Any) -> None:
+        """Memoize a step result; persist it when it is JSON-serializable."""
+        self._step_results[key] = result
+        try:
+            json.dumps(result)
+        except (TypeError, ValueError):
+            return
+        try:
+            await self._cache.set(key, result, self._step_cache_ttl)
+        except Exception as e:
+            secure_logger.warning(f"Step cache store failed: {e}")
+
+    async def clear_step_cache(self) -> None:
+        """Forget memoized step results held by this orchestrator."""
+        for key in self._step_results:
+            await self._cache.delete(key)
+        self._step_results.clear()
 
     async def _execute_step(
         self,
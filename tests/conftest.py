@@ -125,6 +125,30 @@ def setup_test_env(monkeypatch):
     monkeypatch.setenv("CACHE_ENABLED", "false")
 
 
+@pytest.fixture(autouse=True)
+def isolated_quota_broker(tmp_path, monkeypatch):
+    """Keep platform clients' quota buckets out of data/quota.db."""
+    from src.utils import quota_broker
+
+    monkeypatch.setenv("QUOTA_DB_PATH", str(tmp_path / "quota.db"))
+    monkeypatch.setattr(quota_broker, "_quota_broker", None)
+    yield
+    if quota_broker._quota_broker is not None:
+        quota_broker._quota_broker.backend.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_store(tmp_path, monkeypatch):
+    """Keep background jobs submitted by tests out of data/jobs.db."""
+    from src.core import jobs
+
+    monkeypatch.setenv("JOBS_DB_PATH", str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(jobs, "_job_queue", None)
+    yield
+    if jobs._job_queue is not None:
+        jobs._job_queue.store.close()
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Provide temporary directory for tests."""
@@ -2,10 +2,13 @@
 Mock external API services for testing.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 from unittest.mock import MagicMock
 
+from src.discovery.base_client import PlatformClient, RepositoryInfo, SearchResult
+
 
 class MockGitLabClient:
     """Mock GitLab client for testing."""
@@ -238,3 +241,50 @@ class MockGitHubClient:
     ) -> list[dict[str, Any]]:
         """Mock get commits."""
         return self.commits.copy()
+
+
+class StubPlatformClient(PlatformClient):
+    """Platform client returning canned results after a delay."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.closed = False
+
+    @property
+    def platform_name(self) -> str:
+        return self.name
+
+    async def search(self, query, language=None, min_stars=0, max_results=20, **kw):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.name} down")
+        repos = [
+            RepositoryInfo(
+                platform=self.name,
+                id=f"{self.name}/{query}-{i}",
+                url=f"https://{self.name}.example/{query}-{i}",
+                name=f"{query}-{i}",
+                full_name=f"{self.name}/{query}-{i}",
+            )
+            for i in range(2)
+        ]
+        return SearchResult(query, self.name, len(repos), repos, 0)
+
+    async def get_repository(self, repo_id):
+        raise NotImplementedError
+
+    async def get_contents(self, repo_id, path=""):
+        raise NotImplementedError
+
+    async def get_file(self, repo_id, path):
+        raise NotImplementedError
+
+    async def clone(self, repo_id, destination, branch=None, depth=1):
+        raise NotImplementedError
+
+    async def close(self):
+        self.closed = True
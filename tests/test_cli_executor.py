@@ -12,10 +12,18 @@ import pytest
 from src.cli_executor import (
     AgentCLI,
     CLIExecutor,
+    CommandQueue,
     CommandResult,
     ErrorRecovery,
 )
-from src.cli_executor.executor import ErrorType
+from src.cli_executor.error_classifier import (
+    ClassifierRule,
+    ErrorClassifier,
+    get_default_classifier,
+    required_literal,
+)
+from src.cli_executor.executor import ErrorType, ExecutorConfig, TailBuffer
+from src.core.realtime import EventType, get_event_bus
 
 
 class TestCLIExecutor:
@@ -259,3 +267,254 @@ class TestCommandResult:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+@pytest.mark.skipif(
+    CLIExecutor().is_windows, reason="Streaming tests use POSIX shell syntax"
+)
+class TestStreamingExecution:
+    """Tests for streaming subprocess execution."""
+
+    @pytest.mark.asyncio
+    async def test_streams_lines_to_callback(self):
+        """Output lines should reach the callback as they are produced."""
+        executor = CLIExecutor()
+        lines = []
+
+        result = await executor.execute(
+            "echo one; echo two >&2; echo three",
+            on_output=lambda stream, line: lines.append((stream, line)),
+        )
+
+        assert result.success
+        assert ("stdout", "one") in lines
+        assert ("stderr", "two") in lines
+        assert result.stdout == "one\nthree\n"
+
+    @pytest.mark.asyncio
+    async def test_async_callback(self):
+        """Coroutine callbacks should be awaited."""
+        executor = CLIExecutor()
+        lines = []
+
+        async def collect(stream, line):
+            lines.append(line)
+
+        await executor.execute("printf 'a\\nb'", on_output=collect)
+
+        assert lines == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_tail_buffer_bounds_output(self):
+        """Only the tail of large outputs should be kept."""
+        executor = CLIExecutor(ExecutorConfig(output_tail_bytes=100))
+
+        result = await executor.execute("seq 1 1000")
+
+        assert result.output_truncated
+        assert len(result.stdout) <= 100
+        assert result.stdout.endswith("1000\n")
+
+    @pytest.mark.asyncio
+    async def test_classifies_failed_command_output(self):
+        """Failures should be classified from the whole captured tail."""
+        executor = CLIExecutor()
+
+        result = await executor.execute(
+            "echo 'npm WARN request timeout'; "
+            "echo 'ModuleNotFoundError: No module named x' >&2; exit 1"
+        )
+
+        assert result.error_type == ErrorType.DEPENDENCY_MISSING
+
+    @pytest.mark.asyncio
+    async def test_error_published_while_running(self):
+        """A detected error should be published before the command exits."""
+        executor = CLIExecutor(ExecutorConfig(publish_events=True))
+        detected = asyncio.Event()
+        seen = []
+
+        def on_error(event):
+            seen.append(event.data["error_type"])
+            detected.set()
+
+        bus = get_event_bus()
+        bus.subscribe(EventType.COMMAND_ERROR_DETECTED, on_error)
+        try:
+            task = asyncio.create_task(
+                executor.execute(
+                    "echo 'ModuleNotFoundError: No module named x' >&2; sleep 5",
+                    timeout=10,
+                )
+            )
+            await asyncio.wait_for(detected.wait(), 3)
+            assert not task.done()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        finally:
+            bus.unsubscribe(EventType.COMMAND_ERROR_DETECTED, on_error)
+
+        assert seen == [ErrorType.DEPENDENCY_MISSING.value]
+
+    @pytest.mark.asyncio
+    async def test_streamed_error_covers_truncated_tail(self):
+        """An error that scrolled out of the tail is still classified."""
+        executor = CLIExecutor(ExecutorConfig(output_tail_bytes=100))
+
+        result = await executor.execute(
+            "echo 'Permission denied: /etc/x'; seq 1 1000; exit 1"
+        )
+
+        assert result.output_truncated
+        assert result.error_type == ErrorType.PERMISSION_DENIED
+
+    @pytest.mark.asyncio
+    async def test_successful_command_is_not_classified(self):
+        """Error-looking output from a successful command is ignored."""
+        executor = CLIExecutor()
+
+        result = await executor.execute("echo 'connection refused'")
+
+        assert result.success
+        assert result.error_type is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self):
+        """Timed out commands should be killed and reported."""
+        executor = CLIExecutor()
+
+        result = await executor.execute("sleep 5", timeout=1)
+
+        assert not result.success
+        assert result.error_type == ErrorType.TIMEOUT
+        assert result.duration_ms < 4000
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_partial_output(self):
+        """Output captured before the timeout should be returned."""
+        executor = CLIExecutor()
+
+        result = await executor.execute(
+            "echo started; echo warming >&2; sleep 5", timeout=1
+        )
+
+        assert result.error_type == ErrorType.TIMEOUT
+        assert result.stdout == "started\n"
+        assert result.stderr.startswith("warming\n")
+        assert "timed out after 1 seconds" in result.stderr
+
+    def test_tail_buffer(self):
+        """TailBuffer should drop the oldest lines past its limit."""
+        buffer = TailBuffer(max_bytes=6)
+        for line in ["aa\n", "bb\n", "cc\n"]:
+            buffer.append(line)
+
+        assert buffer.getvalue() == "bb\ncc\n"
+        assert buffer.truncated
+
+
+class TestCommandQueue:
+    """Tests for the shared command queue."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """No more than max_concurrent commands should run at once."""
+        queue = CommandQueue(max_concurrent=2)
+        peak = 0
+
+        async def run():
+            nonlocal peak
+            async with queue:
+                peak = max(peak, queue.running)
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(run() for _ in range(6)))
+
+        stats = queue.get_stats()
+        assert peak == 2
+        assert stats["completed"] == 6
+        assert stats["max_wait_ms"] > 0
+
+    def test_agent_cli_shares_queue(self):
+        """AgentCLI instances should share the process-wide queue."""
+        assert AgentCLI().executor.command_queue is AgentCLI().executor.command_queue
+
+
+class TestErrorClassifier:
+    """Tests for the precompiled error classifier."""
+
+    def test_required_literal(self):
+        """Literal prefilters should be safe subsets of each pattern."""
+        assert required_literal(r"npm err! 404") == "npm err! 404"
+        assert required_literal(r"package .* is not installed") == " is not installed"
+        assert required_literal(r"user\.email") == "user.email"
+        assert required_literal(r"foo|barbaz") is None
+        assert required_literal(r"a.b") is None
+        assert required_literal(r"foo{1000}bar") == "bar"
+        assert required_literal(r"ab{2,5}cdef") == "cdef"
+
+    def test_brace_quantifier_does_not_cause_false_negative(self):
+        """Quantifier digits must not be required in the text."""
+        classifier = ErrorClassifier(
+            [ClassifierRule("rep", ErrorType.SYNTAX_ERROR, r"ab{1000}c")]
+        )
+
+        assert classifier.classify("a" + "b" * 1000 + "c") is not None
+
+    def test_rule_order_wins(self):
+        """The first rule in list order should win, not the first in text."""
+        classifier = ErrorClassifier(
+            [
+                ClassifierRule("late", ErrorType.GIT_ERROR, r"merge conflict"),
+                ClassifierRule("early", ErrorType.SYNTAX_ERROR, r"syntaxerror"),
+            ]
+        )
+
+        match = classifier.classify("SyntaxError: x\nCONFLICT: merge conflict in a")
+
+        assert match.rule.name == "late"
+
+    def test_extracts_capture(self):
+        """The first capture group should be returned."""
+        classifier = ErrorClassifier(
+            [
+                ClassifierRule(
+                    "mod", ErrorType.DEPENDENCY_MISSING, r"No module named '([^']+)'"
+                )
+            ]
+        )
+
+        match = classifier.classify("noise\nModuleNotFoundError: No module named 'yaml'")
+
+        assert match.capture == "yaml"
+
+    def test_scans_tail_first_then_full_text(self):
+        """A match in the tail wins; earlier output is the fallback."""
+        classifier = ErrorClassifier(get_default_classifier().rules, tail_chars=100)
+        early = "permission denied\n" + "x" * 1000
+
+        assert classifier.classify_type(early) == ErrorType.PERMISSION_DENIED
+        assert classifier.classify_type(early + "\nSyntaxError: x") == (
+            ErrorType.SYNTAX_ERROR
+        )
+
+    def test_classifies_several_texts(self):
+        """stderr and stdout can be classified together."""
+        classifier = get_default_classifier()
+
+        assert classifier.classify_type("", "fatal: not a git repository") == (
+            ErrorType.GIT_ERROR
+        )
+        assert classifier.classify("", "") is None
+
+    def test_recovery_reuses_compiled_patterns(self):
+        """ErrorRecovery should compile its patterns once."""
+        recovery = ErrorRecovery(CLIExecutor())
+
+        recovery._match_pattern("EACCES")
+        classifier = recovery._classifier
+        pattern, _ = recovery._match_pattern("Permission denied")
+
+        assert recovery._classifier is classifier
+        assert pattern.name == "permission_denied"
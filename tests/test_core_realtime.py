@@ -15,7 +15,9 @@ import pytest
 from src.core.realtime import (
     Event,
     EventBus,
+    EventQueue,
     EventType,
+    QueuePolicy,
     get_event_bus,
 )
 
@@ -272,6 +274,121 @@ class TestEventBus:
         await bus.publish(Event(type=EventType.NOTIFICATION, data={}))
 
 
+class TestFanOut:
+    """Tests for bounded, concurrent fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_stall_others(self):
+        bus = EventBus(callback_timeout=0.05)
+        received = []
+
+        async def slow(event):
+            await asyncio.sleep(10)
+
+        async def fast(event):
+            received.append(event)
+
+        bus.subscribe(EventType.NOTIFICATION, slow)
+        bus.subscribe(EventType.NOTIFICATION, fast)
+
+        start = asyncio.get_running_loop().time()
+        await bus.publish(Event(type=EventType.NOTIFICATION, data={}))
+
+        assert asyncio.get_running_loop().time() - start < 1
+        assert len(received) == 1
+        assert bus.get_stats()["callback_timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_drops_oldest(self):
+        bus = EventBus()
+        queue = bus.create_queue(maxsize=3)
+        for i in range(5):
+            await bus.publish(Event(type=EventType.LOG, data={"i": i}))
+
+        assert [queue.get_nowait().data["i"] for _ in range(3)] == [2, 3, 4]
+        assert queue.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_coalesces_progress(self):
+        bus = EventBus()
+        queue = bus.create_queue(maxsize=2, policy=QueuePolicy.COALESCE)
+        for progress in (0.1, 0.5, 0.9):
+            for workflow_id in ("a", "b"):
+                await bus.emit_async(
+                    EventType.WORKFLOW_PROGRESS,
+                    {"workflow_id": workflow_id, "progress": progress},
+                )
+
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [(e.data["workflow_id"], e.data["progress"]) for e in events] == [
+            ("a", 0.9),
+            ("b", 0.9),
+        ]
+        assert queue.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_queue_coalesces_only_when_full(self):
+        bus = EventBus()
+        queue = bus.create_queue(maxsize=3, policy=QueuePolicy.COALESCE)
+        for message in ("saved", "deployed", "failed", "retried"):
+            await bus.emit_async(EventType.NOTIFICATION, {"message": message})
+
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        # Subject-less notifications share a key; they merge only at capacity
+        assert [e.data["message"] for e in events] == ["saved", "deployed", "retried"]
+        assert queue.coalesced == 1
+        assert queue.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_only_receives_its_types(self):
+        bus = EventBus()
+        queue = bus.create_queue(event_types=[EventType.NOTIFICATION])
+        await bus.publish(Event(type=EventType.LOG, data={}))
+        await bus.publish(Event(type=EventType.NOTIFICATION, data={}))
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait().type == EventType.NOTIFICATION
+
+    @pytest.mark.asyncio
+    async def test_json_serialized_once(self, monkeypatch):
+        bus = EventBus()
+        queues = [bus.create_queue() for _ in range(3)]
+        calls = []
+        original = Event.to_dict
+        monkeypatch.setattr(
+            Event, "to_dict", lambda self: calls.append(1) or original(self)
+        )
+
+        await bus.publish(Event(type=EventType.LOG, data={"x": 1}))
+        payloads = {q.get_nowait().to_json() for q in queues}
+
+        assert len(payloads) == 1
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_events_wakes_on_publish(self):
+        bus = EventBus()
+        stream = bus.stream_events([EventType.NOTIFICATION])
+        next_event = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        await bus.emit_async(EventType.NOTIFICATION, {"msg": "hi"})
+
+        event = await asyncio.wait_for(next_event, 1)
+        assert event.data["msg"] == "hi"
+        await stream.aclose()
+        assert not bus._queues
+
+    @pytest.mark.asyncio
+    async def test_get_blocks_until_put(self):
+        queue = EventQueue(maxsize=2)
+        waiter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        queue.put_nowait(Event(type=EventType.LOG, data={}))
+        assert (await asyncio.wait_for(waiter, 1)).type == EventType.LOG
+        assert queue.empty()
+
+
 class TestGetEventBus:
     """Tests for get_event_bus function."""
 
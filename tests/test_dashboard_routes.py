@@ -8,10 +8,17 @@ Full coverage tests for:
 - Webhook routes
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
+import src.core.health as health_module
+from src.core.health import ComponentHealth, HealthChecker, HealthMonitor, HealthStatus
+from src.core.realtime import EventBus
 from src.dashboard.app import create_app
+from src.discovery.unified_search import UnifiedSearch
+from tests.mocks.mock_external import StubPlatformClient
 
 
 @pytest.fixture
@@ -31,6 +38,96 @@ class TestHealthEndpoint:
         assert "status" in data
 
 
+class TestHealthWebSocket:
+    """Tests for health updates over /ws."""
+
+    def test_snapshot_then_diffs(self, client, monkeypatch):
+        status = {"lm_studio": HealthStatus.HEALTHY}
+
+        async def check():
+            return ComponentHealth("lm_studio", status["lm_studio"], "probe")
+
+        checker = HealthChecker()
+        checker._probes = {"lm_studio": check}
+        monitor = HealthMonitor(checker, interval=0.01, bus=EventBus())
+        monkeypatch.setattr(health_module, "_health_monitor", monitor)
+
+        with client.websocket_connect("/ws") as ws:
+            first = ws.receive_json()
+            assert first["type"] == "health"
+            assert first["data"]["components"][0]["status"] == "healthy"
+
+            status["lm_studio"] = HealthStatus.UNHEALTHY
+            update = ws.receive_json()
+            assert update["type"] == "health_diff"
+            assert update["data"]["changed"][0]["status"] == "unhealthy"
+            assert monitor.running
+
+
+@pytest.fixture
+def stub_search(monkeypatch):
+    """Search service over local stub platforms."""
+    monkeypatch.setattr(UnifiedSearch, "_init_clients", lambda self, *args: None)
+    search = UnifiedSearch()
+    search._clients = {
+        "github": StubPlatformClient("github", delay=0.02),
+        "huggingface": StubPlatformClient("huggingface"),
+    }
+    return search
+
+
+class TestSearchEndpoints:
+    """Tests for the shared search service."""
+
+    def test_search_reuses_app_service(self, stub_search):
+        app = create_app()
+        app.state.search = stub_search
+        client = TestClient(app)
+        body = {"query": "rag", "platforms": ["github", "huggingface"]}
+
+        first = client.post("/api/search", json=body).json()
+        second = client.post("/api/search", json=body).json()
+
+        assert first == second
+        assert first["total"] == 4
+        assert stub_search._clients["github"].calls == 1
+
+    def test_stream_ndjson(self, stub_search):
+        app = create_app()
+        app.state.search = stub_search
+        response = TestClient(app).post(
+            "/api/search/stream",
+            json={"query": "rag", "platforms": ["github", "huggingface"]},
+        )
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["type"] for e in events] == ["platform", "platform", "done"]
+        assert events[0]["platform"] == "huggingface"
+        assert events[-1]["total"] == 4
+
+    def test_stream_sse(self, stub_search):
+        app = create_app()
+        app.state.search = stub_search
+        response = TestClient(app).post(
+            "/api/search/stream",
+            json={"query": "rag", "platforms": ["github"]},
+            headers={"Accept": "text/event-stream"},
+        )
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        chunks = [c for c in response.text.split("\n\n") if c]
+        assert all(c.startswith("data: ") for c in chunks)
+        assert json.loads(chunks[-1][6:])["type"] == "done"
+
+    def test_lifespan_closes_service(self, stub_search):
+        app = create_app()
+        with TestClient(app):
+            app.state.search = stub_search
+        assert stub_search._clients["github"].closed
+        assert app.state.search is None
+
+
 class TestVersionEndpoint:
     """Tests for version endpoint."""
 
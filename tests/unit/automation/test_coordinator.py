@@ -0,0 +1,147 @@
+"""Tests for automation.coordinator scheduler."""
+
+import asyncio
+
+import pytest
+
+try:
+    from src.automation.coordinator import (
+        AutomationConfig,
+        AutomationCoordinator,
+        ScheduledTask,
+    )
+
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error for automation.coordinator: {e}")
+    IMPORTS_AVAILABLE = False
+
+
+@pytest.fixture
+def coordinator():
+    coord = AutomationCoordinator(
+        AutomationConfig(n8n_enabled=False, run_tests_on_startup=False)
+    )
+    for name in list(coord._scheduled_tasks):
+        coord.unschedule(name)
+    return coord
+
+
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Module not available")
+class TestHeapScheduler:
+    """Test the timer-heap scheduler."""
+
+    async def test_runs_task_on_interval(self, coordinator):
+        """Tasks should fire immediately and then on their interval."""
+        calls = []
+
+        async def tick():
+            calls.append(asyncio.get_event_loop().time())
+
+        coordinator.schedule(
+            ScheduledTask("tick", tick, interval_seconds=0.05, run_immediately=True)
+        )
+        await coordinator.start()
+        await asyncio.sleep(0.18)
+        await coordinator.stop()
+
+        assert 3 <= len(calls) <= 5
+        stats = coordinator.get_scheduler_stats()["tick"]
+        assert stats["runs"] == len(calls)
+        assert stats["lateness_ms"]["count"] == len(calls)
+        # Lateness is not mixed into the action history
+        assert coordinator._metrics.get_metrics("scheduled_tick_lateness") is None
+
+    async def test_delayed_start_without_run_immediately(self, coordinator):
+        """Tasks without run_immediately should wait one interval."""
+        calls = []
+
+        async def tick():
+            calls.append(1)
+
+        coordinator.schedule(ScheduledTask("tick", tick, interval_seconds=10))
+        await coordinator.start()
+        await asyncio.sleep(0.05)
+        await coordinator.stop()
+
+        assert calls == []
+
+    async def test_max_instances_prevents_overlap(self, coordinator):
+        """A slow task should not stack up concurrent runs."""
+        active = 0
+        peak = 0
+
+        async def slow():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.15)
+            active -= 1
+
+        coordinator.schedule(
+            ScheduledTask("slow", slow, interval_seconds=0.02, run_immediately=True)
+        )
+        await coordinator.start()
+        await asyncio.sleep(0.2)
+        await coordinator.stop()
+
+        assert peak == 1
+        assert coordinator._scheduled_tasks["slow"].skipped_count > 0
+
+    async def test_coalesces_missed_runs(self, coordinator):
+        """Missed runs should collapse into one when the loop was blocked."""
+        task = ScheduledTask("tick", lambda: asyncio.sleep(0), interval_seconds=0.01)
+        coordinator.schedule(task)
+
+        await asyncio.sleep(0.1)  # ~10 intervals pass before dispatch
+        coordinator._dispatch_due_tasks()
+        coordinator._dispatch_due_tasks()
+        await asyncio.sleep(0)
+
+        assert task.run_count == 1
+        assert [e[2] for e in coordinator._timer_heap].count("tick") == 1
+
+    async def test_jitter_does_not_accumulate(self, coordinator):
+        """Each slot is jittered from its un-jittered due time."""
+        task = ScheduledTask(
+            "tick",
+            lambda: asyncio.sleep(0),
+            interval_seconds=10,
+            run_immediately=True,
+            jitter_seconds=5,
+        )
+        coordinator._timer_heap.clear()  # Stale default-task entries
+        coordinator.schedule(task)
+        fire_at, *_, base = coordinator._timer_heap[0]
+
+        for slot in range(1, 4):
+            coordinator._timer_heap[0] = (0.0, *coordinator._timer_heap[0][1:])
+            coordinator._dispatch_due_tasks()
+            fire_at, *_, due = coordinator._timer_heap[0]
+            assert due == base + slot * 10
+            assert due <= fire_at <= due + 5
+        await asyncio.sleep(0)
+
+    async def test_unschedule_drops_pending_timer(self, coordinator):
+        """Unscheduled tasks should never fire."""
+        calls = []
+
+        async def tick():
+            calls.append(1)
+
+        coordinator.schedule(
+            ScheduledTask("tick", tick, interval_seconds=0.01, run_immediately=True)
+        )
+        coordinator.unschedule("tick")
+        await coordinator.start()
+        await asyncio.sleep(0.05)
+        await coordinator.stop()
+
+        assert calls == []
+
+    def test_rejects_non_positive_interval(self, coordinator):
+        """Zero intervals would spin the scheduler."""
+        with pytest.raises(ValueError):
+            coordinator.schedule(
+                ScheduledTask("bad", lambda: asyncio.sleep(0), interval_seconds=0)
+            )
@@ -0,0 +1,156 @@
+"""Tests for the local site crawler, run against an in-process HTTP server."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.discovery.crawler import (
+    Crawler,
+    RobotsCache,
+    SimHashIndex,
+    normalize_url,
+    simhash,
+)
+from src.discovery.firecrawl_client import FirecrawlClient
+
+ARTICLE = " ".join(f"word{i}" for i in range(500))
+
+
+def page(title: str, body: str, links: list[str]) -> str:
+    anchors = "".join(f'<a href="{href}">{href}</a> ' for href in links)
+    return (
+        f"<html><head><title>{title}</title></head>"
+        f"<body><h1>{title}</h1><p>{body}</p>{anchors}</body></html>"
+    )
+
+
+SITE = {
+    "/": page("Home", "Welcome home", ["/docs/a", "/docs/b", "blog/post", "#top"]),
+    "/docs/a": page("A", "Alpha page text", ["/docs/a/deep", "/", "/private/x"]),
+    "/docs/b": page("B", ARTICLE, ["/docs/b-copy?utm_source=x"]),
+    "/docs/b-copy": page("B", ARTICLE + " extra", []),
+    "/docs/a/deep": page("Deep", "Deep page", ["/docs/a/deeper"]),
+    "/docs/a/deeper": page("Deeper", "Too deep", []),
+    "/blog/post": page("Post", "A blog post", ["https://elsewhere.example/"]),
+    "/private/x": page("Private", "Hidden", []),
+}
+
+ROBOTS = "User-agent: *\nDisallow: /private/\n"
+
+
+@pytest.fixture
+async def site():
+    hits: dict[str, int] = {}
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        path = request.path
+        hits[path] = hits.get(path, 0) + 1
+        if path == "/robots.txt":
+            return web.Response(text=ROBOTS)
+        if path not in SITE:
+            raise web.HTTPNotFound()
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return web.Response(text=SITE[path], content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits
+    server.in_flight = in_flight
+    yield server
+    await server.close()
+
+
+async def crawl(server, **kwargs) -> tuple[list, Crawler]:
+    client = FirecrawlClient(api_key="")
+    async with client:
+        crawler = Crawler(client._session, parse=client._parse_html, **kwargs)
+        pages = [p async for p in crawler.crawl(str(server.make_url("/")))]
+    return pages, crawler
+
+
+def paths(pages) -> set[str]:
+    return {normalize_url(p.url).split("/", 3)[3] for p in pages}
+
+
+class TestCrawler:
+    """Test Crawler against the fixture site."""
+
+    async def test_breadth_first_with_depth_robots_and_dedupe(self, site):
+        pages, crawler = await crawl(site, limit=50, max_depth=2)
+
+        assert paths(pages) == {"", "docs/a", "docs/b", "blog/post", "docs/a/deep"}
+        assert pages[0].metadata["depth"] == 0
+        assert crawler.get_stats()["robots_blocked"] == 1
+        assert crawler.get_stats()["duplicate_content"] == 1
+        assert site.hits["/robots.txt"] == 1
+        assert "/docs/a/deeper" not in site.hits
+        # Off-site links are never fetched
+        assert all("elsewhere" not in p.url for p in pages)
+
+    async def test_include_and_exclude_paths(self, site):
+        pages, _ = await crawl(
+            site,
+            limit=50,
+            max_depth=3,
+            include_paths=[r"^/docs/"],
+            exclude_paths=[r"/deep"],
+        )
+        assert paths(pages) == {"", "docs/a", "docs/b"}
+
+    async def test_limit_stops_crawl(self, site):
+        pages, _ = await crawl(site, limit=2, max_depth=3)
+        assert len(pages) == 2
+
+    async def test_per_host_concurrency(self, site):
+        await crawl(site, limit=50, concurrency=8, per_host_concurrency=1)
+        assert site.in_flight["max"] == 1
+
+    async def test_streams_through_client(self, site):
+        client = FirecrawlClient(api_key="")
+        async with client:
+            first = None
+            async for page in client.crawl_site_stream(str(site.make_url("/"))):
+                first = page
+                break
+        assert first.title == "Home"
+
+
+class TestHelpers:
+    """Test URL normalization, SimHash and robots caching."""
+
+    def test_normalize_url(self):
+        assert (
+            normalize_url("HTTP://Example.COM:80/a?b=2&a=1&utm_source=x#frag")
+            == "http://example.com/a?a=1&b=2"
+        )
+        assert normalize_url("https://example.com") == "https://example.com/"
+        assert normalize_url("../c", "https://example.com/a/b/") == (
+            "https://example.com/a/c"
+        )
+        assert normalize_url("mailto:someone@example.com") is None
+
+    def test_simhash_index_finds_near_duplicates(self):
+        index = SimHashIndex(max_distance=3)
+        index.add(simhash(ARTICLE))
+        assert index.find(simhash(ARTICLE + " extra")) is not None
+        assert index.find(simhash("completely different text about crawling")) is None
+
+    async def test_robots_fetched_once_per_origin(self, site):
+        robots = RobotsCache()
+        async with aiohttp.ClientSession() as session:
+            base = str(site.make_url("/"))
+            results = await asyncio.gather(
+                *(robots.allowed(session, base + "docs/a") for _ in range(5)),
+                robots.allowed(session, base + "private/x"),
+            )
+        assert results == [True] * 5 + [False]
+        assert site.hits["/robots.txt"] == 1
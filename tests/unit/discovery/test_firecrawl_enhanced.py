@@ -392,6 +392,37 @@ class TestFirecrawlEnhanced:
         )
         assert key1 != key5
 
+    @pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Module not available")
+    async def test_code_blocks_extracted_after_tables(self):
+        """Each structure kind is skipped only if it was already extracted."""
+        from datetime import datetime
+
+        from src.discovery.firecrawl_client import FirecrawlFormat, ScrapedContent
+        from src.discovery.firecrawl_enhanced import FirecrawlEnhanced
+
+        client = FirecrawlEnhanced(api_key="test_key")
+        content = ScrapedContent(
+            url="https://example.com",
+            title="Test",
+            description="Test description",
+            content=(
+                "<html><body><table><tr><th>a</th></tr><tr><td>1</td></tr>"
+                "</table><pre><code>print(1)</code></pre></body></html>"
+            ),
+            format=FirecrawlFormat.HTML,
+            timestamp=datetime.now(),
+            links=[],
+            images=[],
+            metadata={},
+        )
+
+        content = await client._extract_tables(content)
+        assert "tables" in content.metadata
+        assert "code_blocks" not in content.metadata
+
+        content = await client._extract_code_blocks(content)
+        assert "code_blocks" in content.metadata
+
 
 class TestRateLimiter:
     """Test RateLimiter class."""
@@ -0,0 +1,87 @@
+"""Tests for single-pass HTML extraction."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.discovery.html_extract import extract_html, extract_page
+
+HTML = """
+<html lang="en">
+<head>
+  <title> Guide </title>
+  <meta name="description" content="A short guide">
+  <meta property="og:title" content="Guide OG">
+  <link rel="canonical" href="/guide">
+  <style>body { color: red }</style>
+</head>
+<body>
+  <nav><a href="/nav-only">Menu</a></nav>
+  <h1>Install</h1>
+  <p>Read the <a href="setup.html">setup</a> and
+     <a href="https://other.example/x">other</a> docs.
+     <a href="mailto:me@example.com">mail</a></p>
+  <img src="/logo.png">
+  <table><tr><th>Name</th><th>Value</th></tr><tr><td>a</td><td>1</td></tr></table>
+  <pre class="language-python"><code>print("hi")</code></pre>
+  <pre><code class="javascript">alert(1)</code></pre>
+  <!-- hidden comment -->
+  <script>var tracking = 1;</script>
+  <footer>Footer text</footer>
+</body>
+</html>
+"""
+
+URL = "https://docs.example.com/start/index.html"
+
+
+class TestExtractPage:
+    """Test extract_page."""
+
+    def test_metadata(self):
+        page = extract_page(URL, HTML)
+        assert page.title == "Guide"
+        assert page.description == "A short guide"
+        assert page.metadata["og:title"] == "Guide OG"
+        assert page.metadata["language"] == "en"
+        assert page.metadata["canonical"] == "https://docs.example.com/guide"
+
+    def test_links_and_images_resolved(self):
+        page = extract_page(URL, HTML)
+        assert page.links == [
+            "https://docs.example.com/start/setup.html",
+            "https://other.example/x",
+        ]
+        assert page.images == ["https://docs.example.com/logo.png"]
+
+    def test_tables_and_code_blocks(self):
+        page = extract_page(URL, HTML)
+        assert page.tables == ["Name | Value\n--- | ---\na | 1"]
+        assert page.code_blocks == [
+            {"code": 'print("hi")', "language": "python"},
+            {"code": "alert(1)", "language": "javascript"},
+        ]
+
+    def test_markdown_drops_boilerplate(self):
+        page = extract_page(URL, HTML)
+        assert "# Install" in page.markdown
+        for noise in ("Menu", "Footer text", "tracking", "hidden comment", "color"):
+            assert noise not in page.markdown
+
+    def test_text_only(self):
+        page = extract_page(URL, HTML, markdown=False, text=True)
+        assert page.markdown == ""
+        assert "Install" in page.text
+
+
+class TestExtractHtml:
+    """Test the off-loop wrapper."""
+
+    async def test_process_pool(self):
+        page = await extract_html(URL, HTML)
+        assert page.title == "Guide"
+        assert page.tables
+
+    async def test_custom_executor_and_options(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = await extract_html(URL, HTML, executor=executor, markdown=False)
+        assert page.markdown == ""
+        assert page.links
@@ -0,0 +1,144 @@
+"""Tests for the priority scrape queue."""
+
+import asyncio
+
+import pytest
+
+from src.discovery.scrape_queue import ScrapeQueue
+
+
+class Recorder:
+    """Handler that records call order and can fail the first N attempts."""
+
+    def __init__(self, delay: float = 0.0, failures: dict[str, int] | None = None):
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, url: str, priority: int) -> str:
+        self.calls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures.get(url, 0) > 0:
+                self.failures[url] -= 1
+                raise RuntimeError("boom")
+            return f"content:{url}"
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+async def make_queue():
+    queues = []
+
+    def factory(handler, **kwargs) -> ScrapeQueue:
+        queue = ScrapeQueue(handler, **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield factory
+    for queue in queues:
+        await queue.close()
+
+
+class TestScrapeQueue:
+    """Test ScrapeQueue."""
+
+    async def test_drains_every_url(self, make_queue):
+        handler = Recorder(delay=0.001)
+        queue = make_queue(handler, concurrency=3)
+        urls = [f"https://site{i % 4}.example/{i}" for i in range(50)]
+
+        results = [r async for r in queue.stream((url, 0) for url in urls)]
+
+        assert sorted(r.value for r in results) == sorted(f"content:{u}" for u in urls)
+        assert handler.max_in_flight <= 3
+        assert len(queue) == 0
+
+    async def test_priority_order(self, make_queue):
+        handler = Recorder()
+        queue = make_queue(handler, concurrency=1)
+        requests = [("https://a/low", 1), ("https://a/high", 3), ("https://a/mid", 2)]
+
+        [r async for r in queue.stream(requests)]
+
+        assert handler.calls == ["https://a/high", "https://a/mid", "https://a/low"]
+
+    async def test_promotes_queued_url(self, make_queue):
+        handler = Recorder()
+        queue = make_queue(handler, concurrency=1)
+        futures = [
+            queue.submit("https://a/1", 1),
+            queue.submit("https://a/2", 2),
+            queue.submit("https://a/1", 5),
+        ]
+        await asyncio.gather(*futures)
+        assert handler.calls == ["https://a/1", "https://a/2"]
+
+    async def test_deduplicates_in_flight_urls(self, make_queue):
+        handler = Recorder(delay=0.01)
+        queue = make_queue(handler, concurrency=2)
+        first = queue.submit("https://a/page")
+        await asyncio.sleep(0.001)  # now in flight
+        second = queue.submit("https://a/page")
+
+        assert second is first
+        await first
+        assert handler.calls == ["https://a/page"]
+        assert queue.get_stats()["deduplicated"] == 1
+
+    async def test_retries_with_backoff(self, make_queue):
+        handler = Recorder(failures={"https://a/flaky": 2, "https://a/dead": 10})
+        queue = make_queue(handler, concurrency=2, max_retries=2, backoff=0.001)
+
+        results = {
+            r.url: r
+            async for r in queue.stream([("https://a/flaky", 0), ("https://a/dead", 0)])
+        }
+
+        assert results["https://a/flaky"].ok
+        assert results["https://a/flaky"].attempts == 3
+        assert results["https://a/dead"].error == "boom"
+        assert results["https://a/dead"].attempts == 3
+
+    async def test_per_domain_interval(self, make_queue):
+        handler = Recorder()
+        queue = make_queue(handler, concurrency=4, domain_interval=0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        [r async for r in queue.stream((f"https://slow/{i}", 0) for i in range(3))]
+        same_domain = loop.time() - start
+
+        start = loop.time()
+        [r async for r in queue.stream((f"https://d{i}/", 0) for i in range(3))]
+        different_domains = loop.time() - start
+
+        assert same_domain >= 0.1
+        assert different_domains < 0.05
+
+    async def test_streams_before_batch_finishes(self, make_queue):
+        async def handler(url, priority):
+            await asyncio.sleep(0.2 if url.endswith("slow") else 0)
+            return url
+
+        queue = make_queue(handler, concurrency=2)
+        stream = queue.stream([("https://a/slow", 0), ("https://a/fast", 0)])
+        first = await anext(stream)
+        assert first.url == "https://a/fast"
+        await stream.aclose()
+
+    async def test_close_fails_pending(self, make_queue):
+        async def handler(url, priority):
+            await asyncio.sleep(10)
+
+        queue = make_queue(handler, concurrency=1)
+        futures = [queue.submit("https://a/1"), queue.submit("https://a/2")]
+        await asyncio.sleep(0)
+        await queue.close()
+        results = await asyncio.gather(*futures)
+        assert all(r.error == "Queue closed" for r in results)
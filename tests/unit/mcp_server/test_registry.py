@@ -0,0 +1,108 @@
+"""Tests for the lazy MCP tool registry."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.mcp_server.registry import (
+    DEFAULT_TOOL_HANDLERS,
+    ToolRegistry,
+)
+
+ROOT = Path(__file__).parent.parent.parent.parent
+
+
+class TestToolRegistry:
+    """Test lazy handler loading."""
+
+    def test_handlers_load_on_first_use(self):
+        """Modules should only be imported when a handler is requested."""
+        registry = ToolRegistry({"dumps": "json:dumps"})
+
+        assert not registry.is_loaded("dumps")
+        assert registry.get_handler("dumps") is json.dumps
+        assert registry.is_loaded("dumps")
+        assert "json" in registry.get_stats()["module_load_ms"]
+
+    def test_unknown_tool(self):
+        """Unknown tools should return None."""
+        assert ToolRegistry({}).get_handler("missing") is None
+
+    def test_rejects_bad_target(self):
+        """Targets must name a module and an attribute."""
+        with pytest.raises(ValueError):
+            ToolRegistry({"bad": "json"})
+
+    def test_prewarm_tolerates_broken_modules(self):
+        """A failing import should not stop the other handlers loading."""
+        registry = ToolRegistry(
+            {"broken": "src.does_not_exist:handler", "dumps": "json:dumps"}
+        )
+
+        registry.prewarm()
+
+        assert registry.is_loaded("dumps")
+        assert not registry.is_loaded("broken")
+
+    @pytest.mark.asyncio
+    async def test_start_prewarm_runs_in_background(self):
+        """Background pre-warm should load every handler."""
+        registry = ToolRegistry({"dumps": "json:dumps", "loads": "json:loads"})
+
+        await registry.start_prewarm()
+
+        assert registry.get_stats()["loaded_tools"] == 2
+
+    def test_default_targets_exist(self):
+        """Every default handler should resolve on the tools module."""
+        registry = ToolRegistry()
+
+        for name in DEFAULT_TOOL_HANDLERS:
+            assert callable(registry.get_handler(name)), name
+
+
+class TestLazyServer:
+    """Test the server's use of the registry."""
+
+    def test_server_import_does_not_load_tools(self):
+        """Importing the server should not import handler modules."""
+        code = (
+            "import sys, src.mcp_server.server; "
+            "print('src.mcp_server.tools' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatches_through_registry(self):
+        """Patched handlers on the tools module should still be called."""
+        from src.mcp_server.server import call_tool
+
+        with patch(
+            "src.mcp_server.tools.handle_get_voices",
+            new=AsyncMock(return_value={"voices": []}),
+        ) as mock_handler:
+            response = await call_tool("get_voices", {})
+
+        mock_handler.assert_awaited_once_with({})
+        assert json.loads(response[0].text) == {"voices": []}
+
+    @pytest.mark.asyncio
+    async def test_call_unknown_tool(self):
+        """Unknown tools should produce an error payload."""
+        from src.mcp_server.server import call_tool
+
+        response = await call_tool("no_such_tool", {})
+
+        assert "Unknown tool" in json.loads(response[0].text)["error"]
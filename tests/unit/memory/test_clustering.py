@@ -0,0 +1,263 @@
+"""Tests for memory clustering and cluster-then-summarize consolidation."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.jobs import JobQueue, JobStatus, JobStore
+from src.memory import mem0_integration
+from src.memory.clustering import (
+    MinHasher,
+    cluster_texts,
+    jaccard,
+    lsh_params,
+    shingles,
+)
+from src.memory.mem0_integration import (
+    CONSOLIDATION_JOB,
+    MemoryCategory,
+    MemoryConfig,
+    MemorySystem,
+    _parse_summaries,
+    register_consolidation_job,
+)
+
+
+class TestClustering:
+    """Test MinHash/LSH clustering."""
+
+    def test_exact_duplicates_ignore_case_and_punctuation(self):
+        clusters = cluster_texts(
+            {"a": "Use FastAPI.", "b": "use fastapi", "c": "Deploy with Docker"}
+        )
+        assert sorted(map(sorted, clusters)) == [["a", "b"], ["c"]]
+
+    def test_near_duplicates_cluster(self):
+        base = "the user prefers fastapi over flask for building small rest services"
+        clusters = cluster_texts(
+            {
+                "a": base,
+                "b": base + " quickly",
+                "c": "kubernetes manifests live in the deploy directory of the repo",
+            },
+            threshold=0.7,
+        )
+        assert clusters[0] == ["a", "b"]
+        assert ["c"] in clusters
+
+    def test_every_id_returned_once(self):
+        texts = {str(i): f"memory number {i % 7} about topic {i % 3}" for i in range(50)}
+        clusters = cluster_texts(texts, threshold=0.5, shingle_size=1)
+        ids = [i for cluster in clusters for i in cluster]
+        assert sorted(ids) == sorted(texts)
+
+    def test_minhash_estimates_jaccard(self):
+        a = shingles(" ".join(f"w{i}" for i in range(100)), size=1)
+        b = shingles(" ".join(f"w{i}" for i in range(50, 150)), size=1)
+        hasher = MinHasher(num_perm=256)
+        sig_a, sig_b = hasher.signature(a), hasher.signature(b)
+        estimate = sum(x == y for x, y in zip(sig_a, sig_b, strict=True)) / 256
+        assert abs(estimate - jaccard(a, b)) < 0.1
+
+    def test_lsh_params_err_below_threshold(self):
+        bands, rows = lsh_params(64, 0.8)
+        assert bands * rows == 64
+        assert (1 / bands) ** (1 / rows) <= 0.8
+
+
+class FakeRouter:
+    """Answers every numbered group and records the prompts."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def complete(self, prompt, task_type=None, max_tokens=None):
+        self.prompts.append(prompt)
+        groups = re.findall(r"^\[(\d+)\] Group: (\S+)", prompt, re.MULTILINE)
+        content = "\n".join(f"[{n}] summary of {label}" for n, label in groups)
+        return SimpleNamespace(content=content, usage={})
+
+
+@pytest.fixture
+def memory(tmp_path):
+    config = MemoryConfig(
+        storage_path=tmp_path,
+        enable_semantic_search=False,
+        consolidation_threshold=0,
+        consolidation_interval=-1,  # everything counts as old
+        consolidation_batch_size=2,
+    )
+    system = MemorySystem(config)
+    system._llm_router = FakeRouter()
+    yield system
+    system._local_store.close()
+
+
+async def add_fixture_memories(memory):
+    # Five copies of one fact collapse without the LLM
+    for _ in range(5):
+        await memory.add("User prefers dark mode in the editor", tags=["ui"])
+    # Three related clusters of three are summarized
+    topics = {
+        "db": "postgres database migration schema",
+        "ci": "github actions workflow pipeline",
+        "k8s": "kubernetes cluster helm chart",
+    }
+    for tag, words in topics.items():
+        for detail in ("alpha", "beta", "gamma"):
+            await memory.add(f"{words} {detail}", tags=[tag])
+    await memory.add("Standalone note about lunch", tags=["misc"])
+
+
+class TestConsolidation:
+    """Test MemorySystem.consolidate_memories."""
+
+    async def test_collapses_duplicates_and_batches_summaries(self, memory):
+        await add_fixture_memories(memory)
+
+        report = await memory.consolidate_memories(category=MemoryCategory.CONTEXT)
+
+        assert report["duplicates_collapsed"] == 4
+        assert report["clusters_summarized"] == 3
+        # Three clusters with two per prompt: two calls instead of four
+        assert report["llm_calls"] == 2
+        assert report["tokens_saved"] > 0
+        assert report["naive_prompt_tokens"] > report["llm_prompt_tokens"]
+
+        entries = memory._local_store.get_all()
+        folded = [e for e in entries if e.consolidated]
+        assert len(folded) == 4 + 9
+        summaries = [e for e in entries if "consolidated" in e.tags]
+        assert sorted(e.content for e in summaries) == [
+            "summary of ci",
+            "summary of db",
+            "summary of k8s",
+        ]
+
+    async def test_consolidated_memories_are_not_reprocessed(self, memory):
+        await add_fixture_memories(memory)
+        await memory.consolidate_memories(category=MemoryCategory.CONTEXT)
+        calls = len(memory._llm_router.prompts)
+
+        report = await memory.consolidate_memories(category=MemoryCategory.CONTEXT)
+
+        assert report["total_consolidated"] == 0
+        assert len(memory._llm_router.prompts) == calls
+
+    async def test_duplicates_collapse_without_router(self, memory):
+        memory._llm_router = None
+        await add_fixture_memories(memory)
+
+        report = await memory.consolidate_memories(category=MemoryCategory.CONTEXT)
+
+        assert report["success"]
+        assert report["duplicates_collapsed"] == 4
+        assert report["llm_calls"] == 0
+
+    async def test_resumes_from_checkpoint(self, memory):
+        await add_fixture_memories(memory)
+        checkpoint = memory.config.storage_path / "consolidation" / "run-1.json"
+        checkpoint.parent.mkdir()
+        checkpoint.write_text(
+            '{"categories_done": ["context"], "report": null}', encoding="utf-8"
+        )
+
+        report = await memory.consolidate_memories(
+            category=MemoryCategory.CONTEXT, run_id="run-1"
+        )
+
+        assert report["total_consolidated"] == 0
+        assert not checkpoint.exists()
+
+
+class FakeMem0:
+    """Mem0 stand-in whose updates cannot carry our metadata."""
+
+    def __init__(self, memories):
+        self.memories = list(memories)
+
+    def get_all(self, user_id):
+        return self.memories
+
+
+class TestConsolidationJobs:
+    """Test consolidation as a persisted background job."""
+
+    async def test_job_resumes_in_a_fresh_queue(self, memory, tmp_path, monkeypatch):
+        await add_fixture_memories(memory)
+        store = JobStore(tmp_path / "jobs.db")
+        first = JobQueue(store, max_workers=1)
+        monkeypatch.setattr(mem0_integration, "get_job_queue", lambda: first)
+
+        job = await memory.submit_consolidation(category=MemoryCategory.CONTEXT)
+        again = await memory.submit_consolidation(category=MemoryCategory.CONTEXT)
+        await first.stop()  # Workers never got to run it
+
+        assert again.id == job.id
+        assert job.params["scope"] == "context:*"
+        assert job.params["storage_path"] == str(memory.config.storage_path)
+
+        # A restarted process registers the kind at setup and resumes the job
+        second = JobQueue(store, max_workers=1)
+        register_consolidation_job(second)
+        await second.start()
+        done = await second.wait(job.id, timeout=5)
+        await second.stop()
+
+        assert done.status == JobStatus.COMPLETE
+        assert done.result["duplicates_collapsed"] == 4
+
+    async def test_job_opens_the_system_for_its_storage_path(
+        self, tmp_path, monkeypatch
+    ):
+        def unexpected():
+            raise AssertionError("job fell back to the global memory system")
+
+        monkeypatch.setattr(mem0_integration, "get_memory_system", unexpected)
+        queue = JobQueue(JobStore(tmp_path / "jobs.db"), max_workers=1)
+        register_consolidation_job(queue)
+        await queue.start()
+        path = tmp_path / "restarted"
+
+        job = await queue.submit(CONSOLIDATION_JOB, {"storage_path": str(path)})
+        done = await queue.wait(job.id, timeout=5)
+        orphan = await queue.submit(CONSOLIDATION_JOB, {"scope": "*:*"})
+        failed = await queue.wait(orphan.id, timeout=5)
+        await queue.stop()
+
+        assert done.status == JobStatus.COMPLETE
+        assert path.is_dir()  # the job opened a store at its own path
+        assert failed.status == JobStatus.FAILED
+        assert "storage_path" in failed.error
+
+    async def test_mem0_consolidation_marks_persist(self, memory):
+        memory._mem0 = FakeMem0(
+            {
+                "id": memory_id,
+                "content": f"fact {memory_id}",
+                "created_at": "2000-01-01T00:00:00",
+                "metadata": {"category": "context"},
+            }
+            for memory_id in ("a", "b")
+        )
+
+        await memory._mark_consolidated(
+            [{"id": "a", "content": "fact a"}], consolidated_into="s1"
+        )
+        # A later run re-reads the ledger and skips the folded memory
+        memory._mem0_consolidated = None
+        candidates = await memory._consolidation_candidates(
+            MemoryCategory.CONTEXT, None
+        )
+
+        assert [m["id"] for m in candidates] == ["b"]
+
+
+def test_parse_summaries():
+    text = "Sure!\n[1] First summary\ncontinues here\n[2]   \n[3] Third"
+    assert _parse_summaries(text, 3) == {
+        1: "First summary\ncontinues here",
+        3: "Third",
+    }
+    assert _parse_summaries("Just one summary", 1) == {1: "Just one summary"}
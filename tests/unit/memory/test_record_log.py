@@ -0,0 +1,160 @@
+"""Tests for the append-only memory record log."""
+
+import json
+
+import pytest
+
+from src.memory.mem0_integration import LocalMemoryStore, MemoryCategory
+from src.memory.record_log import DELETE, PUT, RESET, RecordLog
+
+
+def replay_state(log: RecordLog) -> dict[str, bytes]:
+    state = {}
+    for op, key, ref in log.replay():
+        if op == PUT:
+            state[key] = log.read(ref)
+        elif op == DELETE:
+            state.pop(key, None)
+        else:
+            state.clear()
+    return state
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalMemoryStore(tmp_path)
+    yield store
+    store.close()
+
+
+class TestRecordLog:
+    """Test segment replay, torn writes and compaction."""
+
+    def test_replay_after_reopen(self, tmp_path):
+        """Records should replay in order with lazily readable payloads."""
+        log = RecordLog(tmp_path, prefix="t")
+        log.append_put("a", b'{"v":1}')
+        log.append_put("b", b'{"v":2}')
+        log.append_put("a", b'{"v":3}')
+        log.append_delete("b")
+        log.close()
+
+        reopened = RecordLog(tmp_path, prefix="t")
+        ops = [op for op, _, _ in reopened.replay()]
+        assert ops == [PUT, PUT, PUT, DELETE]
+        assert replay_state(reopened) == {"a": b'{"v":3}'}
+        reopened.close()
+
+    def test_torn_tail_is_ignored(self, tmp_path):
+        """A record cut off mid-write should not break replay."""
+        log = RecordLog(tmp_path, prefix="t")
+        log.append_put("a", b'{"v":1}')
+        log.close()
+        with open(tmp_path / "t-00000000.log", "ab") as f:
+            f.write(b'P\tb\t{"v":')
+
+        reopened = RecordLog(tmp_path, prefix="t")
+        assert replay_state(reopened) == {"a": b'{"v":1}'}
+        reopened.close()
+
+    def test_compaction_swaps_segments(self, tmp_path):
+        """A snapshot should replace every sealed segment atomically."""
+        log = RecordLog(tmp_path, prefix="t")
+        for i in range(5):
+            log.append_put("a", f'{{"v":{i}}}'.encode())
+        seq = log.rotate()
+        log.append_put("b", b'{"v":"new"}')
+
+        tmp, refs = log.write_snapshot(seq, [("a", b'{"v":4}')])
+        log.install_snapshot(seq, tmp, 1)
+
+        assert log.read(refs["a"]) == b'{"v":4}'
+        log.close()
+        reopened = RecordLog(tmp_path, prefix="t")
+        assert [op for op, _, _ in reopened.replay()] == [RESET, PUT, PUT]
+        assert replay_state(reopened) == {"a": b'{"v":4}', "b": b'{"v":"new"}'}
+        reopened.close()
+
+    def test_unfinished_compaction_is_discarded(self, tmp_path):
+        """A crash before the swap should leave the old segments in charge."""
+        log = RecordLog(tmp_path, prefix="t")
+        log.append_put("a", b"1")
+        seq = log.rotate()
+        log.write_snapshot(seq, [("a", b"stale")])
+        log.close()
+
+        reopened = RecordLog(tmp_path, prefix="t")
+        assert not list(tmp_path.glob("*.tmp"))
+        assert replay_state(reopened) == {"a": b"1"}
+        reopened.close()
+
+
+class TestLocalMemoryStoreLog:
+    """Test LocalMemoryStore persistence through the log."""
+
+    def test_writes_append_one_record(self, store, tmp_path):
+        """Adding a memory should append to the log, not rewrite it."""
+        for i in range(20):
+            store.add(f"memory {i}", MemoryCategory.CONTEXT)
+        segment = next(tmp_path.glob("memories-*.log"))
+        size = segment.stat().st_size
+
+        store.add("one more", MemoryCategory.CONTEXT)
+
+        grown = segment.stat().st_size - size
+        assert 0 < grown < 600
+
+    def test_reopen_is_lazy(self, store, tmp_path):
+        """Reopening should index locations and parse entries on demand."""
+        kept = store.add("keep me", MemoryCategory.DECISION, agent_id="ops")
+        gone = store.add("delete me", MemoryCategory.DECISION)
+        store.update(kept.id, "kept and updated")
+        store.delete(gone.id)
+        store.close()
+
+        reopened = LocalMemoryStore(tmp_path)
+        assert reopened.get_stats()["loaded"] == 0
+        entry = reopened.get(kept.id)
+        assert (entry.content, entry.agent_id) == ("kept and updated", "ops")
+        assert reopened.get(gone.id) is None
+        assert reopened.get_stats()["loaded"] == 1
+        reopened.close()
+
+    def test_background_compaction(self, store, tmp_path, monkeypatch):
+        """Superseded records should be compacted away."""
+        monkeypatch.setattr(LocalMemoryStore, "COMPACT_MIN_RECORDS", 10)
+        entry = store.add("counter", MemoryCategory.CONTEXT)
+        for i in range(30):
+            store.update(entry.id, f"counter {i}")
+        store.close()
+
+        reopened = LocalMemoryStore(tmp_path)
+        assert reopened.get_stats()["log_records"] < 31
+        assert reopened.get(entry.id).content == "counter 29"
+        reopened.close()
+
+    def test_clear_survives_reopen(self, store, tmp_path):
+        """Clearing should persist as a reset record."""
+        store.add("old", MemoryCategory.CONTEXT)
+        store.clear()
+        store.add("new", MemoryCategory.CONTEXT)
+        store.close()
+
+        reopened = LocalMemoryStore(tmp_path)
+        assert [e.content for e in reopened.get_all()] == ["new"]
+        reopened.close()
+
+    def test_migrates_legacy_json(self, tmp_path):
+        """An existing memories.json should be imported once."""
+        legacy = LocalMemoryStore(tmp_path / "seed")
+        entry = legacy.add("from json", MemoryCategory.PATTERN)
+        legacy.close()
+        (tmp_path / "old").mkdir()
+        (tmp_path / "old" / "memories.json").write_text(
+            json.dumps({entry.id: entry.to_dict()}), encoding="utf-8"
+        )
+
+        store = LocalMemoryStore(tmp_path / "old")
+        assert [e.content for e in store.search("json")] == ["from json"]
+        assert (tmp_path / "old" / "memories.json.migrated").exists()
+        store.close()
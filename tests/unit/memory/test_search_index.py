@@ -0,0 +1,105 @@
+"""Tests for the BM25 memory search index."""
+
+import pytest
+
+from src.memory.mem0_integration import LocalMemoryStore, MemoryCategory
+from src.memory.search_index import BM25Index, tokenize
+
+
+@pytest.fixture
+def index():
+    index = BM25Index()
+    index.add("fastapi", "User prefers FastAPI over Flask", "preference", "coder")
+    index.add("tabs", "User prefers tabs over spaces", "preference")
+    index.add("cv2", "ModuleNotFoundError cv2: pip install opencv-python", "error")
+    index.add("flask", "Flask flask flask blueprint layout", "pattern", "coder")
+    return index
+
+
+class TestBM25Index:
+    """Test inverted index maintenance and ranking."""
+
+    def test_tokenize(self):
+        """Tokens should be lowercased words without punctuation."""
+        assert tokenize("Use FastAPI, not Flask!") == ["use", "fastapi", "not", "flask"]
+
+    def test_rare_terms_rank_higher(self, index):
+        """A query term in fewer documents should carry more weight."""
+        ranked = [doc_id for doc_id, _ in index.search("prefers fastapi")]
+        assert ranked[0] == "fastapi"
+        assert set(ranked) == {"fastapi", "tabs"}
+
+    def test_term_frequency_saturates(self, index):
+        """Repeated terms should score higher but stay finite."""
+        scores = dict(index.search("flask"))
+        assert scores["flask"] > scores["fastapi"]
+
+    def test_filters_intersect(self, index):
+        """Category and agent filters should both apply."""
+        assert [d for d, _ in index.search("flask", category="pattern")] == ["flask"]
+        assert [d for d, _ in index.search("prefers", agent_id="coder")] == ["fastapi"]
+        assert index.search("flask", category="error", agent_id="coder") == []
+        assert index.filter_ids() is None
+
+    def test_limit_uses_top_k(self, index):
+        """Only the best ``limit`` results should be returned."""
+        assert len(index.search("user prefers flask", limit=2)) == 2
+        assert index.search("flask", limit=0) == []
+
+    def test_update_and_remove(self, index):
+        """Re-adding replaces postings; removing drops them entirely."""
+        index.add("tabs", "Indent with four spaces", "preference")
+        assert "tabs" not in dict(index.search("tabs"))
+        assert "tabs" in dict(index.search("indent"))
+
+        assert index.remove("cv2")
+        assert not index.remove("cv2")
+        assert index.search("opencv") == []
+        assert "opencv" not in index._postings
+        assert index.get_stats()["documents"] == 3
+
+    def test_clear(self, index):
+        """Clearing should empty postings and filters."""
+        index.clear()
+        assert len(index) == 0
+        assert index.search("flask") == []
+        assert index.filter_ids(category="pattern") == set()
+
+
+class TestLocalMemoryStoreSearch:
+    """Test the local store's use of the index."""
+
+    def test_index_follows_store_changes(self, tmp_path):
+        """Add, update and delete should keep search results current."""
+        store = LocalMemoryStore(tmp_path)
+        entry = store.add("Use poetry for packaging", MemoryCategory.DECISION)
+        store.add("Use uv for packaging", MemoryCategory.DECISION, agent_id="ops")
+
+        assert len(store.search("packaging")) == 2
+        assert [e.agent_id for e in store.search("packaging", agent_id="ops")] == [
+            "ops"
+        ]
+
+        store.update(entry.id, "Use hatch for builds")
+        assert [e.id for e in store.search("hatch")] == [entry.id]
+        assert len(store.search("poetry")) == 0
+
+        store.delete(entry.id)
+        assert store.search("hatch") == []
+
+    def test_index_rebuilt_on_load(self, tmp_path):
+        """A reopened store should search its persisted memories."""
+        LocalMemoryStore(tmp_path).add("Prefer pytest fixtures", MemoryCategory.PATTERN)
+
+        reopened = LocalMemoryStore(tmp_path)
+        assert len(reopened.search("fixtures", MemoryCategory.PATTERN)) == 1
+        assert reopened.search("fixtures", MemoryCategory.ERROR_SOLUTION) == []
+
+    def test_empty_query_returns_filtered_memories(self, tmp_path):
+        """A blank query should list memories matching the filters."""
+        store = LocalMemoryStore(tmp_path)
+        store.add("one", MemoryCategory.CONTEXT)
+        store.add("two", MemoryCategory.LEARNING)
+
+        assert [e.content for e in store.search("", MemoryCategory.LEARNING)] == ["two"]
+        assert len(store.search("  ", limit=1)) == 1
@@ -0,0 +1,143 @@
+"""Tests for the semantic memory index."""
+
+import random
+
+import pytest
+
+from src.memory.mem0_integration import MemoryCategory, MemoryConfig, MemorySystem
+from src.memory.semantic_index import NUMPY_AVAILABLE, HashingEmbedder, VectorIndex
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")
+
+WORDS = (
+    "deploy docker kubernetes pytest fixture cache redis sqlite async queue "
+    "worker retry timeout auth token oauth react vue lint format build"
+).split()
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = VectorIndex(tmp_path / "vectors", batch_size=4)
+    index.add("deploy", "Deploy the API with docker compose")
+    index.add("tabs", "User prefers tabs over spaces")
+    index.add("k8s", "Deployments run as containers on kubernetes")
+    yield index
+    index.close()
+
+
+class TestHashingEmbedder:
+    """Test the offline embedder."""
+
+    def test_vectors_are_normalized_and_stable(self):
+        """The same text should always map to the same unit vector."""
+        first = HashingEmbedder(dim=64).embed(["hello world", ""])
+        second = HashingEmbedder(dim=64).embed(["hello world"])
+
+        assert first.shape == (2, 64)
+        assert abs(float(first[0] @ first[0]) - 1.0) < 1e-5
+        assert not first[1].any()
+        assert (first[0] == second[0]).all()
+
+    def test_related_words_are_closer(self):
+        """Shared trigrams should make inflections similar."""
+        a, b, c = HashingEmbedder().embed(["deployment", "deploying", "spaces"])
+        assert a @ b > a @ c
+
+
+class TestVectorIndex:
+    """Test storage and search."""
+
+    def test_search_ranks_related_first(self, index):
+        """Results should be ordered by cosine similarity."""
+        results = index.search("deploying containers", k=2)
+        assert [doc_id for doc_id, _ in results] == ["k8s", "deploy"]
+        assert results[0][1] >= results[1][1]
+
+    def test_allowed_filter(self, index):
+        """Only allowed IDs should be returned."""
+        assert [d for d, _ in index.search("deploy", allowed={"tabs"})] == ["tabs"]
+        assert index.search("deploy", allowed=set()) == []
+
+    def test_batches_pending_embeddings(self, tmp_path):
+        """Adds should wait until a batch fills or a search needs them."""
+        index = VectorIndex(tmp_path, batch_size=3)
+        index.add("a", "one")
+        index.add("b", "two")
+        assert index.get_stats()["pending"] == 2
+
+        index.add("c", "three")
+        assert index.get_stats()["pending"] == 0
+        index.add("d", "four")
+        assert len(index.search("four")) == 4
+        index.close()
+
+    def test_remove_and_reopen(self, index, tmp_path):
+        """Removals should persist and keep the other rows addressable."""
+        assert index.remove("deploy")
+        assert not index.remove("deploy")
+        index.add("tabs", "Indent with four spaces")
+        index.close()
+
+        reopened = VectorIndex(tmp_path / "vectors")
+        assert reopened.ids() == {"tabs", "k8s"}
+        assert reopened.search("indent spaces", k=1)[0][0] == "tabs"
+        reopened.close()
+
+    def test_embedder_change_rebuilds(self, index, tmp_path):
+        """Vectors from another embedder should be discarded."""
+        index.close()
+
+        reopened = VectorIndex(tmp_path / "vectors", HashingEmbedder(dim=32))
+        assert reopened.ids() == set()
+        reopened.close()
+
+    def test_ivf_recall(self, tmp_path):
+        """IVF search should find most of the exact top-k."""
+        rng = random.Random(7)
+        index = VectorIndex(tmp_path, ann_threshold=1000, nprobe=8, batch_size=256)
+        for i in range(2000):
+            index.add(f"m{i}", " ".join(rng.choices(WORDS, k=6)))
+
+        hits = total = 0
+        for _ in range(20):
+            query = " ".join(rng.choices(WORDS, k=3))
+            exact = {d for d, _ in index.search(query, 10, exact=True)}
+            approx = {d for d, _ in index.search(query, 10)}
+            hits += len(exact & approx)
+            total += len(exact)
+
+        assert index.get_stats()["mode"] == "ivf"
+        assert index.get_stats()["ivf_lists"] > 1
+        assert hits / total >= 0.7
+        index.close()
+
+
+class TestHybridMemorySearch:
+    """Test MemorySystem's local hybrid search."""
+
+    async def test_finds_memories_without_shared_keywords(self, tmp_path):
+        """Semantic matches should surface alongside keyword ones."""
+        memory = MemorySystem(MemoryConfig(storage_path=tmp_path))
+        if memory.is_mem0_active:
+            pytest.skip("Mem0 backend active")
+
+        await memory.add("Deployments run on kubernetes", MemoryCategory.DECISION)
+        await memory.add("User prefers tabs", MemoryCategory.PREFERENCE)
+
+        results = await memory.search("deploying", category=MemoryCategory.DECISION)
+        assert [r["content"] for r in results] == ["Deployments run on kubernetes"]
+        assert await memory.search("deploying", category=MemoryCategory.CONTEXT) == []
+
+    async def test_index_synced_with_existing_store(self, tmp_path):
+        """Memories stored before the index existed should be embedded."""
+        first = MemorySystem(
+            MemoryConfig(storage_path=tmp_path, enable_semantic_search=False)
+        )
+        if first.is_mem0_active:
+            pytest.skip("Mem0 backend active")
+        memory_id = await first.add("Containerized deployment", MemoryCategory.DECISION)
+        first._local_store.close()
+
+        second = MemorySystem(MemoryConfig(storage_path=tmp_path))
+        results = await second.search("deploying containers")
+        assert [r["id"] for r in results] == [memory_id]
@@ -2,13 +2,35 @@
 Unit tests for core health module.
 """
 
+import asyncio
+import time
+
 import pytest
 
 from src.core.health import (
     ComponentHealth,
     HealthChecker,
+    HealthMonitor,
     HealthStatus,
+    diff_health,
 )
+from src.core.realtime import EventBus, EventType
+
+
+def _probe(name, status=HealthStatus.HEALTHY, delay=0.0, calls=None):
+    async def check():
+        if calls is not None:
+            calls.append(name)
+        await asyncio.sleep(delay)
+        return ComponentHealth(name=name, status=status, message=status.value)
+
+    return check
+
+
+def _checker(**probes) -> HealthChecker:
+    checker = HealthChecker(probe_timeout=0.2)
+    checker._probes = probes
+    return checker
 
 
 class TestHealthStatus:
@@ -64,5 +86,121 @@ class TestHealthChecker:
         assert hasattr(checker, "check_all")
 
 
+class TestConcurrentChecks:
+    """Test concurrent, cached health checks."""
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self):
+        checker = _checker(**{f"p{i}": _probe(f"p{i}", delay=0.05) for i in range(7)})
+        start = time.monotonic()
+        health = await checker.check_all()
+        assert time.monotonic() - start < 0.2
+        assert [c.name for c in health.components] == [f"p{i}" for i in range(7)]
+        assert health.status == HealthStatus.HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_times_out(self):
+        checker = _checker(fast=_probe("fast"), slow=_probe("slow", delay=5))
+        health = await checker.check_all()
+        slow = health.components[1]
+        assert slow.status == HealthStatus.DEGRADED
+        assert "timed out" in slow.message
+        assert health.status == HealthStatus.DEGRADED
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_check(self):
+        calls = []
+        checker = _checker(a=_probe("a", delay=0.02, calls=calls))
+        results = await asyncio.gather(*(checker.check_all() for _ in range(5)))
+        assert calls == ["a"]
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_cached(self):
+        calls = []
+        checker = _checker(a=_probe("a", calls=calls))
+        first = await checker.get_snapshot(max_age=60)
+        assert await checker.get_snapshot(max_age=60) is first
+        assert first.to_dict()["age_seconds"] >= 0
+        await checker.get_snapshot(max_age=0)
+        assert calls == ["a", "a"]
+
+
+class TestDiffHealth:
+    """Test diff_health."""
+
+    def _snapshot(self, **statuses):
+        return {
+            "status": "healthy",
+            "timestamp": "now",
+            "components": [
+                {"name": n, "status": s, "message": s, "latency_ms": 1.0}
+                for n, s in statuses.items()
+            ],
+        }
+
+    def test_no_change_is_none(self):
+        before = self._snapshot(a="healthy")
+        after = self._snapshot(a="healthy")
+        after["components"][0]["latency_ms"] = 99.0
+        assert diff_health(before, after) is None
+
+    def test_reports_changed_and_removed(self):
+        diff = diff_health(
+            self._snapshot(a="healthy", b="healthy"),
+            self._snapshot(a="unhealthy", c="healthy"),
+        )
+        assert [c["name"] for c in diff["changed"]] == ["a", "c"]
+        assert diff["removed"] == ["b"]
+
+
+class TestHealthMonitor:
+    """Test HealthMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_versioned_diffs_on_change(self):
+        status = {"a": HealthStatus.HEALTHY}
+
+        async def check():
+            return ComponentHealth(name="a", status=status["a"], message="")
+
+        bus = EventBus()
+        queue = bus.create_queue([EventType.HEALTH_CHECK])
+        monitor = HealthMonitor(_checker(a=check), bus=bus)
+
+        version, state = await monitor.state()
+        assert version == 1
+        assert state["components"][0]["status"] == "healthy"
+        assert await monitor.refresh() is None
+
+        status["a"] = HealthStatus.UNHEALTHY
+        diff = await monitor.refresh()
+        assert (diff["base_version"], diff["version"]) == (1, 2)
+        assert diff["changed"][0]["status"] == "unhealthy"
+
+        events = [queue.get_nowait(), queue.get_nowait()]
+        assert [e.data["version"] for e in events] == [1, 2]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_runs_only_while_acquired(self):
+        calls = []
+        monitor = HealthMonitor(
+            _checker(a=_probe("a", calls=calls)), interval=0.01, bus=EventBus()
+        )
+        monitor.acquire()
+        monitor.acquire()
+        await asyncio.sleep(0.05)
+        monitor.release()
+        assert monitor.running
+        monitor.release()
+        await asyncio.sleep(0)
+        assert not monitor.running
+        checks = len(calls)
+        assert checks >= 2
+        await asyncio.sleep(0.03)
+        assert len(calls) == checks
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,251 @@
+"""
+Unit tests for core background jobs module.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core import jobs
+from src.core.jobs import (
+    Job,
+    JobPriority,
+    JobQueue,
+    JobStatus,
+    JobStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    yield store
+    store.close()
+
+
+class TestJobStore:
+    """Test SQLite job persistence."""
+
+    def test_save_and_get(self, store):
+        """Jobs should round-trip through the store."""
+        store.save(Job(id="a", kind="build", params={"x": 1}))
+        store.update("a", status=JobStatus.RUNNING, progress=40, stage="cloning")
+
+        job = store.get("a")
+        assert job.params == {"x": 1}
+        assert job.status == JobStatus.RUNNING
+        assert (job.progress, job.stage) == (40, "cloning")
+
+    def test_list_orders_by_priority(self, store):
+        """Listing should return higher-priority jobs first."""
+        store.save(Job(id="low", kind="k", priority=JobPriority.LOW))
+        store.save(Job(id="high", kind="k", priority=JobPriority.HIGH))
+        store.save(Job(id="done", kind="k", status=JobStatus.COMPLETE))
+
+        listed = store.list_jobs([JobStatus.PENDING])
+        assert [j.id for j in listed] == ["high", "low"]
+
+    def test_claim_is_exclusive(self, store):
+        """Only one owner can move a pending job to running."""
+        store.save(Job(id="a", kind="k"))
+
+        assert store.claim("a", "1:x", "now")
+        assert not store.claim("a", "2:y", "now")
+        job = store.get("a")
+        assert (job.status, job.owner, job.attempts) == (JobStatus.RUNNING, "1:x", 1)
+        assert not store.release("a", "2:y")
+        assert store.release("a", "1:x")
+
+
+class TestJobQueue:
+    """Test the priority worker pool."""
+
+    async def test_submit_returns_immediately(self, store):
+        """Submit should not wait for the handler."""
+        release = asyncio.Event()
+
+        async def handler(params, ctx):
+            ctx.report(50, "working")
+            await release.wait()
+            return {"value": params["n"] * 2}
+
+        queue = JobQueue(store, max_workers=1)
+        queue.register("double", handler)
+
+        job = await queue.submit("double", {"n": 21})
+        await asyncio.sleep(0.01)
+        running = queue.get(job.id)
+        assert running.status == JobStatus.RUNNING
+        assert running.progress == 50
+
+        release.set()
+        done = await queue.wait(job.id, timeout=1)
+        await queue.stop()
+
+        assert done.status == JobStatus.COMPLETE
+        assert done.result == {"value": 42}
+
+    async def test_priority_order(self, store):
+        """Queued jobs should run highest priority first."""
+        order = []
+
+        async def handler(params, ctx):
+            order.append(params["name"])
+            return {}
+
+        queue = JobQueue(store, max_workers=1)
+        queue.register("record", handler)
+
+        jobs = [
+            await queue.submit("record", {"name": "low"}, JobPriority.LOW),
+            await queue.submit("record", {"name": "high"}, JobPriority.HIGH),
+            await queue.submit("record", {"name": "normal"}),
+        ]
+        for job in jobs:
+            await queue.wait(job.id, timeout=1)
+        await queue.stop()
+
+        assert order == ["high", "normal", "low"]
+
+    async def test_cancel_running_job(self, store):
+        """Cancelling should stop the handler and free the worker."""
+
+        async def forever(params, ctx):
+            await asyncio.sleep(60)
+
+        async def quick(params, ctx):
+            return {"ok": True}
+
+        queue = JobQueue(store, max_workers=1)
+        queue.register("forever", forever)
+        queue.register("quick", quick)
+
+        slow = await queue.submit("forever", {})
+        await asyncio.sleep(0.01)
+        assert await queue.cancel(slow.id)
+        fast = await queue.submit("quick", {})
+        done = await queue.wait(fast.id, timeout=1)
+        await queue.stop()
+
+        assert queue.get(slow.id).status == JobStatus.CANCELLED
+        assert done.status == JobStatus.COMPLETE
+        assert not await queue.cancel(slow.id)
+
+    async def test_failures_and_timeouts(self, store):
+        """Exceptions and timeouts should mark the job failed."""
+
+        async def broken(params, ctx):
+            raise RuntimeError("boom")
+
+        async def slow(params, ctx):
+            await asyncio.sleep(1)
+
+        queue = JobQueue(store)
+        queue.register("broken", broken)
+        queue.register("slow", slow, timeout_seconds=0.01)
+
+        failed = await queue.wait((await queue.submit("broken", {})).id, timeout=1)
+        timed_out = await queue.wait((await queue.submit("slow", {})).id, timeout=1)
+        await queue.stop()
+
+        assert failed.status == JobStatus.FAILED
+        assert failed.error == "boom"
+        assert "timed out" in timed_out.error
+
+    async def test_resume_interrupted_jobs(self, store):
+        """Jobs left running by a crash should be re-run on start."""
+        store.save(Job(id="crashed", kind="build", status=JobStatus.RUNNING, attempts=1))
+        store.save(Job(id="exhausted", kind="build", status=JobStatus.RUNNING, attempts=3))
+
+        async def handler(params, ctx):
+            return {"resumed": True}
+
+        queue = JobQueue(store)
+        queue.register("build", handler, max_attempts=3)
+        await queue.start()
+        done = await queue.wait("crashed", timeout=1)
+        await queue.stop()
+
+        assert done.status == JobStatus.COMPLETE
+        assert done.attempts == 2
+        assert store.get("exhausted").status == JobStatus.FAILED
+
+    async def test_start_after_submit_does_not_rerun(self, store):
+        """Recovery must skip jobs this queue is already running."""
+        release = asyncio.Event()
+        calls = []
+
+        async def handler(params, ctx):
+            calls.append(1)
+            await release.wait()
+            return {}
+
+        queue = JobQueue(store)
+        queue.register("build", handler)
+        job = await queue.submit("build", {})
+        await asyncio.sleep(0.01)
+        await queue.start()
+        release.set()
+        done = await queue.wait(job.id, timeout=1)
+        await asyncio.sleep(0.01)
+        await queue.stop()
+
+        assert calls == [1]
+        assert done.attempts == 1
+
+    async def test_running_job_of_live_owner_is_left_alone(self, store, monkeypatch):
+        """Only jobs whose owning process is gone are re-queued."""
+        store.save(
+            Job(id="live", kind="build", status=JobStatus.RUNNING, owner="1:other")
+        )
+        store.save(
+            Job(id="dead", kind="build", status=JobStatus.RUNNING, owner="2:other")
+        )
+        monkeypatch.setattr(jobs.psutil, "pid_exists", lambda pid: pid == 1)
+
+        async def handler(params, ctx):
+            return {}
+
+        queue = JobQueue(store)
+        queue.register("build", handler)
+        await queue.start()
+        done = await queue.wait("dead", timeout=1)
+        await queue.stop()
+
+        assert done.status == JobStatus.COMPLETE
+        assert store.get("live").status == JobStatus.RUNNING
+
+    async def test_single_attempt_kind_is_not_retried(self, store):
+        """Side-effecting kinds registered with max_attempts=1 never re-run."""
+        store.save(
+            Job(id="half-done", kind="deploy", status=JobStatus.RUNNING, attempts=1)
+        )
+
+        async def handler(params, ctx):
+            raise AssertionError("must not run again")
+
+        queue = JobQueue(store)
+        queue.register("deploy", handler, max_attempts=1)
+        await queue.start()
+        await queue.stop()
+
+        assert store.get("half-done").status == JobStatus.FAILED
+
+    async def test_stop_leaves_running_job_resumable(self, store):
+        """Shutting down should not mark in-flight jobs as failed."""
+
+        async def forever(params, ctx):
+            await asyncio.sleep(60)
+
+        queue = JobQueue(store)
+        queue.register("forever", forever)
+        job = await queue.submit("forever", {})
+        await asyncio.sleep(0.01)
+        await queue.stop()
+
+        assert store.get(job.id).status == JobStatus.PENDING
+
+    async def test_unknown_kind(self, store):
+        """Submitting an unregistered kind should fail fast."""
+        with pytest.raises(ValueError):
+            await JobQueue(store).submit("missing", {})
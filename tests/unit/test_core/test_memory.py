@@ -3,6 +3,9 @@ Unit tests for core.memory module.
 """
 
 import os
+import sqlite3
+import threading
+from pathlib import Path
 
 import pytest
 
@@ -127,5 +130,175 @@ class TestMemoryStore:
             assert result is None
 
 
+
+@pytest.fixture
+def store(tmp_path):
+    store = MemoryStore(db_path=tmp_path / "memory.db")
+    yield store
+    store.close()
+
+
+class TestMemoryStoreIndexes:
+    """Test tag tables, full-text search and connection reuse."""
+
+    def test_tag_filter_runs_in_sql(self, store):
+        """Limit should apply after the tag filter, not before."""
+        for i in range(20):
+            store.save_memory(
+                MemoryEntry(
+                    id=f"m{i}",
+                    type=MemoryType.NOTE,
+                    content={"n": i},
+                    tags=["rare"] if i == 0 else ["common"],
+                )
+            )
+
+        results = store.search_memories(tags=["rare", "missing"], limit=5)
+        assert [e.id for e in results] == ["m0"]
+
+    def test_retagging_replaces_tags(self, store):
+        """Saving again should drop tags that were removed."""
+        entry = MemoryEntry(id="m", type=MemoryType.NOTE, content={}, tags=["old"])
+        store.save_memory(entry)
+        entry.tags = ["new"]
+        store.save_memory(entry)
+
+        assert store.search_memories(tags=["old"]) == []
+        assert [e.id for e in store.search_memories(tags=["new"])] == ["m"]
+
+    def test_full_text_memory_search(self, store):
+        """Content should be searchable and stay in sync on update/delete."""
+        store.save_memory(
+            MemoryEntry(id="a", type=MemoryType.NOTE, content={"text": "FastAPI app"})
+        )
+        store.save_memory(
+            MemoryEntry(id="b", type=MemoryType.AGENT, content={"text": "Flask app"})
+        )
+
+        assert {e.id for e in store.search_memories(query="app")} == {"a", "b"}
+        assert [e.id for e in store.search_memories(query="fastapi")] == ["a"]
+        assert store.search_memories(query="app", type=MemoryType.AGENT)[0].id == "b"
+        assert store.search_memories(query='"unbalanced') == []
+
+        store.save_memory(
+            MemoryEntry(id="a", type=MemoryType.NOTE, content={"text": "Django"})
+        )
+        store.delete_memory("b")
+        assert store.search_memories(query="app") == []
+        assert [e.id for e in store.search_memories(query="django")] == ["a"]
+
+    def test_json_keys_are_not_searchable(self, store):
+        """Only content values are indexed, not keys or JSON punctuation."""
+        store.save_memory(
+            MemoryEntry(
+                id="a",
+                type=MemoryType.NOTE,
+                content={"text": "Redis cache", "meta": {"source": ["docs"]}},
+            )
+        )
+
+        assert store.search_memories(query="text") == []
+        assert store.search_memories(query="source") == []
+        assert [e.id for e in store.search_memories(query="docs")] == ["a"]
+
+    def test_like_fallback_escapes_wildcards(self, store):
+        """Without FTS5, % and _ in queries match literally."""
+        store._fts_enabled = False
+        store.save_memory(
+            MemoryEntry(id="a", type=MemoryType.NOTE, content={"text": "100% done"})
+        )
+        store.save_memory(
+            MemoryEntry(id="b", type=MemoryType.NOTE, content={"text": "100 done"})
+        )
+        store.save_message("s", "user", "snake_case names")
+        store.save_message("s", "user", "snakeXcase names")
+
+        assert [e.id for e in store.search_memories(query="100%")] == ["a"]
+        assert store.search_memories(query="text") == []
+        hits = store.search_conversations("snake_case")
+        assert [m["content"] for m in hits] == ["snake_case names"]
+
+    def test_batch_messages_and_search(self, store):
+        """Batched messages should keep order and be full-text searchable."""
+        ids = store.save_messages(
+            "s1",
+            [
+                {"role": "user", "content": "How do I cache embeddings?"},
+                {"role": "assistant", "content": "Use the sqlite cache backend."},
+            ],
+        )
+        store.save_message("s2", "user", "Clear the cache please")
+
+        assert len(set(ids)) == 2
+        assert [m["role"] for m in store.get_conversation("s1")] == [
+            "user",
+            "assistant",
+        ]
+        assert len(store.search_conversations("cache")) == 3
+        hits = store.search_conversations("cache", session_id="s2")
+        assert [m["content"] for m in hits] == ["Clear the cache please"]
+
+    def test_connection_reused_per_thread(self, store):
+        """Each thread should get one WAL connection it keeps."""
+        conn = store._get_conn()
+        assert store._get_conn() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(store._get_conn()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+    def test_migrates_existing_tags(self, tmp_path):
+        """Tags stored only as JSON should be backfilled into the tag table."""
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE memories (id TEXT PRIMARY KEY, type TEXT NOT NULL, "
+            "content TEXT NOT NULL, tags TEXT, created_at TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL, metadata TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO memories VALUES "
+            "('m', 'note', '{\"text\": \"legacy note\"}', '[\"x\"]', 't', 't', '{}')"
+        )
+        conn.commit()
+        conn.close()
+
+        store = MemoryStore(db_path=Path(db_path))
+        assert [e.id for e in store.search_memories(tags=["x"])] == ["m"]
+        assert [e.id for e in store.search_memories(query="legacy")] == ["m"]
+        assert store.search_memories(query="text") == []
+        store.close()
+
+    def test_migrates_v1_json_index(self, tmp_path):
+        """A v1 index over the JSON content is replaced by the text index."""
+        db_path = tmp_path / "v1.db"
+        MemoryStore(db_path=db_path).close()
+        conn = sqlite3.connect(db_path)
+        for trigger in ("insert", "delete", "update"):
+            conn.execute(f"DROP TRIGGER memories_fts_{trigger}")
+        conn.execute("DROP TABLE memories_fts")
+        conn.execute(
+            "CREATE VIRTUAL TABLE memories_fts USING "
+            "fts5(content, content='memories', content_rowid='rowid')"
+        )
+        conn.execute(
+            "INSERT INTO memories (id, type, content, tags, created_at, "
+            "updated_at, metadata) VALUES "
+            "('m', 'note', '{\"text\": \"legacy note\"}', '[]', 't', 't', '{}')"
+        )
+        conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        store = MemoryStore(db_path=db_path)
+        assert [e.id for e in store.search_memories(query="legacy")] == ["m"]
+        assert store.search_memories(query="text") == []
+        store.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
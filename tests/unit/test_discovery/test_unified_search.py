@@ -0,0 +1,125 @@
+"""
+Unit tests for UnifiedSearch caching, coalescing and streaming.
+"""
+
+import asyncio
+
+import pytest
+
+from src.discovery.unified_search import UnifiedSearch
+from tests.mocks.mock_external import StubPlatformClient
+
+
+@pytest.fixture
+def make_search(monkeypatch):
+    monkeypatch.setattr(UnifiedSearch, "_init_clients", lambda self, *args: None)
+
+    def make(*clients: StubPlatformClient) -> UnifiedSearch:
+        search = UnifiedSearch()
+        search._clients = {c.name: c for c in clients}
+        return search
+
+    return make
+
+
+class TestUnifiedSearch:
+    """Test UnifiedSearch."""
+
+    async def test_identical_concurrent_searches_coalesce(self, make_search):
+        github = StubPlatformClient("github", delay=0.02)
+        search = make_search(github)
+
+        results = await asyncio.gather(*(search.search("rag") for _ in range(5)))
+
+        assert github.calls == 1
+        assert all(r is results[0] for r in results)
+        assert search.get_stats()["coalesced"] == 4
+        assert search.get_stats()["inflight"] == 0
+
+    async def test_cache_hit_and_expiry(self, make_search):
+        github = StubPlatformClient("github")
+        search = make_search(github)
+
+        first = await search.search("rag")
+        assert await search.search("rag") is first
+        assert github.calls == 1
+
+        # Different result size is a different search
+        await search.search("rag", max_results=5)
+        assert github.calls == 2
+
+        search._cache_ttl = 0
+        await asyncio.sleep(0.001)
+        await search.search("rag")
+        assert github.calls == 3
+
+    async def test_uncached_search_neither_reads_nor_writes_cache(self, make_search):
+        github = StubPlatformClient("github", delay=0.01)
+        search = make_search(github)
+
+        await search.search("rag", use_cache=False)
+        assert search.get_stats()["cached"] == 0
+
+        # A cached search does not join an uncached one in flight
+        fresh, cached = await asyncio.gather(
+            search.search("rag", use_cache=False), search.search("rag")
+        )
+        assert fresh is not cached
+        assert github.calls == 3
+        assert await search.search("rag") is cached
+
+    async def test_stream_yields_platforms_as_they_complete(self, make_search):
+        search = make_search(
+            StubPlatformClient("github", delay=0.05),
+            StubPlatformClient("huggingface", delay=0.0),
+            StubPlatformClient("kaggle", fail=True),
+        )
+
+        events = [event async for event in search.search_stream("rag")]
+
+        platforms = [e["platform"] for e in events if e["type"] == "platform"]
+        assert platforms[-1] == "github"
+        assert set(platforms) == {"github", "huggingface", "kaggle"}
+        kaggle = next(e for e in events if e.get("platform") == "kaggle")
+        assert "down" in kaggle["error"]
+
+        done = events[-1]
+        assert done["type"] == "done"
+        assert done["result"].total_count == 4
+        assert "kaggle" in done["result"].errors
+
+    async def test_stream_joins_inflight_search_and_replays_cache(self, make_search):
+        github = StubPlatformClient("github", delay=0.02)
+        search = make_search(github)
+
+        async def consume():
+            return [event async for event in search.search_stream("rag")]
+
+        result, streamed = await asyncio.gather(search.search("rag"), consume())
+        assert github.calls == 1
+        assert streamed[-1]["result"] is result
+
+        replay = await consume()
+        assert github.calls == 1
+        assert len(replay[0]["repositories"]) == 2
+
+    async def test_stream_ends_cleanly_when_search_is_closed(self, make_search):
+        search = make_search(
+            StubPlatformClient("github", delay=10),
+            StubPlatformClient("huggingface"),
+        )
+
+        events = []
+        async for event in search.search_stream("rag"):
+            events.append(event)
+            if event["platform"] == "huggingface":
+                await search.close()
+
+        assert [e["platform"] for e in events] == ["huggingface", "github"]
+        assert events[-1]["error"] == "cancelled"
+
+    async def test_close_closes_clients(self, make_search):
+        github = StubPlatformClient("github")
+        search = make_search(github)
+        await search.close()
+        assert github.closed
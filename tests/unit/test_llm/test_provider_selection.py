@@ -0,0 +1,226 @@
+"""
+Unit tests for latency-aware provider selection.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.llm.ollama_client import CompletionResult
+from src.llm.provider_selection import LatencyStats, ProviderSelector, hedged
+from src.llm.router import LLMRouter, ProviderType, TaskComplexity
+
+
+def _result(content: str) -> CompletionResult:
+    return CompletionResult(
+        content=content,
+        model="m",
+        tokens_used=1,
+        finish_reason="stop",
+        duration_ms=1,
+    )
+
+
+def _client(content: str, available: bool = True, delay: float = 0.0):
+    client = AsyncMock()
+    client.is_available.return_value = available
+
+    async def complete(**kwargs):
+        await asyncio.sleep(delay)
+        return _result(content)
+
+    client.complete.side_effect = complete
+    return client
+
+
+class TestLatencyStats:
+    """Test the EWMA bookkeeping."""
+
+    def test_errors_inflate_expected_latency(self):
+        stats = LatencyStats()
+        stats.record(100.0, ok=True)
+        assert stats.expected_ms == pytest.approx(100.0)
+        stats.record(0.0, ok=False)
+        assert stats.latency_ms == pytest.approx(100.0)
+        assert stats.expected_ms == pytest.approx(125.0)
+
+    def test_percentile(self):
+        stats = LatencyStats()
+        for value in range(1, 101):
+            stats.record(float(value), ok=True)
+        assert stats.percentile(0.95) == 96.0
+
+
+class TestProviderSelector:
+    """Test ProviderSelector."""
+
+    async def test_refresh_probes_concurrently_once(self):
+        calls = []
+
+        async def probe():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return True
+
+        selector = ProviderSelector({"a": probe, "b": probe})
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(selector.ensure_fresh() for _ in range(5)))
+        assert loop.time() - start < 0.09
+        assert len(calls) == 2
+
+        await selector.ensure_fresh()
+        assert len(calls) == 2
+
+    async def test_failing_probe_is_unhealthy(self):
+        async def broken():
+            raise ConnectionError("refused")
+
+        selector = ProviderSelector({"a": broken})
+        await selector.refresh()
+        assert selector.is_healthy("a") is False
+
+    def test_rank_by_expected_latency(self):
+        selector = ProviderSelector({}, switch_ratio=0.5)
+        selector.set_health("a", True)
+        selector.set_health("b", True)
+        selector.set_health("c", False)
+        selector.record("a", "m", 100.0, ok=True)
+        selector.record("b", "m", 70.0, ok=True)
+
+        # b is faster, but not enough to leave the preferred provider
+        assert selector.rank(["a", "b", "c"], preferred="a") == ["a", "b"]
+        assert selector.rank(["a", "b", "c"]) == ["b", "a"]
+
+        selector.record("b", "m", 10.0, ok=True)
+        selector.record("b", "m", 10.0, ok=True)
+        selector.record("b", "m", 10.0, ok=True)
+        assert selector.rank(["a", "b"], preferred="a") == ["b", "a"]
+
+    def test_failed_call_marks_unhealthy(self):
+        selector = ProviderSelector({})
+        selector.set_health("a", True)
+        selector.record("a", "m", 5.0, ok=False)
+        assert selector.rank(["a"]) == []
+
+    def test_hedge_delay_needs_samples(self):
+        selector = ProviderSelector({}, min_hedge_samples=3)
+        selector.record("a", "m", 100.0, ok=True)
+        assert selector.hedge_delay("a", "m") is None
+        selector.record("a", "m", 200.0, ok=True)
+        selector.record("a", "m", 300.0, ok=True)
+        assert selector.hedge_delay("a", "m") == pytest.approx(0.3)
+
+
+class TestHedged:
+    """Test hedged requests."""
+
+    async def test_fast_primary_skips_backup(self):
+        backup = AsyncMock(return_value="backup")
+
+        async def primary():
+            return "primary"
+
+        assert await hedged(primary, backup, delay=0.5) == "primary"
+        backup.assert_not_called()
+
+    async def test_backup_wins_and_primary_is_cancelled(self):
+        cancelled = asyncio.Event()
+
+        async def primary():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def backup():
+            return "backup"
+
+        assert await hedged(primary, backup, delay=0.01) == "backup"
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    async def test_failed_backup_waits_for_primary(self):
+        async def primary():
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        async def backup():
+            raise RuntimeError("down")
+
+        assert await hedged(primary, backup, delay=0.01) == "primary"
+
+    async def test_caller_cancel_cancels_primary(self):
+        cancelled = asyncio.Event()
+
+        async def primary():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(hedged(primary, AsyncMock(), delay=1))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+
+class TestRouterSelection:
+    """Test LLMRouter on top of the selector."""
+
+    async def test_requests_reuse_health_snapshot(self):
+        ollama = _client("ollama")
+        lmstudio = _client("lmstudio")
+        router = LLMRouter(ollama_client=ollama, lmstudio_client=lmstudio)
+
+        for _ in range(5):
+            await router.complete("hello", complexity=TaskComplexity.SIMPLE)
+
+        assert ollama.complete.await_count == 5
+        assert ollama.is_available.await_count == 1
+        assert lmstudio.is_available.await_count == 1
+
+    async def test_unhealthy_preferred_falls_back(self):
+        router = LLMRouter(
+            ollama_client=_client("ollama", available=False),
+            lmstudio_client=_client("lmstudio"),
+        )
+        assert await router.get_best_provider() == ProviderType.LMSTUDIO
+
+    async def test_failure_routes_next_request_elsewhere(self):
+        ollama = _client("ollama")
+        ollama.complete.side_effect = ConnectionError("refused")
+        lmstudio = _client("lmstudio")
+        router = LLMRouter(ollama_client=ollama, lmstudio_client=lmstudio)
+
+        first = await router.complete("hello", complexity=TaskComplexity.SIMPLE)
+        second = await router.complete("hello", complexity=TaskComplexity.SIMPLE)
+
+        assert first.content == second.content == "lmstudio"
+        assert ollama.complete.await_count == 1
+
+    async def test_hedge_uses_backup_when_primary_is_slow(self):
+        ollama = _client("ollama")
+        router = LLMRouter(
+            ollama_client=ollama,
+            lmstudio_client=_client("lmstudio"),
+            hedge_requests=True,
+        )
+        router._selector.min_hedge_samples = 2
+        model = router.route(TaskComplexity.SIMPLE).model
+        router._selector.record("ollama", model, 10.0, ok=True)
+        router._selector.record("ollama", model, 10.0, ok=True)
+
+        async def slow(**kwargs):
+            await asyncio.sleep(5)
+
+        ollama.complete.side_effect = slow
+        result = await asyncio.wait_for(
+            router.complete("hello", complexity=TaskComplexity.SIMPLE), 1
+        )
+        assert result.content == "lmstudio"
@@ -0,0 +1,232 @@
+"""
+Unit tests for the LLM response cache.
+"""
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+import src.llm.response_cache as response_cache_module
+from src.llm.litellm_router import CompletionResult, LiteLLMRouter
+from src.llm.ollama_client import CompletionResult as OllamaResult
+from src.llm.providers.base import CompletionResult as ProviderResult
+from src.llm.providers.base import ProviderConfig, ProviderStatus, ProviderType
+from src.llm.providers.registry import ProviderInfo, ProviderRegistry
+from src.llm.response_cache import (
+    ResponseCache,
+    fingerprint,
+    replay_stream,
+    should_cache,
+)
+from src.llm.router import LLMRouter, TaskComplexity
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "responses.db", max_entries=3)
+    monkeypatch.setattr(response_cache_module, "_response_cache", cache)
+    yield cache
+    cache.close()
+
+
+class TestFingerprint:
+    """Test request fingerprinting."""
+
+    def test_canonical_forms_match(self):
+        a = fingerprint("r", "m", [{"role": "user", "content": "hi"}], 0, 100)
+        b = fingerprint(
+            "r", "m", [{"content": "hi", "role": "user", "name": None}], 0.0, 100
+        )
+        assert a == b
+
+    def test_any_request_difference_changes_key(self):
+        base = ("r", "m", [{"role": "user", "content": "hi"}], 0.0, 100)
+        keys = {
+            fingerprint(*base),
+            fingerprint("r", "m2", *base[2:]),
+            fingerprint("r", "m", [{"role": "user", "content": "hi "}], 0.0, 100),
+            fingerprint(*base[:3], 0.1, 100),
+            fingerprint(*base[:4], 200),
+            fingerprint(*base, tools=[{"name": "search"}]),
+        }
+        assert len(keys) == 6
+
+    def test_should_cache(self):
+        assert should_cache(0)
+        assert not should_cache(0.7)
+        assert should_cache(0.7, cache=True)
+        assert not should_cache(0.0, cache=False)
+
+
+class TestResponseCache:
+    """Test ResponseCache storage."""
+
+    def test_round_trip_across_instances(self, cache, tmp_path):
+        cache.store("k", {"content": "hello"})
+        other = ResponseCache(tmp_path / "responses.db")
+        assert other.lookup("k") == {"content": "hello"}
+        other.close()
+
+    def test_hits_do_not_share_payloads(self, cache):
+        cache.store("k", {"usage": {"tokens": 1}})
+        cache.lookup("k")["usage"]["tokens"] = 99
+        assert cache.lookup("k") == {"usage": {"tokens": 1}}
+
+    def test_ttl_expires_entries(self, cache, monkeypatch):
+        cache.store("k", {"content": "old"})
+        future = time.time() + cache.ttl_seconds + 1
+        monkeypatch.setattr(response_cache_module.time, "time", lambda: future)
+        assert cache.lookup("k") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_evicts_least_recently_used(self, cache):
+        for key in ("a", "b", "c"):
+            cache.store(key, {"content": key})
+            time.sleep(0.002)
+        cache._memory.clear()
+        cache.lookup("a")  # "b" is now the least recently used
+        time.sleep(0.002)
+        cache.store("d", {"content": "d"})
+        cache._memory.clear()
+
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") is not None
+        assert cache.get_stats()["entries"] == 3
+
+    def test_per_caller_hit_rates(self, cache):
+        cache.store("k", {"content": "x"})
+        cache.lookup("k", caller="readme")
+        cache.lookup("k", caller="readme")
+        cache.lookup("missing", caller="readme")
+        cache.lookup("missing", caller="review")
+
+        stats = cache.get_stats()
+        assert stats["by_caller"]["readme"]["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["by_caller"]["review"]["hit_rate"] == 0
+        assert stats["hits"] == 2
+
+    async def test_replay_stream(self):
+        text = "x" * 150
+        chunks = [chunk async for chunk in replay_stream(text, chunk_chars=64)]
+        assert [len(c) for c in chunks] == [64, 64, 22]
+        assert "".join(chunks) == text
+
+
+class TestRouterIntegration:
+    """Test the cache under each router."""
+
+    async def test_litellm_router_chat(self, cache, monkeypatch):
+        router = LiteLLMRouter()
+        call = AsyncMock(
+            return_value=CompletionResult(
+                content="answer", model="m", provider="p", cost=0.5
+            )
+        )
+        monkeypatch.setattr(router, "_call_model", call)
+        messages = [{"role": "user", "content": "q"}]
+
+        first = await router.chat(messages, model="m", temperature=0)
+        second = await router.chat(messages, model="m", temperature=0)
+        await router.chat(messages, model="m", temperature=0.7)
+
+        assert call.await_count == 2
+        assert not first.cached
+        assert second.cached and second.content == "answer"
+        assert second.cost == 0.0
+        assert router.get_stats()["cache_hits"] == 1
+
+    async def test_llm_router_skips_providers_on_hit(self, cache):
+        ollama = AsyncMock()
+        ollama.is_available.return_value = True
+        ollama.complete.return_value = OllamaResult(
+            content="done",
+            model="m",
+            tokens_used=5,
+            finish_reason="stop",
+            duration_ms=9,
+        )
+        router = LLMRouter(ollama_client=ollama, lmstudio_client=AsyncMock())
+
+        for _ in range(3):
+            result = await router.complete(
+                "Summarize", complexity=TaskComplexity.SIMPLE, cache=True
+            )
+
+        assert result.cached and result.content == "done"
+        assert ollama.complete.await_count == 1
+        assert ollama.is_available.await_count == 1
+
+    async def test_litellm_fallback_not_cached_under_primary(self, cache, monkeypatch):
+        router = LiteLLMRouter()
+
+        async def call(model, **kwargs):
+            if model == "m":
+                raise RuntimeError("down")
+            return CompletionResult(content="backup", model=model, provider="ollama")
+
+        monkeypatch.setattr(router, "_call_model", call)
+        messages = [{"role": "user", "content": "q"}]
+
+        await router.chat(messages, model="m", temperature=0)
+        again = await router.chat(messages, model="m", temperature=0)
+        fallback = await router.chat(messages, model="ollama/llama3.1", temperature=0)
+
+        assert not again.cached
+        assert fallback.cached and fallback.content == "backup"
+
+    async def test_llm_router_fallback_not_cached_under_plan(self, cache):
+        ollama = AsyncMock()
+        ollama.is_available.return_value = True
+        ollama.complete.side_effect = RuntimeError("down")
+        lmstudio = AsyncMock()
+        lmstudio.is_available.return_value = True
+        lmstudio.complete.return_value = OllamaResult(
+            content="backup",
+            model="m",
+            tokens_used=5,
+            finish_reason="stop",
+            duration_ms=9,
+        )
+        router = LLMRouter(ollama_client=ollama, lmstudio_client=lmstudio)
+        router.hedge_requests = False
+
+        for _ in range(2):
+            result = await router.complete(
+                "Summarize", complexity=TaskComplexity.SIMPLE, cache=True
+            )
+
+        assert result.content == "backup" and not result.cached
+        assert lmstudio.complete.await_count == 2
+
+    async def test_registry_fallback_not_cached_under_requested(
+        self, cache, monkeypatch
+    ):
+        monkeypatch.setattr(
+            ProviderRegistry, "_register_builtin_providers", lambda self: None
+        )
+        registry = ProviderRegistry()
+        for priority, name in enumerate(["openai", "anthropic"]):
+            provider = AsyncMock()
+            provider.name = name
+            provider.health_check.return_value = ProviderStatus.HEALTHY
+            provider.complete.return_value = ProviderResult(
+                content=f"{name} answer", model="m", provider=name, tokens_used=1
+            )
+            config = ProviderConfig(
+                ProviderType.OPENAI, name, "http://x", priority=priority
+            )
+            registry._providers[name] = ProviderInfo(provider, config)
+        openai = registry.get_provider("openai")
+        openai.complete.side_effect = RuntimeError("down")
+
+        first = await registry.complete("q", provider_name="openai", temperature=0)
+        openai.complete.side_effect = None
+        second = await registry.complete("q", provider_name="openai", temperature=0)
+        direct = await registry.complete(
+            "q", provider_name="anthropic", temperature=0
+        )
+
+        assert first.content == "anthropic answer"
+        assert second.content == "openai answer" and not second.cached
+        assert direct.cached and direct.content == "anthropic answer"
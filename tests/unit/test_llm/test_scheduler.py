@@ -0,0 +1,231 @@
+"""
+Unit tests for the local backend scheduler.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import src.llm.litellm_router as litellm_module
+import src.llm.scheduler as scheduler_module
+from src.core.exceptions import LLMOverloadedError
+from src.llm.litellm_router import LiteLLMRouter
+from src.llm.ollama_client import OllamaClient
+from src.llm.scheduler import BackendScheduler, RequestLane, request_lane
+
+
+@pytest.fixture(autouse=True)
+def isolated_schedulers(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "_schedulers", {})
+
+
+def _slow(seconds: float, value=None, log: list | None = None):
+    async def call():
+        if log is not None:
+            log.append(value)
+        await asyncio.sleep(seconds)
+        return value
+
+    return call
+
+
+class TestBackendScheduler:
+    """Test BackendScheduler."""
+
+    async def test_concurrency_cap(self):
+        scheduler = BackendScheduler("test", max_concurrency=2)
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await asyncio.gather(*(scheduler.run(call) for _ in range(8)))
+        assert peak == 2
+        assert scheduler.get_stats()["admitted"] == 8
+        assert scheduler.queue_depth == 0
+
+    async def test_lanes_served_in_priority_order(self):
+        scheduler = BackendScheduler("test", max_concurrency=1)
+        order = []
+        blocker = asyncio.create_task(scheduler.run(_slow(0.02)))
+        await asyncio.sleep(0)
+
+        tasks = [
+            asyncio.create_task(
+                scheduler.run(_slow(0, lane.name, order), lane=lane)
+            )
+            for lane in (
+                RequestLane.CONSOLIDATION,
+                RequestLane.REVIEW,
+                RequestLane.INTERACTIVE,
+            )
+        ]
+        await asyncio.gather(blocker, *tasks)
+        assert order == ["INTERACTIVE", "REVIEW", "CONSOLIDATION"]
+
+    async def test_context_lane(self):
+        scheduler = BackendScheduler("test", max_concurrency=1)
+        order = []
+        blocker = asyncio.create_task(scheduler.run(_slow(0.02)))
+        await asyncio.sleep(0)
+
+        background = asyncio.create_task(scheduler.run(_slow(0, "bg", order)))
+        with request_lane(RequestLane.INTERACTIVE):
+            chat = asyncio.create_task(scheduler.run(_slow(0, "chat", order)))
+        await asyncio.gather(blocker, background, chat)
+        assert order == ["chat", "bg"]
+
+    async def test_rejects_when_deadline_cannot_be_met(self):
+        scheduler = BackendScheduler("test", max_concurrency=1)
+        await scheduler.run(_slow(0.05))  # learn the service time
+
+        blocker = asyncio.create_task(scheduler.run(_slow(0.05)))
+        await asyncio.sleep(0)
+        with pytest.raises(LLMOverloadedError) as exc_info:
+            await scheduler.run(_slow(0), deadline=time.monotonic() + 0.01)
+        assert exc_info.value.code == "LLM_OVERLOADED"
+        assert exc_info.value.details["retry_after"] > 0
+        await blocker
+        assert scheduler.get_stats()["rejected"] == 1
+
+    async def test_queued_request_dropped_at_deadline(self):
+        scheduler = BackendScheduler("test", max_concurrency=1)
+        blocker = asyncio.create_task(scheduler.run(_slow(0.1)))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMOverloadedError):
+            await scheduler.run(_slow(0), deadline=time.monotonic() + 0.02)
+        assert scheduler.queue_depth == 0
+        await blocker
+        # The slot is free again
+        assert await scheduler.run(_slow(0, "ok")) == "ok"
+
+    async def test_queue_full(self):
+        scheduler = BackendScheduler("test", max_concurrency=1, max_queue=1)
+        first = asyncio.create_task(scheduler.run(_slow(0.02)))
+        second = asyncio.create_task(scheduler.run(_slow(0)))
+        await asyncio.sleep(0)
+        with pytest.raises(LLMOverloadedError):
+            await scheduler.run(_slow(0))
+        await asyncio.gather(first, second)
+
+    async def test_cancelled_waiter_frees_its_place(self):
+        scheduler = BackendScheduler("test", max_concurrency=1)
+        blocker = asyncio.create_task(scheduler.run(_slow(0.02)))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(scheduler.run(_slow(0)))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await blocker
+        assert scheduler.get_stats()["running"] == 0
+        assert scheduler.queue_depth == 0
+
+    async def test_coalesces_identical_inflight_requests(self):
+        scheduler = BackendScheduler("test", max_concurrency=4)
+        calls = []
+        results = await asyncio.gather(
+            *(scheduler.run(_slow(0.01, "answer", calls), key="k") for _ in range(5)),
+            scheduler.run(_slow(0.01, "other", calls), key="k2"),
+        )
+        assert results == ["answer"] * 5 + ["other"]
+        assert len(calls) == 2
+        assert scheduler.get_stats()["coalesced"] == 4
+
+    async def test_coalesced_failure_reaches_every_caller(self):
+        scheduler = BackendScheduler("test")
+
+        async def broken():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(scheduler.run(broken, key="k") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_follower_survives_leader_cancel(self):
+        scheduler = BackendScheduler("test")
+        calls = []
+        leader = asyncio.create_task(
+            scheduler.run(_slow(0.05, "answer", calls), key="k")
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            scheduler.run(_slow(0.01, "answer", calls), key="k")
+        )
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+
+        assert await follower == "answer"
+        assert leader.cancelled()
+        assert len(calls) == 2
+
+
+class TestClientIntegration:
+    """Test clients sharing a scheduler."""
+
+    async def test_ollama_clients_share_backend_cap(self):
+        clients = [OllamaClient(max_concurrency=1) for _ in range(3)]
+        assert len({id(c._scheduler) for c in clients}) == 1
+
+        active = peak = 0
+
+        async def post(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"message": {"content": "hi"}}
+            return response
+
+        http = AsyncMock()
+        http.post.side_effect = post
+        for client in clients:
+            client._client = http
+
+        results = await asyncio.gather(
+            *(c.complete(f"prompt {i}") for i, c in enumerate(clients)),
+            clients[0].complete("prompt 0"),
+        )
+        assert [r.content for r in results] == ["hi"] * 4
+        assert peak == 1
+        # The repeated prompt joined the in-flight call
+        assert http.post.await_count == 3
+
+    async def test_litellm_local_models_share_backend_cap(self, monkeypatch):
+        active = peak = 0
+
+        async def acompletion(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return MagicMock(choices=[MagicMock()], usage=None)
+
+        client = OllamaClient(max_concurrency=1)
+        router = LiteLLMRouter()
+        monkeypatch.setattr(litellm_module, "LITELLM_AVAILABLE", True)
+        monkeypatch.setattr(litellm_module, "acompletion", acompletion, raising=False)
+
+        await asyncio.gather(
+            *(
+                router.chat(
+                    [{"role": "user", "content": f"q{i}"}], model="ollama/llama3.1"
+                )
+                for i in range(3)
+            )
+        )
+
+        assert peak == 1
+        assert client._scheduler.get_stats()["admitted"] == 3
@@ -0,0 +1,195 @@
+"""
+Unit tests for end-to-end streaming through LiteLLMRouter.
+"""
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+import src.llm.response_cache as response_cache_module
+import src.llm.scheduler as scheduler_module
+from src.llm.litellm_router import LiteLLMRouter, StreamEvent, StreamEventType
+from src.llm.ollama_client import CompletionResult as OllamaResult
+from src.llm.ollama_client import OllamaClient
+from src.llm.response_cache import ResponseCache
+
+CHUNKS = [
+    {"model": "qwen", "message": {"content": "Hel"}, "done": False},
+    {"model": "qwen", "message": {"content": "lo"}, "done": False},
+    {
+        "model": "qwen",
+        "message": {"content": ""},
+        "done": True,
+        "done_reason": "stop",
+        "prompt_eval_count": 7,
+        "eval_count": 2,
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "_schedulers", {})
+    cache = ResponseCache(tmp_path / "responses.db")
+    monkeypatch.setattr(response_cache_module, "_response_cache", cache)
+    yield
+    cache.close()
+
+
+def _ollama_http(requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        body = "\n".join(json.dumps(chunk) for chunk in CHUNKS) + "\n"
+        return httpx.Response(200, content=body.encode())
+
+    return httpx.AsyncClient(
+        base_url="http://ollama", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.fixture
+def router():
+    router = LiteLLMRouter()
+    client = OllamaClient(default_model="qwen")
+    router.requests = []
+    client._client = _ollama_http(router.requests)
+    router._ollama_client = client
+    return router
+
+
+class TestOllamaStream:
+    """Test OllamaClient.stream_chat."""
+
+    async def test_yields_ndjson_chunks(self):
+        requests = []
+        client = OllamaClient()
+        client._client = _ollama_http(requests)
+        messages = [{"role": "user", "content": "hi"}]
+
+        chunks = [chunk async for chunk in client.stream_chat(messages)]
+
+        assert chunks == CHUNKS
+        assert requests[0]["stream"] is True
+        assert requests[0]["messages"] == messages
+        assert client._scheduler.get_stats()["running"] == 0
+
+
+class TestStreamChat:
+    """Test LiteLLMRouter.stream_chat."""
+
+    async def test_typed_events(self, router):
+        events = [
+            event
+            async for event in router.stream_chat(
+                [{"role": "user", "content": "hi"}], model="ollama/qwen"
+            )
+        ]
+
+        assert [e.type for e in events] == [
+            StreamEventType.TEXT,
+            StreamEventType.TEXT,
+            StreamEventType.USAGE,
+            StreamEventType.FINISH,
+        ]
+        assert "".join(e.text for e in events) == "Hello"
+        assert events[-1].usage["completion_tokens"] == 2
+        assert events[-1].model == "ollama/qwen"
+        assert router.requests[0]["model"] == "qwen"
+
+        streaming = router.get_stats()["streaming"]["ollama/qwen"]
+        assert streaming["streams"] == 1
+        assert streaming["ttft_ms"] is not None
+
+    async def test_stream_text_api(self, router):
+        chunks = [chunk async for chunk in router.stream("hi")]
+        assert chunks == ["Hel", "lo"]
+
+    async def test_call_model_collects_stream(self, router):
+        result = await router._call_model(
+            "ollama/qwen", [{"role": "user", "content": "hi"}], 64, 0.7, stream=True
+        )
+        assert result.content == "Hello"
+        assert result.usage["prompt_tokens"] == 7
+        assert result.finish_reason == "stop"
+
+    async def test_falls_back_only_before_first_event(self, router, monkeypatch):
+        async def fake_stream(model, *args, **kwargs):
+            if model == "primary/model":
+                raise ConnectionError("down")
+            yield StreamEvent(StreamEventType.TEXT, text="ok", model=model)
+            yield StreamEvent(StreamEventType.FINISH, model=model)
+
+        monkeypatch.setattr(router, "_stream_model", fake_stream)
+        router.config.fallback_chains["primary"] = ["backup/model"]
+        events = [e async for e in router.stream_chat([], model="primary/model")]
+        assert events[0].model == "backup/model"
+
+        async def broken_midway(model, *args, **kwargs):
+            yield StreamEvent(StreamEventType.TEXT, text="partial", model=model)
+            raise ConnectionError("reset")
+
+        monkeypatch.setattr(router, "_stream_model", broken_midway)
+        with pytest.raises(ConnectionError):
+            async for _ in router.stream_chat([], model="primary/model"):
+                pass
+
+    async def test_fallback_streams_the_attempt_model(self, router):
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            router.requests.append(body["model"])
+            if body["model"] == "broken":
+                return httpx.Response(500, content=b"model not found")
+            lines = "\n".join(json.dumps(chunk) for chunk in CHUNKS) + "\n"
+            return httpx.Response(200, content=lines.encode())
+
+        router._ollama_client._client = httpx.AsyncClient(
+            base_url="http://ollama", transport=httpx.MockTransport(handler)
+        )
+        router.config.fallback_chains["ollama"] = ["groq/fast", "ollama/backup"]
+
+        events = [e async for e in router.stream_chat([], model="ollama/broken")]
+
+        # groq needs LiteLLM, so it is skipped without a request
+        assert router.requests == ["broken", "backup"]
+        assert events[-1].model == "ollama/backup"
+
+    async def test_completed_stream_is_cached(self, router):
+        messages = [{"role": "user", "content": "hi"}]
+        first = [e async for e in router.stream_chat(messages, temperature=0)]
+        second = [e async for e in router.stream_chat(messages, temperature=0)]
+
+        assert len(router.requests) == 1
+        assert "".join(e.text for e in second) == "".join(e.text for e in first)
+        assert second[-1].type is StreamEventType.FINISH
+        assert router.get_stats()["cache_hits"] == 1
+
+
+class TestFallbackOllama:
+    """Test the non-streaming Ollama fallback."""
+
+    async def test_reuses_client_and_reports_usage(self):
+        router = LiteLLMRouter()
+        client = AsyncMock()
+        client.complete.return_value = OllamaResult(
+            content="done",
+            model="qwen",
+            tokens_used=9,
+            finish_reason="stop",
+            duration_ms=1,
+            prompt_tokens=7,
+            completion_tokens=2,
+        )
+        router._ollama_client = client
+
+        for _ in range(2):
+            result = await router._fallback_ollama([], 64, 0.7)
+
+        assert router._get_ollama_client() is client
+        assert result.model == "ollama/qwen"
+        assert result.usage == {
+            "prompt_tokens": 7,
+            "completion_tokens": 2,
+            "total_tokens": 9,
+        }
@@ -3,6 +3,7 @@ Unit tests for MCP server tools module.
 Tests the core functionality of the tools handlers.
 """
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -289,5 +290,84 @@ class TestUpdateJob:
         assert job["status"] == "running"
 
 
+class TestSynthesisJobs:
+    """Test synthesis running on the background job queue."""
+
+    @pytest.fixture
+    def job_queue(self, tmp_path):
+        from src.core.jobs import JobQueue, JobStore
+
+        queue = JobQueue(JobStore(tmp_path / "jobs.db"))
+        with patch("src.mcp_server.tools.get_job_queue", return_value=queue):
+            yield queue
+
+    @pytest.fixture
+    def build_args(self, tmp_path):
+        return {
+            "repositories": [{"repo_url": "https://github.com/octocat/Hello-World"}],
+            "project_name": "demo",
+            "output_path": str(tmp_path / "out"),
+        }
+
+    @pytest.fixture
+    def mock_builder(self):
+        build_result = MagicMock(
+            project_path="/tmp/demo",
+            repos_processed=1,
+            components_extracted=2,
+            deps_merged=3,
+            files_created=4,
+            docs_generated=[],
+            warnings=[],
+        )
+        with patch("src.mcp_server.tools.ProjectBuilder") as builder_cls:
+            builder_cls.return_value.build = AsyncMock(return_value=build_result)
+            yield builder_cls
+
+    @pytest.mark.asyncio
+    async def test_synthesis_returns_job_id(
+        self, job_queue, build_args, mock_builder
+    ):
+        """The tool should return a job id and finish in the background."""
+        result = await tools.handle_synthesize_project(build_args)
+
+        assert result["status"] == "queued"
+        job_id = result["synthesis_id"]
+
+        await job_queue.wait(job_id, timeout=1)
+        status = await tools.handle_get_synthesis_status({"synthesis_id": job_id})
+        await job_queue.stop()
+
+        assert status["job_status"] == "complete"
+        assert status["progress"] == 100
+        assert status["result"]["files_created"] == 4
+
+    @pytest.mark.asyncio
+    async def test_synthesis_wait(self, job_queue, build_args, mock_builder):
+        """wait=True should return the full synthesis result."""
+        result = await tools.handle_synthesize_project({**build_args, "wait": True})
+        await job_queue.stop()
+
+        assert result["status"] == "success"
+        assert result["project_path"] == "/tmp/demo"
+
+    @pytest.mark.asyncio
+    async def test_cancel_synthesis(self, job_queue, build_args, mock_builder):
+        """Queued jobs should be cancellable through the tool."""
+        async def hang(**kwargs):
+            await asyncio.sleep(60)
+
+        mock_builder.return_value.build = AsyncMock(side_effect=hang)
+        result = await tools.handle_synthesize_project(build_args)
+
+        cancelled = await tools.handle_cancel_synthesis(
+            {"synthesis_id": result["synthesis_id"]}
+        )
+        await job_queue.stop()
+
+        assert cancelled["cancelled"] is True
+        assert cancelled["job_status"] == "cancelled"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -11,10 +11,38 @@ import pytest
 
 from src.resolution.python_resolver import (
     PythonResolver,
+    ResolutionCache,
     ResolutionResult,
     ResolvedPackage,
+    clear_tool_cache,
+    get_resolution_cache,
 )
 
+LOCKFILE = """# This file was autogenerated by uv via the following command:
+#    uv pip compile requirements.in
+annotated-types==0.6.0
+    # via pydantic
+fastapi==0.104.1
+    # via -r requirements.in
+httpx==0.26.0
+    # via -r requirements.in
+pydantic==2.5.0
+    # via
+    #   -r requirements.in
+    #   fastapi
+starlette==0.27.0
+    # via fastapi
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Tool discovery and resolutions are cached per process."""
+    clear_tool_cache()
+    get_resolution_cache().clear()
+    yield
+    clear_tool_cache()
+
 
 class TestPythonResolver:
     """Test suite for PythonResolver."""
@@ -52,6 +80,7 @@ class TestPythonResolver:
             assert resolver._uv_available is True
 
             mock_run.return_value.returncode = 1
+            clear_tool_cache()
             resolver = PythonResolver()
             assert resolver._uv_available is False
 
@@ -63,9 +92,19 @@ class TestPythonResolver:
             assert resolver._pip_compile_available is True
 
             mock_run.return_value.returncode = 1
+            clear_tool_cache()
             resolver = PythonResolver()
             assert resolver._pip_compile_available is False
 
+    def test_tool_discovery_runs_once(self):
+        """New resolvers should reuse the discovered tools."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            PythonResolver()
+            PythonResolver()
+
+            assert mock_run.call_count == 2  # uv and pip-compile, once each
+
     # ========================================
     # Resolution Tests
     # ========================================
@@ -338,3 +377,75 @@ pydantic==2.5.0  # Inline comment
             assert len(result.packages) >= 2  # Simple resolver might include more
             assert result.resolution_time_ms >= 0  # Can be 0 in tests
             assert "simple mode" in result.lockfile_content
+
+
+class TestResolutionCache:
+    """Test memoized resolutions."""
+
+    @pytest.fixture
+    def resolver(self):
+        resolver = PythonResolver(cache=ResolutionCache())
+        resolver._uv_available = True
+        return resolver
+
+    @pytest.fixture
+    def lock_result(self, resolver):
+        return ResolutionResult(
+            success=True,
+            packages=resolver._parse_lockfile(LOCKFILE),
+            lockfile_content=LOCKFILE,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_resolution_is_cached(self, resolver, lock_result):
+        """Equivalent requirement sets should only be solved once."""
+        with patch.object(
+            resolver, "_resolve_with_uv", new=AsyncMock(return_value=lock_result)
+        ) as mock_uv:
+            await resolver.resolve(["fastapi>=0.100", "pydantic>=2", "httpx"])
+            result = await resolver.resolve(["httpx", "Pydantic >= 2", "fastapi>=0.100"])
+
+        assert mock_uv.call_count == 1
+        assert result.success
+        assert len(result.packages) == 5
+        assert resolver.cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subset_served_from_superset(self, resolver, lock_result):
+        """A subset should get the transitive closure of the cached lock."""
+        with patch.object(
+            resolver, "_resolve_with_uv", new=AsyncMock(return_value=lock_result)
+        ) as mock_uv:
+            await resolver.resolve(["fastapi>=0.100", "pydantic>=2", "httpx"])
+            result = await resolver.resolve(["pydantic>=2"])
+
+        assert mock_uv.call_count == 1
+        assert sorted(p.name for p in result.packages) == [
+            "annotated-types",
+            "pydantic",
+        ]
+        assert "fastapi==" not in result.lockfile_content
+
+    @pytest.mark.asyncio
+    async def test_context_is_part_of_key(self, resolver, lock_result):
+        """Different Python versions or constraints must not share results."""
+        with patch.object(
+            resolver, "_resolve_with_uv", new=AsyncMock(return_value=lock_result)
+        ) as mock_uv:
+            await resolver.resolve(["httpx"], python_version="3.11")
+            await resolver.resolve(["httpx"], python_version="3.12")
+            await resolver.resolve(["httpx"], constraints=["anyio<4"])
+
+        assert mock_uv.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, resolver):
+        """Failed resolutions should be retried."""
+        failed = ResolutionResult(success=False, conflicts=["x"])
+        with patch.object(
+            resolver, "_resolve_with_uv", new=AsyncMock(return_value=failed)
+        ) as mock_uv:
+            await resolver.resolve(["httpx"])
+            await resolver.resolve(["httpx"])
+
+        assert mock_uv.call_count == 2
@@ -0,0 +1,140 @@
+"""
+Unit tests for PEP 440 specifier intersection.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.analysis.dependency_analyzer import Dependency, DependencyGraph
+from src.resolution.conflict_detector import ConflictDetector
+from src.resolution.python_resolver import PythonResolver
+from src.resolution.specifiers import find_conflicts, specifiers_compatible
+
+
+class TestSpecifiersCompatible:
+    """Test exact specifier intersection."""
+
+    @pytest.mark.parametrize(
+        "specs",
+        [
+            (">=1.0", "<2.0"),
+            ("==1.0", "==1.0.0"),
+            ("~=1.4", ">=1.9"),
+            ("==1.2.*", "<1.2.5"),
+            (">=2.0b1", "<2.0b3"),
+            ("==1.0a1", ">=0.9"),
+            ("", "==3.0"),
+            # Agree with packaging on post-releases and local labels
+            ("<1.0.post1", "==1.0"),
+            ("==1.0", "==1.0+cpu"),
+            ("<=1.0", "==1.0+cpu"),
+        ],
+    )
+    def test_compatible(self, specs):
+        """Overlapping specifiers should be compatible."""
+        assert specifiers_compatible(*specs)
+
+    @pytest.mark.parametrize(
+        "specs",
+        [
+            (">=2.0", "<2.0"),
+            ("==1.0", "==2.0"),
+            ("~=1.4.2", ">=1.5"),
+            ("!=1.0", "==1.0"),
+            ("==1.2.*", ">=1.3"),
+            ("!=1.2.*", ">=1.2,<1.3"),
+            (">1.0", "<=1.0.post2"),
+            ("<1.0.post1", ">=1.0.post1"),
+            ("==1.0+cpu", "==1.0+cu121"),
+        ],
+    )
+    def test_incompatible(self, specs):
+        """Disjoint specifiers should be incompatible."""
+        assert not specifiers_compatible(*specs)
+
+    def test_prereleases_need_explicit_opt_in(self):
+        """A range containing only pre-releases is empty unless one is named."""
+        assert not specifiers_compatible(">=1.0a1,<1.0")
+        assert not specifiers_compatible(">=1.0.dev0", "<1.0")
+        assert specifiers_compatible(">=1.0a1", "<1.0b1")
+
+    def test_unparseable_is_compatible(self):
+        """Unknown syntax is left to the external resolver."""
+        assert specifiers_compatible("garbage", ">=1")
+
+
+class TestFindConflicts:
+    """Test cross-source conflict detection."""
+
+    def test_reports_sources(self):
+        """Conflicts should name the sources that clash."""
+        conflicts = find_conflicts(
+            {"repo-a": ["numpy>=2.0", "requests"], "repo-b": ["NumPy<2"]}
+        )
+
+        assert len(conflicts) == 1
+        assert conflicts[0].package == "numpy"
+        assert conflicts[0].requirements == [
+            ("repo-a", "numpy>=2.0"),
+            ("repo-b", "NumPy<2"),
+        ]
+        assert "repo-b" in conflicts[0].describe()
+
+    def test_markers_respect_target_python(self):
+        """Requirements for other environments should be ignored."""
+        requirements = {
+            "a": ["foo==1; python_version<'3.8'"],
+            "b": ["foo==2; python_version>='3.8'"],
+        }
+
+        assert find_conflicts(requirements, python_version="3.11") == []
+        assert find_conflicts(
+            {**requirements, "c": ["foo==3"]}, python_version="3.11"
+        )[0].package == "foo"
+
+    def test_local_label_is_not_a_conflict(self):
+        """A local build satisfies the plain public version pin."""
+        assert find_conflicts({"a": ["torch==2.1"], "b": ["torch==2.1+cpu"]}) == []
+
+
+class TestConflictDetectorIntegration:
+    """Test ConflictDetector with exact intersection."""
+
+    def test_range_conflict_is_blocking(self):
+        """Non-overlapping ranges should be reported as blocking."""
+        graph_a = DependencyGraph(direct=[Dependency("torch", ">=2.0")])
+        graph_b = DependencyGraph(direct=[Dependency("torch", "<1.13")])
+
+        report = ConflictDetector().detect([graph_a, graph_b], ["a", "b"])
+
+        assert report.conflicting_packages == 1
+        assert report.has_blocking_conflicts
+
+    def test_overlapping_ranges_are_fine(self):
+        """Overlapping ranges should not be reported."""
+        graph_a = DependencyGraph(direct=[Dependency("torch", ">=2.0")])
+        graph_b = DependencyGraph(direct=[Dependency("torch", "~=2.1")])
+
+        report = ConflictDetector().detect([graph_a, graph_b])
+
+        assert report.conflicts == []
+
+
+class TestResolverShortCircuit:
+    """Test that conflicts skip the external resolver."""
+
+    @pytest.mark.asyncio
+    async def test_conflict_skips_uv(self):
+        """A guaranteed conflict should not invoke uv."""
+        resolver = PythonResolver()
+        resolver._uv_available = True
+
+        with patch.object(
+            resolver, "_resolve_with_uv", new_callable=AsyncMock
+        ) as mock_uv:
+            result = await resolver.resolve(["pydantic>=2", "pydantic<2"])
+
+        mock_uv.assert_not_called()
+        assert not result.success
+        assert result.conflicts == ["pydantic"]
@@ -0,0 +1,209 @@
+"""
+Unit tests for the shared quota broker.
+"""
+
+import asyncio
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+from src.utils.quota_broker import (
+    BucketState,
+    QuotaBroker,
+    QuotaPriority,
+    SQLiteQuotaBackend,
+    get_quota_broker,
+    parse_rate_limit_headers,
+    quota_key,
+    quota_priority,
+)
+
+
+@pytest.fixture
+def broker(tmp_path):
+    backend = SQLiteQuotaBackend(tmp_path / "quota.db")
+    yield QuotaBroker(backend)
+    backend.close()
+
+
+def _take_in_process(db_path, count, queue):
+    async def run():
+        backend = SQLiteQuotaBackend(db_path)
+        granted = 0
+        for _ in range(count):
+            wait = await backend.take(
+                "shared", "worker", 1, QuotaPriority.INTERACTIVE, 50, 1 / 3600, 0
+            )
+            granted += wait == 0
+        backend.close()
+        return granted
+
+    queue.put(asyncio.run(run()))
+
+
+class TestHeaders:
+    """Test rate-limit header parsing."""
+
+    def test_github_headers(self):
+        headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4990",
+            "X-RateLimit-Reset": "1900000000",
+        }
+        assert parse_rate_limit_headers(headers) == (5000, 4990, 1900000000.0)
+
+    def test_relative_reset(self):
+        headers = {
+            "RateLimit-Limit": "100",
+            "RateLimit-Remaining": "7",
+            "RateLimit-Reset": "30",
+        }
+        assert parse_rate_limit_headers(headers, now=1000.0) == (100, 7, 1030.0)
+
+    def test_missing_or_malformed(self):
+        assert parse_rate_limit_headers({}) is None
+        assert parse_rate_limit_headers({"X-RateLimit-Limit": "x"}) is None
+        assert parse_rate_limit_headers(None) is None
+
+    def test_quota_key_hides_token(self):
+        key = quota_key("github", "ghp_secret")
+        assert key.startswith("github:")
+        assert "secret" not in key
+        assert quota_key("github", None) == "github:anonymous"
+
+
+class TestBucketState:
+    """Test the bucket arithmetic shared by both backends."""
+
+    def test_background_leaves_reserve(self):
+        state = BucketState(capacity=10, rate=1.0, tokens=4, updated_at=100.0)
+        # Background keeps 3 tokens back, so it can take only one
+        assert state.take(1, QuotaPriority.BACKGROUND, 100.0) == 0
+        assert state.take(1, QuotaPriority.BACKGROUND, 100.0) > 0
+        # Interactive can drain the rest
+        for _ in range(3):
+            assert state.take(1, QuotaPriority.INTERACTIVE, 100.0) == 0
+        assert state.take(1, QuotaPriority.INTERACTIVE, 100.0) == pytest.approx(1.0)
+
+    def test_server_remaining_blocks_until_reset(self):
+        state = BucketState(capacity=100, rate=100.0, tokens=100, updated_at=0.0)
+        state.apply_headers(limit=5000, remaining=1, reset_at=50.0)
+        assert state.take(1, QuotaPriority.INTERACTIVE, 10.0) == 0
+        assert state.take(1, QuotaPriority.INTERACTIVE, 10.0) == pytest.approx(40.0)
+        # After the window resets the local bucket applies again
+        assert state.take(1, QuotaPriority.INTERACTIVE, 60.0) == 0
+
+    def test_out_of_order_headers_keep_lowest(self):
+        state = BucketState(capacity=100, rate=1.0, tokens=100, updated_at=0.0)
+        state.apply_headers(5000, 4000, reset_at=500.0)
+        state.apply_headers(5000, 4100, reset_at=500.0)
+        assert state.remaining == 4000
+        state.apply_headers(5000, 4999, reset_at=4100.0)
+        assert state.remaining == 4999
+
+
+class TestQuotaBroker:
+    """Test QuotaBroker."""
+
+    async def test_limiters_share_a_bucket(self, broker):
+        first = broker.limiter("gh", 3600, burst_size=3, consumer="a")
+        second = broker.limiter("gh", 3600, burst_size=3, consumer="b")
+        await first.acquire(priority=QuotaPriority.INTERACTIVE)
+        await second.acquire(priority=QuotaPriority.INTERACTIVE)
+        await second.acquire(priority=QuotaPriority.INTERACTIVE)
+
+        bucket = await broker.get_bucket("gh")
+        assert bucket.tokens < 1
+
+        start = time.monotonic()
+        await first.acquire(priority=QuotaPriority.INTERACTIVE)
+        assert time.monotonic() - start > 0.5
+
+    async def test_headers_seed_bucket(self, broker):
+        limiter = broker.limiter("gh", requests_per_hour=5000, burst_size=30)
+        seeded = await limiter.update_from_headers(
+            {
+                "x-ratelimit-limit": "5000",
+                "x-ratelimit-remaining": "2",
+                "x-ratelimit-reset": str(int(time.time()) + 3600),
+            }
+        )
+        assert seeded
+        bucket = await broker.get_bucket("gh")
+        assert bucket.remaining == 2
+        assert bucket.tokens < 3
+        assert not await limiter.update_from_headers({"Content-Type": "text/html"})
+
+    async def test_context_priority(self, broker):
+        broker.configure("gh", capacity=10, requests_per_hour=36)
+        with quota_priority(QuotaPriority.BACKGROUND):
+            for _ in range(7):
+                await broker.acquire("gh", "research")
+            # Only the reserved three tokens are left
+            task = asyncio.create_task(broker.acquire("gh", "research"))
+            await asyncio.sleep(0.05)
+            assert not task.done()
+        # An interactive request still gets through immediately
+        assert await broker.acquire("gh", "search") == 0
+        task.cancel()
+
+    async def test_usage_per_consumer(self, broker):
+        broker.configure("gh", capacity=10, requests_per_hour=3600)
+        await broker.acquire("gh", "search")
+        await broker.acquire("gh", "search")
+        await broker.acquire("gh", "research", tokens=3)
+
+        usage = {row["consumer"]: row for row in await broker.get_usage("gh")}
+        assert usage["search"]["granted"] == 2
+        assert usage["research"]["granted"] == 3
+        assert usage["search"]["throttled"] == 0
+
+        await broker.reset("gh")
+        assert await broker.get_usage() == []
+
+    def test_unconfigured_key(self, broker):
+        with pytest.raises(KeyError):
+            asyncio.run(broker.acquire("missing"))
+
+    def test_processes_share_quota(self, tmp_path):
+        db_path = tmp_path / "quota.db"
+        SQLiteQuotaBackend(db_path).close()
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        workers = [
+            ctx.Process(target=_take_in_process, args=(db_path, 40, queue))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        granted = [queue.get(timeout=60) for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        # 120 attempts against one 50-token bucket: exactly 50 succeed
+        assert sum(granted) == 50
+
+    async def test_locked_database_does_not_block_the_loop(self, broker, tmp_path):
+        other = sqlite3.connect(tmp_path / "quota.db", isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        take = asyncio.create_task(
+            broker.backend.take("k", "c", 1, QuotaPriority.INTERACTIVE, 5, 1, 0)
+        )
+
+        # The loop keeps running while the take waits on the write lock
+        ticks = 0
+        while ticks < 5:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not take.done()
+
+        other.execute("COMMIT")
+        other.close()
+        assert await take == 0
+
+    def test_default_path_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("QUOTA_DB_PATH", str(tmp_path / "elsewhere.db"))
+        broker = get_quota_broker()
+        assert broker.backend._db_path == tmp_path / "elsewhere.db"
@@ -0,0 +1,152 @@
+"""
+Unit tests for token-budgeted context packing.
+"""
+
+import pytest
+
+from src.vibe.context_injector import ContextInjector, ProjectContext
+from src.vibe.context_packer import (
+    DEFAULT_BUDGET,
+    MAX_BUDGET,
+    ContextPacker,
+    ContextSnippet,
+    TokenEstimator,
+    budget_for_model,
+)
+
+
+@pytest.fixture
+def packer():
+    return ContextPacker(TokenEstimator(use_tiktoken=False))
+
+
+def _context(**overrides) -> ProjectContext:
+    fields = {
+        "project_name": "demo",
+        "project_type": "python",
+        "tech_stack": ["Python"],
+        "current_state": "Active development",
+        "components": [f"src.module_{i}.handlers" for i in range(40)]
+        + ["src.api.auth", "src.api.oauth_tokens"],
+        "past_decisions": ["Use JWT for API auth", "Store sessions in Redis"],
+        "recent_changes": ["Modified: src/api/auth.py"],
+        "environment": {},
+    }
+    fields.update(overrides)
+    return ProjectContext(**fields)
+
+
+class TestTokenEstimator:
+    """Test TokenEstimator."""
+
+    def test_estimate_counts_pieces(self):
+        estimator = TokenEstimator(use_tiktoken=False)
+        assert estimator.count("") == 0
+        assert estimator.count("def foo(): return 1") == 7
+        assert estimator.count("x" * 13) == 3
+
+    def test_calibrate_scales_estimate(self):
+        estimator = TokenEstimator(use_tiktoken=False)
+        text = "alpha beta gamma delta"
+        scale = estimator.calibrate([(text, 8)])
+        assert scale == pytest.approx(2.0)
+        assert estimator.count(text) == 8
+
+    def test_truncate_keeps_whole_words(self):
+        estimator = TokenEstimator(use_tiktoken=False)
+        assert estimator.truncate("alpha beta gamma", 2) == "alpha beta"
+        assert estimator.truncate("alpha beta", 10) == "alpha beta"
+        assert estimator.truncate("alpha", 0) == ""
+
+
+class TestBudgetForModel:
+    """Test budget_for_model."""
+
+    def test_unknown_model_uses_default(self):
+        assert budget_for_model(None) == DEFAULT_BUDGET
+        assert budget_for_model("no/such-model") == DEFAULT_BUDGET
+
+    def test_scales_with_context_window(self):
+        assert budget_for_model("ollama/qwen2.5-coder") == 3276
+        assert budget_for_model("ollama/llama3.1") == MAX_BUDGET
+
+
+class TestContextPacker:
+    """Test ContextPacker."""
+
+    def test_relevant_snippets_win_the_budget(self, packer):
+        snippets = [ContextSnippet("components", f"src.module_{i}") for i in range(20)]
+        snippets.append(ContextSnippet("components", "src.api.auth_service"))
+
+        result = packer.pack("Fix the auth service login", snippets, budget=10)
+
+        assert "src.api.auth_service" in result.texts("components")
+        assert result.tokens_used <= 10
+        assert result.tokens_saved == result.candidate_tokens - result.tokens_used
+        assert len(result.snippets) + len(result.dropped) == len(snippets)
+
+    def test_pinned_snippets_packed_first(self, packer):
+        snippets = [
+            ContextSnippet("rules", "Never hardcode secrets", pinned=True),
+            ContextSnippet("rules", "Use the auth service for login", priority=1.0),
+        ]
+        result = packer.pack("auth login", snippets, budget=5)
+        assert result.texts("rules") == ["Never hardcode secrets"]
+
+    def test_oversized_pinned_snippet_is_truncated(self, packer):
+        rule = "Never log secrets " + "or tokens " * 20
+        snippets = [
+            ContextSnippet("rules", rule, pinned=True),
+            ContextSnippet("rules", "Use the auth service", priority=1.0),
+        ]
+
+        result = packer.pack("auth", snippets, budget=6)
+
+        [packed] = result.texts("rules")
+        assert rule.startswith(packed) and packed.startswith("Never log secrets")
+        assert result.tokens_used <= 6
+        assert result.truncated == 1
+        assert snippets[0].text == rule
+
+    def test_dedupes_exact_and_contained_snippets(self, packer):
+        snippets = [
+            ContextSnippet("decisions", "Use JWT tokens for API auth"),
+            ContextSnippet("decisions", "use jwt tokens for api auth"),
+            ContextSnippet("decisions", "JWT tokens"),
+            ContextSnippet("decisions", "Deploy with Docker"),
+        ]
+        result = packer.pack("auth", snippets, budget=1000)
+        assert result.texts("decisions") == [
+            "Use JWT tokens for API auth",
+            "Deploy with Docker",
+        ]
+        assert result.duplicates == 2
+        assert result.tokens_saved > 0
+
+    def test_keeps_input_order(self, packer):
+        snippets = [
+            ContextSnippet("changes", "Modified: README.md"),
+            ContextSnippet("changes", "Modified: src/api/auth.py"),
+        ]
+        result = packer.pack("auth", snippets, budget=1000)
+        assert result.texts("changes") == [s.text for s in snippets]
+
+
+class TestContextInjectorPacking:
+    """Test ContextInjector.pack_context."""
+
+    def test_pack_context_trims_to_budget(self, packer):
+        injector = ContextInjector.__new__(ContextInjector)
+        injector.packer = packer
+        context = _context()
+
+        packed = injector.pack_context(context, "Add OAuth tokens to api auth", 40)
+
+        assert packed.packing["tokens_used"] <= 40
+        assert packed.packing["tokens_saved"] > 0
+        assert packed.current_state == "Active development"
+        assert "src.api.oauth_tokens" in packed.components
+        assert len(packed.components) < len(context.components)
+        # The cached original is left untouched
+        assert len(context.components) == 42
+        assert context.packing is None
@@ -0,0 +1,259 @@
+"""Tests for workflows.orchestrator DAG execution."""
+
+import asyncio
+import os
+
+import pytest
+
+os.environ["APP_ENV"] = "testing"
+
+try:
+    from src.core.cache import CacheManager
+    from src.workflows.orchestrator import (
+        WorkflowDefinition,
+        WorkflowEngine,
+        WorkflowOrchestrator,
+        WorkflowStep,
+        WorkflowType,
+    )
+
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Import error for workflows.orchestrator: {e}")
+    IMPORTS_AVAILABLE = False
+
+
+def _step(name, func, depends_on=None, cacheable=False, **params):
+    return WorkflowStep(
+        name=name,
+        engine=WorkflowEngine.NATIVE,
+        action="call",
+        parameters={"_function": func, **params},
+        depends_on=depends_on or [],
+        cacheable=cacheable,
+    )
+
+
+CALLS = []
+
+
+async def double(x):
+    CALLS.append(x)
+    return x * 2
+
+
+def _workflow(*steps):
+    return WorkflowDefinition(
+        id="wf",
+        name="test",
+        workflow_type=WorkflowType.AUTOMATION,
+        steps=list(steps),
+    )
+
+
+@pytest.fixture
+def orchestrator():
+    orch = WorkflowOrchestrator()
+    orch._cache = CacheManager("memory")
+    return orch
+
+
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Module not available")
+class TestDAGExecution:
+    """Test eager DAG scheduling."""
+
+    async def test_dependent_starts_before_slow_sibling_finishes(self, orchestrator):
+        """A step should start as soon as its own dependencies are done."""
+        events = []
+
+        async def slow(tag):
+            await asyncio.sleep(0.2)
+            events.append(f"end:{tag}")
+            return tag
+
+        async def fast(tag):
+            events.append(f"end:{tag}")
+            return tag
+
+        result = await orchestrator.execute(
+            _workflow(
+                _step("slow", slow, tag="slow"),
+                _step("fast", fast, tag="fast"),
+                _step("child", fast, depends_on=["fast"], tag="child"),
+            )
+        )
+
+        assert result.success
+        assert events.index("end:child") < events.index("end:slow")
+        assert result.critical_path == ["slow"]
+
+    async def test_failure_skips_dependents(self, orchestrator):
+        """Dependents of a failed step should be skipped, not reported as cycles."""
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def ok(tag):
+            return tag
+
+        result = await orchestrator.execute(
+            _workflow(
+                _step("a", boom),
+                _step("b", ok, depends_on=["a"], tag="b"),
+                _step("c", ok, depends_on=["b"], tag="c"),
+                _step("d", ok, tag="d"),
+            )
+        )
+
+        assert not result.success
+        assert result.skipped_steps == ["b", "c"]
+        assert result.data == {"d": "d"}
+        assert "a: boom" in result.errors
+        assert not any("Circular" in e for e in result.errors)
+
+    async def test_fail_fast_cancels_running_steps(self, orchestrator):
+        """fail_fast should cancel in-flight steps."""
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        result = await orchestrator.execute(
+            _workflow(_step("a", boom), _step("b", hang)),
+            fail_fast=True,
+        )
+
+        assert not result.success
+        assert "b: cancelled" in result.errors
+
+    async def test_cancelling_execute_cancels_running_steps(self, orchestrator):
+        """Cancelling execute() itself should not leave step tasks running."""
+        started = asyncio.Event()
+        stopped = asyncio.Event()
+
+        async def hang():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            finally:
+                stopped.set()
+
+        execution = asyncio.create_task(
+            orchestrator.execute(_workflow(_step("a", hang)))
+        )
+        await started.wait()
+        execution.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await execution
+        assert stopped.is_set()
+
+    async def test_detects_cycle_before_running(self, orchestrator):
+        """Cycles should be rejected without executing anything."""
+        calls = []
+
+        async def ok():
+            calls.append(1)
+
+        result = await orchestrator.execute(
+            _workflow(
+                _step("a", ok, depends_on=["b"]),
+                _step("b", ok, depends_on=["a"]),
+            )
+        )
+
+        assert not result.success
+        assert result.errors[0].startswith("Circular dependency detected")
+        assert calls == []
+
+    async def test_engine_limit_caps_concurrency(self):
+        """Per-engine limits should bound concurrent steps."""
+        orchestrator = WorkflowOrchestrator(engine_limits={WorkflowEngine.NATIVE: 2})
+        orchestrator._cache = CacheManager("memory")
+        active = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return i
+
+        result = await orchestrator.execute(
+            _workflow(*[_step(f"s{i}", work, i=i) for i in range(6)])
+        )
+
+        assert result.success
+        assert peak == 2
+
+    async def test_memoizes_step_results(self, orchestrator):
+        """Identical cacheable steps should be served from the memo on re-run."""
+        CALLS.clear()
+        workflow = _workflow(_step("a", double, cacheable=True, x=21))
+        first = await orchestrator.execute(workflow)
+        second = await orchestrator.execute(workflow)
+
+        assert first.data == second.data == {"a": 42}
+        assert CALLS == [21]
+        assert second.cached_steps == ["a"]
+
+        uncached = await orchestrator.execute(workflow, use_cache=False)
+        assert uncached.cached_steps == []
+        assert CALLS == [21, 21]
+
+    async def test_steps_are_not_memoized_by_default(self, orchestrator):
+        """Steps may have side effects, so memoization is opt-in."""
+        CALLS.clear()
+        workflow = _workflow(_step("a", double, x=1))
+        await orchestrator.execute(workflow)
+        second = await orchestrator.execute(workflow)
+
+        assert CALLS == [1, 1]
+        assert second.cached_steps == []
+
+    async def test_closures_are_never_memoized(self, orchestrator):
+        """Functions without a stable import path get no cache key."""
+
+        def make(offset):
+            async def add(x):
+                return x + offset
+
+            return add
+
+        first = await orchestrator.execute(
+            _workflow(_step("a", make(1), cacheable=True, x=1))
+        )
+        second = await orchestrator.execute(
+            _workflow(_step("a", make(100), cacheable=True, x=1))
+        )
+        lam = await orchestrator.execute(
+            _workflow(_step("a", lambda: asyncio.sleep(0, 5), cacheable=True))
+        )
+
+        assert lam.success
+        assert lam.data == {"a": 5}
+        assert first.data == {"a": 2}
+        assert second.data == {"a": 101}
+        assert second.cached_steps == lam.cached_steps == []
+
+    async def test_upstream_results_are_part_of_the_key(self, orchestrator):
+        """A dependent step re-runs when its inputs change."""
+        CALLS.clear()
+
+        def workflow(x):
+            return _workflow(
+                _step("a", double, x=x),
+                _step("b", double, depends_on=["a"], cacheable=True, x=100),
+            )
+
+        await orchestrator.execute(workflow(1))
+        again = await orchestrator.execute(workflow(1))
+        changed = await orchestrator.execute(workflow(2))
+
+        assert again.cached_steps == ["b"]
+        assert changed.cached_steps == []
+        assert CALLS.count(100) == 2